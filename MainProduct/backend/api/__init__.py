@@ -2,5 +2,8 @@
 API 패키지
 """
 from .routes import api_bp
+from .metrics import metrics_bp
+from .compression import compression_bp, json_response
+from .images import images_bp
 
-__all__ = ['api_bp']
+__all__ = ['api_bp', 'metrics_bp', 'compression_bp', 'images_bp', 'json_response']
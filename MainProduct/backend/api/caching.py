@@ -0,0 +1,96 @@
+"""
+HTTP 캐시 헤더 (ETag / If-None-Match / Cache-Control)
+
+- ETag는 응답 내용을 결정하는 값(캐시 항목 본문, 리뷰 버전 등)에서 만든 강한 ETag
+- If-None-Match가 일치하면 본문 없이 304 반환
+- 압축된 응답은 api/compression.py에서 ETag에 인코딩 접미사(-gzip, -br)를 붙이므로
+  비교 시 접미사를 제거합니다.
+"""
+import hashlib
+from typing import Any, Optional
+
+from flask import Response, g, request
+
+from config import Config
+from utils.metrics import metrics
+from utils.serialization import response_cache
+
+# 라우트별 Cache-Control
+#  - 외부 API 캐시에서 나온 응답: 브라우저가 max-age 동안 재요청 없이 사용
+#  - 리뷰: 작성 직후 바로 보여야 하므로 매번 재검증 (일치하면 304)
+CACHE_POLICIES = {
+    "streaming": f"public, max-age={Config.HTTP_CACHE_MAX_AGE}, stale-while-revalidate={Config.HTTP_CACHE_SWR}",
+    "discover": f"public, max-age={Config.HTTP_CACHE_MAX_AGE}, stale-while-revalidate={Config.HTTP_CACHE_SWR}",
+    "reviews": "no-cache",
+    "review_stats": "no-cache",
+    "movie_detail": "no-cache",
+}
+
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def make_etag(*parts: Any) -> str:
+    """값들로부터 강한 ETag 생성 (따옴표 포함)"""
+    if len(parts) == 1 and isinstance(parts[0], bytes):
+        data = parts[0]
+    else:
+        data = repr(parts).encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _strip_suffix(tag: str) -> str:
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)]
+    return tag
+
+
+def etag_matches(etag: str) -> bool:
+    """요청의 If-None-Match에 etag가 포함되어 있는지 확인"""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    if if_none_match.star_tag:
+        return True
+    tag = etag.strip('"')
+    return any(_strip_suffix(t) == tag for t in if_none_match.as_set(include_weak=True))
+
+
+def not_modified(etag: str, policy: str, route: str) -> Response:
+    """304 응답"""
+    metrics.inc("http_not_modified_total", route=route)
+    response = Response(status=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_POLICIES[policy]
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def conditional(response: Response, policy: str, route: str, etag: Optional[str] = None) -> Response:
+    """
+    응답에 ETag / Cache-Control 설정 (If-None-Match가 일치하면 304로 교체)
+
+    Args:
+        response: 200 응답
+        policy: CACHE_POLICIES 키
+        route: 메트릭 레이블
+        etag: 미리 계산한 ETag (없으면 본문 해시, 직렬화 캐시 키가 있으면 함께 캐시)
+    """
+    if etag is None:
+        cache_key = g.get("response_cache_key")
+        etag = response_cache.get(("etag", cache_key)) if cache_key is not None else None
+        if etag is None:
+            etag = make_etag(response.get_data())
+            if cache_key is not None:
+                response_cache.put(("etag", cache_key), etag)
+
+    if etag_matches(etag):
+        return not_modified(etag, policy, route)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_POLICIES[policy]
+    return response
+
+
+metrics.describe("http_not_modified_total", "counter", "If-None-Match 일치로 304를 반환한 요청 수")
@@ -0,0 +1,120 @@
+"""
+응답 압축 (gzip / brotli) 및 직렬화 결과 캐시 응답
+"""
+import gzip
+from typing import Any, Hashable, Optional
+
+from flask import Blueprint, Response, g, request
+
+from config import Config
+from utils.metrics import metrics
+from utils.serialization import dumps, response_cache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+compression_bp = Blueprint('compression', __name__)
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/html",
+    "text/plain",
+    "text/css",
+}
+
+
+def json_response(payload: Any, cache_key: Optional[Hashable] = None, status: int = 200) -> Response:
+    """
+    JSON 응답 생성 (cache_key가 있으면 직렬화/압축 결과 재사용)
+
+    Args:
+        payload: 응답 객체
+        cache_key: 응답 내용을 결정하는 키 (캐시 항목 버전 포함), 없으면 매번 직렬화
+        status: HTTP 상태 코드
+    """
+    if cache_key is None:
+        return Response(dumps(payload), status=status, mimetype="application/json")
+
+    body = response_cache.get(cache_key)
+    if body is None:
+        body = dumps(payload)
+        response_cache.put(cache_key, body)
+    g.response_cache_key = cache_key
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _negotiate(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (br > gzip, q=0 제외)"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.strip().lower()] = q
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 압축"""
+    if encoding == "br":
+        return brotli.compress(body, quality=Config.BROTLI_LEVEL)
+    return gzip.compress(body, compresslevel=Config.GZIP_LEVEL, mtime=0)
+
+
+@compression_bp.after_app_request
+def _compress_response(response):
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < Config.COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = _negotiate(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+
+    cache_key = g.get("response_cache_key")
+    compressed = response_cache.get((cache_key, encoding)) if cache_key is not None else None
+    if compressed is None:
+        compressed = compress(body, encoding)
+        if cache_key is not None:
+            response_cache.put((cache_key, encoding), compressed)
+
+    metrics.inc("response_bytes_total", len(body), encoding="identity")
+    metrics.inc("response_bytes_total", len(compressed), encoding=encoding)
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+
+    # 인코딩별로 다른 표현이므로 강한 ETag에 접미사 추가 (api/caching.py에서 비교 시 제거)
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{'br' if encoding == 'br' else 'gzip'}", weak)
+    return response
+
+
+metrics.describe("response_bytes_total", "counter", "압축 전(identity)/후 응답 바이트 수")
@@ -0,0 +1,69 @@
+"""
+이미지 프록시 라우트 (포스터 / 제공처 로고)
+
+응답은 URL(파일명 + 폭)과 Accept에 의해서만 결정되므로 1년 immutable 캐시로 응답합니다.
+"""
+from flask import Blueprint, jsonify, request, send_file
+
+from api.compression import json_response
+from config import Config
+from services.image_service import ImageNotFound, image_service, tmdb_filename
+
+images_bp = Blueprint('images', __name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@images_bp.route('/api/images/<kind>/<int:width>/<filename>', methods=['GET'])
+def get_image(kind: str, width: int, filename: str):
+    """
+    크기 변환된 포스터/로고 이미지 API
+    
+    예: /api/images/poster/185/abc.jpg  (Accept에 image/avif, image/webp가 있으면 변환)
+    """
+    fmt = image_service.negotiate(request.headers.get("Accept", ""))
+    try:
+        path, digest, mimetype = image_service.variant(kind, width, filename, fmt)
+    except ImageNotFound:
+        return jsonify({"error": "이미지를 찾을 수 없습니다."}), 404
+    except Exception as e:
+        print(f"[ERROR] 이미지 프록시 실패 ({kind}/{width}/{filename}): {e}")
+        return jsonify({"error": "이미지를 가져오지 못했습니다."}), 502
+
+    response = send_file(path, mimetype=mimetype, etag=digest, conditional=True, max_age=31536000)
+    response.headers["Cache-Control"] = IMMUTABLE
+    response.vary.add("Accept")
+    return response
+
+
+@images_bp.route('/api/images/logos', methods=['GET'])
+def get_logo_bundle():
+    """
+    제공처 로고 묶음 API (data URI, 로고 개수만큼 이미지 요청하지 않도록)
+    
+    Query Parameters:
+        paths: 로고 URL 또는 파일명 (쉼표 구분, 최대 IMAGE_LOGO_BUNDLE_MAX개)
+        width: 로고 폭 (기본 64)
+    
+    Response:
+        {"logos": {"<요청한 값>": "data:image/webp;base64,..."}}
+        가져오지 못한 로고가 있으면 제외하고 캐시하지 않음 (Cache-Control: no-store)
+    """
+    width = request.args.get("width", 64, type=int)
+    requested = [p.strip() for p in request.args.get("paths", "").split(",") if p.strip()]
+    requested = requested[:Config.IMAGE_LOGO_BUNDLE_MAX]
+    filenames = {value: tmdb_filename(value) for value in requested}
+
+    fmt = image_service.negotiate(request.headers.get("Accept", ""))
+    bundle = image_service.logo_bundle([f for f in filenames.values() if f], width, fmt)
+    logos = {value: bundle[f] for value, f in filenames.items() if f in bundle}
+
+    if len(logos) < sum(1 for f in filenames.values() if f):
+        # 가져오지 못한 로고가 있으면 (일시적 오류 포함) 서버/브라우저에 캐시하지 않음
+        response = json_response({"logos": logos})
+        response.headers["Cache-Control"] = "no-store"
+    else:
+        response = json_response({"logos": logos}, cache_key=("logos", tuple(sorted(requested)), width, fmt))
+        response.headers["Cache-Control"] = IMMUTABLE
+    response.vary.add("Accept")
+    return response
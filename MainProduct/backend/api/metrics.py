@@ -0,0 +1,55 @@
+"""
+요청 계측 및 Prometheus /metrics 엔드포인트
+"""
+import time
+
+from flask import Blueprint, Response, g, request
+
+from utils.metrics import StageTimer, metrics
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+def stage_timer(route: str) -> StageTimer:
+    """
+    현재 요청의 단계별 타이머 생성
+
+    after_request에서 Server-Timing 헤더로 출력됩니다.
+    """
+    timer = StageTimer(route)
+    g.stage_timer = timer
+    return timer
+
+
+@metrics_bp.before_app_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@metrics_bp.after_app_request
+def _record_request(response):
+    started = g.get("request_started")
+    if started is None:
+        return response
+
+    elapsed = time.perf_counter() - started
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.inc("http_requests_total", endpoint=endpoint, method=request.method,
+                status=response.status_code)
+    metrics.observe("http_request_seconds", elapsed, endpoint=endpoint, method=request.method)
+
+    # 브라우저 개발자 도구에서 단계별 시간 확인 (교차 출처 허용)
+    timings = []
+    timer = g.get("stage_timer")
+    if timer is not None and timer.stages:
+        timings.append(timer.server_timing())
+    timings.append(f"total;dur={elapsed * 1000:.1f}")
+    response.headers["Server-Timing"] = ", ".join(timings)
+    response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+
+@metrics_bp.route('/metrics')
+def prometheus_metrics():
+    """Prometheus 텍스트 포맷 메트릭 (전체 워커 합산)"""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
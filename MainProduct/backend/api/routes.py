@@ -1,17 +1,32 @@
 """
 Flask API 라우트
 """
-from typing import List
-from flask import Blueprint, request, jsonify
+import hmac
+import threading
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Response, request, jsonify
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
 
 from config import Config
-from services.tmdb_service import tmdb_service
-from services.omdb_service import omdb_service
+from services.tmdb_service import MovieNotFound, tmdb_service
 from services.recommendation import recommendation_service
-from database import get_db, SessionLocal
+from services.batch_analyze import BatchInputError, batch_analyze_service
+from services.taste_profile import ProfileConflictError, ProfileLimitError, taste_profile_service
+from services.warmup import warmup_service
+from services.image_service import image_service
+from services.review_search import review_search_service
+from services.review_archive import review_archive_service
+from services.review_events import SubscriberLimitError, review_event_bus
+from database import get_db, read_session, write_token, SessionLocal
 from models.review import Review
+from models.review_version import ReviewVersion
+from api.metrics import stage_timer
+from api.compression import json_response
+from api.caching import conditional, etag_matches, make_etag, not_modified
+from utils.lifecycle import on_post_fork
+from utils.serialization import dumps, entry_version
 
 api_bp = Blueprint('api', __name__)
 
@@ -25,10 +40,15 @@ def health_check():
         "version": "2.0",
         "endpoints": {
             "analyze": "/api/analyze",
+            "analyze_batch": "/api/analyze/batch",
             "discover": "/api/discover",
             "streaming_single": "/api/streaming/<movie_id>",
             "streaming_bulk": "/api/streaming/bulk",
-            "reviews": "/api/reviews/<movie_id>"
+            "reviews": "/api/reviews/<movie_id>",
+            "movie_detail": "/api/movies/<movie_id>/detail",
+            "profiles": "/api/profiles",
+            "ready": "/ready",
+            "warmup": "/api/warmup"
         },
         "config": {
             "tmdb_configured": bool(Config.TMDB_API_KEY),
@@ -37,100 +57,187 @@ def health_check():
     })
 
 
+@api_bp.route('/ready')
+def readiness_check():
+    """준비 상태 확인 API (시작 시 캐시 워밍업이 끝나기 전까지 503, 수동 워밍업은 영향 없음)"""
+    state = warmup_service.state()
+    return jsonify({"ready": warmup_service.ready, "warmup": state}), 200 if warmup_service.ready else 503
+
+
+def _warmup_authorized() -> bool:
+    """WARMUP_TOKEN이 있으면 Bearer 토큰 확인, 없으면 프록시를 거치지 않은 loopback 요청만 허용"""
+    if Config.WARMUP_TOKEN:
+        scheme, _, token = (request.headers.get("Authorization") or "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(token.strip(), Config.WARMUP_TOKEN)
+    return request.remote_addr in ("127.0.0.1", "::1") and "X-Forwarded-For" not in request.headers
+
+
+@api_bp.route('/api/warmup', methods=['POST'])
+def trigger_warmup():
+    """
+    캐시 워밍업 수동 실행 API (백그라운드, 실행 중에도 /ready는 그대로)
+    
+    Headers:
+        Authorization: Bearer <WARMUP_TOKEN> (WARMUP_TOKEN이 없으면 같은 호스트에서만 호출 가능)
+    
+    Request Body (선택):
+    {
+        "top_n": 200
+    }
+    """
+    if not _warmup_authorized():
+        return jsonify({"error": "워밍업 실행 권한이 없습니다"}), 403
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        top_n = int(data.get('top_n') or Config.WARMUP_TOP_N)
+        
+        if not warmup_service.start(top_n):
+            return jsonify({"error": "워밍업이 이미 실행 중입니다", "warmup": warmup_service.state()}), 409
+        
+        return jsonify({"message": "워밍업을 시작했습니다", "top_n": top_n}), 202
+    
+    except (TypeError, ValueError):
+        return jsonify({"error": "top_n은 정수여야 합니다"}), 400
+
+
+def _resolve_titles(titles: List[str], lang: str) -> List[int]:
+    """영화 제목 → TMDb ID 변환 (찾지 못한 제목은 건너뜀)"""
+    resolved_ids = []
+    for title in titles:
+        try:
+            movie = tmdb_service.search_movie(title, lang)
+            if movie:
+                movie_id = movie.get("id")
+                if movie_id:
+                    resolved_ids.append(movie_id)
+        except Exception:
+            continue
+    return resolved_ids
+
+
 @api_bp.route('/api/analyze', methods=['POST'])
 def analyze():
-    """영화 취향 분석 및 추천 API"""
+    """
+    영화 취향 분석 및 추천 API
+    
+    Request Body:
+    {
+        "titles": ["기생충", "인셉션"],
+        "language": "ko-KR",
+        "save_profile": false        // true면 취향 프로필을 저장하고 profile_id 반환
+    }
+    또는 저장된 프로필로 분석 (제목 검색 / 상세 조회 / TF-IDF 계산 생략):
+    {
+        "profile_id": "..."
+    }
+    """
     try:
         data = request.get_json(force=True)
         titles: List[str] = data.get("titles", [])
-        lang: str = data.get("language", "ko-KR")
+        profile_id = data.get("profile_id")
+        timer = stage_timer("analyze")
+        saved_profile_id = None
         
-        # 1. 영화 제목 → TMDb ID 변환
-        resolved_ids = []
-        for title in titles:
+        if profile_id:
+            # 1~3. 저장된 프로필 사용
+            db = SessionLocal()
             try:
-                movie = tmdb_service.search_movie(title, lang)
-                if movie:
-                    movie_id = movie.get("id")
-                    if movie_id:
-                        resolved_ids.append(movie_id)
-            except Exception:
-                continue
-        
-        if not resolved_ids:
-            return jsonify({
-                "error": "입력한 제목으로 TMDb에서 영화를 찾을 수 없습니다."
-            }), 400
-        
-        # 2. 좋아하는 영화들의 프로필 조회
-        favorite_profiles = tmdb_service.get_bulk_movie_details(resolved_ids, lang)
-        
-        # 3. TF-IDF 프로필 생성
-        try:
-            vectorizer, user_vector, top_features = recommendation_service.create_tfidf_profile(
-                favorite_profiles
-            )
-        except Exception as e:
-            return jsonify({"error": f"TF-IDF 분석 실패: {str(e)}"}), 500
-        
-        # 4. 후보 영화 풀 생성
-        candidate_ids = []
-        for profile in favorite_profiles:
-            candidate_ids.extend(profile.get("candidate_ids") or [])
-        
-        candidate_ids = list(dict.fromkeys(candidate_ids))[:Config.CANDIDATE_LIMIT]
-        candidates = tmdb_service.get_bulk_movie_details(candidate_ids, lang)
-        
-        # 5. 추천 점수 계산
-        exclude_ids = {p.get("id") for p in favorite_profiles}
-        scored_movies = recommendation_service.score_candidates(
-            vectorizer,
-            user_vector,
-            candidates,
-            exclude_ids
-        )
-        
-        # 6. 상위 N개 선택
-        top_movies = scored_movies[:Config.TOP_N]
-        recommendations = []
-        
-        for idx, (score, profile) in enumerate(top_movies, start=1):
-            if idx <= Config.ENRICH_TOP:
-                profile = omdb_service.enrich_movie_profile(profile)
+                with timer.stage("profile"):
+                    profile = taste_profile_service.get(db, str(profile_id))
+                    if profile is None:
+                        return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+                    lang: str = data.get("language") or profile.language
+                    favorites = profile.to_dict()["favorites"]
+                    exclude_ids = set(profile.favorite_ids)
+                    patterns = recommendation_service.top_patterns(profile.pattern_counts)
+                    try:
+                        vectorizer, user_vector, top_features, candidate_ids = (
+                            taste_profile_service.scoring_inputs(profile)
+                        )
+                    except ValueError:
+                        return jsonify({"error": "취향 프로필에 좋아하는 영화가 없습니다."}), 400
+            finally:
+                db.close()
+        else:
+            lang = data.get("language", "ko-KR")
             
-            recommendations.append({
-                "score": float(score),
-                "id": profile.get("id"),
-                "title": profile.get("title"),
-                "overview": profile.get("overview"),
-                "poster": profile.get("poster"),
-                "genres": profile.get("genres"),
-                "vote_average": profile.get("vote_average"),
-                "vote_count": profile.get("vote_count"),
-                "release_date": profile.get("release_date"),
-                "runtime": profile.get("runtime"),
-                "omdb": profile.get("omdb"),
-            })
-        
-        # 7. 패턴 분석
-        patterns = recommendation_service.analyze_patterns(favorite_profiles)
-        
-        # 8. 응답 구성
-        response = {
-            "favorites": [
+            # 1. 영화 제목 → TMDb ID 변환
+            with timer.stage("search"):
+                resolved_ids = _resolve_titles(titles, lang)
+            
+            if not resolved_ids:
+                return jsonify({
+                    "error": "입력한 제목으로 TMDb에서 영화를 찾을 수 없습니다."
+                }), 400
+            
+            # 2. 좋아하는 영화들의 프로필 조회
+            with timer.stage("favorites"):
+                favorite_profiles = tmdb_service.get_bulk_movie_details(resolved_ids, lang)
+            
+            # 3. TF-IDF 프로필 생성
+            try:
+                with timer.stage("tfidf"):
+                    vectorizer, user_vector, top_features = recommendation_service.create_tfidf_profile(
+                        favorite_profiles
+                    )
+            except Exception as e:
+                return jsonify({"error": f"TF-IDF 분석 실패: {str(e)}"}), 500
+            
+            favorites = [
                 {
                     "id": p.get("id"),
                     "title": p.get("title"),
                     "poster": p.get("poster")
                 }
                 for p in favorite_profiles
-            ],
+            ]
+            exclude_ids = {p.get("id") for p in favorite_profiles}
+            
+            # 4. 후보 영화 풀 생성
+            candidate_ids = []
+            for profile in favorite_profiles:
+                candidate_ids.extend(profile.get("candidate_ids") or [])
+            
+            candidate_ids = list(dict.fromkeys(candidate_ids))[:Config.CANDIDATE_LIMIT]
+            
+            # 패턴 분석
+            with timer.stage("patterns"):
+                patterns = recommendation_service.analyze_patterns(favorite_profiles)
+            
+            if data.get("save_profile"):
+                db = SessionLocal()
+                try:
+                    with timer.stage("profile"):
+                        saved_profile_id = taste_profile_service.create(db, favorite_profiles, lang).id
+                except ProfileLimitError as e:
+                    return jsonify({"error": str(e)}), 400
+                finally:
+                    db.close()
+        
+        with timer.stage("candidates"):
+            candidates = tmdb_service.get_bulk_movie_details(candidate_ids, lang)
+        
+        # 5. 추천 점수 계산, 6. 상위 N개 선택 (MMR 다양성 재정렬, 같은 감독/장르 쏠림 방지)
+        top_movies = recommendation_service.rank(vectorizer, user_vector, candidates, exclude_ids, timer)
+        
+        with timer.stage("omdb"):
+            recommendations = recommendation_service.recommendation_entries(top_movies)
+        
+        # 7. 응답 구성
+        response = {
+            "favorites": favorites,
             "top_features": top_features,
             "top_genres": patterns["top_genres"],
             "top_directors": patterns["top_directors"],
             "top_actors": patterns["top_actors"],
             "recommendations": recommendations,
         }
+        if profile_id or saved_profile_id:
+            response["profile_id"] = profile_id or saved_profile_id
+        
+        # 곧 요청될 포스터 썸네일을 미리 변환 (백그라운드, 응답 지연 없음)
+        image_service.prefetch(r["poster"] for r in recommendations)
         
         return jsonify(response)
     
@@ -138,6 +245,237 @@ def analyze():
         return jsonify({"error": f"서버 오류: {str(e)}"}), 500
 
 
+@api_bp.route('/api/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """
+    여러 좋아하는 영화 목록 일괄 추천 API
+    
+    Request Body:
+    {
+        "lists": [
+            {"id": "user-1", "titles": ["기생충", "인셉션"]},
+            {"id": "user-2", "movie_ids": [496243, 27205]}
+        ],
+        "language": "ko-KR",
+        "top_n": 20,
+        "stream": false      // 생략하면 목록 수가 BATCH_ANALYZE_STREAM_THRESHOLD를 넘을 때 NDJSON 스트리밍
+    }
+    
+    Response:
+        {"results": [{"id", /api/analyze 응답 항목...}, ...]}
+        또는 application/x-ndjson (한 줄에 목록 1개, 청크 단위로 전송)
+    """
+    try:
+        data = request.get_json(force=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "요청 본문은 JSON 객체여야 합니다."}), 400
+        lists = data.get("lists")
+        lang = data.get("language", "ko-KR")
+        try:
+            top_n = int(data.get("top_n") or Config.TOP_N)
+        except (TypeError, ValueError):
+            return jsonify({"error": "top_n은 정수여야 합니다."}), 400
+        top_n = min(max(top_n, 1), Config.TOP_N)
+        
+        if not isinstance(lists, list) or not lists:
+            return jsonify({"error": "lists는 비어 있지 않은 배열이어야 합니다."}), 400
+        if len(lists) > Config.BATCH_ANALYZE_MAX_LISTS:
+            return jsonify({"error": f"lists는 최대 {Config.BATCH_ANALYZE_MAX_LISTS}개입니다."}), 400
+        
+        stream = data.get("stream")
+        if stream is None:
+            stream = len(lists) > Config.BATCH_ANALYZE_STREAM_THRESHOLD
+        
+        timer = stage_timer("analyze_batch")
+        try:
+            plan = batch_analyze_service.prepare(lists, lang, timer)
+        except BatchInputError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        if not stream:
+            with timer.stage("scoring"):
+                results = [
+                    result
+                    for chunk in batch_analyze_service.score(plan, top_n, len(lists))
+                    for result in chunk
+                ]
+            return json_response({"results": results})
+        
+        # 준비(검색/조회)가 끝난 뒤 청크 단위로 점수를 계산하며 전송
+        def generate():
+            for chunk in batch_analyze_service.score(plan, top_n, Config.BATCH_ANALYZE_CHUNK):
+                yield b"".join(dumps(result) + b"\n" for result in chunk)
+        
+        return Response(generate(), mimetype="application/x-ndjson")
+    
+    except Exception as e:
+        return jsonify({"error": f"서버 오류: {str(e)}"}), 500
+
+
+def _profile_payload(profile) -> dict:
+    """취향 프로필 응답 (좋아하는 영화 + 패턴, 상위 특징)"""
+    payload = profile.to_dict()
+    payload.update(recommendation_service.top_patterns(profile.pattern_counts))
+    if profile.favorites:
+        _, _, top_features = recommendation_service.vectorize_taste(
+            profile.term_sums, profile.doc_freq, len(profile.favorites)
+        )
+        payload["top_features"] = top_features
+    else:
+        payload["top_features"] = []
+    return payload
+
+
+@api_bp.route('/api/profiles', methods=['POST'])
+def create_profile():
+    """
+    취향 프로필 생성 API
+    
+    Request Body:
+    {
+        "titles": ["기생충", "인셉션"],   // 또는 "movie_ids": [496243, 27205]
+        "language": "ko-KR"
+    }
+    """
+    try:
+        data = request.get_json(force=True)
+        lang = data.get("language", "ko-KR")
+        movie_ids = [int(m) for m in data.get("movie_ids") or []]
+        movie_ids.extend(_resolve_titles(data.get("titles") or [], lang))
+        
+        if not movie_ids:
+            return jsonify({"error": "titles 또는 movie_ids가 필요합니다."}), 400
+        
+        movies = tmdb_service.get_bulk_movie_details(movie_ids, lang)
+        if not movies:
+            return jsonify({"error": "영화 정보를 찾을 수 없습니다."}), 400
+        
+        db = SessionLocal()
+        try:
+            profile = taste_profile_service.create(db, movies, lang)
+            return jsonify({"profile": _profile_payload(profile)}), 201
+        finally:
+            db.close()
+    except (TypeError, ValueError):
+        return jsonify({"error": "movie_ids는 정수 배열이어야 합니다."}), 400
+    except ProfileLimitError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print(f"[ERROR] 취향 프로필 생성 실패: {str(e)}")
+        return jsonify({"error": f"취향 프로필 생성 실패: {str(e)}"}), 500
+
+
+@api_bp.route('/api/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id: str):
+    """취향 프로필 조회 API"""
+    db = SessionLocal()
+    try:
+        profile = taste_profile_service.get(db, profile_id)
+        if profile is None:
+            return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+        return jsonify({"profile": _profile_payload(profile)})
+    finally:
+        db.close()
+
+
+@api_bp.route('/api/profiles/<profile_id>', methods=['DELETE'])
+def delete_profile(profile_id: str):
+    """취향 프로필 삭제 API"""
+    db = SessionLocal()
+    try:
+        if not taste_profile_service.delete(db, profile_id):
+            return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+        return jsonify({"message": "취향 프로필이 삭제되었습니다."})
+    finally:
+        db.close()
+
+
+@api_bp.route('/api/profiles/<profile_id>/favorites', methods=['POST'])
+def add_profile_favorite(profile_id: str):
+    """
+    좋아하는 영화 추가 API (추가한 영화의 특징만 프로필에 반영)
+    
+    Request Body:
+    {
+        "movie_id": 27205        // 또는 "title": "인셉션"
+    }
+    """
+    try:
+        data = request.get_json(force=True)
+        db = SessionLocal()
+        try:
+            profile = taste_profile_service.get(db, profile_id)
+            if profile is None:
+                return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+            lang = profile.language
+            
+            movie_id = data.get("movie_id")
+            if movie_id is None and data.get("title"):
+                resolved = _resolve_titles([data["title"]], lang)
+                movie_id = resolved[0] if resolved else None
+            if movie_id is None:
+                return jsonify({"error": "movie_id 또는 title로 영화를 찾을 수 없습니다."}), 400
+            
+            movie = tmdb_service.get_movie_details(int(movie_id), lang)
+            if not movie:
+                return jsonify({"error": "영화 정보를 찾을 수 없습니다."}), 404
+            
+            profile = taste_profile_service.add_favorite(db, profile_id, movie)
+            if profile is None:
+                return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+            return jsonify({"profile": _profile_payload(profile)})
+        finally:
+            db.close()
+    except (TypeError, ValueError):
+        return jsonify({"error": "movie_id는 정수여야 합니다."}), 400
+    except ProfileLimitError as e:
+        return jsonify({"error": str(e)}), 400
+    except ProfileConflictError as e:
+        return jsonify({"error": str(e)}), 409
+    except MovieNotFound:
+        return jsonify({"error": "영화 정보를 찾을 수 없습니다."}), 404
+    except Exception as e:
+        print(f"[ERROR] 좋아하는 영화 추가 실패: {str(e)}")
+        return jsonify({"error": f"좋아하는 영화 추가 실패: {str(e)}"}), 500
+
+
+@api_bp.route('/api/profiles/<profile_id>/favorites/<int:movie_id>', methods=['DELETE'])
+def remove_profile_favorite(profile_id: str, movie_id: int):
+    """좋아하는 영화 삭제 API (저장된 기여분만 빼서 갱신)"""
+    try:
+        db = SessionLocal()
+        try:
+            profile = taste_profile_service.remove_favorite(db, profile_id, movie_id)
+            if profile is None:
+                return jsonify({"error": "취향 프로필을 찾을 수 없습니다."}), 404
+            return jsonify({"profile": _profile_payload(profile)})
+        finally:
+            db.close()
+    except ProfileConflictError as e:
+        return jsonify({"error": str(e)}), 409
+    except Exception as e:
+        print(f"[ERROR] 좋아하는 영화 삭제 실패: {str(e)}")
+        return jsonify({"error": f"좋아하는 영화 삭제 실패: {str(e)}"}), 500
+
+
+def _streaming_payload(streaming_info: dict, region: str) -> dict:
+    """스트리밍 정보 응답 (제공처가 없으면 안내 메시지 추가)"""
+    has_providers = any([
+        streaming_info.get('flatrate'),
+        streaming_info.get('rent'),
+        streaming_info.get('buy'),
+        streaming_info.get('free'),
+        streaming_info.get('ads')
+    ])
+    
+    if not has_providers and not streaming_info.get('error'):
+        return {
+            **streaming_info,
+            "message": f"{region} 지역에서 사용 가능한 스트리밍 정보가 없습니다."
+        }
+    return streaming_info
+
+
 @api_bp.route('/api/streaming/<int:movie_id>', methods=['GET'])
 def get_streaming(movie_id: int):
     """특정 영화의 스트리밍 제공 정보 조회 API"""
@@ -145,22 +483,18 @@ def get_streaming(movie_id: int):
         region = request.args.get('region', 'KR').upper()
         
         streaming_info = tmdb_service.get_streaming_providers(movie_id, region)
+        version = entry_version(
+            tmdb_service.get_streaming_providers.cache_entry(tmdb_service, movie_id, region),
+            streaming_info
+        )
+        cache_key = ("streaming", movie_id, region, version) if version else None
         
-        has_providers = any([
-            streaming_info.get('flatrate'),
-            streaming_info.get('rent'),
-            streaming_info.get('buy'),
-            streaming_info.get('free'),
-            streaming_info.get('ads')
-        ])
-        
-        if not has_providers and not streaming_info.get('error'):
-            return jsonify({
-                **streaming_info,
-                "message": f"{region} 지역에서 사용 가능한 스트리밍 정보가 없습니다."
-            })
+        response = json_response(_streaming_payload(streaming_info, region), cache_key)
         
-        return jsonify(streaming_info)
+        # 조회 실패(캐시되지 않은 오류 응답)는 브라우저에 캐시하지 않음
+        if cache_key is None:
+            return response
+        return conditional(response, "streaming", "streaming")
     
     except Exception as e:
         return jsonify({
@@ -187,11 +521,23 @@ def get_streaming_bulk():
         
         streaming_infos = tmdb_service.get_bulk_streaming_providers(movie_ids, region)
         
-        return jsonify({
+        # 모든 항목이 캐시 값이면 (영화 ID, 버전) 목록으로 직렬화 결과 재사용
+        versions = tuple(
+            (info["movie_id"], entry_version(
+                tmdb_service.get_streaming_providers.cache_entry(tmdb_service, info["movie_id"], region),
+                info
+            ))
+            for info in streaming_infos
+        )
+        cache_key = None
+        if all(version for _, version in versions):
+            cache_key = ("streaming_bulk", region, versions)
+        
+        return json_response({
             "items": streaming_infos,
             "total": len(streaming_infos),
             "region": region
-        })
+        }, cache_key)
     
     except Exception as e:
         return jsonify({
@@ -252,17 +598,76 @@ def discover():
             lang=lang,
             page=page
         )
+        version = entry_version(
+            tmdb_service.discover_movies.cache_entry(tmdb_service, genres, themes, lang, page),
+            movies
+        )
+        cache_key = ("discover", tuple(genres), tuple(themes), lang, page, version) if version else None
+        image_service.prefetch(m.get("poster") for m in movies)
         
-        return jsonify({
+        response = json_response({
             "items": movies,
             "total": len(movies),
             "page": page
-        })
+        }, cache_key)
+        
+        if cache_key is None:
+            return response
+        return conditional(response, "discover", "discover")
     
     except Exception as e:
         return jsonify({"error": f"서버 오류: {str(e)}"}), 500
 
 
+def _read_after():
+    """
+    쓰기 응답의 read_after (쿼리 파라미터 read_after 또는 X-Read-After 헤더)
+    
+    값이 있으면 그 쓰기가 반영된 DB(primary 또는 따라잡은 복제본)에서 조회합니다.
+    """
+    value = request.args.get('read_after') or request.headers.get('X-Read-After')
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+@api_bp.route('/api/reviews/search', methods=['GET'])
+def search_reviews():
+    """
+    리뷰 내용 검색 API
+    
+    Query Parameters:
+        q: 검색어 (모든 단어를 포함하는 리뷰, 한글은 2글자 이상)
+        movie_id: 특정 영화 리뷰만 검색 (선택)
+        sort: relevance (관련도순, 기본값) / recent (최신순)
+        limit: 페이지 크기 (기본값 20, 최대 REVIEW_SEARCH_MAX_LIMIT)
+        cursor: 이전 응답의 next_cursor (다음 페이지)
+    
+    Response:
+        {"reviews": [{..., "rank": 0.12}], "next_cursor": "..." 또는 null}
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        movie_id = request.args.get('movie_id', type=int)
+        sort = request.args.get('sort', 'relevance')
+        limit = min(max(request.args.get('limit', 20, type=int), 1), Config.REVIEW_SEARCH_MAX_LIMIT)
+        cursor = request.args.get('cursor') or None
+        
+        db = read_session(_read_after())
+        try:
+            reviews, next_cursor = review_search_service.search(db, query, movie_id, sort, limit, cursor)
+        finally:
+            db.close()
+        
+        return jsonify({"reviews": reviews, "next_cursor": next_cursor, "query": query})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print(f"[ERROR] 리뷰 검색 실패: {str(e)}")
+        return jsonify({"error": f"리뷰 검색 실패: {str(e)}"}), 500
+
+
 @api_bp.route('/api/reviews/<int:movie_id>', methods=['GET'])
 def get_reviews(movie_id: int):
     """특정 영화의 리뷰 목록 조회 API"""
@@ -270,25 +675,35 @@ def get_reviews(movie_id: int):
         limit = int(request.args.get('limit', 50))
         offset = int(request.args.get('offset', 0))
         
-        db = SessionLocal()
+        db = read_session(_read_after())
         try:
+            # 리뷰 버전(PK 조회 1번)으로 ETag 확인 → 일치하면 리뷰 조회 없이 304
+            etag = make_etag("reviews", movie_id, ReviewVersion.current(db, movie_id), limit, offset)
+            if etag_matches(etag):
+                return not_modified(etag, "reviews", "reviews")
+            
             reviews = db.query(Review).filter(
                 Review.movie_id == movie_id
             ).order_by(
-                desc(Review.created_at)
+                desc(Review.created_at), desc(Review.id)
             ).limit(limit).offset(offset).all()
             
-            total = db.query(Review).filter(
-                Review.movie_id == movie_id
-            ).count()
+            total, rating_sum = db.query(
+                func.count(), func.coalesce(func.sum(Review.rating), 0.0)
+            ).filter(Review.movie_id == movie_id).one()
+            
+            # 보관(Parquet)된 오래된 리뷰를 개수와 페이지 뒤쪽에 합침
+            reviews, total, _ = review_archive_service.with_archived(
+                db, movie_id, [review.to_dict() for review in reviews], total, rating_sum, offset, limit
+            )
             
             print(f"[DEBUG] 리뷰 조회 - movie_id: {movie_id}, total: {total}")
             
-            return jsonify({
-                "reviews": [review.to_dict() for review in reviews],
+            return conditional(jsonify({
+                "reviews": reviews,
                 "total": total,
                 "movie_id": movie_id
-            })
+            }), "reviews", "reviews", etag)
         finally:
             db.close()
     except Exception as e:
@@ -332,6 +747,13 @@ def create_review():
             )
             
             db.add(review)
+            version = ReviewVersion.bump(db, movie_id)
+            db.flush()
+            review_event_bus.publish(db, movie_id, "review_created", {
+                "review": review.to_dict(),
+                "stats": _review_stats(db, movie_id),
+                "version": version
+            })
             db.commit()
             db.refresh(review)
             
@@ -339,7 +761,8 @@ def create_review():
             
             return jsonify({
                 "review": review.to_dict(),
-                "message": "리뷰가 성공적으로 작성되었습니다."
+                "message": "리뷰가 성공적으로 작성되었습니다.",
+                "read_after": write_token()
             }), 201
         finally:
             db.close()
@@ -362,9 +785,16 @@ def delete_review(review_id: int):
                 return jsonify({"error": "리뷰를 찾을 수 없습니다."}), 404
             
             db.delete(review)
+            version = ReviewVersion.bump(db, review.movie_id)
+            db.flush()
+            review_event_bus.publish(db, review.movie_id, "review_deleted", {
+                "review_id": review_id,
+                "stats": _review_stats(db, review.movie_id),
+                "version": version
+            })
             db.commit()
             
-            return jsonify({"message": "리뷰가 삭제되었습니다."})
+            return jsonify({"message": "리뷰가 삭제되었습니다.", "read_after": write_token()})
         finally:
             db.close()
     except Exception as e:
@@ -376,20 +806,240 @@ def delete_review(review_id: int):
 def get_review_stats(movie_id: int):
     """영화의 리뷰 통계 조회 API"""
     try:
-        db = SessionLocal()
+        db = read_session(_read_after())
         try:
-            reviews = db.query(Review).filter(Review.movie_id == movie_id).all()
-            
-            total = len(reviews)
-            avg_rating = sum(r.rating for r in reviews) / total if total > 0 else 0.0
+            etag = make_etag("review_stats", movie_id, ReviewVersion.current(db, movie_id))
+            if etag_matches(etag):
+                return not_modified(etag, "review_stats", "review_stats")
             
-            return jsonify({
-                "total_reviews": total,
-                "average_rating": round(avg_rating, 2),
-                "movie_id": movie_id
-            })
+            return conditional(jsonify(_review_stats(db, movie_id)), "review_stats", "review_stats", etag)
         finally:
             db.close()
     except Exception as e:
         print(f"[ERROR] 통계 조회 실패: {str(e)}")
         return jsonify({"error": f"통계 조회 실패: {str(e)}"}), 500
+
+
+def _review_stats(db: Session, movie_id: int) -> dict:
+    """영화의 리뷰 수 / 평균 별점 (보관된 리뷰 포함)"""
+    total, rating_sum = db.query(
+        func.count(), func.coalesce(func.sum(Review.rating), 0.0)
+    ).filter(Review.movie_id == movie_id).one()
+    _, total, avg_rating = review_archive_service.with_archived(
+        db, movie_id, [], total, rating_sum, 0, 0
+    )
+    return {
+        "total_reviews": total,
+        "average_rating": round(avg_rating, 2),
+        "movie_id": movie_id
+    }
+
+
+@api_bp.route('/api/reviews/<int:movie_id>/events', methods=['GET'])
+def review_events(movie_id: int):
+    """
+    영화 리뷰 실시간 이벤트 API (Server-Sent Events)
+    
+    Events:
+        ready: 연결됨 {"movie_id", "version"}
+        review_created: {"movie_id", "review", "stats", "version"}
+        review_deleted: {"movie_id", "review_id", "stats", "version"}
+        resync: 이벤트를 놓쳤음 → 리뷰 목록/통계를 다시 조회 {"movie_id", "version"}
+    
+    이벤트 ID는 영화의 리뷰 버전이며, 브라우저가 재연결하며 보내는 Last-Event-ID보다
+    현재 버전이 크면 resync를 먼저 보냅니다.
+    """
+    try:
+        last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            last_event_id = None
+        
+        # 버전 조회보다 먼저 구독해야 그 사이의 이벤트를 놓치지 않음
+        subscription = review_event_bus.subscribe(movie_id)
+        try:
+            db = read_session()
+            try:
+                version = ReviewVersion.current(db, movie_id)
+            finally:
+                db.close()
+        except Exception:
+            review_event_bus.unsubscribe(subscription)
+            raise
+        
+        response = Response(
+            review_event_bus.stream(subscription, last_event_id, version),
+            mimetype="text/event-stream"
+        )
+        # 스트림을 시작하기 전에 연결이 끊겨도 구독 해제
+        response.call_on_close(lambda: review_event_bus.unsubscribe(subscription))
+        response.headers["Cache-Control"] = "no-cache"
+        # nginx 등 프록시가 이벤트를 모아서 보내지 않도록
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+    except SubscriberLimitError as e:
+        response = jsonify({"error": str(e)})
+        response.headers["Retry-After"] = "30"
+        return response, 503
+    except Exception as e:
+        print(f"[ERROR] 리뷰 이벤트 연결 실패: {str(e)}")
+        return jsonify({"error": f"리뷰 이벤트 연결 실패: {str(e)}"}), 500
+
+
+MOVIE_DETAIL_FIELDS = ("streaming", "reviews", "stats")
+
+_detail_executor: Optional[ThreadPoolExecutor] = None
+_detail_executor_lock = threading.Lock()
+
+
+def _movie_detail_executor() -> ThreadPoolExecutor:
+    """영화 상세 API의 스트리밍 조회용 공용 스레드 풀 (요청마다 만들지 않음, 처음 필요할 때 생성)"""
+    global _detail_executor
+    if _detail_executor is None:
+        with _detail_executor_lock:
+            if _detail_executor is None:
+                _detail_executor = ThreadPoolExecutor(
+                    max_workers=Config.MAX_WORKERS,
+                    thread_name_prefix="movie-detail"
+                )
+    return _detail_executor
+
+
+@on_post_fork
+def _reset_movie_detail_executor():
+    """마스터의 스레드 풀은 fork된 워커에 스레드가 없으므로 새로 생성"""
+    global _detail_executor, _detail_executor_lock
+    _detail_executor = None
+    _detail_executor_lock = threading.Lock()
+
+
+@api_bp.route('/api/movies/<int:movie_id>/detail', methods=['GET'])
+def get_movie_detail(movie_id: int):
+    """
+    영화 상세 모달용 통합 API (스트리밍 정보 + 리뷰 첫 페이지 + 리뷰 통계)
+    
+    Query Parameters:
+        region: 국가 코드 (기본값: KR)
+        fields: 포함할 항목 (쉼표 구분, 기본값: streaming,reviews,stats)
+        limit / offset: 리뷰 페이지 (기본값: 50 / 0)
+        read_after: 리뷰 작성/삭제 응답의 read_after (작성한 리뷰가 보이는 DB에서 조회)
+    
+    스트리밍 정보는 별도 스레드에서 조회하고, 그동안 리뷰 페이지와 통계를
+    윈도 함수(count/avg over())로 한 번의 쿼리에서 조회합니다.
+    ETag는 리뷰 버전과 스트리밍 캐시 항목 버전으로 만들어, 일치하면 리뷰 조회 없이 304를 반환합니다.
+    """
+    try:
+        region = request.args.get('region', 'KR').upper()
+        limit = int(request.args.get('limit', 50))
+        offset = int(request.args.get('offset', 0))
+        fields = request.args.get('fields')
+        fields = {f.strip() for f in fields.split(',')} if fields else set(MOVIE_DETAIL_FIELDS)
+        
+        unknown = fields - set(MOVIE_DETAIL_FIELDS)
+        if unknown:
+            return jsonify({"error": f"알 수 없는 fields: {', '.join(sorted(unknown))}"}), 400
+        
+        timer = stage_timer("movie_detail")
+        result = {"movie_id": movie_id}
+        
+        streaming_future = None
+        if "streaming" in fields:
+            streaming_future = _movie_detail_executor().submit(
+                tmdb_service.get_streaming_providers, movie_id, region
+            )
+        
+        def detail_etag(streaming_version: Optional[int], review_version: Optional[int]) -> str:
+            return make_etag("movie_detail", movie_id, region, tuple(sorted(fields)), limit, offset,
+                             streaming_version, review_version)
+        
+        db = read_session(_read_after()) if fields & {"reviews", "stats"} else None
+        try:
+            review_version = ReviewVersion.current(db, movie_id) if db is not None else None
+            
+            # 스트리밍이 이미 캐시되어 있으면 리뷰 조회 전에 ETag 확인 (PK 조회 1번)
+            entry = (tmdb_service.get_streaming_providers.cache_entry(tmdb_service, movie_id, region)
+                     if streaming_future is not None else None)
+            if streaming_future is None or entry is not None:
+                etag = detail_etag(entry.version if entry is not None else None, review_version)
+                if etag_matches(etag):
+                    return not_modified(etag, "movie_detail", "movie_detail")
+            
+            if db is not None:
+                with timer.stage("db"):
+                    reviews, total, average = _fetch_reviews_with_stats(db, movie_id, limit, offset)
+                if "reviews" in fields:
+                    result["reviews"] = {
+                        "reviews": reviews,
+                        "total": total,
+                        "movie_id": movie_id
+                    }
+                if "stats" in fields:
+                    result["stats"] = {
+                        "total_reviews": total,
+                        "average_rating": round(average, 2),
+                        "movie_id": movie_id
+                    }
+        finally:
+            if db is not None:
+                db.close()
+        
+        streaming_version = None
+        if streaming_future is not None:
+            with timer.stage("streaming"):
+                streaming_info = streaming_future.result()
+            result["streaming"] = _streaming_payload(streaming_info, region)
+            streaming_version = entry_version(
+                tmdb_service.get_streaming_providers.cache_entry(tmdb_service, movie_id, region),
+                streaming_info
+            )
+            # 조회 실패(캐시되지 않은 오류 응답)는 브라우저에 캐시하지 않음
+            if streaming_version is None:
+                return json_response(result)
+        
+        return conditional(json_response(result), "movie_detail", "movie_detail",
+                           detail_etag(streaming_version, review_version))
+    
+    except ValueError:
+        return jsonify({"error": "limit / offset은 정수여야 합니다."}), 400
+    except Exception as e:
+        print(f"[ERROR] 영화 상세 조회 실패: {str(e)}")
+        return jsonify({"error": f"영화 상세 조회 실패: {str(e)}"}), 500
+
+
+def _fetch_reviews_with_stats(db: Session, movie_id: int, limit: int, offset: int):
+    """
+    리뷰 페이지와 전체 개수/평균 별점을 한 번의 쿼리로 조회 (보관된 리뷰 포함)
+    
+    Args:
+        db: 조회 세션 (호출한 쪽에서 닫음)
+    
+    Returns:
+        (리뷰 딕셔너리 리스트, 전체 개수, 평균 별점)
+    """
+    rows = db.execute(
+        select(
+            Review,
+            func.count().over().label("total"),
+            func.sum(Review.rating).over().label("rating_sum")
+        )
+        .where(Review.movie_id == movie_id)
+        .order_by(desc(Review.created_at), desc(Review.id))
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    
+    if rows:
+        total, rating_sum = rows[0].total, float(rows[0].rating_sum or 0.0)
+    elif offset == 0:
+        total, rating_sum = 0, 0.0
+    else:
+        # 마지막 페이지를 넘긴 경우에만 통계를 따로 조회
+        total, rating_sum = db.execute(
+            select(func.count(), func.coalesce(func.sum(Review.rating), 0.0))
+            .where(Review.movie_id == movie_id)
+        ).one()
+    
+    return review_archive_service.with_archived(
+        db, movie_id, [row.Review.to_dict() for row in rows], total, float(rating_sum), offset, limit
+    )
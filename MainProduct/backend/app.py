@@ -4,41 +4,71 @@ Flask 애플리케이션 메인 파일
 from flask import Flask
 from flask_cors import CORS
 from config import Config
-from api import api_bp
+from api import api_bp, metrics_bp, compression_bp, images_bp
 from database import init_db
+from services.warmup import warmup_service
+from services.catalog_snapshot import load_catalog_snapshot
+from services.scheduler import scheduler
+import jobs.periodic  # noqa: F401  (예약 작업 등록)
+from utils.serialization import FastJSONProvider
 
 
-def create_app():
-    """Flask 애플리케이션 팩토리"""
+def create_app(init_database: bool = Config.INIT_DB_ON_STARTUP):
+    """
+    Flask 애플리케이션 팩토리
+    
+    Args:
+        init_database: 데이터베이스 테이블 초기화 여부
+    """
     app = Flask(__name__)
     
     # 설정 로드
     app.config.from_object(Config)
     
+    # JSON 직렬화 (orjson이 있으면 사용)
+    app.json = FastJSONProvider(app)
+    
     # CORS 설정 (React 프론트엔드와 통신)
     CORS(app, resources={
         r"/api/*": {
             "origins": "*",
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"]
+            "allow_headers": ["Content-Type", "Authorization", "X-Read-After"]
         }
     })
     
-    # Blueprint 등록
+    # Blueprint 등록 (after_request 훅은 역순 실행 → 압축이 마지막에 적용되도록 먼저 등록)
+    app.register_blueprint(compression_bp)
     app.register_blueprint(api_bp)
+    app.register_blueprint(images_bp)
+    app.register_blueprint(metrics_bp)
     
     # 데이터베이스 초기화
-    with app.app_context():
-        try:
-            init_db()
-            print("[성공] 데이터베이스 테이블이 초기화되었습니다.")
-        except Exception as e:
-            print(f"[경고] 데이터베이스 초기화 실패: {e}")
+    if init_database:
+        with app.app_context():
+            try:
+                init_db()
+                print("[성공] 데이터베이스 테이블이 초기화되었습니다.")
+            except Exception as e:
+                print(f"[경고] 데이터베이스 초기화 실패: {e}")
+    
+    # 카탈로그 스냅샷 로드 → 워밍업은 스냅샷에 없는 항목만 조회 (preload 모드에서는 마스터의 preload 훅에서 실행)
+    if not Config.APP_PRELOAD:
+        load_catalog_snapshot()
+    
+    # 캐시 워밍업 (preload 모드에서는 마스터의 preload 훅에서 fork 전에 실행)
+    if Config.WARMUP_ON_START and not Config.APP_PRELOAD:
+        warmup_service.start()
+    
+    # 백그라운드 작업 스케줄러 (preload 모드에서는 워커 fork 직후 시작, services/scheduler.py)
+    if Config.SCHEDULER_ENABLED and not Config.APP_PRELOAD:
+        scheduler.start()
     
     return app
 
 
 # Gunicorn이 사용할 수 있도록 app 객체를 모듈 레벨에서 생성
+# (gunicorn.conf.py의 preload_app 모드에서는 마스터에서 1번만 실행되고 워커는 fork로 공유)
 app = create_app()
 
 
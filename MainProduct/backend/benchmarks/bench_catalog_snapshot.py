@@ -0,0 +1,70 @@
+"""
+카탈로그 로드: TMDb JSON 응답에서 프로필 생성 vs 카탈로그 스냅샷(Arrow / Parquet) 읽기
+
+TMDb 응답 형태의 합성 데이터(bench_profile_memory)로 N편의 프로필을 만들고
+- JSON: 응답 파싱 + MovieCore/MovieOverlay 생성 + 해시 특징 계산 (네트워크 시간 제외)
+- arrow / parquet: services/catalog_snapshot.py 스냅샷 읽기 (특징은 파일의 값을 그대로 사용)
+시간과 파일 크기를 비교합니다.
+
+실행: python -m benchmarks.bench_catalog_snapshot [--count 10000] [--rounds 3]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+
+from benchmarks.bench_profile_memory import IMAGE_BASE_URL, make_payload
+from services import feature_hashing
+from services.catalog_snapshot import FORMATS, catalog_snapshot_service
+from services.movie_profile import MovieCore, MovieOverlay
+
+
+def load_json(payloads, lang: str = "ko-KR"):
+    """TMDb 응답(JSON 문자열) → (core, overlay) 목록"""
+    rows = []
+    for payload in payloads:
+        detail = json.loads(payload)
+        core = MovieCore.from_tmdb(detail)
+        overlay = MovieOverlay.from_tmdb(detail, lang, IMAGE_BASE_URL)
+        rows.append((core, replace(overlay, features=feature_hashing.build_features(core, overlay))))
+    return rows
+
+
+def timed(label: str, func, rounds: int, size: str = ""):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    print(f"{label:<10} {statistics.median(samples):7.2f} 초   {size}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 스냅샷 로드 벤치마크")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    payloads = [make_payload(movie_id, rnd) for movie_id in range(1, args.count + 1)]
+    json_bytes = sum(len(payload.encode("utf-8")) for payload in payloads)
+    timed("JSON", lambda: load_json(payloads), args.rounds, f"{json_bytes / 1024 / 1024:.1f} MB (응답 합계)")
+
+    rows = load_json(payloads)
+    now = time.time()
+    with tempfile.TemporaryDirectory() as workdir:
+        for fmt in FORMATS:
+            path = os.path.join(workdir, fmt)
+            manifest = catalog_snapshot_service.save(
+                path, [(core, now) for core, _ in rows], [(core, overlay, now) for core, overlay in rows], fmt
+            )
+            timed(fmt, lambda: catalog_snapshot_service.read(path), args.rounds,
+                  f"{manifest['bytes'] / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
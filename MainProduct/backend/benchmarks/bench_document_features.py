@@ -0,0 +1,71 @@
+"""
+후보 점수 계산: 요청마다 문서 생성/토큰화 vs 프로필과 함께 캐시된 해시 특징
+
+TMDb 응답 형태의 합성 데이터(bench_profile_memory)로 MovieProfile을 만들고
+좋아하는 영화 5편 + 후보 150편의 score_candidate_matrix 시간을 비교합니다.
+- 토큰화: dict 프로필 (캐시된 특징 없음 → 매 요청 build_document + HashingVectorizer)
+- 캐시: MovieProfile (overlay에 저장된 int32 인덱스 + float32 빈도를 이어 붙여 CSR 생성)
+캐시된 특징이 차지하는 메모리(영화 × 언어당)도 함께 출력합니다.
+
+실행: python -m benchmarks.bench_document_features [--count 2000] [--rounds 300]
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from dataclasses import replace
+
+from benchmarks.bench_profile_memory import IMAGE_BASE_URL, make_payload
+from config import Config
+from services import feature_hashing
+from services.movie_profile import MovieCore, MovieOverlay, MovieProfile
+from services.recommendation import RecommendationService
+
+
+def make_profiles(count: int, lang: str = "ko-KR"):
+    """캐시에 들어가는 형태의 MovieProfile (overlay에 해시 특징 포함)"""
+    rnd = random.Random(42)
+    profiles = []
+    for movie_id in range(1, count + 1):
+        detail = json.loads(make_payload(movie_id, rnd))
+        core = MovieCore.from_tmdb(detail)
+        overlay = MovieOverlay.from_tmdb(detail, lang, IMAGE_BASE_URL)
+        profiles.append(MovieProfile(core, replace(overlay, features=feature_hashing.build_features(core, overlay))))
+    return profiles
+
+
+def bench(label: str, favorites, candidates, rounds: int):
+    rnd = random.Random(3)
+    vectorizer, user_vector, _ = RecommendationService.create_tfidf_profile(favorites)
+    samples = []
+    for _ in range(rounds):
+        chosen = rnd.sample(candidates, 150)
+        started = time.perf_counter()
+        RecommendationService.score_candidate_matrix(vectorizer, user_vector, chosen, set())
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    print(f"{label:<22} p50 {statistics.median(samples):6.2f} ms   p95 {samples[int(len(samples) * 0.95)]:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐시된 문서 해시 특징 벤치마크")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+
+    profiles = make_profiles(max(args.count, 160))
+    dicts = [p.to_dict() for p in profiles]
+
+    for mode in ("vocabulary", "hashing"):
+        Config.TFIDF_MODE = mode
+        bench(f"{mode} 토큰화", dicts[:5], dicts[5:], args.rounds)
+        bench(f"{mode} 캐시", profiles[:5], profiles[5:], args.rounds)
+
+    sizes = [p.features.nbytes for p in profiles]
+    print(f"해시 특징 크기: 평균 {statistics.mean(sizes):.0f} B/항목 (특징 {statistics.mean(sizes) / 8:.0f}개), "
+          f"overlay 16384개 기준 {statistics.mean(sizes) * 16384 / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+TF-IDF 어휘 방식 vs 특징 해싱 방식 벤치마크
+
+합성 영화 프로필(Zipf 분포 단어)로 두 가지를 비교합니다.
+1. 요청 1번: 좋아하는 영화 5편으로 프로필 생성 + 후보 150편 점수 계산 (지연 시간, 최대 할당 메모리)
+2. 카탈로그 색인: N편 TF-IDF 행렬 생성 (fit 시간, 남아 있는 어휘/행렬 메모리)
+
+실행: python -m benchmarks.bench_hashing [--catalog 20000] [--rounds 200]
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from config import Config
+from services import feature_hashing
+from services.recommendation import TFIDF_PARAMS, RecommendationService
+
+VOCABULARY_SIZE = 50000
+
+
+def make_profiles(n: int, seed: int = 11):
+    """단어 5만 개(Zipf 분포)에서 뽑은 줄거리/키워드와 인물 이름을 가진 합성 프로필"""
+    rnd = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    words = [f"w{i}" for i in range(VOCABULARY_SIZE)]
+    return [
+        {
+            "id": i,
+            "overview": " ".join(rnd.choices(words, weights=weights, k=60)),
+            "genres": [f"genre{rnd.randint(1, 19)}" for _ in range(3)],
+            "keywords": rnd.choices(words, weights=weights, k=8),
+            "cast": [f"actor{rnd.randint(1, 20000)}" for _ in range(10)],
+            "directors": [f"director{rnd.randint(1, 3000)}"],
+            "writers": [f"writer{rnd.randint(1, 5000)}" for _ in range(2)],
+            "vote_count": rnd.randint(0, 20000),
+        }
+        for i in range(n)
+    ]
+
+
+def request_once(favorites, candidates):
+    vectorizer, user_vector, top_features = RecommendationService.create_tfidf_profile(favorites)
+    RecommendationService.score_candidate_matrix(vectorizer, user_vector, candidates, set())
+    return top_features
+
+
+def bench_request(label: str, profiles, rounds: int):
+    rnd = random.Random(3)
+    samples = []
+    for _ in range(rounds):
+        chosen = rnd.sample(profiles, 155)
+        started = time.perf_counter()
+        request_once(chosen[:5], chosen[5:])
+        samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    request_once(profiles[:5], profiles[5:155])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples.sort()
+    print(f"{label:<10} 요청 p50 {statistics.median(samples):7.2f} ms   "
+          f"p95 {samples[int(len(samples) * 0.95)]:7.2f} ms   최대 할당 {peak / 1024:8.1f} KB")
+
+
+def bench_catalog(label: str, build, documents):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = build(documents)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} 카탈로그 {len(documents)}편 {elapsed:6.2f} s   "
+          f"유지 {current / 1024 / 1024:7.1f} MB   최대 {peak / 1024 / 1024:7.1f} MB")
+    return kept
+
+
+def fit_vocabulary(documents):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(max_features=200000, dtype=np.float32, **TFIDF_PARAMS)
+    matrix = vectorizer.fit_transform(documents)
+    # 새 영화를 색인하려면 이 어휘를 모든 워커가 가지고 있어야 함
+    return vectorizer, matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TF-IDF 어휘 vs 특징 해싱 벤치마크")
+    parser.add_argument("--catalog", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    profiles = make_profiles(max(args.catalog, 155))
+    documents = [RecommendationService.build_document(p) for p in profiles[:args.catalog]]
+
+    for mode in ("vocabulary", "hashing"):
+        Config.TFIDF_MODE = mode
+        request_once(profiles[:5], profiles[5:155])  # import / 첫 호출 비용 제외
+        bench_request(mode, profiles, args.rounds)
+
+    vectorizer, _ = bench_catalog("vocabulary", fit_vocabulary, documents)
+    print(f"{'':<10} 어휘 {len(vectorizer.vocabulary_)}개")
+    del vectorizer
+    bench_catalog("hashing", feature_hashing.tfidf_matrix, documents)
+    print(f"{'':<10} 특징 {Config.HASHING_N_FEATURES}개 (어휘 없음, 코퍼스 IDF 파일 {Config.HASHING_N_FEATURES * 4 / 1024 / 1024:.0f} MB mmap 공유)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+영화 상세 모달 지연 시간 벤치마크 (3번 호출 vs 통합 API 1번)
+
+실행 중인 서버에 대해 모달을 여는 두 가지 방식의 지연 시간을 측정합니다.
+- 3번 호출: /api/streaming/<id>, /api/reviews/<id>, /api/reviews/stats/<id>를 동시에 요청
+  (브라우저와 같이 요청별 연결, 모두 끝날 때까지의 시간)
+- 통합: /api/movies/<id>/detail 1번
+
+실행: python -m benchmarks.bench_movie_detail --base-url http://localhost:8000 [--movie-ids 550,680] [--rounds 50]
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import requests
+
+
+def _get(session: requests.Session, url: str):
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    return response
+
+
+def three_calls(base_url: str, movie_id: int, executor: ThreadPoolExecutor, sessions: List[requests.Session]):
+    urls = [
+        f"{base_url}/api/streaming/{movie_id}?region=KR",
+        f"{base_url}/api/reviews/{movie_id}",
+        f"{base_url}/api/reviews/stats/{movie_id}",
+    ]
+    for future in [executor.submit(_get, s, u) for s, u in zip(sessions, urls)]:
+        future.result()
+
+
+def combined(base_url: str, movie_id: int, session: requests.Session):
+    _get(session, f"{base_url}/api/movies/{movie_id}/detail?region=KR")
+
+
+def measure(func: Callable[[int], None], movie_ids: List[int], rounds: int) -> List[float]:
+    """라운드마다 모든 영화에 대해 실행, 1회당 지연 시간(ms) 목록 반환"""
+    samples = []
+    for _ in range(rounds):
+        for movie_id in movie_ids:
+            started = time.perf_counter()
+            func(movie_id)
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(label: str, samples: List[float]):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{label:<12} p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms   "
+          f"mean {statistics.mean(samples):8.2f} ms   (n={len(samples)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영화 상세 모달 지연 시간 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--movie-ids", default="550,680,13,155,27205")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    movie_ids = [int(x) for x in args.movie_ids.split(",") if x.strip()]
+    sessions = [requests.Session() for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # 캐시 예열 (외부 API 조회 시간 제외, 서버 처리 + 왕복 시간만 비교)
+        for movie_id in movie_ids:
+            three_calls(base_url, movie_id, executor, sessions)
+            combined(base_url, movie_id, sessions[0])
+
+        summarize("3번 호출", measure(lambda m: three_calls(base_url, m, executor, sessions), movie_ids, args.rounds))
+        summarize("통합 API", measure(lambda m: combined(base_url, m, sessions[0]), movie_ids, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+영화 프로필 메모리 사용량 벤치마크 (dict vs MovieProfile)
+
+TMDb 응답 형태의 합성 데이터로 캐시 규모(기본 8192편 × 2개 언어)의 프로필을 만들고,
+응답 원본을 버린 뒤 남아 있는 메모리를 tracemalloc으로 측정합니다.
+- dict: 기존 방식, (영화, 언어)마다 전체 프로필
+- MovieProfile: 영화당 MovieCore 1개 + 언어별 MovieOverlay
+
+실행: python -m benchmarks.bench_profile_memory [--count 8192]
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from services.movie_profile import MovieCore, MovieOverlay
+
+IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w342"
+
+GENRES = ["액션", "모험", "애니메이션", "코미디", "범죄", "다큐멘터리", "드라마", "가족", "판타지",
+          "역사", "공포", "음악", "미스터리", "로맨스", "SF", "TV 영화", "스릴러", "전쟁", "서부"]
+
+
+def make_payload(movie_id: int, rnd: random.Random) -> str:
+    """TMDb /movie/{id}?append_to_response=... 형태의 JSON 문자열 생성"""
+    detail = {
+        "id": movie_id,
+        "title": f"영화 제목 {movie_id}",
+        "original_title": f"Movie Title {movie_id}",
+        "overview": "줄거리 " * rnd.randint(20, 60),
+        "genres": [{"id": i, "name": g} for i, g in enumerate(rnd.sample(GENRES, 3))],
+        "keywords": {"keywords": [{"id": k, "name": f"keyword {k}"} for k in rnd.sample(range(3000), 8)]},
+        "credits": {
+            "cast": [{"id": a, "name": f"Actor Name {a}"} for a in rnd.sample(range(2000), 15)],
+            "crew": [
+                {"id": d, "name": f"Director Name {d}", "job": "Director"} for d in rnd.sample(range(500), 1)
+            ] + [
+                {"id": w, "name": f"Writer Name {w}", "job": "Screenplay"} for w in rnd.sample(range(800), 2)
+            ],
+        },
+        "recommendations": {"results": [{"id": rnd.randint(1, 900000)} for _ in range(20)]},
+        "similar": {"results": [{"id": rnd.randint(1, 900000)} for _ in range(20)]},
+        "external_ids": {"imdb_id": f"tt{movie_id:07d}", "facebook_id": None, "twitter_id": None},
+        "poster_path": f"/poster{movie_id}.jpg",
+        "vote_average": 7.1,
+        "vote_count": rnd.randint(0, 20000),
+        "release_date": "2019-05-30",
+        "runtime": 132,
+    }
+    return json.dumps(detail, ensure_ascii=False)
+
+
+def dict_profiles(payload, langs):
+    """기존 get_movie_details의 dict 정규화 방식 ((영화, 언어)마다 전체 응답 디코딩)"""
+    return [dict_profile(json.loads(payload), lang) for lang in langs]
+
+
+def dict_profile(detail, lang):
+    """이전 get_movie_details와 동일한 dict 프로필"""
+    genres = [g.get("name") for g in (detail.get("genres") or [])]
+    keywords = [k.get("name") for k in ((detail.get("keywords") or {}).get("keywords") or [])]
+    cast = [c.get("name") for c in ((detail.get("credits") or {}).get("cast") or [])[:10]]
+    crew = (detail.get("credits") or {}).get("crew") or []
+    recommendations = ((detail.get("recommendations") or {}).get("results") or [])
+    similars = ((detail.get("similar") or {}).get("results") or [])
+    return {
+        "id": detail.get("id"),
+        "title": detail.get("title") or detail.get("original_title"),
+        "overview": detail.get("overview") or "",
+        "genres": genres,
+        "keywords": keywords,
+        "cast": cast,
+        "directors": [c.get("name") for c in crew if c.get("job") == "Director"],
+        "writers": [c.get("name") for c in crew if c.get("job") in ("Writer", "Screenplay")],
+        "poster": IMAGE_BASE_URL + detail.get("poster_path") if detail.get("poster_path") else None,
+        "vote_average": detail.get("vote_average"),
+        "vote_count": detail.get("vote_count"),
+        "release_date": detail.get("release_date"),
+        "runtime": detail.get("runtime"),
+        "lang": lang,
+        "external_ids": detail.get("external_ids") or {},
+        "candidate_ids": [m.get("id") for m in recommendations[:30] + similars[:30] if m.get("id")],
+    }
+
+
+def slotted_profiles(payload, langs):
+    """현재 캐시 방식: core는 첫 전체 조회에서 1번, 나머지 언어는 overlay만"""
+    core = MovieCore.from_tmdb(json.loads(payload))
+    overlays = [MovieOverlay.from_tmdb(json.loads(payload), lang, IMAGE_BASE_URL) for lang in langs]
+    return [core] + overlays
+
+
+def measure(builder, payloads, langs):
+    """응답 원본을 버린 뒤 캐시 항목들이 유지하는 메모리(바이트) 측정"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    profiles = []
+    for payload in payloads:
+        profiles.append(builder(payload, langs))
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained, profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영화 프로필 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=8192, help="영화 수 (워커당 캐시 크기)")
+    parser.add_argument("--languages", default="ko-KR,en-US", help="언어별 캐시 항목")
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    payloads = [make_payload(i, rnd) for i in range(1, args.count + 1)]
+    langs = args.languages.split(",")
+
+    dict_bytes, _ = measure(dict_profiles, payloads, langs)
+    slot_bytes, _ = measure(slotted_profiles, payloads, langs)
+    entries = args.count * len(langs)
+
+    print(f"캐시 항목 수: {entries} ({args.count}편 × {len(langs)}개 언어)")
+    print(f"dict:         {dict_bytes / 1024 / 1024:8.1f} MiB ({dict_bytes / entries:7.0f} B/항목)")
+    print(f"MovieProfile: {slot_bytes / 1024 / 1024:8.1f} MiB ({slot_bytes / entries:7.0f} B/항목)")
+    print(f"감소율:       {(1 - slot_bytes / dict_bytes) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+응답 직렬화 / 압축 벤치마크
+
+라우트별 응답 형태의 합성 데이터로 다음을 측정합니다.
+- 인코딩 시간: Flask 기본 jsonify 설정(json, ensure_ascii, sort_keys) vs orjson
+- 전송 바이트: 압축 없음 / gzip / brotli (설치된 경우)
+
+실행: python -m benchmarks.bench_serialization [--repeat 200]
+"""
+import argparse
+import gzip
+import json
+import random
+import timeit
+
+from config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+LOGO_BASE_URL = "https://image.tmdb.org/t/p/original"
+POSTER_BASE_URL = "https://image.tmdb.org/t/p/w342"
+PROVIDERS = ["Netflix", "Disney Plus", "Watcha", "wavve", "TVING", "Coupang Play", "Apple TV", "Google Play Movies"]
+GENRES = ["액션", "모험", "코미디", "범죄", "드라마", "판타지", "스릴러", "SF", "로맨스"]
+
+
+def provider_list(rnd: random.Random):
+    return [
+        {
+            "provider_id": rnd.randint(1, 2000),
+            "provider_name": name,
+            "logo_path": f"{LOGO_BASE_URL}/logo{rnd.randint(1, 9999)}.jpg",
+            "display_priority": rnd.randint(0, 50),
+        }
+        for name in rnd.sample(PROVIDERS, rnd.randint(0, 4))
+    ]
+
+
+def streaming_info(movie_id: int, rnd: random.Random):
+    return {
+        "movie_id": movie_id,
+        "region": "KR",
+        "link": f"https://www.themoviedb.org/movie/{movie_id}/watch?locale=KR",
+        "flatrate": provider_list(rnd),
+        "rent": provider_list(rnd),
+        "buy": provider_list(rnd),
+        "free": [],
+        "ads": [],
+    }
+
+
+def analyze_payload(rnd: random.Random):
+    recommendations = []
+    for i in range(Config.TOP_N):
+        recommendations.append({
+            "id": 1000 + i,
+            "title": f"추천 영화 {i}",
+            "year": "2019",
+            "genres": rnd.sample(GENRES, 3),
+            "poster": f"{POSTER_BASE_URL}/poster{i}.jpg",
+            "score": round(rnd.random(), 4),
+            "overview": "영화 줄거리 문장입니다. " * rnd.randint(8, 25),
+            "vote_average": 7.3,
+            "vote_count": rnd.randint(100, 20000),
+            "release_date": "2019-05-30",
+            "runtime": 132,
+            "omdb": {
+                "imdbRating": "8.5",
+                "Metascore": "96",
+                "Awards": "Won 4 Oscars. 300 wins & 400 nominations total",
+                "BoxOffice": "$53,369,749",
+                "Ratings": [
+                    {"Source": "Internet Movie Database", "Value": "8.5/10"},
+                    {"Source": "Rotten Tomatoes", "Value": "99%"},
+                ],
+            } if i < Config.ENRICH_TOP else None,
+        })
+    return {
+        "favorites": [{"id": i, "title": f"좋아하는 영화 {i}", "poster": f"{POSTER_BASE_URL}/f{i}.jpg"} for i in range(5)],
+        "top_features": [f"keyword {k}" for k in range(20)],
+        "top_genres": [[g, rnd.randint(1, 5)] for g in GENRES[:5]],
+        "top_directors": [[f"Director {d}", 1] for d in range(5)],
+        "top_actors": [[f"Actor {a}", 2] for a in range(5)],
+        "recommendations": recommendations,
+    }
+
+
+def discover_payload(rnd: random.Random):
+    return {
+        "items": [
+            {
+                "id": i, "title": f"영화 {i}", "year": "2021",
+                "poster": f"{POSTER_BASE_URL}/d{i}.jpg", "source": "TMDb",
+                "vote_average": 6.8, "vote_count": rnd.randint(10, 9000),
+                "overview": "줄거리 " * rnd.randint(20, 60),
+            }
+            for i in range(20)
+        ],
+        "total": 20,
+        "page": 1,
+    }
+
+
+def route_payloads():
+    rnd = random.Random(42)
+    bulk = [streaming_info(i, rnd) for i in range(50)]
+    return {
+        "/api/analyze": analyze_payload(rnd),
+        "/api/streaming/bulk": {"items": bulk, "total": len(bulk), "region": "KR"},
+        "/api/streaming/<id>": streaming_info(1, rnd),
+        "/api/discover": discover_payload(rnd),
+    }
+
+
+def flask_default_dumps(obj) -> bytes:
+    """Flask DefaultJSONProvider (DEBUG=False) 설정과 동일"""
+    return json.dumps(obj, ensure_ascii=True, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def measure(func, obj, repeat: int) -> float:
+    """1회 평균 소요 시간 (us)"""
+    return min(timeit.repeat(lambda: func(obj), number=repeat, repeat=3)) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 / 압축 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    encoders = [("json(flask)", flask_default_dumps)]
+    if orjson is not None:
+        encoders.append(("orjson", lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)))
+
+    print(f"{'route':<22} {'encoder':<12} {'encode(us)':>11} {'raw(B)':>9} {'gzip(B)':>9} "
+          f"{'gzip(us)':>9} {'br(B)':>9} {'br(us)':>9}")
+    for route, payload in route_payloads().items():
+        for name, encode in encoders:
+            body = encode(payload)
+            gz = gzip.compress(body, compresslevel=Config.GZIP_LEVEL)
+            gz_us = measure(lambda b: gzip.compress(b, compresslevel=Config.GZIP_LEVEL), body, args.repeat // 4 or 1)
+            if brotli is not None:
+                br = len(brotli.compress(body, quality=Config.BROTLI_LEVEL))
+                br_us = f"{measure(lambda b: brotli.compress(b, quality=Config.BROTLI_LEVEL), body, args.repeat // 4 or 1):9.1f}"
+            else:
+                br, br_us = "-", "-"
+            print(f"{route:<22} {name:<12} {measure(encode, payload, args.repeat):11.1f} {len(body):9d} "
+                  f"{len(gz):9d} {gz_us:9.1f} {br:>9} {br_us:>9}")
+
+
+if __name__ == "__main__":
+    main()
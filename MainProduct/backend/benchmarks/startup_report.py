@@ -0,0 +1,125 @@
+"""
+시작 시간 / 워커 메모리 리포트
+
+1) import 시간: 새 파이썬 프로세스에서 `-X importtime`으로 모듈별 누적 import 시간 측정
+2) 첫 추천 요청 시 지연 로드되는 모듈(numpy/scipy/scikit-learn) 비용 측정
+3) 실행 중인 gunicorn 워커별 RSS / PSS / 공유 메모리 (/proc/<pid>/smaps_rollup, Linux 전용)
+
+실행:
+    python -m benchmarks.startup_report                  # import 시간만
+    python -m benchmarks.startup_report --master <pid>   # gunicorn 마스터 PID의 워커 메모리 포함
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_python(code: str) -> Tuple[str, str]:
+    env = dict(os.environ)
+    # 리포트 실행에 실제 DB가 필요하지 않도록 기본값은 메모리 SQLite
+    env.setdefault("DATABASE_URL", "sqlite://")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout, result.stderr
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """-X importtime 출력에서 모듈별 누적 import 시간(us) 파싱"""
+    _, stderr = _run_python(code)
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative_us.strip())
+        except ValueError:
+            continue
+    return times
+
+
+def report_imports():
+    print("== import 시간 ==")
+    for label, code in [
+        ("services", "import services"),
+        ("app (create_app 포함)", "import app"),
+    ]:
+        times = import_times(code)
+        top_name = code.split()[-1]
+        total = times.get(top_name, 0)
+        heavy = {name: us for name, us in times.items() if name in ("numpy", "scipy", "sklearn", "sqlalchemy", "flask", "requests")}
+        print(f"{label:<24} {total / 1000:8.1f} ms")
+        for name, us in sorted(heavy.items(), key=lambda x: -x[1]):
+            print(f"    {name:<20} {us / 1000:8.1f} ms")
+
+    stdout, _ = _run_python(
+        "import time, services\n"
+        "from services.recommendation import recommendation_service, warm_imports\n"
+        "t = time.perf_counter(); warm_imports(); print((time.perf_counter() - t) * 1000)"
+    )
+    print(f"{'첫 추천 시 지연 로드':<24} {float(stdout.strip().splitlines()[-1]):8.1f} ms  (preload 모드에서는 마스터에서 1번)")
+
+
+def _children(pid: int) -> List[int]:
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # 두 번째 필드(comm)에 공백이 있을 수 있으므로 마지막 ')' 이후로 파싱
+                fields = f.read().rsplit(")", 1)[1].split()
+            if int(fields[1]) == pid:
+                children.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return sorted(children)
+
+
+def _smaps_rollup(pid: int) -> Dict[str, int]:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[0].endswith(":"):
+                values[parts[0][:-1]] = int(parts[1])
+    return values
+
+
+def report_workers(master_pid: int):
+    print(f"\n== gunicorn 워커 메모리 (master={master_pid}) ==")
+    print(f"{'pid':>8} {'RSS(MiB)':>10} {'PSS(MiB)':>10} {'공유(MiB)':>10} {'전용(MiB)':>10}")
+    total_rss = total_pss = 0
+    for pid in [master_pid] + _children(master_pid):
+        try:
+            m = _smaps_rollup(pid)
+        except OSError:
+            continue
+        shared = m.get("Shared_Clean", 0) + m.get("Shared_Dirty", 0)
+        private = m.get("Private_Clean", 0) + m.get("Private_Dirty", 0)
+        total_rss += m.get("Rss", 0)
+        total_pss += m.get("Pss", 0)
+        label = f"{pid}{'*' if pid == master_pid else ''}"
+        print(f"{label:>8} {m.get('Rss', 0) / 1024:10.1f} {m.get('Pss', 0) / 1024:10.1f} "
+              f"{shared / 1024:10.1f} {private / 1024:10.1f}")
+    print(f"{'합계':>8} {total_rss / 1024:10.1f} {total_pss / 1024:10.1f}  (* = master, PSS 합계가 실제 사용량)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 / 워커 메모리 리포트")
+    parser.add_argument("--master", type=int, help="gunicorn 마스터 PID")
+    args = parser.parse_args()
+
+    report_imports()
+    if args.master:
+        report_workers(args.master)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,41 @@ class Config:
     ENRICH_TOP = int(os.getenv("ENRICH_TOP", "10"))
     MAX_WORKERS = int(os.getenv("MAX_WORKERS", "8"))
     
+    # TF-IDF 벡터화 방식: vocabulary (요청별 어휘) / hashing (특징 해싱, 어휘 dict 없음)
+    # 해싱 특징 수, 코퍼스 IDF 파일(jobs/hashing_idf.py, 없으면 좋아하는 영화 기준 IDF), 특징 이름 역조회 스케치 크기
+    TFIDF_MODE = os.getenv("TFIDF_MODE", "vocabulary").lower()
+    HASHING_N_FEATURES = int(os.getenv("HASHING_N_FEATURES", str(2 ** 20)))
+    HASHING_IDF_PATH = os.getenv("HASHING_IDF_PATH", "hashing_idf.npy")
+    HASHING_NAME_SKETCH_SIZE = int(os.getenv("HASHING_NAME_SKETCH_SIZE", "65536"))
+    
+    # 다양성 재정렬 (MMR): λ=1이면 점수순, 장르/감독별 최대 추천 수 (0이면 제한 없음)
+    MMR_LAMBDA = float(os.getenv("MMR_LAMBDA", "0.7"))
+    MMR_MAX_PER_GENRE = int(os.getenv("MMR_MAX_PER_GENRE", "10"))
+    MMR_MAX_PER_DIRECTOR = int(os.getenv("MMR_MAX_PER_DIRECTOR", "2"))
+    
+    # 일괄 분석 (/api/analyze/batch): 최대 목록 수, 이보다 많으면 NDJSON 스트리밍, 스트리밍 청크 크기
+    BATCH_ANALYZE_MAX_LISTS = int(os.getenv("BATCH_ANALYZE_MAX_LISTS", "500"))
+    BATCH_ANALYZE_STREAM_THRESHOLD = int(os.getenv("BATCH_ANALYZE_STREAM_THRESHOLD", "50"))
+    BATCH_ANALYZE_CHUNK = int(os.getenv("BATCH_ANALYZE_CHUNK", "100"))
+    
+    # 저장된 취향 프로필당 최대 좋아하는 영화 수
+    TASTE_PROFILE_MAX_FAVORITES = int(os.getenv("TASTE_PROFILE_MAX_FAVORITES", "50"))
+    
+    # 협업 필터링 (jobs/train_cf.py로 학습한 모델, 없으면 콘텐츠 기반 점수만 사용)
+    CF_MODEL_DIR = os.getenv("CF_MODEL_DIR", "cf_model")
+    CF_WEIGHT = float(os.getenv("CF_WEIGHT", "0.3"))
+    CF_FACTORS = int(os.getenv("CF_FACTORS", "32"))
+    CF_ITERATIONS = int(os.getenv("CF_ITERATIONS", "15"))
+    CF_REGULARIZATION = float(os.getenv("CF_REGULARIZATION", "0.1"))
+    CF_ALPHA = float(os.getenv("CF_ALPHA", "10"))
+    CF_RELOAD_INTERVAL = float(os.getenv("CF_RELOAD_INTERVAL", "60"))
+    CF_EXCLUDED_AUTHORS = [
+        name.strip() for name in os.getenv("CF_EXCLUDED_AUTHORS", "익명").split(",") if name.strip()
+    ]
+    
+    # 시작 시 데이터베이스 스키마 초기화 (gunicorn preload 모드에서는 마스터에서 1번만 실행)
+    INIT_DB_ON_STARTUP = os.getenv("INIT_DB_ON_STARTUP", "True").lower() == "true"
+    
     # Flask 설정
     HOST = "0.0.0.0"
     PORT = int(os.getenv("PORT", "8000"))
@@ -32,3 +67,132 @@ class Config:
     
     # 요청 타임아웃 (초)
     REQUEST_TIMEOUT = 6
+    
+    # 외부 API 속도 제한 (초당 요청 수, 전체 워커 합계 기준) 및 재시도/서킷 브레이커
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+    TMDB_RATE_LIMIT = float(os.getenv("TMDB_RATE_LIMIT", "40"))
+    OMDB_RATE_LIMIT = float(os.getenv("OMDB_RATE_LIMIT", "10"))
+    UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "3"))
+    UPSTREAM_BACKOFF_BASE = float(os.getenv("UPSTREAM_BACKOFF_BASE", "0.25"))
+    UPSTREAM_BACKOFF_CAP = float(os.getenv("UPSTREAM_BACKOFF_CAP", "4"))
+    UPSTREAM_MAX_WAIT = float(os.getenv("UPSTREAM_MAX_WAIT", "10"))
+    UPSTREAM_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "5"))
+    UPSTREAM_RESET_TIMEOUT = float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30"))
+    UPSTREAM_FALLBACK_SIZE = int(os.getenv("UPSTREAM_FALLBACK_SIZE", "512"))
+    
+    # 응답 직렬화 / 압축 (JSON_BACKEND: auto=orjson이 있으면 사용, json=표준 라이브러리)
+    JSON_BACKEND = os.getenv("JSON_BACKEND", "auto").lower()
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+    GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+    BROTLI_LEVEL = int(os.getenv("BROTLI_LEVEL", "5"))
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2048"))
+    
+    # 브라우저 캐시 (외부 API 기반 응답의 Cache-Control max-age / stale-while-revalidate, 초)
+    HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "300"))
+    HTTP_CACHE_SWR = int(os.getenv("HTTP_CACHE_SWR", "3600"))
+    
+    # TMDb 캐시 TTL (초): soft TTL 이후에는 기존 값을 반환하면서 백그라운드 갱신,
+    # hard TTL 이후에는 요청이 직접 갱신 (갱신 실패 시 기존 값 유지)
+    CACHE_DETAILS_SOFT_TTL = float(os.getenv("CACHE_DETAILS_SOFT_TTL", "86400"))
+    CACHE_DETAILS_HARD_TTL = float(os.getenv("CACHE_DETAILS_HARD_TTL", "604800"))
+    CACHE_SEARCH_SOFT_TTL = float(os.getenv("CACHE_SEARCH_SOFT_TTL", "21600"))
+    CACHE_SEARCH_HARD_TTL = float(os.getenv("CACHE_SEARCH_HARD_TTL", "259200"))
+    CACHE_DISCOVER_SOFT_TTL = float(os.getenv("CACHE_DISCOVER_SOFT_TTL", "900"))
+    CACHE_DISCOVER_HARD_TTL = float(os.getenv("CACHE_DISCOVER_HARD_TTL", "21600"))
+    CACHE_STREAMING_SOFT_TTL = float(os.getenv("CACHE_STREAMING_SOFT_TTL", "21600"))
+    CACHE_STREAMING_HARD_TTL = float(os.getenv("CACHE_STREAMING_HARD_TTL", "172800"))
+    CACHE_REFRESH_WORKERS = int(os.getenv("CACHE_REFRESH_WORKERS", "4"))
+    
+    # 네거티브 캐시 (찾지 못한 제목 / 404 영화 ID를 DB에 TTL과 함께 저장, 워커별 Bloom 필터로 먼저 확인)
+    # TTL(초), Bloom 필터 용량/오탐률, 다른 워커 기록 가져오기 / 만료 항목 정리 후 필터 재생성 주기(초)
+    NEGATIVE_CACHE_ENABLED = os.getenv("NEGATIVE_CACHE_ENABLED", "True").lower() == "true"
+    NEGATIVE_CACHE_TITLE_TTL = float(os.getenv("NEGATIVE_CACHE_TITLE_TTL", "86400"))
+    NEGATIVE_CACHE_MOVIE_TTL = float(os.getenv("NEGATIVE_CACHE_MOVIE_TTL", "604800"))
+    NEGATIVE_CACHE_CAPACITY = int(os.getenv("NEGATIVE_CACHE_CAPACITY", "200000"))
+    NEGATIVE_CACHE_ERROR_RATE = float(os.getenv("NEGATIVE_CACHE_ERROR_RATE", "0.01"))
+    NEGATIVE_CACHE_SYNC_INTERVAL = float(os.getenv("NEGATIVE_CACHE_SYNC_INTERVAL", "30"))
+    NEGATIVE_CACHE_REBUILD_INTERVAL = float(os.getenv("NEGATIVE_CACHE_REBUILD_INTERVAL", "3600"))
+    
+    # 백그라운드 작업 스케줄러 (services/scheduler.py, 작업 목록은 jobs/periodic.py)
+    # 웹 워커 안에서 실행 여부 (사이드카로 실행하면 False), 작업별 주기 재정의 "이름=초,..." (0이면 끔),
+    # 주기에 더할 무작위 지연 비율, 프로세스당 동시 실행 작업 수, 실행 기록 보관 일수,
+    # PostgreSQL이 아닐 때 리더 선출용 잠금 파일 디렉토리
+    SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "False").lower() == "true"
+    SCHEDULER_INTERVALS = {
+        name.strip(): float(seconds)
+        for name, seconds in (
+            item.split("=", 1) for item in os.getenv("SCHEDULER_INTERVALS", "").split(",") if "=" in item
+        )
+    }
+    SCHEDULER_JITTER = float(os.getenv("SCHEDULER_JITTER", "0.1"))
+    SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", "2"))
+    SCHEDULER_HISTORY_DAYS = int(os.getenv("SCHEDULER_HISTORY_DAYS", "30"))
+    SCHEDULER_LOCK_DIR = os.getenv("SCHEDULER_LOCK_DIR", "/tmp/movie-reco-scheduler")
+    
+    # 조회 전용 DB 복제본 (URL/가중치 쉼표 구분, 허용 복제 지연, 상태 확인 주기, 쓰기 후 primary 조회 시간)
+    DATABASE_REPLICA_URLS = [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+    DATABASE_REPLICA_WEIGHTS = [float(w) for w in os.getenv("DATABASE_REPLICA_WEIGHTS", "").split(",") if w.strip()]
+    DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "5"))
+    DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5"))
+    DB_READ_YOUR_WRITES_WINDOW = float(os.getenv("DB_READ_YOUR_WRITES_WINDOW", "10"))
+    
+    # 리뷰 실시간 이벤트 SSE (워커당 최대 연결 수, 연결당 대기 이벤트 수, keep-alive 주기/연결 최대 유지 시간(초),
+    # 브라우저 재연결 대기(ms), 워커 간 전달에 PostgreSQL LISTEN/NOTIFY 사용)
+    REVIEW_EVENTS_MAX_SUBSCRIBERS = int(os.getenv("REVIEW_EVENTS_MAX_SUBSCRIBERS", "48"))
+    REVIEW_EVENTS_QUEUE_SIZE = int(os.getenv("REVIEW_EVENTS_QUEUE_SIZE", "32"))
+    REVIEW_EVENTS_HEARTBEAT = float(os.getenv("REVIEW_EVENTS_HEARTBEAT", "15"))
+    REVIEW_EVENTS_MAX_AGE = float(os.getenv("REVIEW_EVENTS_MAX_AGE", "300"))
+    REVIEW_EVENTS_RETRY_MS = int(os.getenv("REVIEW_EVENTS_RETRY_MS", "3000"))
+    REVIEW_EVENTS_PG_BRIDGE = os.getenv("REVIEW_EVENTS_PG_BRIDGE", "True").lower() == "true"
+    
+    # 리뷰 저장소 (PostgreSQL 월별 파티션 사용/미리 만들 달 수, 오래된 리뷰 Parquet 보관 디렉토리/기준 개월 수)
+    REVIEW_PARTITIONING = os.getenv("REVIEW_PARTITIONING", "True").lower() == "true"
+    REVIEW_PARTITION_MONTHS_AHEAD = int(os.getenv("REVIEW_PARTITION_MONTHS_AHEAD", "3"))
+    REVIEW_ARCHIVE_DIR = os.getenv("REVIEW_ARCHIVE_DIR", "review_archive")
+    REVIEW_ARCHIVE_AFTER_MONTHS = int(os.getenv("REVIEW_ARCHIVE_AFTER_MONTHS", "24"))
+    
+    # 리뷰 검색 최대 페이지 크기
+    REVIEW_SEARCH_MAX_LIMIT = int(os.getenv("REVIEW_SEARCH_MAX_LIMIT", "100"))
+    
+    # 이미지 프록시 (포스터/로고 크기 변환 + 디스크 캐시)
+    IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "/tmp/movie-reco-images")
+    IMAGE_CACHE_MAX_MB = int(os.getenv("IMAGE_CACHE_MAX_MB", "1024"))
+    IMAGE_CACHE_PRUNE_EVERY = int(os.getenv("IMAGE_CACHE_PRUNE_EVERY", "500"))
+    IMAGE_WIDTHS = [int(w) for w in os.getenv("IMAGE_WIDTHS", "64,92,185,342,500").split(",") if w.strip()]
+    IMAGE_FETCH_CONCURRENCY = int(os.getenv("IMAGE_FETCH_CONCURRENCY", "8"))
+    IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+    IMAGE_AVIF_QUALITY = int(os.getenv("IMAGE_AVIF_QUALITY", "55"))
+    IMAGE_JPEG_QUALITY = int(os.getenv("IMAGE_JPEG_QUALITY", "82"))
+    IMAGE_LOGO_BUNDLE_MAX = int(os.getenv("IMAGE_LOGO_BUNDLE_MAX", "30"))
+    # analyze/discover 응답의 포스터 프리페치 (스레드 수 0이면 끔, 대기열 초과분은 건너뜀)
+    IMAGE_PREFETCH_WORKERS = int(os.getenv("IMAGE_PREFETCH_WORKERS", "2"))
+    IMAGE_PREFETCH_QUEUE = int(os.getenv("IMAGE_PREFETCH_QUEUE", "200"))
+    IMAGE_PREFETCH_WIDTHS = [int(w) for w in os.getenv("IMAGE_PREFETCH_WIDTHS", "185,342").split(",") if w.strip()]
+    IMAGE_PREFETCH_FORMAT = os.getenv("IMAGE_PREFETCH_FORMAT", "webp")
+    
+    # 메트릭 (gunicorn 워커 간 집계용 스냅샷 디렉토리, 비어 있으면 프로세스 단위)
+    METRICS_DIR = os.getenv("METRICS_DIR", "")
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+    
+    # 캐시 워밍업 (핫 키 로그 디렉토리, 비어 있으면 기록 안 함)
+    WARMUP_LOG_DIR = os.getenv("WARMUP_LOG_DIR", "")
+    WARMUP_LOG_MAX_KEYS = int(os.getenv("WARMUP_LOG_MAX_KEYS", "2000"))
+    WARMUP_FLUSH_INTERVAL = float(os.getenv("WARMUP_FLUSH_INTERVAL", "30"))
+    WARMUP_DECAY = float(os.getenv("WARMUP_DECAY", "0.98"))
+    WARMUP_ON_START = os.getenv("WARMUP_ON_START", "False").lower() == "true"
+    WARMUP_TOP_N = int(os.getenv("WARMUP_TOP_N", "200"))
+    WARMUP_POPULAR_PAGES = int(os.getenv("WARMUP_POPULAR_PAGES", "1"))
+    WARMUP_CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "4"))
+    WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "120"))
+    # POST /api/warmup 인증 토큰 (Authorization: Bearer <토큰>, 비워 두면 같은 호스트(loopback)에서만 허용)
+    WARMUP_TOKEN = os.getenv("WARMUP_TOKEN", "")
+    
+    # 카탈로그 스냅샷 (정규화된 영화 프로필 + 해시 특징을 Arrow/Parquet으로 저장, services/catalog_snapshot.py)
+    # 시작 시 캐시에 로드할 스냅샷 디렉토리 (비어 있으면 사용 안 함, 예약 작업 catalog_snapshot이 여기에 저장),
+    # 저장 형식 (arrow: 압축 없음, mmap으로 바로 로드 / parquet: zstd 압축, 전송/보관용)
+    CATALOG_SNAPSHOT_PATH = os.getenv("CATALOG_SNAPSHOT_PATH", "")
+    CATALOG_SNAPSHOT_FORMAT = os.getenv("CATALOG_SNAPSHOT_FORMAT", "arrow").lower()
+    CATALOG_SNAPSHOT_ON_START = os.getenv("CATALOG_SNAPSHOT_ON_START", "True").lower() == "true"
+    
+    # gunicorn preload 모드 여부 (gunicorn.conf.py에서 설정)
+    APP_PRELOAD = os.getenv("APP_PRELOAD", "False").lower() == "true"
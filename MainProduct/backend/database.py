@@ -2,9 +2,16 @@
 데이터베이스 설정
 """
 import os
+import time
+from typing import Optional
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from config import Config
+from utils.db_router import ReplicaRouter
+from utils.lifecycle import on_post_fork
 
 # 환경 변수에서 데이터베이스 URL 가져오기
 DATABASE_URL = os.getenv(
@@ -15,6 +22,24 @@ DATABASE_URL = os.getenv(
 # SQLAlchemy 엔진 생성
 engine = create_engine(DATABASE_URL, echo=True)
 
+# 조회 전용 복제본 라우터 (DATABASE_REPLICA_URLS가 비어 있으면 항상 primary)
+replica_router = ReplicaRouter(
+    engine,
+    Config.DATABASE_REPLICA_URLS,
+    Config.DATABASE_REPLICA_WEIGHTS,
+    max_lag=Config.DB_REPLICA_MAX_LAG,
+    check_interval=Config.DB_REPLICA_CHECK_INTERVAL,
+    read_your_writes_window=Config.DB_READ_YOUR_WRITES_WINDOW
+)
+
+
+@on_post_fork
+def _dispose_inherited_pool():
+    """fork 전 마스터가 연 커넥션을 워커가 공유하지 않도록 풀 초기화"""
+    engine.dispose(close=False)
+    replica_router.reset()
+
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -31,7 +56,39 @@ def get_db():
         db.close()
 
 
+def read_session(read_after: Optional[float] = None) -> Session:
+    """
+    조회 전용 세션 (복제본 또는 primary)
+    
+    Args:
+        read_after: 쓰기 응답의 read_after (그 쓰기가 반영된 DB에서만 조회)
+    """
+    return SessionLocal(bind=replica_router.choose(read_after))
+
+
+def write_token() -> float:
+    """쓰기 커밋 후 응답에 넣을 read_after 값 (커밋 시각)"""
+    return round(time.time(), 3)
+
+
 def init_db():
     """데이터베이스 테이블 초기화"""
     from models.review import Review
+    from models.review_version import ReviewVersion
+    from models.taste_profile import TasteProfile
+    from models.review_archive import ReviewArchive, ReviewArchiveStat
+    from models.negative_result import NegativeResult
+    from models.job_run import JobRun
+    from services.review_partitions import review_partition_service
+    from services.review_search import review_search_service
+    
+    # 새 PostgreSQL DB면 reviews를 월별 파티션 테이블로 먼저 생성
+    with engine.begin() as conn:
+        review_partition_service.before_create_all(conn)
+    
     Base.metadata.create_all(bind=engine)
+    
+    # 리뷰 검색 컬럼/인덱스, 앞으로의 월 파티션 (create_all은 기존 테이블에 컬럼을 추가하지 않음)
+    with engine.begin() as conn:
+        review_search_service.ensure_schema(conn)
+        review_partition_service.after_create_all(conn)
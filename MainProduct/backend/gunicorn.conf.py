@@ -0,0 +1,58 @@
+"""
+Gunicorn 설정
+
+실행: gunicorn -c gunicorn.conf.py app:app
+
+preload_app 모드(기본값)에서는 마스터가 앱을 한 번만 로드합니다.
+- DB 스키마 초기화(init_db)가 워커마다가 아니라 마스터에서 1번만 실행
+- 무거운 모듈/읽기 전용 데이터는 워커 fork 전에 로드되어 copy-on-write로 공유 (utils/lifecycle.py)
+"""
+import os
+import shutil
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+
+# 스레드 워커: 리뷰 실시간 이벤트(SSE) 연결이 대기하는 동안 같은 워커의 다른 스레드가 요청 처리
+# (워커당 SSE 연결은 REVIEW_EVENTS_MAX_SUBSCRIBERS개까지, threads보다 작게 유지)
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "64"))
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+
+# 앱(Config)이 워커 수를 알 수 있도록 환경 변수로 전달 (외부 API 속도 제한 분배)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# 앱이 preload 모드인지 알 수 있도록 전달 (캐시 워밍업을 마스터에서 실행, services/warmup.py)
+os.environ["APP_PRELOAD"] = str(preload_app)
+
+# 캐시 워밍업용 핫 키 로그 (재시작 후에도 유지되도록 metrics와 별도 디렉토리)
+os.environ.setdefault("WARMUP_LOG_DIR", "/tmp/movie-reco-warmup")
+
+# 워커 간 메트릭 집계 디렉토리 (utils/metrics.py)
+os.environ.setdefault("METRICS_DIR", "/tmp/movie-reco-metrics")
+
+
+def on_starting(server):
+    """마스터 시작 시 이전 실행의 메트릭 스냅샷 정리"""
+    metrics_dir = os.environ["METRICS_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    """워커 fork 직전 (마스터): 공유할 읽기 전용 상태 로드"""
+    if preload_app:
+        from utils.lifecycle import run_preload
+        run_preload()
+
+
+def post_fork(server, worker):
+    """워커 fork 직후: 프로세스별 자원 재생성"""
+    from utils.lifecycle import run_post_fork
+    run_post_fork()
+
+
+def child_exit(server, worker):
+    """워커 종료 후 (마스터): 종료된 워커의 메트릭 스냅샷 삭제 (합산에서 제외)"""
+    from utils.metrics import metrics
+    metrics.remove_snapshot(worker.pid)
@@ -0,0 +1,3 @@
+"""
+오프라인/배치 작업 패키지
+"""
@@ -0,0 +1,475 @@
+"""
+대량 추천 사전 계산 배치 작업
+
+좋아하는 영화 목록 파일(NDJSON)을 스트리밍으로 읽어 목록별 추천 결과를 미리 계산합니다.
+
+1단계 (prepare): 제목 → TMDb ID 변환, 프로필 조회, 카탈로그 TF-IDF 행렬 생성
+    작업 디렉토리에 CSR 배열(.npy)로 저장 → 워커 프로세스들이 mmap으로 공유
+2단계 (score): ProcessPoolExecutor로 배치 단위 벡터화 점수 계산,
+    결과를 NDJSON(또는 Parquet)으로 스트리밍 저장, 배치마다 체크포인트 기록
+
+입력 형식 (한 줄에 하나):
+    {"id": "user-1", "titles": ["기생충", "인셉션"]}
+    {"id": "user-2", "movie_ids": [496243, 27205]}
+
+사용법:
+    python -m jobs.batch_recommend --input lists.ndjson --output recs.ndjson --workdir ./batch_work
+    python -m jobs.batch_recommend ... --resume        # 중단된 작업 이어서 실행
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from config import Config
+from services.recommendation import RecommendationService
+
+
+CATALOG_DIR = "catalog"
+RESOLVED_FILE = "resolved.ndjson"
+CHECKPOINT_FILE = "checkpoint.json"
+MANIFEST_FILE = "manifest.json"
+
+
+def _read_ndjson(path: str, skip: int = 0) -> Iterator[Dict[str, Any]]:
+    """NDJSON 파일을 한 줄씩 읽기 (앞의 skip개 줄은 건너뜀)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f):
+            if line_no < skip:
+                continue
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _chunks(iterable, size: int) -> Iterator[List[Any]]:
+    """이터러블을 size개씩 묶어서 반환"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    """임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# 1단계: 카탈로그 준비
+# ---------------------------------------------------------------------------
+
+class CatalogBuilder:
+    """좋아하는 영화 목록으로부터 공유 카탈로그 행렬을 만드는 클래스"""
+
+    def __init__(self, workdir: str, lang: str, chunk_size: int):
+        self.workdir = workdir
+        self.lang = lang
+        self.chunk_size = chunk_size
+        # movie_id → (문서, 투표 수, 후보 ID 리스트)
+        self.catalog: Dict[int, Tuple[str, int, List[int]]] = {}
+
+    def _resolve_ids(self, entry: Dict[str, Any]) -> List[int]:
+        """입력 항목의 제목/ID를 TMDb ID 리스트로 변환"""
+        from services.tmdb_service import tmdb_service
+
+        if entry.get("movie_ids"):
+            return [int(movie_id) for movie_id in entry["movie_ids"]]
+
+        resolved = []
+        for title in entry.get("titles") or []:
+            try:
+                movie = tmdb_service.search_movie(title, self.lang)
+                if movie and movie.get("id"):
+                    resolved.append(movie["id"])
+            except Exception:
+                continue
+        return resolved
+
+    def seed_from_snapshot(self, path: str) -> int:
+        """
+        카탈로그 스냅샷(services/catalog_snapshot.py)의 영화로 카탈로그 채우기
+
+        스냅샷에 있는 영화는 TMDb를 다시 조회하지 않고, 없는 영화만 준비 단계에서 조회합니다.
+
+        Returns:
+            추가된 영화 수
+        """
+        from services.catalog_snapshot import catalog_snapshot_service
+
+        added = 0
+        for profile in catalog_snapshot_service.profiles(path, self.lang):
+            if profile.id not in self.catalog:
+                self.catalog[profile.id] = (
+                    RecommendationService.build_document(profile),
+                    profile.get("vote_count") or 0,
+                    list(profile.get("candidate_ids") or []),
+                )
+                added += 1
+        print(f"[배치] 스냅샷에서 카탈로그 {added}편 로드: {path}")
+        return added
+
+    def _fetch_missing(self, movie_ids: List[int]):
+        """카탈로그에 없는 영화 프로필을 조회하여 추가"""
+        from services.tmdb_service import tmdb_service
+
+        missing = [movie_id for movie_id in dict.fromkeys(movie_ids) if movie_id not in self.catalog]
+        if not missing:
+            return
+
+        for profile in tmdb_service.get_bulk_movie_details(missing, self.lang):
+            self.catalog[profile.get("id")] = (
+                RecommendationService.build_document(profile),
+                profile.get("vote_count") or 0,
+                list(profile.get("candidate_ids") or []),
+            )
+
+    def run(self, input_path: str):
+        """입력 파일 전체를 처리하여 resolved.ndjson과 카탈로그 행렬 생성"""
+        resolved_path = os.path.join(self.workdir, RESOLVED_FILE)
+        total_lists = 0
+
+        with open(resolved_path, "w", encoding="utf-8") as out, \
+                ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            for chunk in _chunks(_read_ndjson(input_path), self.chunk_size):
+                resolved = list(executor.map(self._resolve_ids, chunk))
+
+                favorite_ids = [movie_id for ids in resolved for movie_id in ids]
+                self._fetch_missing(favorite_ids)
+
+                candidate_ids = []
+                for movie_id in dict.fromkeys(favorite_ids):
+                    if movie_id in self.catalog:
+                        candidate_ids.extend(self.catalog[movie_id][2][:Config.CANDIDATE_LIMIT])
+                self._fetch_missing(candidate_ids)
+
+                for entry, ids in zip(chunk, resolved):
+                    out.write(json.dumps({
+                        "id": entry.get("id", total_lists),
+                        "favorites": [movie_id for movie_id in ids if movie_id in self.catalog],
+                    }, ensure_ascii=False) + "\n")
+                    total_lists += 1
+
+                print(f"[배치] 준비 {total_lists}개 목록 / 카탈로그 {len(self.catalog)}편")
+
+        self._save_catalog()
+        _write_json_atomic(os.path.join(self.workdir, MANIFEST_FILE), {
+            "total_lists": total_lists,
+            "catalog_size": len(self.catalog),
+            "language": self.lang,
+            "created_at": time.time(),
+        })
+
+    def _save_catalog(self):
+        """카탈로그를 mmap 가능한 .npy 배열로 저장"""
+        catalog_dir = os.path.join(self.workdir, CATALOG_DIR)
+        os.makedirs(catalog_dir, exist_ok=True)
+
+        # 행 순서 = 영화 ID 오름차순 (searchsorted로 ID → 행 변환)
+        ids = np.array(sorted(self.catalog), dtype=np.int64)
+        documents = [self.catalog[movie_id][0] for movie_id in ids]
+        vote_counts = np.array([self.catalog[movie_id][1] for movie_id in ids], dtype=np.float64)
+
+        # 카탈로그 전체 기준 TF-IDF (행 단위 L2 정규화)
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=200000, dtype=np.float32)
+        matrix = vectorizer.fit_transform(documents).tocsr()
+        matrix.sort_indices()
+
+        # 후보 ID → 행 번호 (CSR 형태의 인접 리스트)
+        cand_indptr = [0]
+        cand_rows = []
+        for movie_id in ids:
+            rows = _ids_to_rows(ids, self.catalog[movie_id][2])
+            cand_rows.extend(rows)
+            cand_indptr.append(len(cand_rows))
+
+        np.save(os.path.join(catalog_dir, "ids.npy"), ids)
+        np.save(os.path.join(catalog_dir, "data.npy"), matrix.data.astype(np.float32))
+        np.save(os.path.join(catalog_dir, "indices.npy"), matrix.indices.astype(np.int32))
+        np.save(os.path.join(catalog_dir, "indptr.npy"), matrix.indptr.astype(np.int64))
+        np.save(os.path.join(catalog_dir, "bonus.npy"), RecommendationService.popularity_bonuses(vote_counts))
+        np.save(os.path.join(catalog_dir, "cand_indptr.npy"), np.array(cand_indptr, dtype=np.int64))
+        np.save(os.path.join(catalog_dir, "cand_rows.npy"), np.array(cand_rows, dtype=np.int32))
+        _write_json_atomic(os.path.join(catalog_dir, "shape.json"), {"shape": list(matrix.shape)})
+
+
+def _ids_to_rows(ids: np.ndarray, movie_ids: List[int]) -> List[int]:
+    """정렬된 카탈로그 ID 배열에서 영화 ID들의 행 번호 조회 (없는 ID는 제외)"""
+    if not movie_ids or ids.size == 0:
+        return []
+    query = np.asarray(movie_ids, dtype=np.int64)
+    positions = np.searchsorted(ids, query)
+    positions = np.minimum(positions, ids.size - 1)
+    found = ids[positions] == query
+    return positions[found].tolist()
+
+
+# ---------------------------------------------------------------------------
+# 2단계: 워커 프로세스 점수 계산
+# ---------------------------------------------------------------------------
+
+# 워커 프로세스별 공유 카탈로그 (mmap, 읽기 전용)
+_worker_catalog: Optional[Dict[str, Any]] = None
+
+
+def load_catalog(workdir: str) -> Dict[str, Any]:
+    """작업 디렉토리의 카탈로그를 읽기 전용 mmap으로 로드"""
+    catalog_dir = os.path.join(workdir, CATALOG_DIR)
+
+    def load(name):
+        return np.load(os.path.join(catalog_dir, f"{name}.npy"), mmap_mode="r")
+
+    with open(os.path.join(catalog_dir, "shape.json"), "r", encoding="utf-8") as f:
+        shape = tuple(json.load(f)["shape"])
+
+    # mmap 배열을 복사 없이 그대로 CSR 행렬로 사용 → 페이지 캐시를 프로세스 간 공유
+    matrix = sparse.csr_matrix(
+        (load("data"), load("indices"), load("indptr")),
+        shape=shape,
+        copy=False
+    )
+    return {
+        "ids": load("ids"),
+        "matrix": matrix,
+        "bonus": load("bonus"),
+        "cand_indptr": load("cand_indptr"),
+        "cand_rows": load("cand_rows"),
+    }
+
+
+def _init_worker(workdir: str):
+    """ProcessPoolExecutor 워커 초기화"""
+    global _worker_catalog
+    _worker_catalog = load_catalog(workdir)
+
+
+def _candidate_rows(catalog: Dict[str, Any], favorite_rows: List[int], limit: int) -> List[int]:
+    """좋아하는 영화들의 후보 행 번호 (순서 유지 중복 제거, 좋아하는 영화 제외)"""
+    cand_indptr = catalog["cand_indptr"]
+    cand_rows = catalog["cand_rows"]
+
+    rows = []
+    for row in favorite_rows:
+        rows.extend(cand_rows[cand_indptr[row]:cand_indptr[row + 1]].tolist())
+
+    exclude = set(favorite_rows)
+    unique_rows = [row for row in dict.fromkeys(rows)][:limit]
+    return [row for row in unique_rows if row not in exclude]
+
+
+def score_lists(batch: List[Dict[str, Any]], top_n: int, candidate_limit: int) -> List[Dict[str, Any]]:
+    """
+    목록 배치에 대한 추천 계산 (워커 프로세스에서 실행)
+
+    Args:
+        batch: [{"id": ..., "favorites": [movie_id, ...]}, ...]
+        top_n: 목록별 추천 개수
+        candidate_limit: 목록별 후보 최대 개수
+
+    Returns:
+        [{"id": ..., "recommendations": [{"id": movie_id, "score": 점수}, ...]}, ...]
+    """
+    catalog = _worker_catalog
+    ids = catalog["ids"]
+
+    favorite_rows = [_ids_to_rows(ids, entry["favorites"]) for entry in batch]
+    candidate_rows = [
+        _candidate_rows(catalog, rows, candidate_limit)
+        for rows in favorite_rows
+    ]
+
+    scored = RecommendationService.score_batch(
+        catalog["matrix"],
+        favorite_rows,
+        candidate_rows,
+        catalog["bonus"],
+        top_n
+    )
+
+    return [
+        {
+            "id": entry["id"],
+            "recommendations": [
+                {"id": int(ids[row]), "score": round(score, 6)}
+                for row, score in ranked
+            ],
+        }
+        for entry, ranked in zip(batch, scored)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 결과 출력 (NDJSON / Parquet)
+# ---------------------------------------------------------------------------
+
+class NdjsonWriter:
+    """NDJSON 결과 출력 (체크포인트 시점의 바이트 위치로 잘라내어 재개)"""
+
+    def __init__(self, path: str, offset: int):
+        mode = "r+b" if os.path.exists(path) else "wb"
+        self.file = open(path, mode)
+        self.file.truncate(offset)
+        self.file.seek(offset)
+
+    def write(self, results: List[Dict[str, Any]], part: int):
+        for result in results:
+            self.file.write(json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def position(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """Parquet 결과 출력 (배치마다 part 파일 1개, 재개 시 덮어씀)"""
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("[오류] Parquet 출력에는 pyarrow 패키지가 필요합니다.")
+
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, results: List[Dict[str, Any]], part: int):
+        pa = self.pa
+        table = pa.table({
+            "id": pa.array([str(r["id"]) for r in results]),
+            "movie_ids": pa.array(
+                [[rec["id"] for rec in r["recommendations"]] for r in results],
+                type=pa.list_(pa.int64())
+            ),
+            "scores": pa.array(
+                [[rec["score"] for rec in r["recommendations"]] for r in results],
+                type=pa.list_(pa.float32())
+            ),
+        })
+        self.pq.write_table(table, os.path.join(self.path, f"part-{part:06d}.parquet"))
+
+    def position(self) -> int:
+        return 0
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run_scoring(args: argparse.Namespace):
+    """2단계: 체크포인트부터 이어서 점수 계산 및 결과 저장"""
+    checkpoint_path = os.path.join(args.workdir, CHECKPOINT_FILE)
+    checkpoint = {"done": 0, "parts": 0, "offset": 0}
+    if args.resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        print(f"[배치] 체크포인트에서 재개: {checkpoint['done']}개 목록 완료")
+
+    if args.format == "parquet":
+        writer = ParquetWriter(args.output)
+    else:
+        writer = NdjsonWriter(args.output, checkpoint["offset"])
+
+    batches = _chunks(
+        _read_ndjson(os.path.join(args.workdir, RESOLVED_FILE), skip=checkpoint["done"]),
+        args.batch_size
+    )
+    started = time.time()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=args.processes,
+            initializer=_init_worker,
+            initargs=(args.workdir,)
+        ) as executor:
+            # 진행 중인 배치 수를 제한하면서 입력 순서대로 결과 기록
+            pending = []
+            for batch in batches:
+                pending.append((len(batch), executor.submit(score_lists, batch, args.top_n, args.candidate_limit)))
+                if len(pending) >= args.processes * 2:
+                    _drain(pending.pop(0), writer, checkpoint, checkpoint_path)
+            while pending:
+                _drain(pending.pop(0), writer, checkpoint, checkpoint_path)
+    finally:
+        writer.close()
+
+    elapsed = time.time() - started
+    print(f"[배치] 완료: {checkpoint['done']}개 목록, {elapsed:.1f}초")
+
+
+def _drain(item, writer, checkpoint: Dict[str, Any], checkpoint_path: str):
+    """완료된 배치 결과를 기록하고 체크포인트 갱신"""
+    size, future = item
+    results = future.result()
+    writer.write(results, checkpoint["parts"])
+
+    checkpoint["done"] += size
+    checkpoint["parts"] += 1
+    checkpoint["offset"] = writer.position()
+    _write_json_atomic(checkpoint_path, checkpoint)
+
+    if checkpoint["parts"] % 20 == 0:
+        print(f"[배치] {checkpoint['done']}개 목록 처리")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="좋아하는 영화 목록 대량 추천 사전 계산")
+    parser.add_argument("--input", required=True, help="입력 NDJSON 파일")
+    parser.add_argument("--output", required=True, help="출력 파일 (parquet은 디렉토리)")
+    parser.add_argument("--workdir", required=True, help="카탈로그/체크포인트 작업 디렉토리")
+    parser.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson")
+    parser.add_argument("--language", default="ko-KR")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=512, help="워커에 넘길 목록 수")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="준비 단계에서 한 번에 조회할 목록 수")
+    parser.add_argument("--top-n", type=int, default=Config.TOP_N)
+    parser.add_argument("--candidate-limit", type=int, default=Config.CANDIDATE_LIMIT)
+    parser.add_argument("--resume", action="store_true", help="작업 디렉토리의 체크포인트에서 재개")
+    parser.add_argument("--snapshot",
+                        help="카탈로그 스냅샷 디렉토리 (포함된 영화는 TMDb를 조회하지 않음)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    os.makedirs(args.workdir, exist_ok=True)
+
+    manifest_path = os.path.join(args.workdir, MANIFEST_FILE)
+    if args.resume and os.path.exists(manifest_path):
+        print("[배치] 준비된 카탈로그를 재사용합니다.")
+    else:
+        builder = CatalogBuilder(args.workdir, args.language, args.chunk_size)
+        if args.snapshot:
+            builder.seed_from_snapshot(args.snapshot)
+        builder.run(args.input)
+
+    run_scoring(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+카탈로그 스냅샷 생성 / 확인 (services/catalog_snapshot.py)
+
+TMDb에서 영화 프로필을 조회하여 Arrow(또는 Parquet) 스냅샷으로 저장합니다.
+서버는 CATALOG_SNAPSHOT_PATH의 스냅샷을 시작할 때 캐시에 로드하므로 네트워크 워밍업 없이 시작할 수 있습니다.
+
+대상 영화: 핫 키 로그의 상세 조회 상위 N개 + 인기 영화 + 입력 파일(--input NDJSON / --ids),
+--candidates를 주면 그 영화들의 후보(추천/비슷한 영화)까지 포함합니다.
+--base로 기존 스냅샷을 주면 그 안의 영화는 다시 조회하지 않습니다.
+
+사용법:
+    python -m jobs.catalog_snapshot export --output ./catalog_snapshot --candidates
+    python -m jobs.catalog_snapshot export --output ./snap --input lists.ndjson --language ko-KR en-US
+    python -m jobs.catalog_snapshot export --output ./snap --base ./snap --popular-pages 5 --format parquet
+    python -m jobs.catalog_snapshot inspect ./catalog_snapshot
+"""
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+from config import Config
+from jobs.batch_recommend import CatalogBuilder, _chunks, _read_ndjson
+from services.catalog_snapshot import FORMATS, catalog_snapshot_service
+from services.movie_profile import MovieCore, MovieOverlay
+from services.tmdb_service import tmdb_service
+from utils.hotkeys import hot_keys
+
+
+def _target_ids(args) -> List[int]:
+    """스냅샷에 넣을 영화 ID (중복 제거, 순서 유지)"""
+    movie_ids = [int(key[0]) for key in hot_keys.top("details", args.hot_keys)]
+    movie_ids += tmdb_service.get_popular_movie_ids(args.popular_pages)
+    if args.ids:
+        with open(args.ids, "r", encoding="utf-8") as f:
+            movie_ids += [int(line) for line in f if line.strip()]
+    if args.input:
+        builder = CatalogBuilder(workdir="", lang=args.language[0], chunk_size=args.chunk_size)
+        for entry in _read_ndjson(args.input):
+            movie_ids += builder._resolve_ids(entry)
+    return list(dict.fromkeys(movie_ids))
+
+
+def export(args):
+    """영화 프로필을 조회하여 스냅샷 저장"""
+    output = args.output or Config.CATALOG_SNAPSHOT_PATH
+    if not output:
+        raise SystemExit("--output 또는 CATALOG_SNAPSHOT_PATH가 필요합니다.")
+
+    cores: Dict[int, Tuple[MovieCore, float]] = {}
+    overlays: Dict[Tuple[int, str], Tuple[MovieCore, MovieOverlay, float]] = {}
+    if args.base:
+        cores, base_overlays = catalog_snapshot_service.read(args.base)
+        overlays = {(core.id, overlay.lang): (core, overlay, fetched_at) for core, overlay, fetched_at in base_overlays}
+        print(f"[스냅샷] 기존 스냅샷: core {len(cores)}개 / overlay {len(overlays)}개")
+
+    def fetch(movie_ids: List[int], lang: str) -> List[int]:
+        """스냅샷에 없는 (영화, 언어)만 조회, 조회한 영화 ID 반환"""
+        missing = [movie_id for movie_id in movie_ids if (movie_id, lang) not in overlays]
+        fetched = []
+        for chunk in _chunks(missing, args.chunk_size):
+            for profile in tmdb_service.get_bulk_movie_details(chunk, lang):
+                core_entry = tmdb_service.core_cache.peek(profile.id)
+                overlay_entry = tmdb_service.overlay_cache.peek((profile.id, lang))
+                now = time.time()
+                cores[profile.id] = (profile.core, core_entry.fetched_at if core_entry else now)
+                overlays[(profile.id, lang)] = (
+                    profile.core, profile.overlay, overlay_entry.fetched_at if overlay_entry else now
+                )
+                fetched.append(profile.id)
+            print(f"[스냅샷] {lang}: core {len(cores)}개 / overlay {len(overlays)}개")
+        return fetched
+
+    movie_ids = _target_ids(args)
+    for lang in args.language:
+        fetch(movie_ids, lang)
+    if args.candidates:
+        candidate_ids = list(dict.fromkeys(
+            candidate_id
+            for movie_id in movie_ids if movie_id in cores
+            for candidate_id in cores[movie_id][0].candidate_ids[:Config.CANDIDATE_LIMIT]
+        ))
+        for lang in args.language:
+            fetch(candidate_ids, lang)
+
+    # overlay의 core는 같은 영화의 최신 core와 맞춤 (기존 스냅샷 + 새로 조회한 core)
+    rows = [(cores[movie_id][0], overlay, fetched_at)
+            for (movie_id, _), (_, overlay, fetched_at) in overlays.items()]
+    manifest = catalog_snapshot_service.save(output, list(cores.values()), rows, args.format)
+    print(f"[스냅샷] 저장: {output} ({manifest['format']}, core {manifest['cores']}개 / "
+          f"overlay {manifest['overlays']}개, {manifest['bytes'] / 1024 / 1024:.1f} MB)")
+
+
+def inspect(args):
+    """스냅샷 정보와 읽기 시간 출력"""
+    manifest = catalog_snapshot_service.manifest(args.path)
+    created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(manifest["created_at"]))
+    print(f"형식: {manifest['format']}, 생성: {created}, 크기: {manifest['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"core {manifest['cores']}개 / overlay {manifest['overlays']}개, 언어: {', '.join(manifest['languages'])}")
+
+    started = time.perf_counter()
+    cores, overlays = catalog_snapshot_service.read(args.path)
+    elapsed = time.perf_counter() - started
+    ages = sorted(time.time() - fetched_at for _, fetched_at in cores.values())
+    print(f"읽기: {elapsed:.2f}초 (core {len(cores)}개 / overlay {len(overlays)}개)")
+    if ages:
+        print(f"조회 후 경과: 중앙값 {ages[len(ages) // 2] / 3600:.1f}시간, 최대 {ages[-1] / 3600:.1f}시간 "
+              f"(hard TTL {Config.CACHE_DETAILS_HARD_TTL / 3600:.0f}시간)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카탈로그 스냅샷 (Arrow/Parquet)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_export = commands.add_parser("export", help="TMDb에서 조회하여 스냅샷 저장")
+    parser_export.add_argument("--output", help="스냅샷 디렉토리 (기본값: CATALOG_SNAPSHOT_PATH)")
+    parser_export.add_argument("--format", choices=FORMATS, default=Config.CATALOG_SNAPSHOT_FORMAT)
+    parser_export.add_argument("--language", nargs="+", default=["ko-KR"])
+    parser_export.add_argument("--base", help="기존 스냅샷 (포함된 영화는 다시 조회하지 않음)")
+    parser_export.add_argument("--input", help="좋아하는 영화 목록 NDJSON (jobs/batch_recommend.py 형식)")
+    parser_export.add_argument("--ids", help="영화 ID 파일 (한 줄에 하나)")
+    parser_export.add_argument("--hot-keys", type=int, default=Config.WARMUP_TOP_N, help="핫 키 상위 N개")
+    parser_export.add_argument("--popular-pages", type=int, default=Config.WARMUP_POPULAR_PAGES)
+    parser_export.add_argument("--candidates", action="store_true", help="후보 영화까지 포함")
+    parser_export.add_argument("--chunk-size", type=int, default=1000, help="한 번에 조회할 영화 수")
+    parser_export.set_defaults(func=export)
+
+    parser_inspect = commands.add_parser("inspect", help="스냅샷 정보 / 읽기 시간")
+    parser_inspect.add_argument("path")
+    parser_inspect.set_defaults(func=inspect)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
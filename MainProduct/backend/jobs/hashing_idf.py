@@ -0,0 +1,86 @@
+"""
+해싱 TF-IDF용 코퍼스 IDF 생성 (TFIDF_MODE=hashing)
+
+좋아하는 영화 목록 파일(jobs/batch_recommend.py와 같은 NDJSON)의 영화와 그 후보 영화들로
+해시 인덱스별 문서 빈도를 세어 IDF 벡터(float32, 길이 HASHING_N_FEATURES)를 저장합니다.
+서버는 이 파일을 mmap으로 읽어 워커들이 공유합니다 (services/feature_hashing.py).
+
+IDF = ln((1 + 문서 수) / (1 + 문서 빈도)) + 1  (TfidfVectorizer의 smooth idf와 같음)
+
+사용법:
+    python -m jobs.hashing_idf --input lists.ndjson --output hashing_idf.npy
+"""
+import argparse
+import os
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from config import Config
+from jobs.batch_recommend import CatalogBuilder, _chunks, _read_ndjson, _write_json_atomic
+from services import feature_hashing
+
+
+def build_idf(documents: List[str], chunk_size: int = 5000) -> np.ndarray:
+    """문서들의 해시 인덱스별 문서 빈도 → IDF 벡터"""
+    doc_freq = np.zeros(Config.HASHING_N_FEATURES, dtype=np.int64)
+    vectorizer = feature_hashing.hashing_vectorizer()
+    for chunk in _chunks(documents, chunk_size):
+        counts = vectorizer.transform(chunk).tocsr()
+        doc_freq += np.bincount(counts.indices, minlength=Config.HASHING_N_FEATURES)
+    return (np.log((1.0 + len(documents)) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+
+
+def save_idf(path: str, idf: np.ndarray, n_docs: int, language: str):
+    """IDF 벡터(.npy)와 메타데이터(.npy.json)를 임시 파일에 쓴 뒤 교체"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, idf)
+    os.replace(tmp_path, path)
+    _write_json_atomic(f"{path}.json", {
+        "n_docs": n_docs,
+        "n_features": Config.HASHING_N_FEATURES,
+        "language": language,
+        "created_at": time.time(),
+    })
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="해싱 TF-IDF 코퍼스 IDF 생성")
+    parser.add_argument("--input", required=True, help="좋아하는 영화 목록 NDJSON 파일")
+    parser.add_argument("--output", default=Config.HASHING_IDF_PATH, help="IDF 파일 (.npy)")
+    parser.add_argument("--language", default="ko-KR")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 조회할 목록 수")
+    parser.add_argument("--snapshot",
+                        help="카탈로그 스냅샷 디렉토리 (포함된 영화는 TMDb를 조회하지 않음)")
+    args = parser.parse_args(argv)
+
+    # 제목 검색 / 프로필 조회는 일괄 추천 준비 단계와 같은 방식 (작업 디렉토리는 사용하지 않음)
+    builder = CatalogBuilder(workdir="", lang=args.language, chunk_size=args.chunk_size)
+    if args.snapshot:
+        builder.seed_from_snapshot(args.snapshot)
+    for chunk in _chunks(_read_ndjson(args.input), args.chunk_size):
+        favorite_ids = [movie_id for entry in chunk for movie_id in builder._resolve_ids(entry)]
+        builder._fetch_missing(favorite_ids)
+        candidate_ids = [
+            candidate_id
+            for movie_id in dict.fromkeys(favorite_ids) if movie_id in builder.catalog
+            for candidate_id in builder.catalog[movie_id][2][:Config.CANDIDATE_LIMIT]
+        ]
+        builder._fetch_missing(candidate_ids)
+        print(f"[해싱 IDF] 카탈로그 {len(builder.catalog)}편")
+
+    documents = [document for document, _, _ in builder.catalog.values()]
+    if not documents:
+        raise SystemExit("입력 파일에서 영화를 찾지 못했습니다.")
+
+    idf = build_idf(documents)
+    save_idf(args.output, idf, len(documents), args.language)
+    print(f"[해싱 IDF] {len(documents)}편 기준 IDF 저장: {args.output} ({idf.nbytes / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
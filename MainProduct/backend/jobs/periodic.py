@@ -0,0 +1,111 @@
+"""
+예약 작업 목록 (services/scheduler.py)
+
+주기는 SCHEDULER_INTERVALS="이름=초,..."로 바꿀 수 있습니다 (0이면 자동 실행 안 함, run-once는 가능).
+
+local (워커마다, 프로세스 메모리 캐시):
+    popular_lists_refresh   자주 요청된 발견(discover) 목록 다시 조회
+    stale_profile_refresh   자주 조회된 검색/상세/스트리밍 항목 다시 조회
+        soft TTL이 지난 항목은 SWR 캐시가 백그라운드에서 갱신하므로 hard TTL로 만료되기 전에 새 값으로 바뀜
+
+cluster (전체에서 1곳만):
+    review_partitions       앞으로의 리뷰 월 파티션 생성
+    review_archive          오래된 리뷰를 Parquet으로 보관 (기본 꺼짐)
+    cf_train                협업 필터링 모델 증분 학습 (기본 꺼짐)
+    job_history_purge       SCHEDULER_HISTORY_DAYS보다 오래된 실행 기록 삭제
+    catalog_snapshot        이 워커의 영화 프로필 캐시를 CATALOG_SNAPSHOT_PATH에 저장 (기본 꺼짐)
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+from sqlalchemy import delete
+
+from config import Config
+from database import SessionLocal, engine
+from models.job_run import JobRun
+from services.catalog_snapshot import catalog_snapshot_service
+from services.review_partitions import review_partition_service
+from services.scheduler import CLUSTER, LOCAL, scheduler
+from services.tmdb_service import tmdb_service
+from utils.hotkeys import hot_keys
+
+
+def _replay(loaders: Dict[str, Callable], top_n: int) -> str:
+    """핫 키 로그의 종류별 상위 키로 캐시 함수 호출 (핫 키 집계에는 반영하지 않음)"""
+    tasks = [(kind, loader, key) for kind, loader in loaders.items() for key in hot_keys.top(kind, top_n)]
+
+    def load(task):
+        kind, loader, key = task
+        with hot_keys.suppressed():
+            try:
+                loader(*key)
+                return True
+            except Exception:
+                return False
+
+    with ThreadPoolExecutor(max_workers=Config.WARMUP_CONCURRENCY) as executor:
+        loaded = sum(executor.map(load, tasks))
+    return f"{loaded}/{len(tasks)}개 조회"
+
+
+@scheduler.job("popular_lists_refresh", interval=600, scope=LOCAL)
+def refresh_popular_lists():
+    """자주 요청된 발견(discover) 목록 다시 조회"""
+    return _replay({"discover": tmdb_service.discover_movies}, Config.WARMUP_TOP_N)
+
+
+@scheduler.job("stale_profile_refresh", interval=1800, scope=LOCAL)
+def refresh_stale_profiles():
+    """자주 조회된 검색/상세/스트리밍 항목 다시 조회"""
+    return _replay({
+        "search": tmdb_service.search_movie,
+        "details": tmdb_service.get_movie_details,
+        "streaming": tmdb_service.get_streaming_providers,
+    }, Config.WARMUP_TOP_N)
+
+
+@scheduler.job("review_partitions", interval=86400, scope=CLUSTER)
+def maintain_review_partitions():
+    """앞으로의 리뷰 월 파티션 생성"""
+    with engine.begin() as conn:
+        if not review_partition_service.is_partitioned(conn):
+            return "reviews가 파티션 테이블이 아니므로 건너뜀"
+        created = review_partition_service.ensure_partitions(conn)
+    return f"생성: {', '.join(created) if created else '없음'}"
+
+
+@scheduler.job("review_archive", interval=0, scope=CLUSTER)
+def archive_reviews():
+    """REVIEW_ARCHIVE_AFTER_MONTHS보다 오래된 리뷰를 Parquet으로 보관"""
+    from jobs import review_storage
+    review_storage.main(["archive"])
+
+
+@scheduler.job("cf_train", interval=0, scope=CLUSTER)
+def train_collaborative_model():
+    """협업 필터링 모델 증분 학습 (모델이 없으면 전체 학습)"""
+    from jobs import train_cf
+    train_cf.main(["--incremental"])
+
+
+@scheduler.job("job_history_purge", interval=86400, scope=CLUSTER)
+def purge_job_history():
+    """SCHEDULER_HISTORY_DAYS보다 오래된 실행 기록 삭제"""
+    cutoff = datetime.utcnow() - timedelta(days=Config.SCHEDULER_HISTORY_DAYS)
+    db = SessionLocal()
+    try:
+        deleted = db.execute(delete(JobRun).where(JobRun.started_at < cutoff)).rowcount
+        db.commit()
+    finally:
+        db.close()
+    return f"{deleted}개 삭제"
+
+
+@scheduler.job("catalog_snapshot", interval=0, scope=CLUSTER)
+def export_catalog_snapshot():
+    """영화 프로필 캐시를 카탈로그 스냅샷으로 저장 (다음 배포 / 재시작 시 로드)"""
+    if not Config.CATALOG_SNAPSHOT_PATH:
+        return "CATALOG_SNAPSHOT_PATH가 없으므로 건너뜀"
+    manifest = catalog_snapshot_service.export_caches(Config.CATALOG_SNAPSHOT_PATH, Config.CATALOG_SNAPSHOT_FORMAT)
+    return f"core {manifest['cores']}개 / overlay {manifest['overlays']}개 ({manifest['bytes'] / 1024 / 1024:.1f} MB)"
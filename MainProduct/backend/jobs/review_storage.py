@@ -0,0 +1,262 @@
+"""
+리뷰 저장소 관리 작업 (월별 파티션 / Parquet 보관 / 기존 테이블 온라인 이전)
+
+사용법:
+    python -m jobs.review_storage status                 # 파티션, 이전 진행 상황, 보관 파일
+    python -m jobs.review_storage maintain               # 앞으로의 월 파티션 생성 (cron으로 매일/매주)
+    python -m jobs.review_storage archive                # REVIEW_ARCHIVE_AFTER_MONTHS보다 오래된 달 보관
+    python -m jobs.review_storage archive --older-than-months 36 --dry-run
+
+기존 일반 reviews 테이블을 파티션 테이블로 이전 (PostgreSQL, 서비스 중단 없이):
+    python -m jobs.review_storage partition-prepare      # 새 테이블 + 동기화 트리거 생성
+    python -m jobs.review_storage partition-copy         # 기존 행을 id 구간별로 짧은 트랜잭션으로 복사
+    python -m jobs.review_storage partition-cutover      # 짧은 잠금 안에서 테이블 이름 교체
+
+prepare 이후의 작성/수정/삭제는 트리거가 새 테이블에 바로 반영하므로
+copy는 prepare 시점의 최대 id까지만 복사하면 됩니다 (중단되면 이어서 실행).
+cutover 후 기존 테이블은 reviews_legacy로 남으며, 확인 후 직접 삭제합니다.
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import func, select, text
+
+from config import Config
+from database import engine
+from models.review import Review
+from models.review_archive import ReviewArchive
+from services.review_archive import review_archive_service
+from services.review_partitions import add_months, month_start, review_partition_service
+
+NEW_TABLE = "reviews_partitioned"
+LEGACY_TABLE = "reviews_legacy"
+STATE_TABLE = "review_partition_migration"
+
+COPY_COLUMNS = "id, movie_id, author_name, content, rating, created_at, search_text"
+
+SYNC_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION reviews_partition_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM {NEW_TABLE} WHERE id = OLD.id AND created_at = OLD.created_at;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    INSERT INTO {NEW_TABLE} ({COPY_COLUMNS})
+    VALUES (NEW.id, NEW.movie_id, NEW.author_name, NEW.content, NEW.rating, NEW.created_at, NEW.search_text)
+    ON CONFLICT DO NOTHING;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def _require_postgres():
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("파티션 이전은 PostgreSQL에서만 사용할 수 있습니다.")
+
+
+def _table_exists(conn, table: str) -> bool:
+    return conn.execute(text("SELECT to_regclass(:table)"), {"table": table}).scalar() is not None
+
+
+def _rename_indexes(conn, table: str, old: str, new: str):
+    """테이블의 인덱스 이름에서 old를 new로 교체 (PK 제약 인덱스 포함)"""
+    names = conn.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = :table AND schemaname = current_schema()"
+    ), {"table": table}).scalars().all()
+    for name in names:
+        if old in name:
+            conn.execute(text(f'ALTER INDEX "{name}" RENAME TO "{name.replace(old, new, 1)}"'))
+
+
+def partition_prepare(args):
+    """새 파티션 테이블, 동기화 트리거, 진행 상황 테이블 생성"""
+    _require_postgres()
+    with engine.begin() as conn:
+        if review_partition_service.is_partitioned(conn):
+            raise SystemExit("reviews는 이미 파티션 테이블입니다.")
+        if _table_exists(conn, NEW_TABLE):
+            raise SystemExit(f"{NEW_TABLE}이 이미 있습니다. partition-copy로 이어서 진행하세요.")
+
+        first = conn.execute(select(func.min(Review.created_at))).scalar()
+        review_partition_service.create_table(conn, NEW_TABLE, month_start(first) if first else None)
+
+        # 트리거 생성(SHARE ROW EXCLUSIVE 잠금)은 진행 중인 작성 트랜잭션이 끝나길 기다리므로
+        # 이후 읽은 최대 id까지만 복사하면 나머지는 모두 트리거로 반영됩니다
+        conn.execute(text(SYNC_FUNCTION))
+        conn.execute(text(
+            "CREATE TRIGGER reviews_partition_sync AFTER INSERT OR UPDATE OR DELETE ON reviews "
+            "FOR EACH ROW EXECUTE FUNCTION reviews_partition_sync()"
+        ))
+        target_id = conn.execute(select(func.coalesce(func.max(Review.id), 0))).scalar()
+        conn.execute(text(
+            f"CREATE TABLE {STATE_TABLE} (target_id integer NOT NULL, copied_id integer NOT NULL, "
+            "started_at timestamp NOT NULL)"
+        ))
+        conn.execute(text(
+            f"INSERT INTO {STATE_TABLE} VALUES (:target_id, 0, :now)"
+        ), {"target_id": target_id, "now": datetime.utcnow()})
+
+    print(f"[이전] {NEW_TABLE} 생성 완료, 복사할 최대 id: {target_id}")
+
+
+def partition_copy(args):
+    """prepare 시점의 행을 id 구간별로 복사 (구간마다 커밋, 중단 후 재실행 시 이어서)"""
+    _require_postgres()
+    started = time.time()
+    while True:
+        with engine.begin() as conn:
+            target_id, copied_id = conn.execute(text(
+                f"SELECT target_id, copied_id FROM {STATE_TABLE} FOR UPDATE"
+            )).one()
+            if copied_id >= target_id:
+                break
+            upto = min(copied_id + args.chunk_size, target_id)
+            # FOR SHARE: 복사하는 동안 같은 행의 삭제/수정이 끝나기를 기다리게 하여
+            # 트리거보다 늦게 옛 값을 넣는 일이 없도록 함
+            conn.execute(text(
+                f"INSERT INTO {NEW_TABLE} ({COPY_COLUMNS}) "
+                f"SELECT {COPY_COLUMNS} FROM reviews WHERE id > :after AND id <= :upto "
+                "FOR SHARE ON CONFLICT DO NOTHING"
+            ), {"after": copied_id, "upto": upto})
+            conn.execute(text(f"UPDATE {STATE_TABLE} SET copied_id = :upto"), {"upto": upto})
+
+        print(f"[이전] 복사 {upto}/{target_id} ({upto / max(target_id, 1):.1%}, {time.time() - started:.0f}s)")
+        if args.pause:
+            time.sleep(args.pause)
+
+    print("[이전] 복사 완료 → partition-cutover를 실행하세요.")
+
+
+def partition_cutover(args):
+    """짧은 ACCESS EXCLUSIVE 잠금 안에서 reviews ↔ 새 테이블 이름 교체"""
+    _require_postgres()
+    with engine.begin() as conn:
+        conn.execute(text(f"SET LOCAL lock_timeout = '{args.lock_timeout}s'"))
+        target_id, copied_id = conn.execute(text(f"SELECT target_id, copied_id FROM {STATE_TABLE}")).one()
+        if copied_id < target_id:
+            raise SystemExit(f"복사가 끝나지 않았습니다 ({copied_id}/{target_id}). partition-copy를 먼저 실행하세요.")
+
+        conn.execute(text("LOCK TABLE reviews IN ACCESS EXCLUSIVE MODE"))
+        conn.execute(text("DROP TRIGGER reviews_partition_sync ON reviews"))
+        conn.execute(text("DROP FUNCTION reviews_partition_sync()"))
+
+        conn.execute(text(f"ALTER TABLE reviews RENAME TO {LEGACY_TABLE}"))
+        _rename_indexes(conn, LEGACY_TABLE, "reviews", LEGACY_TABLE)
+
+        partitions = review_partition_service.list_partitions(conn, NEW_TABLE)
+        conn.execute(text(f"ALTER TABLE {NEW_TABLE} RENAME TO reviews"))
+        _rename_indexes(conn, "reviews", NEW_TABLE, "reviews")
+        for name in partitions:
+            renamed = name.replace(NEW_TABLE, "reviews", 1)
+            conn.execute(text(f"ALTER TABLE {name} RENAME TO {renamed}"))
+            _rename_indexes(conn, renamed, NEW_TABLE, "reviews")
+
+        # 기존 SERIAL 시퀀스가 reviews_legacy와 함께 삭제되지 않도록 소유 컬럼 변경
+        conn.execute(text("ALTER SEQUENCE reviews_id_seq OWNED BY reviews.id"))
+        conn.execute(text(f"DROP TABLE {STATE_TABLE}"))
+
+    print(f"[이전] 완료: reviews는 파티션 테이블입니다. 확인 후 DROP TABLE {LEGACY_TABLE}; 을 실행하세요.")
+
+
+def maintain(args):
+    """앞으로의 월 파티션 생성"""
+    with engine.begin() as conn:
+        if not review_partition_service.is_partitioned(conn):
+            print("[파티션] reviews가 파티션 테이블이 아니므로 건너뜁니다.")
+            return
+        created = review_partition_service.ensure_partitions(conn, months_ahead=args.months_ahead)
+    print(f"[파티션] 생성: {', '.join(created) if created else '없음'}")
+
+
+def archive(args):
+    """오래된 달을 하나씩 Parquet으로 보관 (달마다 커밋)"""
+    cutoff = add_months(month_start(datetime.utcnow()), -args.older_than_months)
+    with engine.connect() as conn:
+        first = conn.execute(select(func.min(Review.created_at))).scalar()
+        partitions = (review_partition_service.list_partitions(conn)
+                      if review_partition_service.is_partitioned(conn) else [])
+
+    # 비어 있는 오래된 월 파티션도 정리
+    months = [month_start(first)] if first else []
+    months += [datetime.strptime(name[-6:], "%Y%m").date() for name in partitions if name[-7:-6] == "p"]
+    if not months:
+        print("[보관] 보관할 리뷰가 없습니다.")
+        return
+
+    month = min(months)
+    while month < cutoff:
+        if args.dry_run:
+            with engine.connect() as conn:
+                count = conn.execute(select(func.count(Review.id)).where(
+                    Review.created_at >= month, Review.created_at < add_months(month, 1)
+                )).scalar()
+            print(f"[보관] {month:%Y-%m}: {count}개 (dry-run)")
+        else:
+            with engine.begin() as conn:
+                count = review_archive_service.archive_month(conn, month)
+            print(f"[보관] {month:%Y-%m}: {count}개 → {Config.REVIEW_ARCHIVE_DIR}")
+        month = add_months(month, 1)
+
+
+def status(args):
+    """파티션, 이전 진행 상황, 보관 파일 출력"""
+    with engine.connect() as conn:
+        partitioned = review_partition_service.is_partitioned(conn)
+        print(f"reviews 파티션 테이블: {'예' if partitioned else '아니오'}")
+        if partitioned:
+            rows = conn.execute(text(
+                "SELECT c.relname, c.reltuples::bigint AS estimate FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = 'reviews'::regclass "
+                "ORDER BY c.relname"
+            )).all()
+            for row in rows:
+                print(f"  {row.relname}: 약 {max(row.estimate, 0)}행")
+
+        if engine.dialect.name == "postgresql" and _table_exists(conn, STATE_TABLE):
+            target_id, copied_id, started_at = conn.execute(text(f"SELECT * FROM {STATE_TABLE}")).one()
+            print(f"파티션 이전 진행 중: {copied_id}/{target_id} (시작 {started_at:%Y-%m-%d %H:%M})")
+
+        archives = conn.execute(select(ReviewArchive).order_by(ReviewArchive.month)).all()
+        print(f"보관 파일: {len(archives)}개")
+        for row in archives:
+            print(f"  {row.month:%Y-%m}: {row.row_count}개 ({row.path})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리뷰 저장소 관리 (파티션 / 보관 / 이전)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="파티션/이전/보관 상태").set_defaults(func=status)
+
+    parser_maintain = commands.add_parser("maintain", help="앞으로의 월 파티션 생성")
+    parser_maintain.add_argument("--months-ahead", type=int, default=Config.REVIEW_PARTITION_MONTHS_AHEAD)
+    parser_maintain.set_defaults(func=maintain)
+
+    parser_archive = commands.add_parser("archive", help="오래된 리뷰를 Parquet으로 보관")
+    parser_archive.add_argument("--older-than-months", type=int, default=Config.REVIEW_ARCHIVE_AFTER_MONTHS)
+    parser_archive.add_argument("--dry-run", action="store_true", help="보관할 달/개수만 출력")
+    parser_archive.set_defaults(func=archive)
+
+    commands.add_parser("partition-prepare", help="이전용 파티션 테이블 + 트리거 생성").set_defaults(
+        func=partition_prepare
+    )
+
+    parser_copy = commands.add_parser("partition-copy", help="기존 행 복사 (이어서 실행 가능)")
+    parser_copy.add_argument("--chunk-size", type=int, default=10000, help="트랜잭션당 id 구간 크기")
+    parser_copy.add_argument("--pause", type=float, default=0.0, help="구간 사이 대기 시간(초, 부하 조절)")
+    parser_copy.set_defaults(func=partition_copy)
+
+    parser_cutover = commands.add_parser("partition-cutover", help="테이블 이름 교체")
+    parser_cutover.add_argument("--lock-timeout", type=int, default=5, help="잠금 대기 제한(초)")
+    parser_cutover.set_defaults(func=partition_cutover)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
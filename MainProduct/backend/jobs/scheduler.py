@@ -0,0 +1,81 @@
+"""
+백그라운드 작업 스케줄러 CLI (services/scheduler.py, 작업 목록은 jobs/periodic.py)
+
+사용법:
+    python -m jobs.scheduler list                          # 작업, 주기, 마지막 실행
+    python -m jobs.scheduler run-once review_partitions    # 작업 1회 실행 (리더 잠금은 확인)
+    python -m jobs.scheduler history [--job cf_train] [--limit 20]
+    python -m jobs.scheduler run                           # 사이드카: cluster 작업을 주기마다 실행
+
+사이드카로 실행할 때는 웹 워커의 SCHEDULER_ENABLED를 False로 둡니다.
+local 작업은 그 프로세스의 메모리 캐시만 갱신하므로 사이드카에서는 기본적으로 실행하지 않습니다.
+"""
+import argparse
+import sys
+
+import jobs.periodic  # noqa: F401  (작업 등록)
+from services.scheduler import CLUSTER, FAILED, LOCAL, scheduler
+
+
+def list_jobs(args):
+    """등록된 작업 목록"""
+    for name, job in sorted(scheduler.jobs.items()):
+        interval = job.effective_interval
+        try:
+            last = scheduler.last_started(name)
+        except Exception:
+            last = None
+        print(f"{name:<24} {job.scope:<8} {f'{interval:.0f}초' if interval > 0 else '꺼짐':>8}  "
+              f"동시 {job.max_concurrency}  마지막 {f'{last:%Y-%m-%d %H:%M:%S}' if last else '-':<19}  "
+              f"{job.description}")
+
+
+def run_once(args):
+    """작업 1회 실행"""
+    if args.job not in scheduler.jobs:
+        raise SystemExit(f"알 수 없는 작업: {args.job} (가능: {', '.join(sorted(scheduler.jobs))})")
+    status = scheduler.run(args.job, force=True)
+    print(f"[스케줄러] {args.job}: {status}")
+    if status == FAILED:
+        sys.exit(1)
+
+
+def history(args):
+    """최근 실행 기록"""
+    for run in scheduler.history(args.job, args.limit):
+        duration = f"{run.duration:.1f}초" if run.duration is not None else "-"
+        print(f"{run.started_at:%Y-%m-%d %H:%M:%S}  {run.job:<24} {run.status:<8} {duration:>9}  "
+              f"{run.host}  {run.message or ''}")
+
+
+def run(args):
+    """사이드카: 주기마다 작업 실행 (종료할 때까지)"""
+    scheduler.run_forever(args.scope)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="백그라운드 작업 스케줄러")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="작업 목록").set_defaults(func=list_jobs)
+
+    parser_once = commands.add_parser("run-once", help="작업 1회 실행")
+    parser_once.add_argument("job", help="작업 이름")
+    parser_once.set_defaults(func=run_once)
+
+    parser_history = commands.add_parser("history", help="실행 기록")
+    parser_history.add_argument("--job", help="작업 이름")
+    parser_history.add_argument("--limit", type=int, default=20)
+    parser_history.set_defaults(func=history)
+
+    parser_run = commands.add_parser("run", help="사이드카로 주기 실행")
+    parser_run.add_argument("--scope", nargs="+", choices=[CLUSTER, LOCAL], default=[CLUSTER],
+                            help="실행할 작업 범위")
+    parser_run.set_defaults(func=run)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+협업 필터링 모델 학습 배치 작업 (Implicit ALS)
+
+reviews 테이블을 ID 순으로 청크 단위로 읽어 (작성자 × 영화) 희소 행렬을 만들고
+ALS로 factor를 학습하여 Config.CF_MODEL_DIR에 저장합니다 (services/collaborative.py 참고).
+서버는 manifest가 바뀌면 다시 로드하므로 재시작할 필요가 없습니다.
+
+- 전체 학습: 모든 리뷰로 처음부터 학습
+- 증분 학습(--incremental): 마지막 학습 이후 작성된 리뷰만 반영
+    새 리뷰를 쓴 작성자 factor를 다시 fold-in 하고, 처음 등장한 영화 factor를 추가
+    (삭제된 리뷰는 반영되지 않으므로 주기적으로 전체 학습 필요)
+
+익명 작성자(Config.CF_EXCLUDED_AUTHORS)는 서로 다른 사람이 섞여 있으므로 제외합니다.
+
+사용법:
+    python -m jobs.train_cf                        # 전체 학습
+    python -m jobs.train_cf --incremental          # 새 리뷰만 반영
+    python -m jobs.train_cf --factors 64 --iterations 20 --output ./cf_model
+"""
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select
+
+from config import Config
+from database import SessionLocal
+from models.review import Review
+from services.collaborative import (
+    MANIFEST_FILE,
+    USERS_FILE,
+    CollaborativeModel,
+    fold_in,
+    solve_rows,
+)
+
+# (리뷰 ID, 작성자, 영화 ID, 별점) 청크
+RatingChunk = Tuple[np.ndarray, List[str], np.ndarray, np.ndarray]
+
+
+def iter_ratings(
+    chunk_size: int,
+    after_id: int = 0,
+    authors: Optional[Sequence[str]] = None,
+    movie_ids: Optional[Sequence[int]] = None
+) -> Iterator[RatingChunk]:
+    """
+    리뷰를 ID 순으로 청크 단위 조회 (키셋 페이지네이션, 전체를 한 번에 메모리에 올리지 않음)
+
+    Args:
+        chunk_size: 청크당 행 수
+        after_id: 이 ID 이후의 리뷰만 조회
+        authors / movie_ids: 지정하면 해당 작성자/영화의 리뷰만 조회
+    """
+    excluded = set(Config.CF_EXCLUDED_AUTHORS)
+    last_id = after_id
+    db = SessionLocal()
+    try:
+        while True:
+            query = (
+                select(Review.id, Review.author_name, Review.movie_id, Review.rating)
+                .where(Review.id > last_id)
+                .order_by(Review.id)
+                .limit(chunk_size)
+            )
+            if authors is not None:
+                query = query.where(Review.author_name.in_(list(authors)))
+            if movie_ids is not None:
+                query = query.where(Review.movie_id.in_(list(movie_ids)))
+
+            rows = db.execute(query).all()
+            if not rows:
+                return
+            last_id = rows[-1].id
+
+            rows = [r for r in rows if r.author_name not in excluded]
+            if rows:
+                yield (
+                    np.fromiter((r.id for r in rows), dtype=np.int64, count=len(rows)),
+                    [r.author_name for r in rows],
+                    np.fromiter((r.movie_id for r in rows), dtype=np.int64, count=len(rows)),
+                    np.fromiter((r.rating for r in rows), dtype=np.float64, count=len(rows)),
+                )
+    finally:
+        db.close()
+
+
+def _index(keys: Dict, key) -> int:
+    index = keys.get(key)
+    if index is None:
+        index = keys[key] = len(keys)
+    return index
+
+
+def build_matrix(chunks: Iterator[RatingChunk]):
+    """
+    청크들로 (작성자 × 영화) 별점 CSR 행렬 생성 (같은 작성자/영화 중복 리뷰는 평균)
+
+    Returns:
+        (행렬, 작성자 목록, 영화 ID 배열(오름차순), 마지막 리뷰 ID)
+    """
+    users: Dict[str, int] = {}
+    items: Dict[int, int] = {}
+    row_parts, col_parts, value_parts = [], [], []
+    last_id = 0
+
+    for ids, authors, movie_ids, ratings in chunks:
+        row_parts.append(np.fromiter((_index(users, a) for a in authors), dtype=np.int32, count=len(authors)))
+        col_parts.append(np.fromiter((_index(items, int(m)) for m in movie_ids), dtype=np.int32, count=len(movie_ids)))
+        value_parts.append(ratings)
+        last_id = max(last_id, int(ids[-1]))
+
+    if not users:
+        return None, [], np.zeros(0, dtype=np.int64), last_id
+
+    rows = np.concatenate(row_parts)
+    cols = np.concatenate(col_parts)
+    values = np.concatenate(value_parts)
+
+    # 영화 열을 ID 오름차순으로 재배치 (서빙 시 searchsorted 조회)
+    item_ids = np.fromiter(items.keys(), dtype=np.int64, count=len(items))
+    order = np.argsort(item_ids)
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    cols = remap[cols]
+
+    shape = (len(users), len(items))
+    sums = sparse.csr_matrix((values, (rows, cols)), shape=shape)
+    counts = sparse.csr_matrix((np.ones_like(values), (rows, cols)), shape=shape)
+    matrix = sums.multiply(counts.power(-1)).tocsr()
+
+    return matrix, list(users.keys()), item_ids[order], last_id
+
+
+def train(matrix: "sparse.csr_matrix", factors: int, iterations: int, regularization: float, alpha: float):
+    """ALS 학습 → (작성자 factor, 영화 factor)"""
+    rng = np.random.default_rng(42)
+    user_factors = rng.normal(0, 0.01, (matrix.shape[0], factors))
+    item_factors = rng.normal(0, 0.01, (matrix.shape[1], factors))
+    by_item = matrix.T.tocsr()
+
+    for iteration in range(iterations):
+        started = time.perf_counter()
+        user_factors = solve_rows(item_factors, matrix.indptr, matrix.indices, matrix.data, regularization, alpha)
+        item_factors = solve_rows(user_factors, by_item.indptr, by_item.indices, by_item.data, regularization, alpha)
+        print(f"[CF] 반복 {iteration + 1}/{iterations}: {time.perf_counter() - started:.2f}초")
+
+    return user_factors, item_factors
+
+
+def save_model(
+    output_dir: str,
+    item_ids: np.ndarray,
+    item_factors: np.ndarray,
+    users: List[str],
+    user_factors: np.ndarray,
+    manifest: Dict
+):
+    """모델 저장 (파일마다 임시 파일 → rename, manifest는 마지막에 기록)"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    def replace_npy(name: str, array: np.ndarray):
+        tmp_path = os.path.join(output_dir, f".{name}.tmp.npy")
+        np.save(tmp_path, array)
+        os.replace(tmp_path, os.path.join(output_dir, name))
+
+    def replace_json(name: str, data):
+        tmp_path = os.path.join(output_dir, f".{name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(output_dir, name))
+
+    replace_npy("item_ids.npy", item_ids.astype(np.int64))
+    replace_npy("item_factors.npy", item_factors.astype(np.float32))
+    replace_npy("user_factors.npy", user_factors.astype(np.float32))
+    replace_json(USERS_FILE, users)
+    replace_json(MANIFEST_FILE, manifest)
+
+
+def run_full(args):
+    matrix, users, item_ids, last_id = build_matrix(iter_ratings(args.chunk_size))
+    if matrix is None:
+        print("[CF] 학습할 리뷰가 없습니다.")
+        return
+
+    print(f"[CF] 작성자 {len(users)}명 × 영화 {len(item_ids)}편, 리뷰 {matrix.nnz}건")
+    user_factors, item_factors = train(matrix, args.factors, args.iterations, args.regularization, args.alpha)
+    save_model(args.output, item_ids, item_factors, users, user_factors, {
+        "factors": args.factors,
+        "iterations": args.iterations,
+        "regularization": args.regularization,
+        "alpha": args.alpha,
+        "last_review_id": last_id,
+        "trained_at": time.time(),
+        "mode": "full",
+    })
+    print(f"[CF] 저장 완료: {args.output}")
+
+
+def run_incremental(args):
+    model = CollaborativeModel(args.output, mmap=False)
+    manifest = dict(model.manifest)
+    regularization, alpha = model.regularization, model.alpha
+
+    new_authors, new_movies, last_id = set(), set(), manifest["last_review_id"]
+    for ids, authors, movie_ids, _ in iter_ratings(args.chunk_size, after_id=last_id):
+        new_authors.update(authors)
+        new_movies.update(int(m) for m in movie_ids)
+        last_id = max(last_id, int(ids[-1]))
+
+    if not new_authors:
+        print("[CF] 새 리뷰가 없습니다.")
+        return
+
+    item_ids = np.asarray(model.item_ids)
+    item_factors = np.asarray(model.item_factors, dtype=np.float64)
+    users = list(model.users)
+    user_index = {name: i for i, name in enumerate(users)}
+    user_factors = np.asarray(model.user_factors, dtype=np.float64)
+    new_item_ids = sorted(m for m in new_movies if model.rows_for([m])[0] < 0)
+
+    # 1) 새 리뷰를 쓴 작성자: 전체 리뷰 기준으로 factor 다시 계산 (알려진 영화만 사용)
+    history: Dict[str, Tuple[List[int], List[float]]] = {}
+    for _, authors, movie_ids, ratings in iter_ratings(args.chunk_size, authors=sorted(new_authors)):
+        for author, movie_id, rating in zip(authors, movie_ids, ratings):
+            entry = history.setdefault(author, ([], []))
+            entry[0].append(int(movie_id))
+            entry[1].append(float(rating))
+
+    updated = []
+    for author, (movie_ids, ratings) in history.items():
+        rows = model.rows_for(movie_ids)
+        known = rows >= 0
+        if not known.any():
+            vector = np.zeros(item_factors.shape[1])
+        else:
+            vector = fold_in(item_factors, model.gram, rows[known], np.asarray(ratings)[known],
+                             regularization, alpha)
+        if author in user_index:
+            user_factors[user_index[author]] = vector
+        else:
+            user_index[author] = len(users)
+            users.append(author)
+            user_factors = np.vstack([user_factors, vector])
+        updated.append(author)
+
+    # 2) 처음 등장한 영화: 평가한 작성자 factor로 fold-in
+    added = []
+    if new_item_ids:
+        user_gram = user_factors.T @ user_factors
+        ratings_by_item: Dict[int, Tuple[List[int], List[float]]] = {}
+        for _, authors, movie_ids, ratings in iter_ratings(args.chunk_size, movie_ids=new_item_ids):
+            for author, movie_id, rating in zip(authors, movie_ids, ratings):
+                if author in user_index:
+                    entry = ratings_by_item.setdefault(int(movie_id), ([], []))
+                    entry[0].append(user_index[author])
+                    entry[1].append(float(rating))
+        for movie_id in new_item_ids:
+            if movie_id not in ratings_by_item:
+                continue
+            rows, ratings = ratings_by_item[movie_id]
+            added.append((movie_id, fold_in(user_factors, user_gram, np.asarray(rows), np.asarray(ratings),
+                                            regularization, alpha)))
+
+    if added:
+        item_ids = np.concatenate([item_ids, np.asarray([m for m, _ in added], dtype=np.int64)])
+        item_factors = np.vstack([item_factors, np.vstack([v for _, v in added])])
+        order = np.argsort(item_ids)
+        item_ids, item_factors = item_ids[order], item_factors[order]
+
+    manifest.update({"last_review_id": last_id, "trained_at": time.time(), "mode": "incremental"})
+    save_model(args.output, item_ids, item_factors, users, user_factors, manifest)
+    print(f"[CF] 증분 반영 완료: 작성자 {len(updated)}명 갱신, 영화 {len(added)}편 추가")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="협업 필터링 모델 학습 (Implicit ALS)")
+    parser.add_argument("--output", default=Config.CF_MODEL_DIR, help="모델 디렉토리")
+    parser.add_argument("--incremental", action="store_true", help="마지막 학습 이후 리뷰만 반영")
+    parser.add_argument("--factors", type=int, default=Config.CF_FACTORS)
+    parser.add_argument("--iterations", type=int, default=Config.CF_ITERATIONS)
+    parser.add_argument("--regularization", type=float, default=Config.CF_REGULARIZATION)
+    parser.add_argument("--alpha", type=float, default=Config.CF_ALPHA)
+    parser.add_argument("--chunk-size", type=int, default=10000, help="리뷰 조회 청크 크기")
+    args = parser.parse_args(argv)
+
+    if args.incremental and os.path.exists(os.path.join(args.output, MANIFEST_FILE)):
+        run_incremental(args)
+    else:
+        run_full(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,10 @@
 모델 패키지
 """
 from models.review import Review
+from models.review_version import ReviewVersion
+from models.review_archive import ReviewArchive, ReviewArchiveStat
+from models.taste_profile import TasteProfile
+from models.negative_result import NegativeResult
+from models.job_run import JobRun
 
-__all__ = ['Review']
+__all__ = ['Review', 'ReviewVersion', 'ReviewArchive', 'ReviewArchiveStat', 'TasteProfile', 'NegativeResult', 'JobRun']
@@ -0,0 +1,34 @@
+"""
+백그라운드 작업 실행 기록 모델 (services/scheduler.py)
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
+from database import Base
+
+
+class JobRun(Base):
+    """예약 작업 1회 실행 기록"""
+    __tablename__ = 'job_runs'
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 작업 이름 (jobs/periodic.py)
+    job = Column(String(64), nullable=False)
+
+    # 상태 (running / success / failed)
+    status = Column(String(16), nullable=False, default="running")
+
+    # 실행한 프로세스 (호스트:pid)
+    host = Column(String(128), nullable=False)
+
+    # 시작 / 종료 시각 (UTC), 소요 시간(초)
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    duration = Column(Float, nullable=True)
+
+    # 작업 결과 요약 또는 오류 메시지
+    message = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index('ix_job_runs_job_started_at', 'job', 'started_at'),
+    )
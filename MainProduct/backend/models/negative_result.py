@@ -0,0 +1,28 @@
+"""
+TMDb에서 찾지 못한 결과 모델 (네거티브 캐시)
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Index
+from database import Base
+
+
+class NegativeResult(Base):
+    """찾지 못한 제목 / 없는 영화 ID (만료 시각까지 다시 조회하지 않음)"""
+    __tablename__ = 'negative_results'
+
+    # 종류 (title: 제목 검색 결과 없음, movie: 영화 ID 404)
+    kind = Column(String(16), primary_key=True)
+
+    # 키 (title: "언어|정규화된 제목", movie: 영화 ID)
+    key = Column(String(512), primary_key=True)
+
+    # 만료 시각 (UTC)
+    expires_at = Column(DateTime, nullable=False)
+
+    # 기록 시각 (UTC, 다시 기록하면 갱신) → 워커들이 이후 기록만 가져와 Bloom 필터에 추가
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_negative_results_created_at', 'created_at'),
+        Index('ix_negative_results_expires_at', 'expires_at'),
+    )
@@ -2,8 +2,10 @@
 리뷰 모델
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Index
+from sqlalchemy.orm import deferred, validates
 from database import Base
+from utils.text_search import search_text
 
 
 class Review(Base):
@@ -28,6 +30,22 @@ class Review(Base):
     # 작성일자
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
+    # 검색용 토큰 (한글 2-gram, content가 바뀔 때 자동 갱신)
+    # PostgreSQL은 이 컬럼으로 생성된 search_vector(tsvector, GIN 인덱스),
+    # SQLite는 reviews_fts(FTS5) 가상 테이블로 검색합니다 (services/review_search.py)
+    # 목록 조회에서는 필요 없으므로 지연 로딩
+    search_text = deferred(Column(Text, nullable=True))
+    
+    # 영화별 최신순 목록 (PostgreSQL 파티션 테이블은 파티션마다 생성됨, services/review_partitions.py)
+    __table_args__ = (
+        Index('ix_reviews_movie_id_created_at', movie_id, created_at.desc(), id.desc()),
+    )
+    
+    @validates('content')
+    def _update_search_text(self, key, content):
+        self.search_text = search_text(content)
+        return content
+    
     def to_dict(self):
         """딕셔너리로 변환"""
         return {
@@ -0,0 +1,41 @@
+"""
+보관(아카이브)된 리뷰 메타데이터 모델
+
+오래된 리뷰는 월 단위 Parquet 파일로 옮기고 reviews 테이블에서 삭제합니다 (jobs/review_storage.py).
+- ReviewArchive: 월별 Parquet 파일 목록
+- ReviewArchiveStat: 영화별 보관된 리뷰 수 / 별점 합계 (목록 total, 평균 별점 계산용)
+"""
+from datetime import datetime
+from sqlalchemy import Column, Date, DateTime, Float, Integer, String
+from database import Base
+
+
+class ReviewArchive(Base):
+    """월별 리뷰 보관 파일"""
+    __tablename__ = 'review_archives'
+
+    # 보관한 달 (1일)
+    month = Column(Date, primary_key=True)
+
+    # REVIEW_ARCHIVE_DIR 기준 파일 이름
+    path = Column(String(255), nullable=False)
+
+    # 파일의 리뷰 수
+    row_count = Column(Integer, nullable=False)
+
+    # 보관 시각
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ReviewArchiveStat(Base):
+    """영화별 보관된 리뷰 집계"""
+    __tablename__ = 'review_archive_stats'
+
+    # 영화 ID (TMDb ID)
+    movie_id = Column(Integer, primary_key=True)
+
+    # 보관된 리뷰 수
+    review_count = Column(Integer, nullable=False, default=0)
+
+    # 보관된 리뷰 별점 합계
+    rating_sum = Column(Float, nullable=False, default=0.0)
@@ -0,0 +1,83 @@
+"""
+영화별 리뷰 버전 모델 (ETag용)
+"""
+from datetime import datetime
+from typing import List, Union
+from sqlalchemy import Column, Integer, DateTime, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from database import Base, engine
+
+
+class ReviewVersion(Base):
+    """영화별 리뷰 목록/통계 버전 (리뷰 작성·삭제 시 증가)"""
+    __tablename__ = 'review_versions'
+
+    # 영화 ID (TMDb ID)
+    movie_id = Column(Integer, primary_key=True)
+
+    # 버전 (리뷰가 바뀔 때마다 1씩 증가)
+    version = Column(Integer, nullable=False, default=1)
+
+    # 마지막 변경 시각
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    @classmethod
+    def current(cls, db: Session, movie_id: int) -> int:
+        """
+        영화의 현재 리뷰 버전 조회 (PK 조회 1번)
+
+        Returns:
+            버전 (리뷰가 한 번도 바뀌지 않았으면 0)
+        """
+        version = db.execute(
+            select(cls.version).where(cls.movie_id == movie_id)
+        ).scalar_one_or_none()
+        return version or 0
+
+    @classmethod
+    def bump(cls, db: Session, movie_id: int) -> int:
+        """
+        영화의 리뷰 버전 증가 (리뷰 변경과 같은 트랜잭션에서 호출)
+
+        PostgreSQL / SQLite의 INSERT ... ON CONFLICT DO UPDATE로 동시 요청에도 안전하게 증가합니다.
+
+        Returns:
+            증가한 버전 (리뷰 실시간 이벤트 ID로 사용)
+        """
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        now = datetime.utcnow()
+        stmt = insert(cls).values(movie_id=movie_id, version=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.movie_id],
+            set_={"version": cls.version + 1, "updated_at": now}
+        )
+        return db.execute(stmt.returning(cls.version)).scalar_one()
+
+    @classmethod
+    def bump_many(cls, db: Union[Session, Connection], movie_ids: List[int]):
+        """
+        여러 영화의 리뷰 버전 증가 (리뷰 보관 등 대량 변경과 같은 트랜잭션에서 호출)
+
+        Args:
+            db: 세션 또는 연결
+            movie_ids: 영화 ID 목록
+        """
+        if not movie_ids:
+            return
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        now = datetime.utcnow()
+        stmt = insert(cls)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.movie_id],
+            set_={"version": cls.version + 1, "updated_at": now}
+        )
+        db.execute(stmt, [{"movie_id": movie_id, "version": 1, "updated_at": now} for movie_id in movie_ids])
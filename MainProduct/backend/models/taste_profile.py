@@ -0,0 +1,74 @@
+"""
+저장된 취향 프로필 모델
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from database import Base
+
+
+def new_profile_id() -> str:
+    """추측하기 어려운 프로필 키 (사용자 계정이 없으므로 키가 곧 접근 권한)"""
+    return uuid.uuid4().hex
+
+
+class TasteProfile(Base):
+    """
+    취향 프로필 (좋아하는 영화 + 누적 단어 벡터 + 패턴 빈도)
+
+    영화를 추가/삭제하면 해당 영화의 기여분만 더하거나 빼서 갱신합니다 (services/taste_profile.py).
+    동시 수정은 version 컬럼으로 감지합니다 (낙관적 잠금).
+    """
+    __tablename__ = 'taste_profiles'
+
+    # 프로필 키
+    id = Column(String(32), primary_key=True, default=new_profile_id)
+
+    # 프로필 언어 (줄거리/장르명 언어)
+    language = Column(String(10), nullable=False, default="ko-KR")
+
+    # 좋아하는 영화 목록 (영화별 기여분 포함)
+    # [{"id", "title", "poster", "terms": {단어: 가중치}, "candidate_ids", "genres", "directors", "cast"}, ...]
+    favorites = Column(JSON, nullable=False, default=list)
+
+    # 좋아하는 영화 단어 벡터 합계 {단어: 가중치 합}
+    term_sums = Column(JSON, nullable=False, default=dict)
+
+    # 단어별 좋아하는 영화 수 {단어: 영화 수}
+    doc_freq = Column(JSON, nullable=False, default=dict)
+
+    # 후보 영화별 추천한 좋아하는 영화 수 {"영화 ID": 수}
+    candidate_counts = Column(JSON, nullable=False, default=dict)
+
+    # 장르/감독/배우 빈도 {"genres": {...}, "directors": {...}, "cast": {...}}
+    pattern_counts = Column(JSON, nullable=False, default=dict)
+
+    # 버전 (수정할 때마다 증가)
+    version = Column(Integer, nullable=False, default=1)
+
+    # 작성일자 / 수정일자
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
+
+    @property
+    def favorite_ids(self) -> List[int]:
+        """좋아하는 영화 ID 목록"""
+        return [favorite["id"] for favorite in self.favorites or []]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 요약"""
+        return {
+            "id": self.id,
+            "language": self.language,
+            "favorites": [
+                {"id": f["id"], "title": f.get("title"), "poster": f.get("poster")}
+                for f in self.favorites or []
+            ],
+            "version": self.version,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -0,0 +1,191 @@
+"""
+여러 좋아하는 영화 목록 일괄 분석 (/api/analyze/batch)
+
+목록마다 /api/analyze를 호출하면 HTTP 왕복과 제목 검색/상세 조회가 목록 수만큼 반복됩니다.
+일괄 분석은
+1. 모든 목록의 제목을 한 번씩만 검색
+2. 좋아하는 영화 합집합 → 상세 조회 1번, 후보 영화 합집합 → 상세 조회 1번
+3. 목록마다 /api/analyze와 같은 TF-IDF 프로필 / 점수 / 다양성 재정렬
+   (RecommendationService.create_tfidf_profile / rank / recommendation_entries)
+순서로 처리합니다.
+
+점수는 목록의 좋아하는 영화만으로 계산하므로 같은 요청의 다른 목록과 무관하며
+같은 목록을 /api/analyze로 보낸 결과와 같습니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import Config
+from services.recommendation import recommendation_service
+from services.tmdb_service import tmdb_service
+from utils.metrics import StageTimer, metrics
+
+
+class BatchInputError(ValueError):
+    """요청 목록 형식 오류 (메시지는 클라이언트에 그대로 반환)"""
+
+
+@dataclass
+class BatchPlan:
+    """일괄 분석 준비 결과 (조회한 프로필 + 목록별 좋아하는 영화/후보 ID)"""
+
+    entries: List[Dict[str, Any]]
+    profiles: Dict[int, Dict[str, Any]]
+
+
+class BatchAnalyzeService:
+    """여러 목록 일괄 추천 서비스"""
+
+    def _resolve_titles(self, titles: List[str], lang: str) -> Dict[str, Optional[int]]:
+        """중복 제거한 제목들을 병렬 검색 → {제목: 영화 ID}"""
+        def search(title: str) -> Optional[int]:
+            try:
+                movie = tmdb_service.search_movie(title, lang)
+                return movie.get("id") if movie else None
+            except Exception:
+                return None
+
+        unique_titles = list(dict.fromkeys(titles))
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            return dict(zip(unique_titles, executor.map(search, unique_titles)))
+
+    @staticmethod
+    def _validate(lists: List[Any]):
+        """
+        목록 형식 확인
+
+        Raises:
+            BatchInputError: 잘못된 항목 (필드 이름 포함)
+        """
+        for index, entry in enumerate(lists):
+            if not isinstance(entry, dict):
+                raise BatchInputError(f"lists[{index}]는 객체여야 합니다.")
+            titles = entry.get("titles") or []
+            if not isinstance(titles, list) or not all(isinstance(t, str) for t in titles):
+                raise BatchInputError(f"lists[{index}].titles는 문자열 배열이어야 합니다.")
+            movie_ids = entry.get("movie_ids") or []
+            if not isinstance(movie_ids, list) or not all(
+                (isinstance(m, int) and not isinstance(m, bool)) or (isinstance(m, str) and m.isdigit())
+                for m in movie_ids
+            ):
+                raise BatchInputError(f"lists[{index}].movie_ids는 정수 배열이어야 합니다.")
+
+    def prepare(self, lists: List[Dict[str, Any]], lang: str, timer: StageTimer) -> BatchPlan:
+        """
+        제목 검색, 좋아하는 영화 / 후보 영화 상세 조회 (모든 목록의 합집합으로 1번씩)
+
+        Args:
+            lists: [{"id": ..., "titles": [...]} 또는 {"id": ..., "movie_ids": [...]}, ...]
+            lang: 언어 코드
+            timer: 단계별 타이머
+
+        Returns:
+            BatchPlan
+
+        Raises:
+            BatchInputError: 목록 형식이 잘못되었거나 모든 목록에서 영화를 찾지 못했을 때
+        """
+        self._validate(lists)
+
+        # 1. 제목 → TMDb ID (모든 목록의 제목을 한 번씩만 검색)
+        with timer.stage("search"):
+            titles = [title for entry in lists for title in entry.get("titles") or []]
+            resolved = self._resolve_titles(titles, lang) if titles else {}
+
+        entries = []
+        for index, entry in enumerate(lists):
+            favorite_ids = [int(m) for m in entry.get("movie_ids") or []]
+            favorite_ids.extend(resolved[t] for t in entry.get("titles") or [] if resolved.get(t))
+            entries.append({
+                "id": entry.get("id", index),
+                "favorite_ids": list(dict.fromkeys(favorite_ids)),
+            })
+
+        # 2. 좋아하는 영화 합집합 상세 조회 1번
+        with timer.stage("favorites"):
+            favorite_union = list(dict.fromkeys(m for e in entries for m in e["favorite_ids"]))
+            profiles = {p.get("id"): p for p in tmdb_service.get_bulk_movie_details(favorite_union, lang)}
+
+        if not profiles:
+            raise BatchInputError("입력한 목록에서 TMDb 영화를 찾을 수 없습니다.")
+
+        # 목록별 후보 풀 (/api/analyze와 같은 순서 유지 중복 제거, 좋아하는 영화는 점수 계산에서 제외)
+        for entry in entries:
+            entry["favorite_ids"] = [m for m in entry["favorite_ids"] if m in profiles]
+            entry["candidate_ids"] = list(dict.fromkeys(
+                candidate_id
+                for movie_id in entry["favorite_ids"]
+                for candidate_id in profiles[movie_id].get("candidate_ids") or []
+            ))[:Config.CANDIDATE_LIMIT]
+
+        # 3. 후보 합집합 상세 조회 1번
+        with timer.stage("candidates"):
+            candidate_union = list(dict.fromkeys(
+                m for e in entries for m in e["candidate_ids"] if m not in profiles
+            ))
+            for profile in tmdb_service.get_bulk_movie_details(candidate_union, lang):
+                profiles[profile.get("id")] = profile
+
+        return BatchPlan(entries=entries, profiles=profiles)
+
+    def analyze(self, plan: BatchPlan, entry: Dict[str, Any], top_n: int) -> Dict[str, Any]:
+        """
+        목록 1개 분석 (/api/analyze와 같은 계산, 응답 항목에 id 추가)
+
+        Returns:
+            {"id", "favorites", "top_features", "top_genres", "top_directors", "top_actors",
+             "recommendations"} (실패하면 "error" 포함)
+        """
+        favorite_profiles = [plan.profiles[m] for m in entry["favorite_ids"]]
+        result: Dict[str, Any] = {
+            "id": entry["id"],
+            "favorites": [
+                {"id": p.get("id"), "title": p.get("title"), "poster": p.get("poster")}
+                for p in favorite_profiles
+            ],
+            "recommendations": [],
+        }
+        if not favorite_profiles:
+            result["error"] = "입력한 제목으로 TMDb에서 영화를 찾을 수 없습니다."
+            return result
+
+        try:
+            vectorizer, user_vector, top_features = recommendation_service.create_tfidf_profile(
+                favorite_profiles
+            )
+        except Exception as e:
+            result["error"] = f"TF-IDF 분석 실패: {e}"
+            return result
+
+        patterns = recommendation_service.analyze_patterns(favorite_profiles)
+        candidates = [plan.profiles[m] for m in entry["candidate_ids"] if m in plan.profiles]
+        top_movies = recommendation_service.rank(
+            vectorizer, user_vector, candidates, set(entry["favorite_ids"])
+        )
+        result.update({
+            "top_features": top_features,
+            "top_genres": patterns["top_genres"],
+            "top_directors": patterns["top_directors"],
+            "top_actors": patterns["top_actors"],
+            "recommendations": recommendation_service.recommendation_entries(top_movies[:top_n]),
+        })
+        return result
+
+    def score(self, plan: BatchPlan, top_n: int, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        목록 청크마다 분석 (스트리밍 시 청크 단위로 전송)
+
+        Yields:
+            청크의 목록별 결과 리스트
+        """
+        for start in range(0, len(plan.entries), chunk_size):
+            results = [self.analyze(plan, entry, top_n) for entry in plan.entries[start:start + chunk_size]]
+            metrics.inc("analyze_batch_lists_total", len(results))
+            yield results
+
+
+# 싱글톤 인스턴스
+batch_analyze_service = BatchAnalyzeService()
+
+metrics.describe("analyze_batch_lists_total", "counter", "일괄 분석으로 처리한 목록 수")
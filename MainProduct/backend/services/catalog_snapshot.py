@@ -0,0 +1,451 @@
+"""
+카탈로그 스냅샷 (정규화된 영화 프로필을 Arrow/Parquet 열 형식으로 저장 / 로드)
+
+캐시를 다시 채우려면 영화마다 TMDb get_movie_details를 호출해야 하므로, 새 컨테이너는
+네트워크 대신 스냅샷 파일로 core/overlay 캐시와 해시 특징(후보 행렬의 행)을 바로 채울 수 있습니다.
+
+스냅샷 디렉토리:
+    cores.arrow     영화당 1행 (MovieCore)
+    overlays.arrow  영화 × 언어당 1행 (MovieOverlay + 해시 특징)
+    manifest.json   형식, 개수, 생성 시각, 해시 특징 설정
+
+- 장르/키워드/출연/감독/작가는 list<dictionary<int32, string>> → 이름은 파일에 1번만 저장,
+  로드할 때도 사전의 문자열 객체를 모든 영화가 공유 (MovieCore의 intern과 같은 효과)
+- 해시 특징은 list<int32> 인덱스 + list<float32> 빈도 → 토큰화 없이 배열 그대로 사용
+- arrow(기본): 압축 없는 Arrow IPC 파일을 mmap으로 읽음 → 해시 특징 배열은 복사 없이 파일 페이지를 가리키므로
+  preload 모드에서 워커들이 페이지 캐시를 공유
+- parquet: zstd 압축 (전송/보관용, 로드할 때 압축 해제)
+- 항목마다 원래 조회 시각을 저장하여 복원 후에도 soft/hard TTL이 그대로 적용됨 (오래된 항목은 SWR로 갱신)
+
+해시 특징 설정(HASHING_N_FEATURES, 토큰화 설정)이 스냅샷과 다르면 특징은 다시 계산합니다.
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+from config import Config
+from services import feature_hashing
+from services.movie_profile import DocumentFeatures, MovieCore, MovieOverlay, MovieProfile
+from utils.lifecycle import on_preload
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+CORES = "cores"
+OVERLAYS = "overlays"
+MANIFEST_FILE = "manifest.json"
+FORMATS = ("arrow", "parquet")
+
+# Arrow record batch / Parquet row group 크기
+BATCH_SIZE = 10000
+
+
+def _require_pyarrow():
+    """numpy / pyarrow는 스냅샷을 읽고 쓸 때만 import (서버 시작 시 스냅샷이 없으면 불러오지 않음)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:  # pragma: no cover - 선택 의존성
+        raise RuntimeError("카탈로그 스냅샷을 읽고 쓰려면 pyarrow가 필요합니다.")
+
+
+def _names_type():
+    import pyarrow as pa
+
+    return pa.list_(pa.dictionary(pa.int32(), pa.string()))
+
+
+def _core_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.int32()),
+        ("keywords", _names_type()),
+        ("cast", _names_type()),
+        ("directors", _names_type()),
+        ("writers", _names_type()),
+        ("vote_average", pa.float64()),
+        ("vote_count", pa.int32()),
+        ("release_date", pa.string()),
+        ("runtime", pa.int32()),
+        ("imdb_id", pa.string()),
+        ("candidate_ids", pa.list_(pa.int32())),
+        ("fetched_at", pa.float64()),
+    ])
+
+
+def _overlay_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("movie_id", pa.int32()),
+        ("lang", pa.dictionary(pa.int32(), pa.string())),
+        ("title", pa.string()),
+        ("overview", pa.string()),
+        ("genres", _names_type()),
+        ("poster", pa.string()),
+        ("feature_indices", pa.list_(pa.int32())),
+        ("feature_counts", pa.list_(pa.float32())),
+        ("fetched_at", pa.float64()),
+    ])
+
+
+def _offsets(lengths: Iterable[int]) -> "pa.Array":
+    import numpy as np
+    import pyarrow as pa
+
+    lengths = np.fromiter(lengths, dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
+    return pa.array(offsets)
+
+
+def _names_array(rows: List[Tuple[str, ...]]) -> "pa.Array":
+    """이름 튜플 목록 → list<dictionary<int32, string>> (열 전체가 사전 1개를 공유)"""
+    import pyarrow as pa
+
+    values = pa.array([name for names in rows for name in names], pa.string()).dictionary_encode()
+    return pa.ListArray.from_arrays(_offsets(len(names) for names in rows), values)
+
+
+def _list_array(arrays: List["np.ndarray"], dtype) -> "pa.Array":
+    import numpy as np
+    import pyarrow as pa
+
+    values = np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.zeros(0, dtype=dtype)
+    return pa.ListArray.from_arrays(_offsets(len(a) for a in arrays), pa.array(values))
+
+
+class _NameDecoder:
+    """list<dictionary> 열 → 이름 튜플 (같은 사전은 한 번만 문자열로 변환)"""
+
+    def __init__(self):
+        self._lookups: Dict[Tuple[int, int], "np.ndarray"] = {}
+
+    def _lookup(self, dictionary: "pa.Array") -> "np.ndarray":
+        import numpy as np
+
+        key = (dictionary.buffers()[-1].address if len(dictionary) else 0, len(dictionary))
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            lookup = np.empty(len(dictionary), dtype=object)
+            lookup[:] = [sys.intern(name) for name in dictionary.to_pylist()]
+            self._lookups[key] = lookup
+        return lookup
+
+    def decode(self, column: "pa.ChunkedArray") -> List[Tuple[str, ...]]:
+        import numpy as np
+        import pyarrow as pa
+
+        rows = []
+        for chunk in column.chunks:
+            values = chunk.values
+            if pa.types.is_dictionary(values.type):
+                names = self._lookup(values.dictionary)[values.indices.to_numpy(zero_copy_only=False)]
+            else:
+                # Parquet에서 사전 형식이 복원되지 않은 경우
+                names = np.empty(len(values), dtype=object)
+                names[:] = [sys.intern(name) for name in values.to_pylist()]
+            offsets = chunk.offsets.to_numpy().tolist()
+            rows.extend(tuple(names[start:end]) for start, end in zip(offsets[:-1], offsets[1:]))
+        return rows
+
+
+def _list_slices(column: "pa.ChunkedArray") -> List["np.ndarray"]:
+    """list<숫자> 열 → 행별 numpy 배열 (Arrow 파일이면 mmap 버퍼를 가리키는 뷰, 복사 없음)"""
+    rows = []
+    for chunk in column.chunks:
+        values = chunk.values.to_numpy(zero_copy_only=False)
+        offsets = chunk.offsets.to_numpy().tolist()
+        rows.extend(values[start:end] for start, end in zip(offsets[:-1], offsets[1:]))
+    return rows
+
+
+class CatalogSnapshotService:
+    """카탈로그 스냅샷 저장/로드 서비스"""
+
+    def __init__(self):
+        self.loaded: Dict[str, Any] = {}
+
+    def state(self) -> Dict[str, Any]:
+        """마지막으로 로드한 스냅샷 정보 (없으면 빈 dict)"""
+        return dict(self.loaded)
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def save(
+        self,
+        path: str,
+        cores: List[Tuple[MovieCore, float]],
+        overlays: List[Tuple[MovieCore, MovieOverlay, float]],
+        fmt: str = "arrow"
+    ) -> Dict[str, Any]:
+        """
+        스냅샷 저장 (임시 디렉토리에 쓴 뒤 교체)
+
+        Args:
+            path: 스냅샷 디렉토리
+            cores: (core, 조회 시각) 목록
+            overlays: (같은 영화의 core, overlay, 조회 시각) 목록
+            fmt: arrow / parquet
+
+        Returns:
+            manifest
+        """
+        _require_pyarrow()
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 스냅샷 형식: {fmt}")
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        core_table = pa.Table.from_arrays([
+            pa.array([c.id for c, _ in cores], pa.int32()),
+            _names_array([c.keywords for c, _ in cores]),
+            _names_array([c.cast for c, _ in cores]),
+            _names_array([c.directors for c, _ in cores]),
+            _names_array([c.writers for c, _ in cores]),
+            pa.array([c.vote_average for c, _ in cores], pa.float64()),
+            pa.array([c.vote_count for c, _ in cores], pa.int32()),
+            pa.array([c.release_date for c, _ in cores], pa.string()),
+            pa.array([c.runtime for c, _ in cores], pa.int32()),
+            pa.array([c.imdb_id for c, _ in cores], pa.string()),
+            _list_array([np.asarray(c.candidate_ids, dtype=np.int32) for c, _ in cores], np.int32),
+            pa.array([fetched_at for _, fetched_at in cores], pa.float64()),
+        ], schema=_core_schema())
+
+        # 캐시된 특징이 다른 core로 계산된 것이면 다시 계산
+        features = [
+            MovieProfile(core, overlay).features or feature_hashing.build_features(core, overlay)
+            for core, overlay, _ in overlays
+        ]
+        overlay_table = pa.Table.from_arrays([
+            pa.array([core.id for core, _, _ in overlays], pa.int32()),
+            pa.array([overlay.lang for _, overlay, _ in overlays], pa.string()).dictionary_encode(),
+            pa.array([overlay.title for _, overlay, _ in overlays], pa.string()),
+            pa.array([overlay.overview for _, overlay, _ in overlays], pa.string()),
+            _names_array([overlay.genres for _, overlay, _ in overlays]),
+            pa.array([overlay.poster for _, overlay, _ in overlays], pa.string()),
+            _list_array([f.indices for f in features], np.int32),
+            _list_array([f.counts for f in features], np.float32),
+            pa.array([fetched_at for _, _, fetched_at in overlays], pa.float64()),
+        ], schema=_overlay_schema())
+
+        tmp_path = f"{path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        for name, table in ((CORES, core_table), (OVERLAYS, overlay_table)):
+            if fmt == "arrow":
+                with pa.OSFile(os.path.join(tmp_path, f"{name}.arrow"), "wb") as sink, \
+                        pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=BATCH_SIZE)
+            else:
+                pq.write_table(table, os.path.join(tmp_path, f"{name}.parquet"),
+                               compression="zstd", row_group_size=BATCH_SIZE)
+
+        manifest = {
+            "format": fmt,
+            "cores": core_table.num_rows,
+            "overlays": overlay_table.num_rows,
+            "languages": sorted({overlay.lang for _, overlay, _ in overlays}),
+            "features": feature_hashing.features_signature(),
+            "bytes": sum(os.path.getsize(os.path.join(tmp_path, f)) for f in os.listdir(tmp_path)),
+            "created_at": time.time(),
+        }
+        with open(os.path.join(tmp_path, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+        # 로드한 프로세스는 교체 전 파일을 계속 mmap으로 읽을 수 있음 (삭제된 파일도 열려 있는 동안 유지)
+        old_path = f"{path}.old"
+        shutil.rmtree(old_path, ignore_errors=True)
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+        return manifest
+
+    def export_caches(self, path: str, fmt: str = "arrow") -> Dict[str, Any]:
+        """
+        이 프로세스의 영화 프로필 캐시(core + overlay)를 스냅샷으로 저장
+
+        Returns:
+            manifest
+        """
+        from services.tmdb_service import tmdb_service
+
+        cores = {movie_id: entry for movie_id, entry in tmdb_service.core_cache.entries()}
+        overlays = [
+            (cores[movie_id].value, entry.value, entry.fetched_at)
+            for (movie_id, _), entry in tmdb_service.overlay_cache.entries()
+            if movie_id in cores
+        ]
+        return self.save(path, [(entry.value, entry.fetched_at) for entry in cores.values()], overlays, fmt)
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def manifest(path: str) -> Dict[str, Any]:
+        with open(os.path.join(path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _table(path: str, name: str) -> "pa.Table":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrow_path = os.path.join(path, f"{name}.arrow")
+        if os.path.exists(arrow_path):
+            return pa.ipc.open_file(pa.memory_map(arrow_path, "r")).read_all()
+        return pq.read_table(os.path.join(path, f"{name}.parquet"), memory_map=True)
+
+    def read(self, path: str) -> Tuple[Dict[int, Tuple[MovieCore, float]], List[Tuple[MovieCore, MovieOverlay, float]]]:
+        """
+        스냅샷 읽기
+
+        Returns:
+            ({영화 ID: (core, 조회 시각)}, [(core, 해시 특징이 포함된 overlay, 조회 시각)])
+            core가 없는 overlay는 제외됩니다.
+
+        Raises:
+            RuntimeError: pyarrow 없음
+            OSError: 스냅샷 파일 없음
+        """
+        _require_pyarrow()
+        features_valid = self.manifest(path).get("features") == feature_hashing.features_signature()
+        decoder = _NameDecoder()
+
+        table = self._table(path, CORES)
+        columns = {
+            name: decoder.decode(table.column(name))
+            for name in ("keywords", "cast", "directors", "writers")
+        }
+        candidates = _list_slices(table.column("candidate_ids"))
+        scalars = {
+            name: table.column(name).to_pylist()
+            for name in ("id", "vote_average", "vote_count", "release_date", "runtime", "imdb_id", "fetched_at")
+        }
+        cores = {}
+        for i, movie_id in enumerate(scalars["id"]):
+            cores[movie_id] = (MovieCore(
+                id=movie_id,
+                keywords=columns["keywords"][i],
+                cast=columns["cast"][i],
+                directors=columns["directors"][i],
+                writers=columns["writers"][i],
+                vote_average=scalars["vote_average"][i],
+                vote_count=scalars["vote_count"][i],
+                release_date=scalars["release_date"][i],
+                runtime=scalars["runtime"][i],
+                imdb_id=scalars["imdb_id"][i],
+                candidate_ids=tuple(candidates[i].tolist()),
+            ), scalars["fetched_at"][i])
+
+        table = self._table(path, OVERLAYS)
+        genres = decoder.decode(table.column("genres"))
+        indices = _list_slices(table.column("feature_indices"))
+        counts = _list_slices(table.column("feature_counts"))
+        scalars = {
+            name: table.column(name).to_pylist()
+            for name in ("movie_id", "lang", "title", "overview", "poster", "fetched_at")
+        }
+        overlays = []
+        for i, movie_id in enumerate(scalars["movie_id"]):
+            if movie_id not in cores:
+                continue
+            core = cores[movie_id][0]
+            overlay = MovieOverlay(
+                lang=sys.intern(scalars["lang"][i]),
+                title=scalars["title"][i],
+                overview=scalars["overview"][i] or "",
+                genres=genres[i],
+                poster=scalars["poster"][i],
+            )
+            if features_valid and len(indices[i]):
+                features = DocumentFeatures(indices=indices[i], counts=counts[i], core=core)
+            else:
+                features = feature_hashing.build_features(core, overlay)
+            overlays.append((core, replace(overlay, features=features), scalars["fetched_at"][i]))
+        return cores, overlays
+
+    def profiles(self, path: str, lang: str) -> List[MovieProfile]:
+        """스냅샷에서 한 언어의 영화 프로필 목록 (배치 작업 카탈로그 준비용)"""
+        _, overlays = self.read(path)
+        return [MovieProfile(core, overlay) for core, overlay, _ in overlays if overlay.lang == lang]
+
+    def load(self, path: str) -> Dict[str, Any]:
+        """
+        스냅샷을 TMDb 영화 프로필 캐시(core/overlay)에 로드
+
+        hard TTL이 지난 항목(과 core가 지난 영화의 overlay)은 건너뛰고, 나머지는 원래 조회 시각으로 넣어
+        soft TTL이 지난 항목은 처음 요청될 때 백그라운드에서 갱신됩니다.
+        캐시 크기보다 많으면 파일 뒤쪽(저장 시점에 최근 사용된 항목)이 남습니다.
+
+        Returns:
+            로드 결과 (state()와 같음)
+        """
+        from services.tmdb_service import tmdb_service
+
+        started = time.perf_counter()
+        cores, overlays = self.read(path)
+        cutoff = time.time() - Config.CACHE_DETAILS_HARD_TTL
+
+        loaded_cores = 0
+        for movie_id, (core, fetched_at) in cores.items():
+            if fetched_at > cutoff:
+                tmdb_service.core_cache.put(movie_id, core, fetched_at)
+                loaded_cores += 1
+        loaded_overlays = 0
+        for core, overlay, fetched_at in overlays:
+            # core가 만료되어 로드하지 않은 영화의 overlay는 해시 특징이 캐시에 없는 core를 가리키므로 제외
+            if fetched_at > cutoff and cores[core.id][1] > cutoff:
+                tmdb_service.overlay_cache.put((core.id, overlay.lang), overlay, fetched_at)
+                loaded_overlays += 1
+
+        elapsed = time.perf_counter() - started
+        manifest = self.manifest(path)
+        self.loaded = {
+            "path": path,
+            "format": manifest.get("format"),
+            "created_at": manifest.get("created_at"),
+            "cores": loaded_cores,
+            "overlays": loaded_overlays,
+            "expired": len(cores) - loaded_cores + len(overlays) - loaded_overlays,
+            "seconds": round(elapsed, 3),
+        }
+        metrics.observe("catalog_snapshot_load_seconds", elapsed)
+        metrics.set_gauge("catalog_snapshot_entries", loaded_cores, kind="core")
+        metrics.set_gauge("catalog_snapshot_entries", loaded_overlays, kind="overlay")
+        print(f"[스냅샷] core {loaded_cores}개 / overlay {loaded_overlays}개 로드 ({elapsed:.2f}초, {path})")
+        return self.state()
+
+
+# 싱글톤 인스턴스
+catalog_snapshot_service = CatalogSnapshotService()
+
+
+@on_preload
+def load_catalog_snapshot():
+    """시작 시 스냅샷을 캐시에 로드 (preload 모드: 마스터에서 fork 전 → 워커들이 공유)"""
+    if not (Config.CATALOG_SNAPSHOT_PATH and Config.CATALOG_SNAPSHOT_ON_START):
+        return
+    if not os.path.exists(os.path.join(Config.CATALOG_SNAPSHOT_PATH, MANIFEST_FILE)):
+        print(f"[알림] 카탈로그 스냅샷이 없습니다: {Config.CATALOG_SNAPSHOT_PATH}")
+        return
+    try:
+        catalog_snapshot_service.load(Config.CATALOG_SNAPSHOT_PATH)
+    except Exception as e:
+        print(f"[경고] 카탈로그 스냅샷 로드 실패: {e}")
+
+
+metrics.describe("catalog_snapshot_load_seconds", "histogram", "카탈로그 스냅샷 로드 시간",
+                 buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0))
+metrics.describe("catalog_snapshot_entries", "gauge", "스냅샷에서 로드한 캐시 항목 수", aggregate="max")
@@ -0,0 +1,236 @@
+"""
+협업 필터링 추천 점수 (Implicit ALS)
+
+reviews 테이블의 (작성자, 영화, 별점)을 암시적 피드백으로 보고 행렬 분해로 영화 factor를 학습합니다.
+- 학습: jobs/train_cf.py (오프라인, 전체 학습 또는 새 리뷰만 fold-in)
+- 요청 시: 입력한 좋아하는 영화들로 사용자 벡터를 fold-in 하여 후보 영화 점수 계산
+  → 외부 API 호출 없이 행렬 연산만 추가
+
+모델 파일 (Config.CF_MODEL_DIR):
+    item_ids.npy      영화 ID (오름차순, int64)
+    item_factors.npy  영화 factor (float32, item_ids와 같은 순서)
+    user_factors.npy  작성자 factor (float32, 증분 학습용)
+    users.json        작성자 이름 목록 (user_factors와 같은 순서)
+    manifest.json     하이퍼파라미터, 마지막으로 반영한 리뷰 ID (마지막에 기록)
+"""
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from config import Config
+from utils.lifecycle import on_preload
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MANIFEST_FILE = "manifest.json"
+USERS_FILE = "users.json"
+
+
+def confidence(ratings: "np.ndarray", alpha: float) -> "np.ndarray":
+    """별점(0~5) → 신뢰도 (1 + alpha × 별점/5)"""
+    return 1.0 + alpha * (ratings / 5.0)
+
+
+def solve_rows(
+    fixed: "np.ndarray",
+    indptr: "np.ndarray",
+    indices: "np.ndarray",
+    ratings: "np.ndarray",
+    regularization: float,
+    alpha: float
+) -> "np.ndarray":
+    """
+    ALS 한 쪽 갱신: 반대쪽 factor(fixed)를 고정하고 CSR 각 행의 factor 계산
+
+    x_r = (YᵀY + Yᵣᵀ(Cᵣ - I)Yᵣ + λI)⁻¹ Yᵣᵀ Cᵣ p   (p = 1, Hu et al. 2008)
+
+    Args:
+        fixed: 고정된 factor 행렬 (n × k)
+        indptr / indices / ratings: 행 → 열(fixed 행 번호), 별점 CSR 배열
+        regularization: λ
+        alpha: 신뢰도 계수
+
+    Returns:
+        행 factor 행렬 (행 수 × k, 평가가 없는 행은 0)
+    """
+    import numpy as np
+
+    fixed = np.asarray(fixed, dtype=np.float64)
+    k = fixed.shape[1]
+    gram = fixed.T @ fixed
+    eye = regularization * np.eye(k)
+    out = np.zeros((len(indptr) - 1, k), dtype=np.float64)
+
+    for row in range(len(indptr) - 1):
+        start, end = indptr[row], indptr[row + 1]
+        if start == end:
+            continue
+        y = fixed[indices[start:end]]
+        c = confidence(ratings[start:end], alpha)
+        a = gram + (y.T * (c - 1.0)) @ y + eye
+        out[row] = np.linalg.solve(a, y.T @ c)
+    return out
+
+
+def fold_in(
+    fixed: "np.ndarray",
+    gram: "np.ndarray",
+    rows: "np.ndarray",
+    ratings: "np.ndarray",
+    regularization: float,
+    alpha: float
+) -> "np.ndarray":
+    """
+    반대쪽 factor를 고정하고 새 행(사용자/영화) 1개의 factor 계산
+
+    Args:
+        fixed: 고정된 factor 행렬
+        gram: fixedᵀ fixed (미리 계산)
+        rows: 평가한 fixed 행 번호
+        ratings: 별점
+    """
+    import numpy as np
+
+    y = np.asarray(fixed[rows], dtype=np.float64)
+    c = confidence(np.asarray(ratings, dtype=np.float64), alpha)
+    a = gram + (y.T * (c - 1.0)) @ y + regularization * np.eye(gram.shape[0])
+    return np.linalg.solve(a, y.T @ c)
+
+
+class CollaborativeModel:
+    """학습된 영화 factor (mmap으로 로드, 워커 간 공유)"""
+
+    def __init__(self, model_dir: str, mmap: bool = True):
+        import numpy as np
+
+        with open(os.path.join(model_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+
+        mode = "r" if mmap else None
+        self.item_ids = np.load(os.path.join(model_dir, "item_ids.npy"), mmap_mode=mode)
+        self.item_factors = np.load(os.path.join(model_dir, "item_factors.npy"), mmap_mode=mode)
+        self.user_factors = np.load(os.path.join(model_dir, "user_factors.npy"), mmap_mode=mode)
+        with open(os.path.join(model_dir, USERS_FILE), "r", encoding="utf-8") as f:
+            self.users: List[str] = json.load(f)
+
+        self.regularization = self.manifest["regularization"]
+        self.alpha = self.manifest["alpha"]
+        factors = np.asarray(self.item_factors, dtype=np.float64)
+        self.gram = factors.T @ factors
+
+    def rows_for(self, movie_ids: Iterable[int]) -> "np.ndarray":
+        """영화 ID → item 행 번호 (모델에 없는 영화는 -1)"""
+        import numpy as np
+
+        ids = np.asarray(list(movie_ids), dtype=np.int64)
+        if not len(self.item_ids) or not len(ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.searchsorted(self.item_ids, ids)
+        pos = np.minimum(pos, len(self.item_ids) - 1)
+        return np.where(self.item_ids[pos] == ids, pos, -1)
+
+    def user_vector(self, movie_ids: Iterable[int]) -> Optional["np.ndarray"]:
+        """좋아하는 영화들로 사용자 벡터 fold-in (모델에 있는 영화가 없으면 None)"""
+        import numpy as np
+
+        rows = self.rows_for(movie_ids)
+        rows = rows[rows >= 0]
+        if not len(rows):
+            return None
+        # 좋아하는 영화 = 별점 5점으로 간주
+        return fold_in(self.item_factors, self.gram, rows, np.full(len(rows), 5.0),
+                       self.regularization, self.alpha)
+
+    def scores(self, user_vector: "np.ndarray", movie_ids: List[int]) -> Dict[int, float]:
+        """
+        후보 영화의 예측 선호도 (0~1로 자름, 모델에 없는 영화는 제외)
+        """
+        import numpy as np
+
+        rows = self.rows_for(movie_ids)
+        known = rows >= 0
+        if not known.any():
+            return {}
+        predicted = np.clip(np.asarray(self.item_factors[rows[known]]) @ user_vector, 0.0, 1.0)
+        ids = np.asarray(movie_ids, dtype=np.int64)[known]
+        return {int(movie_id): float(score) for movie_id, score in zip(ids, predicted)}
+
+
+class CollaborativeService:
+    """
+    협업 필터링 점수 서비스
+
+    모델 디렉토리의 manifest가 바뀌면(재학습) CF_RELOAD_INTERVAL초 이내에 다시 로드합니다.
+    모델이 없으면 빈 점수를 반환하여 콘텐츠 기반 추천만 사용됩니다.
+    """
+
+    def __init__(self, model_dir: str):
+        self.model_dir = model_dir
+        self.model: Optional[CollaborativeModel] = None
+        self._loaded_mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _manifest_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(os.path.join(self.model_dir, MANIFEST_FILE))
+        except OSError:
+            return None
+
+    def load(self) -> Optional[CollaborativeModel]:
+        """필요하면 모델 (재)로드"""
+        now = time.monotonic()
+        if self._checked_at and now - self._checked_at < Config.CF_RELOAD_INTERVAL:
+            return self.model
+
+        with self._lock:
+            self._checked_at = now
+            mtime = self._manifest_mtime()
+            if mtime is None or mtime == self._loaded_mtime:
+                return self.model
+            try:
+                self.model = CollaborativeModel(self.model_dir)
+                self._loaded_mtime = mtime
+                print(f"[CF] 모델 로드: 영화 {len(self.model.item_ids)}편, "
+                      f"작성자 {len(self.model.users)}명")
+            except Exception as e:
+                print(f"[ERROR] CF 모델 로드 실패: {e}")
+        return self.model
+
+    def score(self, favorite_ids: Iterable[int], candidate_ids: List[int]) -> Dict[int, float]:
+        """
+        후보 영화별 협업 필터링 점수
+
+        Args:
+            favorite_ids: 사용자가 입력한 좋아하는 영화 ID
+            candidate_ids: 후보 영화 ID
+
+        Returns:
+            {영화 ID: 점수(0~1)} (모델에 없는 영화는 포함되지 않음)
+        """
+        model = self.load()
+        if model is None:
+            return {}
+        user_vector = model.user_vector(favorite_ids)
+        if user_vector is None:
+            metrics.inc("cf_requests_total", result="cold")
+            return {}
+        scores = model.scores(user_vector, candidate_ids)
+        metrics.inc("cf_requests_total", result="ok" if scores else "no_overlap")
+        return scores
+
+
+# 싱글톤 인스턴스
+collaborative_service = CollaborativeService(Config.CF_MODEL_DIR)
+
+metrics.describe("cf_requests_total", "counter", "협업 필터링 점수 요청 수 (ok / cold / no_overlap)")
+
+
+@on_preload
+def load_cf_model():
+    """gunicorn 마스터에서 모델을 mmap으로 로드 (워커는 fork로 공유)"""
+    collaborative_service.load()
@@ -0,0 +1,428 @@
+"""
+특징 해싱(feature hashing) TF-IDF (TFIDF_MODE=hashing)
+
+기본 방식은 요청마다 좋아하는 영화의 단어로 어휘(dict, 최대 TFIDF_MAX_FEATURES개)를 만들고
+그 어휘로 TfidfVectorizer를 구성합니다. 해싱 방식은 단어를 murmurhash로
+고정 크기(HASHING_N_FEATURES) 인덱스에 바로 대응시키므로
+- 어휘 dict가 없고 fit도 없음 → 새 영화를 그대로 벡터화, 워커 간 공유할 상태 없음
+- IDF: jobs/hashing_idf.py로 만든 코퍼스 IDF 벡터(.npy)가 있으면 mmap으로 읽어 워커들이 공유,
+  없으면 기본 방식과 같이 좋아하는 영화 기준 smooth IDF
+- 후보 벡터는 기본 방식과 같이 좋아하는 영화에 나온 특징만 사용 (해시 충돌 외에는 같은 점수)
+  요청별 행렬의 열은 그 특징들(정렬된 해시 인덱스 배열)이므로 2^20 크기 배열을 만들지 않습니다.
+- top_features: 해시 인덱스 → 단어 역조회 스케치 (크기 제한 LRU, 없으면 좋아하는 영화 단어에서 찾아 채움)
+
+영화 문서의 해시 특징(DocumentFeatures)은 프로필을 조회할 때 한 번 계산되어 캐시된 overlay에 함께 저장되고,
+후보 행렬은 두 방식 모두 이 배열들을 이어 붙여 만듭니다 (요청마다 문서 생성/토큰화 없음).
+
+해시는 sklearn HashingVectorizer / FeatureHasher와 같습니다 (murmurhash3_32, seed 0, 부호 없음).
+"""
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import Config
+from services.movie_profile import DocumentFeatures, MovieCore, MovieOverlay, MovieProfile
+from utils.cache import LRUCache
+from utils.lifecycle import on_preload
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy import sparse
+
+_hashing_vectorizer = None
+_idf: Optional["np.ndarray"] = None
+_idf_loaded = False
+
+
+def hashing_vectorizer():
+    """단어 빈도 HashingVectorizer (TF-IDF 토큰화 설정과 같음, 정규화 없음)"""
+    global _hashing_vectorizer
+    if _hashing_vectorizer is None:
+        import numpy as np
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from services.recommendation import TFIDF_PARAMS
+
+        _hashing_vectorizer = HashingVectorizer(
+            n_features=Config.HASHING_N_FEATURES,
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32,
+            **TFIDF_PARAMS
+        )
+    return _hashing_vectorizer
+
+
+def feature_index(term: str) -> int:
+    """단어의 해시 인덱스 (HashingVectorizer와 같은 값)"""
+    from sklearn.utils import murmurhash3_32
+
+    return abs(murmurhash3_32(term, positive=False)) % Config.HASHING_N_FEATURES
+
+
+def features_signature() -> Dict[str, Any]:
+    """해시 특징을 만든 설정 (저장된 특징을 그대로 쓸 수 있는지 확인용)"""
+    from services.recommendation import TFIDF_PARAMS
+
+    return {"n_features": Config.HASHING_N_FEATURES, "tfidf_params": repr(sorted(TFIDF_PARAMS.items()))}
+
+
+def build_features(core: MovieCore, overlay: MovieOverlay) -> DocumentFeatures:
+    """
+    영화 1편의 TF-IDF 문서를 토큰화하여 해시 특징 생성 (프로필을 캐시할 때 한 번)
+
+    Args:
+        core: 언어와 무관한 영화 정보
+        overlay: 언어별 영화 정보 (문서의 줄거리/장르)
+
+    Returns:
+        core를 기록한 DocumentFeatures
+    """
+    metrics.inc("document_features_built_total", source="fetch")
+    return _features(MovieProfile(core, overlay), core)
+
+
+def document_features(profile: Dict[str, Any]) -> DocumentFeatures:
+    """
+    프로필의 해시 특징 (캐시된 것이 있으면 그대로, dict 프로필 등은 문서를 토큰화하여 계산)
+    """
+    features = getattr(profile, "features", None)
+    if features is not None:
+        return features
+    metrics.inc("document_features_built_total", source="request")
+    return _features(profile, None)
+
+
+def _features(profile: Dict[str, Any], core: Optional[MovieCore]) -> DocumentFeatures:
+    import numpy as np
+    from services.recommendation import RecommendationService
+
+    # HashingVectorizer 결과는 행 안에서 인덱스가 정렬되어 있고 중복이 없음
+    counts = hashing_vectorizer().transform([RecommendationService.build_document(profile)])
+    return DocumentFeatures(
+        indices=counts.indices.astype(np.int32),
+        counts=counts.data.astype(np.float32),
+        core=core,
+    )
+
+
+def counts_matrix(features: List[DocumentFeatures]) -> "sparse.csr_matrix":
+    """해시 특징들을 이어 붙인 단어 빈도 행렬 (n × HASHING_N_FEATURES, 복사 외에는 연산 없음)"""
+    import numpy as np
+    from scipy import sparse
+
+    indptr = np.zeros(len(features) + 1, dtype=np.int64)
+    np.cumsum([len(f.indices) for f in features], out=indptr[1:])
+    if features:
+        indices = np.concatenate([f.indices for f in features])
+        data = np.concatenate([f.counts for f in features])
+    else:
+        indices = np.zeros(0, dtype=np.int32)
+        data = np.zeros(0, dtype=np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(features), Config.HASHING_N_FEATURES))
+
+
+def hash_terms(weights: Dict[str, float]) -> "sparse.csr_matrix":
+    """{단어: 값} → 1 × HASHING_N_FEATURES 희소 벡터 (충돌한 단어는 합산)"""
+    import numpy as np
+    from sklearn.feature_extraction import FeatureHasher
+
+    hasher = FeatureHasher(
+        n_features=Config.HASHING_N_FEATURES, input_type="dict", alternate_sign=False, dtype=np.float64
+    )
+    return hasher.transform([weights]).tocsr()
+
+
+def corpus_idf() -> Optional["np.ndarray"]:
+    """
+    코퍼스 IDF 벡터 (HASHING_IDF_PATH, 처음 사용할 때 mmap으로 로드)
+
+    Returns:
+        길이 HASHING_N_FEATURES의 float32 배열 (파일이 없거나 크기가 다르면 None)
+    """
+    global _idf, _idf_loaded
+    if _idf_loaded:
+        return _idf
+    _idf_loaded = True
+
+    path = Config.HASHING_IDF_PATH
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        import numpy as np
+
+        idf = np.load(path, mmap_mode="r")
+        if idf.shape != (Config.HASHING_N_FEATURES,):
+            print(f"[경고] 해싱 IDF 크기 {idf.shape}가 HASHING_N_FEATURES({Config.HASHING_N_FEATURES})와 다릅니다.")
+            return None
+        _idf = idf
+        print(f"[해싱] 코퍼스 IDF 로드: {path} ({_idf_meta(path).get('n_docs', '?')}편 기준)")
+    except Exception as e:
+        print(f"[경고] 해싱 IDF 로드 실패: {e}")
+    return _idf
+
+
+def _idf_meta(path: str) -> Dict[str, Any]:
+    try:
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class FeatureNameSketch:
+    """
+    해시 인덱스 → 대표 단어 역조회 (크기 제한 LRU)
+
+    어휘 dict 전체를 두지 않고 top_features에 나온 인덱스만 기억합니다.
+    모르는 인덱스는 호출한 쪽이 준 단어들(좋아하는 영화의 단어)을 해시하여 찾습니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self._names = LRUCache(maxsize=maxsize)
+
+    def lookup(self, indices: Iterable[int], terms: Callable[[], Iterable[str]]) -> Dict[int, str]:
+        """
+        Args:
+            indices: 이름이 필요한 해시 인덱스
+            terms: 스케치에 없을 때 찾아볼 단어들 (필요할 때만 호출)
+
+        Returns:
+            {인덱스: 단어} (찾지 못한 인덱스는 '#인덱스')
+        """
+        names = {}
+        missing = set()
+        for index in indices:
+            name = self._names.get(index)
+            if name is None:
+                missing.add(index)
+            else:
+                names[index] = name
+
+        if missing:
+            for term in terms():
+                index = feature_index(term)
+                if index in missing:
+                    self._names.put(index, term)
+                    names[index] = term
+                    missing.discard(index)
+                    if not missing:
+                        break
+            for index in missing:
+                names[index] = f"#{index}"
+        return names
+
+
+class HashedTfidfVectorizer:
+    """
+    후보 영화 변환기 (TfidfVectorizer.transform 대체)
+
+    좋아하는 영화에 나온 해시 인덱스(columns, 정렬됨)와 그 IDF만 가지고 있으며,
+    변환 결과의 열 j는 해시 인덱스 columns[j]입니다 (사용자 벡터와 같은 순서).
+    """
+
+    def __init__(self, columns: "np.ndarray", idf: "np.ndarray"):
+        self.columns = columns
+        self.idf_ = idf
+
+    def transform(self, documents: List[str]) -> "sparse.csr_matrix":
+        """문서 → 행 단위 L2 정규화된 TF-IDF 행렬 (좋아하는 영화에 없는 특징은 0)"""
+        counts = hashing_vectorizer().transform(documents)
+        return self.weigh(counts)
+
+    def transform_features(self, features: List[DocumentFeatures]) -> "sparse.csr_matrix":
+        """캐시된 해시 특징 → transform과 같은 행렬 (토큰화 없음)"""
+        return self.weigh(counts_matrix(features))
+
+    def weigh(self, counts: "sparse.csr_matrix") -> "sparse.csr_matrix":
+        """해시 단어 빈도 행렬 → columns 열만 남기고 IDF를 곱해 행 단위 L2 정규화 (n × len(columns))"""
+        import numpy as np
+        from scipy import sparse
+        from sklearn.preprocessing import normalize
+
+        counts = counts.tocsr()
+        positions = np.minimum(np.searchsorted(self.columns, counts.indices), len(self.columns) - 1)
+        known = self.columns[positions] == counts.indices
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        matrix = sparse.csr_matrix(
+            ((counts.data[known] * self.idf_[positions[known]]).astype(np.float32),
+             (rows[known], positions[known])),
+            shape=(counts.shape[0], len(self.columns))
+        )
+        return normalize(matrix, copy=False)
+
+
+def _user_vector(
+    columns: "np.ndarray",
+    sums: "np.ndarray",
+    doc_freqs: "np.ndarray",
+    n_favorites: int
+) -> Tuple[HashedTfidfVectorizer, "np.ndarray", "np.ndarray"]:
+    """해시 인덱스별 합계/문서 빈도 → (vectorizer, 사용자 벡터(1 × len(columns)), 인덱스별 값)"""
+    idf = _column_idf(columns, doc_freqs, n_favorites)
+    values = idf * sums / n_favorites
+    return HashedTfidfVectorizer(columns, idf), values.reshape(1, -1), values
+
+
+def _column_idf(columns: "np.ndarray", doc_freqs: "np.ndarray", n_favorites: int) -> "np.ndarray":
+    """해시 인덱스별 IDF (코퍼스 IDF가 없으면 좋아하는 영화 기준 smooth IDF)"""
+    import numpy as np
+
+    idf = corpus_idf()
+    if idf is not None:
+        return np.asarray(idf[columns], dtype=np.float64)
+    # 충돌로 합산된 문서 빈도는 좋아하는 영화 수를 넘지 않도록
+    doc_freqs = np.minimum(doc_freqs, n_favorites)
+    return np.log((1.0 + n_favorites) / (1.0 + doc_freqs)) + 1.0
+
+
+def _top_features(
+    columns: "np.ndarray",
+    values: "np.ndarray",
+    terms: Callable[[], Iterable[str]]
+) -> List[Tuple[str, float]]:
+    top = values.argsort()[::-1][:10]
+    names = feature_names.lookup((int(columns[i]) for i in top), terms)
+    return [(names[int(columns[i])], float(values[i])) for i in top]
+
+
+def create_tfidf_profile(
+    favorite_profiles: List[Dict[str, Any]]
+) -> Tuple[HashedTfidfVectorizer, "np.ndarray", List[Tuple[str, float]]]:
+    """
+    RecommendationService.create_tfidf_profile의 해싱 버전 (어휘 dict 없음)
+
+    사용자 선호 벡터 = 좋아하는 영화들의 (행 단위 L2 정규화된) TF-IDF 벡터 평균
+
+    Returns:
+        (vectorizer, user_vector, top_features)
+    """
+    import numpy as np
+    from sklearn.preprocessing import normalize
+    from services.recommendation import RecommendationService
+
+    if not favorite_profiles:
+        raise ValueError("최소 1개 이상의 영화 프로필이 필요합니다.")
+
+    counts = counts_matrix([document_features(p) for p in favorite_profiles]).astype(np.float64)
+    if counts.nnz == 0:
+        raise ValueError("최소 1개 이상의 영화 프로필이 필요합니다.")
+    # 행 안의 해시 인덱스는 중복이 없으므로 인덱스별 등장 횟수 = 문서 빈도
+    columns, inverse = np.unique(counts.indices, return_inverse=True)
+    doc_freqs = np.bincount(inverse, minlength=len(columns)).astype(np.float64)
+    columns = columns.astype(np.int64)
+    idf = _column_idf(columns, doc_freqs, len(favorite_profiles))
+
+    # 영화별 TF-IDF를 L2 정규화한 뒤 영화 간 평균
+    counts.data = counts.data * idf[inverse]
+    vectors = normalize(counts, copy=False)
+    values = np.bincount(inverse, weights=vectors.data, minlength=len(columns)) / len(favorite_profiles)
+    vectorizer, user_vector = HashedTfidfVectorizer(columns, idf), values.reshape(1, -1)
+
+    def terms():
+        # 스케치에 없는 이름을 찾을 때만 문서를 다시 토큰화
+        analyzer = hashing_vectorizer().build_analyzer()
+        return dict.fromkeys(
+            term for p in favorite_profiles for term in analyzer(RecommendationService.build_document(p))
+        )
+
+    return vectorizer, user_vector, _top_features(columns, values, terms)
+
+
+def vectorize_taste(
+    term_sums: Dict[str, float],
+    doc_freq: Dict[str, int],
+    n_favorites: int
+) -> Tuple[HashedTfidfVectorizer, "np.ndarray", List[Tuple[str, float]]]:
+    """RecommendationService.vectorize_taste의 해싱 버전 (저장된 취향 프로필의 단어 합계로 계산)"""
+    import numpy as np
+
+    if not n_favorites or not term_sums:
+        raise ValueError("최소 1개 이상의 영화 프로필이 필요합니다.")
+
+    summed = hash_terms(term_sums)
+    summed.sort_indices()
+    doc_freqs = hash_terms({term: float(doc_freq.get(term, 1)) for term in term_sums})
+    doc_freqs.sort_indices()
+
+    columns = summed.indices.astype(np.int64)
+    vectorizer, user_vector, values = _user_vector(columns, summed.data, doc_freqs.data, n_favorites)
+
+    # 충돌한 단어 중에는 합계가 큰 단어를 대표로
+    return vectorizer, user_vector, _top_features(
+        columns, values, lambda: sorted(term_sums, key=term_sums.get, reverse=True)
+    )
+
+
+def project_terms(
+    terms: List[str],
+    idf: "np.ndarray",
+    values: "np.ndarray"
+) -> Tuple[HashedTfidfVectorizer, "np.ndarray"]:
+    """
+    어휘 방식(단어별) 사용자 벡터를 해시 인덱스 열로 옮김 → 후보는 캐시된 해시 특징으로 변환
+
+    같은 인덱스로 충돌한 단어는 값을 합산하고 IDF는 큰 값을 사용합니다.
+
+    Args:
+        terms: 어휘 (단어 리스트)
+        idf: 단어별 IDF
+        values: 단어별 사용자 벡터 값
+
+    Returns:
+        (vectorizer, user_vector(1 × 열 수))
+    """
+    import numpy as np
+    from sklearn.utils import murmurhash3_32
+
+    n_features = Config.HASHING_N_FEATURES
+    hashes = np.fromiter(
+        (abs(murmurhash3_32(term, positive=False)) % n_features for term in terms),
+        dtype=np.int64, count=len(terms)
+    )
+    columns, inverse = np.unique(hashes, return_inverse=True)
+    column_idf = np.zeros(len(columns))
+    np.maximum.at(column_idf, inverse, idf)
+    column_values = np.bincount(inverse, weights=values, minlength=len(columns))
+    return HashedTfidfVectorizer(columns, column_idf), column_values.reshape(1, -1)
+
+
+def tfidf_matrix(documents: List[str]) -> "sparse.csr_matrix":
+    """
+    카탈로그 TF-IDF 행렬 (일괄 분석용, 행 단위 L2 정규화, fit 없음)
+
+    코퍼스 IDF가 없으면 주어진 문서들 기준 smooth IDF를 사용합니다.
+    """
+    return catalog_matrix(hashing_vectorizer().transform(documents).tocsr())
+
+
+def catalog_matrix(counts: "sparse.csr_matrix") -> "sparse.csr_matrix":
+    """단어 빈도 행렬(tfidf_matrix / counts_matrix) → 카탈로그 TF-IDF 행렬"""
+    import numpy as np
+    from sklearn.preprocessing import normalize
+
+    idf = corpus_idf()
+    if idf is None:
+        doc_freq = np.bincount(counts.indices, minlength=Config.HASHING_N_FEATURES)
+        idf = np.log((1.0 + counts.shape[0]) / (1.0 + doc_freq)) + 1.0
+    counts.data = (counts.data * idf[counts.indices]).astype(np.float32)
+    return normalize(counts, copy=False)
+
+
+# 싱글톤 인스턴스
+feature_names = FeatureNameSketch(Config.HASHING_NAME_SKETCH_SIZE)
+
+
+@on_preload
+def load_hashing_idf():
+    """gunicorn 마스터에서 코퍼스 IDF를 mmap (워커는 fork로 같은 페이지 공유)"""
+    # 프로필 해시 특징은 두 방식 모두 사용
+    hashing_vectorizer()
+    if Config.TFIDF_MODE == "hashing":
+        corpus_idf()
+
+
+metrics.describe(
+    "document_features_built_total", "counter",
+    "영화 문서 토큰화 횟수 (fetch: 프로필 캐시 시 1번, request: 캐시된 특징이 없어 요청 중 계산)"
+)
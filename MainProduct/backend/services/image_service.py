@@ -0,0 +1,431 @@
+"""
+포스터 / 제공처 로고 이미지 프록시
+
+TMDb CDN 이미지를 받아 UI에 필요한 크기로 줄이고(WebP/AVIF 지원 시 변환) 디스크에 캐시합니다.
+- 원본은 요청 폭 이상인 TMDb 크기 중 가장 작은 것을 받음 (w342 포스터를 92px로 줄이는 식)
+- 디스크 캐시는 내용 주소 방식: blobs/<sha256> 에 바이트, refs/<키 해시> 에 (sha256, MIME)
+  → 같은 이미지는 한 번만 저장, ETag = sha256
+- TMDb 이미지 경로는 내용이 바뀌면 파일명이 바뀌므로 응답은 immutable로 캐시 가능
+- Pillow가 없으면 크기 변환 없이 가장 가까운 TMDb 크기 원본을 그대로 캐시/응답
+"""
+import base64
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+
+from config import Config
+from utils.lifecycle import on_post_fork, on_preload
+from utils.metrics import metrics
+
+TMDB_IMAGE_HOST = "https://image.tmdb.org/t/p"
+
+# TMDb가 제공하는 이미지 폭 (종류별)
+SOURCE_WIDTHS = {
+    "poster": (92, 154, 185, 342, 500, 780),
+    "logo": (45, 92, 154, 185, 300, 500),
+}
+
+# TMDb 파일명만 허용 (경로 이동 / 임의 URL 요청 방지)
+FILENAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}\.(jpg|jpeg|png|svg|webp)$")
+
+MIME_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+
+@lru_cache(maxsize=None)
+def _pillow():
+    """Pillow Image 모듈 (이미지를 변환할 때 import, 설치되어 있지 않으면 None)"""
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - 선택 의존성
+        return None
+    return Image
+
+
+class ImageNotFound(Exception):
+    """허용되지 않는 요청이거나 TMDb에 이미지가 없을 때"""
+
+
+def tmdb_filename(url: Optional[str]) -> Optional[str]:
+    """TMDb 이미지 URL/경로에서 파일명 추출 (예: .../w342/abc.jpg → abc.jpg)"""
+    if not url:
+        return None
+    filename = url.rsplit("/", 1)[-1]
+    return filename if FILENAME_PATTERN.match(filename) else None
+
+
+class ImageCache:
+    """내용 주소 방식 디스크 캐시 (프로세스 간 공유, 임시 파일 → rename으로 원자적 기록)"""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._writes = 0
+        # 용량 추정치: 마지막 정리 때 측정한 blob 합계 + 이후 이 프로세스가 쓴 바이트 (측정 전에는 None)
+        self._approx_bytes: Optional[int] = None
+        self._pruning = False
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        """fork 이후: 부모에서 실행 중이던 정리 스레드는 자식에 없음"""
+        self._pruning = False
+        self._lock = threading.Lock()
+
+    def _ref_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "refs", digest[:2], digest)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[Tuple[str, str, str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (파일 경로, sha256, MIME) 또는 None (없거나 정리로 삭제됨)
+        """
+        try:
+            with open(self._ref_path(key), "r", encoding="ascii") as f:
+                digest, mimetype = f.read().split()
+        except (OSError, ValueError):
+            return None
+        path = self._blob_path(digest)
+        return (path, digest, mimetype) if os.path.exists(path) else None
+
+    def read(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """캐시된 바이트와 MIME"""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        try:
+            with open(entry[0], "rb") as f:
+                return f.read(), entry[2]
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes, mimetype: str) -> Tuple[str, str, str]:
+        """바이트 저장 후 (파일 경로, sha256, MIME) 반환"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        written = 0
+        if not os.path.exists(path):
+            self._write_atomic(path, data)
+            written = len(data)
+        self._write_atomic(self._ref_path(key), f"{digest} {mimetype}".encode("ascii"))
+
+        # 추정 용량이 상한을 넘었거나(측정 전 포함) IMAGE_CACHE_PRUNE_EVERY번째 쓰기일 때만
+        # 백그라운드에서 정리 (다른 워커가 쓴 양은 주기적 정리로 반영)
+        with self._lock:
+            self._writes += 1
+            if self._approx_bytes is not None:
+                self._approx_bytes += written
+            over = self._approx_bytes is None or self._approx_bytes > self.max_bytes
+            should_prune = not self._pruning and (over or self._writes % Config.IMAGE_CACHE_PRUNE_EVERY == 0)
+            if should_prune:
+                self._pruning = True
+        if should_prune:
+            threading.Thread(target=self._prune_in_background, name="image-cache-prune", daemon=True).start()
+        return path, digest, mimetype
+
+    def _prune_in_background(self):
+        try:
+            self.prune()
+        except Exception as e:
+            print(f"[ERROR] 이미지 캐시 정리 실패: {e}")
+        finally:
+            with self._lock:
+                self._pruning = False
+
+    def prune(self):
+        """용량을 넘으면 오래된 blob부터 삭제 (ref는 조회 시 blob이 없으면 미스로 처리)"""
+        blobs = []
+        total = 0
+        for directory, _, files in os.walk(os.path.join(self.root, "blobs")):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total > self.max_bytes:
+            blobs.sort()
+            removed = 0
+            for _, size, path in blobs:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    continue
+            metrics.inc("image_cache_evictions_total", removed)
+
+        with self._lock:
+            self._approx_bytes = total
+
+
+class ImageService:
+    """이미지 프록시 서비스 (크기 변환 + 디스크 캐시 + 프리페치)"""
+
+    def __init__(self):
+        self.cache = ImageCache(Config.IMAGE_CACHE_DIR, Config.IMAGE_CACHE_MAX_MB * 1024 * 1024)
+        self.session = requests.Session()
+        self._fetch_slots = threading.BoundedSemaphore(Config.IMAGE_FETCH_CONCURRENCY)
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._inflight_lock = threading.Lock()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_pending = 0
+        self._prefetch_lock = threading.Lock()
+        self._bundle_executor: Optional[ThreadPoolExecutor] = None
+        self._formats: Optional[Tuple[str, ...]] = None
+
+    @property
+    def formats(self) -> Tuple[str, ...]:
+        """Pillow에서 인코딩 가능한 변환 포맷 (선호 순, 처음 사용할 때 확인)"""
+        if self._formats is None:
+            self._formats = self._supported_formats()
+        return self._formats
+
+    @staticmethod
+    def _supported_formats() -> Tuple[str, ...]:
+        if _pillow() is None:
+            return ()
+        from PIL import features as pil_features
+        return tuple(fmt for fmt in ("avif", "webp") if pil_features.check(fmt))
+
+    def _reset(self):
+        """fork 이후 세션 / 프리페치 스레드 풀 재생성"""
+        self.session = requests.Session()
+        self._inflight = {}
+        self._prefetch_executor = None
+        self._prefetch_pending = 0
+        self._bundle_executor = None
+        self.cache._reset()
+
+    def negotiate(self, accept: str) -> str:
+        """
+        Accept 헤더로 출력 포맷 선택 (avif > webp > 원본 포맷)
+
+        Returns:
+            "avif" / "webp" / "original"
+        """
+        accept = (accept or "").lower()
+        for fmt in self.formats:
+            if f"image/{fmt}" in accept:
+                return fmt
+        return "original"
+
+    def variant(self, kind: str, width: int, filename: str, fmt: str) -> Tuple[str, str, str]:
+        """
+        크기 변환된 이미지 (디스크 캐시, 같은 키 동시 요청은 1번만 생성)
+
+        Args:
+            kind: "poster" / "logo"
+            width: 출력 폭 (Config.IMAGE_WIDTHS 중 하나)
+            filename: TMDb 파일명
+            fmt: negotiate 결과
+
+        Returns:
+            (파일 경로, sha256, MIME)
+
+        Raises:
+            ImageNotFound: 허용되지 않는 요청이거나 TMDb에 이미지가 없을 때
+        """
+        if kind not in SOURCE_WIDTHS or width not in Config.IMAGE_WIDTHS or not FILENAME_PATTERN.match(filename):
+            raise ImageNotFound(f"{kind}/{width}/{filename}")
+        if _pillow() is None or filename.endswith(".svg"):
+            fmt = "original"
+
+        key = f"{kind}/{width}/{filename}/{fmt}"
+        entry = self.cache.get(key)
+        if entry is not None:
+            metrics.inc("image_requests_total", kind=kind, result="hit")
+            return entry
+
+        with self._inflight_lock:
+            lock = self._inflight.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                entry = self.cache.get(key)
+                if entry is None:
+                    original, mimetype = self._original(kind, width, filename)
+                    data, mimetype = self._resize(original, mimetype, width, fmt)
+                    entry = self.cache.put(key, data, mimetype)
+                    metrics.inc("image_requests_total", kind=kind, result="miss")
+                else:
+                    metrics.inc("image_requests_total", kind=kind, result="hit")
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return entry
+
+    def _original(self, kind: str, width: int, filename: str) -> Tuple[bytes, str]:
+        """요청 폭 이상인 가장 작은 TMDb 크기 원본 (디스크 캐시)"""
+        source_width = next((w for w in SOURCE_WIDTHS[kind] if w >= width), None)
+        size = f"w{source_width}" if source_width else "original"
+        if filename.endswith(".svg"):
+            size = "original"
+
+        key = f"{kind}/source/{size}/{filename}"
+        cached = self.cache.read(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        with self._fetch_slots:
+            response = self.session.get(f"{TMDB_IMAGE_HOST}/{size}/{filename}", timeout=Config.REQUEST_TIMEOUT)
+        metrics.observe("image_fetch_seconds", time.perf_counter() - started, kind=kind)
+        if response.status_code == 404:
+            raise ImageNotFound(filename)
+        response.raise_for_status()
+
+        mimetype = response.headers.get("Content-Type", "").split(";")[0] or "application/octet-stream"
+        self.cache.put(key, response.content, mimetype)
+        return response.content, mimetype
+
+    @staticmethod
+    def _resize(data: bytes, mimetype: str, width: int, fmt: str) -> Tuple[bytes, str]:
+        """폭 width로 축소 (비율 유지, 확대하지 않음) 후 fmt로 인코딩"""
+        Image = _pillow()
+        if Image is None or mimetype == MIME_TYPES["svg"]:
+            return data, mimetype
+
+        with Image.open(io.BytesIO(data)) as image:
+            source_format = (image.format or "JPEG").lower()
+            if image.width > width:
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.LANCZOS)
+
+            if fmt == "original":
+                fmt = "png" if source_format == "png" else "jpeg"
+            if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            elif image.mode == "P":
+                image = image.convert("RGBA")
+
+            out = io.BytesIO()
+            if fmt == "avif":
+                image.save(out, "AVIF", quality=Config.IMAGE_AVIF_QUALITY)
+            elif fmt == "webp":
+                image.save(out, "WEBP", quality=Config.IMAGE_WEBP_QUALITY, method=4)
+            elif fmt == "png":
+                image.save(out, "PNG", optimize=True)
+            else:
+                image.save(out, "JPEG", quality=Config.IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+        return out.getvalue(), MIME_TYPES[fmt]
+
+    def logo_bundle(self, filenames: Iterable[str], width: int, fmt: str) -> Dict[str, str]:
+        """
+        제공처 로고 여러 개를 data URI로 묶어서 반환 (로고마다 이미지 요청을 하지 않도록)
+
+        로고는 IMAGE_FETCH_CONCURRENCY개 스레드 풀에서 동시에 조회합니다.
+
+        Returns:
+            {파일명: "data:image/...;base64,..."} (찾지 못한 로고는 제외, 요청 순서 유지)
+        """
+        def load(filename: str) -> Optional[str]:
+            try:
+                path, _, mimetype = self.variant("logo", width, filename, fmt)
+                with open(path, "rb") as f:
+                    return f"data:{mimetype};base64,{base64.b64encode(f.read()).decode('ascii')}"
+            except (ImageNotFound, OSError, requests.RequestException):
+                return None
+
+        unique = list(dict.fromkeys(filenames))
+        uris = map(load, unique) if len(unique) <= 1 else self._fetch_executor().map(load, unique)
+        return {filename: uri for filename, uri in zip(unique, uris) if uri is not None}
+
+    def prefetch(self, urls: Iterable[Optional[str]], kind: str = "poster"):
+        """
+        응답에 포함된 이미지를 백그라운드에서 미리 변환 (동시 실행 수 / 대기열 제한)
+
+        대기열이 IMAGE_PREFETCH_QUEUE를 넘으면 나머지는 건너뜁니다 (요청 시 생성).
+        """
+        if not Config.IMAGE_PREFETCH_WORKERS:
+            return
+        filenames = [f for f in dict.fromkeys(tmdb_filename(u) for u in urls) if f]
+        if not filenames:
+            return
+
+        executor = self._executor()
+        for filename in filenames:
+            for width in Config.IMAGE_PREFETCH_WIDTHS:
+                with self._prefetch_lock:
+                    if self._prefetch_pending >= Config.IMAGE_PREFETCH_QUEUE:
+                        metrics.inc("image_prefetch_total", result="dropped")
+                        continue
+                    self._prefetch_pending += 1
+                executor.submit(self._prefetch_one, kind, width, filename)
+
+    def _prefetch_one(self, kind: str, width: int, filename: str):
+        try:
+            fmt = Config.IMAGE_PREFETCH_FORMAT if Config.IMAGE_PREFETCH_FORMAT in self.formats else "original"
+            self.variant(kind, width, filename, fmt)
+            metrics.inc("image_prefetch_total", result="ok")
+        except Exception:
+            metrics.inc("image_prefetch_total", result="error")
+        finally:
+            with self._prefetch_lock:
+                self._prefetch_pending -= 1
+
+    def _fetch_executor(self) -> ThreadPoolExecutor:
+        """요청 처리용 로고 조회 스레드 풀 (프리페치 대기열과 분리, 처음 사용할 때 생성)"""
+        with self._prefetch_lock:
+            if self._bundle_executor is None:
+                self._bundle_executor = ThreadPoolExecutor(
+                    max_workers=Config.IMAGE_FETCH_CONCURRENCY,
+                    thread_name_prefix="image-fetch"
+                )
+            return self._bundle_executor
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._prefetch_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=Config.IMAGE_PREFETCH_WORKERS,
+                    thread_name_prefix="image-prefetch"
+                )
+            return self._prefetch_executor
+
+
+# 싱글톤 인스턴스
+image_service = ImageService()
+on_post_fork(image_service._reset)
+
+
+@on_preload
+def warm_pillow():
+    """gunicorn 마스터에서 Pillow와 지원 포맷을 미리 로드 (워커는 fork로 공유)"""
+    image_service.formats
+
+
+metrics.describe("image_requests_total", "counter", "이미지 프록시 요청 수 (디스크 캐시 hit / miss)")
+metrics.describe("image_fetch_seconds", "histogram", "TMDb 이미지 원본 다운로드 시간")
+metrics.describe("image_prefetch_total", "counter", "이미지 프리페치 결과 (ok / error / dropped)")
+metrics.describe("image_cache_evictions_total", "counter", "용량 초과로 삭제한 이미지 blob 수")
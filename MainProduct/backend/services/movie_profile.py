@@ -0,0 +1,216 @@
+"""
+캐시용 영화 프로필 레코드
+
+프로필은 언어와 무관한 핵심 정보(MovieCore)와 언어별 정보(MovieOverlay)로 나뉘어 캐시됩니다.
+- MovieCore: 키워드, 출연/제작진, 후보 영화 ID, 외부 ID 등 (영화당 1개)
+- MovieOverlay: 제목, 줄거리, 장르명, 포스터 (영화 × 언어당 1개)
+  + TF-IDF 문서의 해시 특징(DocumentFeatures, 조회할 때 한 번 계산하여 함께 캐시)
+"""
+import sys
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _intern_all(values: Iterable[Optional[str]]) -> Tuple[str, ...]:
+    """인물/장르/키워드 이름은 영화 간 중복이 많으므로 intern하여 같은 객체를 공유"""
+    return tuple(sys.intern(v) for v in values if v)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MovieCore:
+    """언어와 무관한 영화 정보 (불변)"""
+
+    id: int
+    keywords: Tuple[str, ...]
+    cast: Tuple[str, ...]
+    directors: Tuple[str, ...]
+    writers: Tuple[str, ...]
+    vote_average: Optional[float]
+    vote_count: Optional[int]
+    release_date: Optional[str]
+    runtime: Optional[int]
+    imdb_id: Optional[str]
+    candidate_ids: Tuple[int, ...]
+
+    @classmethod
+    def from_tmdb(cls, detail: Dict[str, Any]) -> "MovieCore":
+        """
+        TMDb /movie/{id} 응답(append_to_response 포함)으로 핵심 정보 생성
+
+        Args:
+            detail: TMDb 상세 응답 (keywords, credits, recommendations, external_ids, similar 포함)
+
+        Returns:
+            MovieCore
+        """
+        credits = detail.get("credits") or {}
+        crew = credits.get("crew") or []
+        recommendations = ((detail.get("recommendations") or {}).get("results") or [])
+        similars = ((detail.get("similar") or {}).get("results") or [])
+
+        return cls(
+            id=detail.get("id"),
+            keywords=_intern_all(
+                k.get("name") for k in ((detail.get("keywords") or {}).get("keywords") or [])
+            ),
+            cast=_intern_all(c.get("name") for c in (credits.get("cast") or [])[:10]),
+            directors=_intern_all(c.get("name") for c in crew if c.get("job") == "Director"),
+            writers=_intern_all(c.get("name") for c in crew if c.get("job") in ("Writer", "Screenplay")),
+            vote_average=detail.get("vote_average"),
+            vote_count=detail.get("vote_count"),
+            release_date=detail.get("release_date"),
+            runtime=detail.get("runtime"),
+            imdb_id=(detail.get("external_ids") or {}).get("imdb_id"),
+            candidate_ids=tuple(
+                m.get("id")
+                for m in recommendations[:30] + similars[:30]
+                if m.get("id")
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DocumentFeatures:
+    """
+    TF-IDF 문서(build_document)의 토큰화 결과 (불변)
+
+    해시 인덱스(int32, 오름차순, 중복 없음)와 단어 빈도(float32)만 저장하므로
+    요청 처리 중에는 문자열 처리 없이 바로 후보 행렬을 만들 수 있습니다 (services/feature_hashing.py).
+    """
+
+    indices: "np.ndarray"
+    counts: "np.ndarray"
+    # 계산에 사용한 core (overlay보다 core가 먼저 갱신되면 맞지 않는 특징을 쓰지 않도록)
+    core: Optional[MovieCore] = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.indices.nbytes + self.counts.nbytes
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MovieOverlay:
+    """언어별 영화 정보 (불변)"""
+
+    lang: str
+    title: Optional[str]
+    overview: str
+    genres: Tuple[str, ...]
+    poster: Optional[str]
+    features: Optional[DocumentFeatures] = None
+
+    @classmethod
+    def from_tmdb(cls, detail: Dict[str, Any], lang: str, image_base_url: str) -> "MovieOverlay":
+        """
+        TMDb /movie/{id}?language=... 응답으로 언어별 정보 생성
+
+        Args:
+            detail: TMDb 상세 응답 (append_to_response 없이도 충분)
+            lang: 언어 코드
+            image_base_url: 포스터 이미지 기본 URL
+
+        Returns:
+            MovieOverlay
+        """
+        return cls(
+            lang=sys.intern(lang),
+            title=detail.get("title") or detail.get("original_title"),
+            overview=detail.get("overview") or "",
+            genres=_intern_all(g.get("name") for g in (detail.get("genres") or [])),
+            poster=(
+                image_base_url + detail.get("poster_path")
+                if detail.get("poster_path") else None
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MovieProfile:
+    """
+    정규화된 TMDb 영화 프로필 (불변, MovieCore + MovieOverlay 조합)
+
+    캐시된 core/overlay 객체를 여러 요청과 언어가 공유하므로 수정할 수 없습니다.
+    OMDb 정보 추가 등은 with_omdb()처럼 새 객체를 반환합니다.
+    기존 dict 기반 코드와의 호환을 위해 profile.get("title") 형태의 조회를 지원합니다.
+    """
+
+    core: MovieCore
+    overlay: MovieOverlay
+    omdb: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_tmdb(cls, detail: Dict[str, Any], lang: str, image_base_url: str) -> "MovieProfile":
+        """TMDb 상세 응답(append_to_response 포함)으로 프로필 생성"""
+        return cls(
+            MovieCore.from_tmdb(detail),
+            MovieOverlay.from_tmdb(detail, lang, image_base_url)
+        )
+
+    # 언어와 무관한 정보
+    id = property(lambda self: self.core.id)
+    keywords = property(lambda self: self.core.keywords)
+    cast = property(lambda self: self.core.cast)
+    directors = property(lambda self: self.core.directors)
+    writers = property(lambda self: self.core.writers)
+    vote_average = property(lambda self: self.core.vote_average)
+    vote_count = property(lambda self: self.core.vote_count)
+    release_date = property(lambda self: self.core.release_date)
+    runtime = property(lambda self: self.core.runtime)
+    imdb_id = property(lambda self: self.core.imdb_id)
+    candidate_ids = property(lambda self: self.core.candidate_ids)
+
+    # 언어별 정보
+    lang = property(lambda self: self.overlay.lang)
+    title = property(lambda self: self.overlay.title)
+    overview = property(lambda self: self.overlay.overview)
+    genres = property(lambda self: self.overlay.genres)
+    poster = property(lambda self: self.overlay.poster)
+
+    @property
+    def features(self) -> Optional[DocumentFeatures]:
+        """캐시된 TF-IDF 해시 특징 (없거나 다른 core로 계산된 것이면 None)"""
+        features = self.overlay.features
+        return features if features is not None and features.core is self.core else None
+
+    @property
+    def external_ids(self) -> Dict[str, Any]:
+        return {"imdb_id": self.imdb_id} if self.imdb_id else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get 호환 조회"""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def with_omdb(self, omdb: Dict[str, Any]) -> "MovieProfile":
+        """OMDb 정보가 추가된 새 프로필 반환 (캐시된 원본은 그대로)"""
+        return replace(self, omdb=dict(omdb))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 직렬화"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "overview": self.overview,
+            "genres": list(self.genres),
+            "keywords": list(self.keywords),
+            "cast": list(self.cast),
+            "directors": list(self.directors),
+            "writers": list(self.writers),
+            "poster": self.poster,
+            "vote_average": self.vote_average,
+            "vote_count": self.vote_count,
+            "release_date": self.release_date,
+            "runtime": self.runtime,
+            "lang": self.lang,
+            "external_ids": self.external_ids,
+            "candidate_ids": list(self.candidate_ids),
+            "omdb": self.omdb,
+        }
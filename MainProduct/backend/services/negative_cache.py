@@ -0,0 +1,275 @@
+"""
+네거티브 캐시 (TMDb에서 찾지 못한 제목 / 없는 영화 ID)
+
+찾지 못한 제목은 요청마다 검색 2번(요청 언어 → en-US), 404인 후보 영화 ID는 예외라서 캐시되지 않아
+다른 사용자의 candidate_ids에 나올 때마다 다시 조회됩니다. 이 결과를 만료 시각과 함께 저장합니다.
+
+- 저장소: negative_results 테이블 (재시작 후에도 유지, 모든 워커가 공유)
+- 워커별 Bloom 필터: 대부분의 조회(정상 제목/ID)는 필터에서 바로 "없음" → DB 조회 없음
+- 필터가 "있을 수 있음"이라고 하면 최근 확인 결과(LRU) 또는 DB에서 만료 여부 확인
+- 백그라운드 스레드가 NEGATIVE_CACHE_SYNC_INTERVAL초마다 다른 워커가 기록한 항목을 필터에 추가하고,
+  NEGATIVE_CACHE_REBUILD_INTERVAL초마다 만료 항목을 지운 뒤 필터를 새로 만듭니다 (Bloom 필터는 삭제 불가).
+
+DB 오류 시에는 캐시가 없는 것처럼 동작합니다 (TMDb 조회).
+"""
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import delete, select
+
+from config import Config
+from database import SessionLocal, engine
+from models.negative_result import NegativeResult
+from utils.bloom import BloomFilter
+from utils.cache import LRUCache
+from utils.lifecycle import on_preload
+from utils.metrics import metrics
+
+# DB 키 최대 길이 (NegativeResult.key)
+MAX_KEY_LENGTH = 500
+
+# 필터 오탐 / 확인 결과 캐시 크기 (DB에 없음도 기록하여 같은 오탐을 다시 조회하지 않음)
+CONFIRMED_SIZE = 8192
+
+# DB에 없는 키 (확인 결과 캐시 값)
+_ABSENT = datetime.min
+
+
+def title_key(title: str, lang: str) -> str:
+    """제목 검색 결과 키 (언어 + 공백 정리/대소문자 무시한 제목)"""
+    return f"{lang}|{' '.join(title.split()).casefold()}"[:MAX_KEY_LENGTH]
+
+
+def _ttl(kind: str) -> float:
+    return Config.NEGATIVE_CACHE_MOVIE_TTL if kind == "movie" else Config.NEGATIVE_CACHE_TITLE_TTL
+
+
+class NegativeCache:
+    """찾지 못한 결과 저장소 (DB + 워커별 Bloom 필터)"""
+
+    def __init__(self):
+        self._bloom = self._new_filter(0)
+        self._confirmed = LRUCache(maxsize=CONFIRMED_SIZE)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._synced_at: Optional[datetime] = None
+        self._syncer_pid = None
+
+    @staticmethod
+    def _new_filter(entries: int) -> BloomFilter:
+        return BloomFilter(max(Config.NEGATIVE_CACHE_CAPACITY, entries * 2), Config.NEGATIVE_CACHE_ERROR_RATE)
+
+    def contains(self, kind: str, key) -> bool:
+        """
+        찾지 못한 결과로 기록되어 있고 만료되지 않았는지
+
+        Args:
+            kind: title / movie
+            key: title_key() 또는 영화 ID
+        """
+        return str(key) in self.known_missing(kind, [key])
+
+    def known_missing(self, kind: str, keys: Iterable) -> Set[str]:
+        """
+        키들 중 찾지 못한 결과로 기록된 것 (Bloom 필터 → 확인 결과 캐시 → DB 1번)
+
+        Returns:
+            기록된 키(문자열) 집합
+        """
+        if not Config.NEGATIVE_CACHE_ENABLED:
+            return set()
+        self._ensure_syncer()
+
+        bloom = self._bloom
+        now = datetime.utcnow()
+        found: Set[str] = set()
+        unknown = []
+        results = Counter()
+        for key in keys:
+            key = str(key)
+            if f"{kind}:{key}" not in bloom:
+                results["filtered"] += 1
+                continue
+            expires_at = self._confirmed.get(f"{kind}:{key}")
+            if expires_at is None:
+                unknown.append(key)
+            elif expires_at > now:
+                found.add(key)
+            else:
+                results["miss"] += 1
+
+        if unknown:
+            expires = self._lookup(kind, unknown)
+            for key in unknown:
+                expires_at = expires.get(key, _ABSENT)
+                self._confirmed.put(f"{kind}:{key}", expires_at)
+                if expires_at > now:
+                    found.add(key)
+                else:
+                    results["miss"] += 1
+
+        results["hit"] += len(found)
+        for result, count in results.items():
+            if count:
+                metrics.inc("negative_cache_checks_total", count, kind=kind, result=result)
+        return found
+
+    def add(self, kind: str, key):
+        """
+        찾지 못한 결과 기록 (TTL 동안 다시 조회하지 않음)
+
+        Args:
+            kind: title / movie
+            key: title_key() 또는 영화 ID
+        """
+        if not Config.NEGATIVE_CACHE_ENABLED:
+            return
+        self._ensure_syncer()
+
+        key = str(key)[:MAX_KEY_LENGTH]
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=_ttl(kind))
+        self._bloom.add(f"{kind}:{key}")
+        self._confirmed.put(f"{kind}:{key}", expires_at)
+        metrics.inc("negative_cache_added_total", kind=kind)
+
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        db = SessionLocal()
+        try:
+            stmt = insert(NegativeResult).values(kind=kind, key=key, expires_at=expires_at, created_at=now)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[NegativeResult.kind, NegativeResult.key],
+                set_={"expires_at": expires_at, "created_at": now}
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            metrics.inc("negative_cache_errors_total", op="add")
+            print(f"[경고] 네거티브 캐시 기록 실패 ({kind}): {e}")
+        finally:
+            db.close()
+
+    def _lookup(self, kind: str, keys: list) -> dict:
+        """DB에서 키들의 만료 시각 조회 (없는 키는 결과에 없음)"""
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(NegativeResult.key, NegativeResult.expires_at)
+                .where(NegativeResult.kind == kind, NegativeResult.key.in_(keys))
+            ).all()
+            return {key: expires_at for key, expires_at in rows}
+        except Exception as e:
+            metrics.inc("negative_cache_errors_total", op="lookup")
+            print(f"[경고] 네거티브 캐시 조회 실패 ({kind}): {e}")
+            return {}
+        finally:
+            db.close()
+
+    def rebuild(self):
+        """만료 항목 삭제 후 남은 항목으로 Bloom 필터를 새로 만들어 교체"""
+        started = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            db.execute(delete(NegativeResult).where(NegativeResult.expires_at <= started))
+            db.commit()
+            rows = db.execute(
+                select(NegativeResult.kind, NegativeResult.key)
+                .where(NegativeResult.expires_at > started)
+            ).all()
+        except Exception as e:
+            db.rollback()
+            metrics.inc("negative_cache_errors_total", op="rebuild")
+            print(f"[경고] 네거티브 캐시 로드 실패: {e}")
+            return
+        finally:
+            db.close()
+
+        bloom = self._new_filter(len(rows))
+        for kind, key in rows:
+            bloom.add(f"{kind}:{key}")
+        # 교체 전후에 add()된 항목은 다음 sync에서 다시 추가됨
+        self._bloom = bloom
+        self._confirmed.cache_clear()
+        self._synced_at = started
+        self._loaded = True
+        self._report()
+
+    def sync(self):
+        """다른 워커가 마지막 동기화 이후 기록한 항목을 Bloom 필터와 확인 결과 캐시에 반영"""
+        started = datetime.utcnow()
+        # 커밋이 늦게 보이는 기록을 놓치지 않도록 한 주기만큼 겹쳐서 조회
+        since = self._synced_at - timedelta(seconds=Config.NEGATIVE_CACHE_SYNC_INTERVAL)
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(NegativeResult.kind, NegativeResult.key, NegativeResult.expires_at)
+                .where(NegativeResult.created_at > since)
+            ).all()
+        except Exception as e:
+            metrics.inc("negative_cache_errors_total", op="sync")
+            print(f"[경고] 네거티브 캐시 동기화 실패: {e}")
+            return
+        finally:
+            db.close()
+
+        bloom = self._bloom
+        for kind, key, expires_at in rows:
+            entry = f"{kind}:{key}"
+            if entry not in bloom:
+                bloom.add(entry)
+            self._confirmed.put(entry, expires_at)
+        self._synced_at = started
+        self._report()
+
+    def _report(self):
+        metrics.set_gauge("negative_cache_filter_entries", self._bloom.count)
+        metrics.set_gauge("negative_cache_filter_bytes", self._bloom.nbytes)
+
+    def _ensure_syncer(self):
+        """프로세스마다 (fork 이후 포함) 백그라운드 동기화 스레드 1개 실행"""
+        if self._syncer_pid == os.getpid():
+            return
+        with self._lock:
+            if self._syncer_pid == os.getpid():
+                return
+            self._syncer_pid = os.getpid()
+
+        def loop():
+            # preload에서 로드했으면 필터를 물려받았으므로 동기화부터
+            rebuild_at = time.monotonic() + Config.NEGATIVE_CACHE_REBUILD_INTERVAL if self._loaded else 0.0
+            while True:
+                if not self._loaded or time.monotonic() >= rebuild_at or self._bloom.saturated:
+                    self.rebuild()
+                    rebuild_at = time.monotonic() + Config.NEGATIVE_CACHE_REBUILD_INTERVAL
+                else:
+                    self.sync()
+                time.sleep(Config.NEGATIVE_CACHE_SYNC_INTERVAL)
+
+        threading.Thread(target=loop, name="negative-cache-sync", daemon=True).start()
+
+
+# 싱글톤 인스턴스
+negative_cache = NegativeCache()
+
+
+@on_preload
+def load_negative_cache():
+    """gunicorn 마스터에서 Bloom 필터 생성 (워커는 fork로 공유, 이후 각자 동기화)"""
+    if Config.NEGATIVE_CACHE_ENABLED:
+        negative_cache.rebuild()
+
+
+metrics.describe("negative_cache_checks_total", "counter",
+                 "네거티브 캐시 확인 수 (filtered: Bloom 필터에서 없음, hit: 기록됨 → 외부 조회 생략, miss: 오탐/만료)")
+metrics.describe("negative_cache_added_total", "counter", "찾지 못한 결과로 기록한 수")
+metrics.describe("negative_cache_errors_total", "counter", "네거티브 캐시 DB 오류 수")
+metrics.describe("negative_cache_filter_entries", "gauge", "Bloom 필터 항목 수", aggregate="max")
+metrics.describe("negative_cache_filter_bytes", "gauge", "Bloom 필터 크기 (바이트, 워커당)", aggregate="max")
@@ -3,30 +3,29 @@ OMDb API 호출 서비스
 """
 from typing import Dict, Any
 
-import requests
 from config import Config
+from services.movie_profile import MovieProfile
+from services.upstream_client import UpstreamClient
+from utils.metrics import instrumented
 
 
 class OMDbService:
     """OMDb API 서비스 클래스"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json"})
+        self.client = UpstreamClient(
+            "omdb",
+            Config.OMDB_RATE_LIMIT / max(Config.WEB_CONCURRENCY, 1)
+        )
         self.base_url = Config.OMDB_BASE_URL
         self.api_key = Config.OMDB_API_KEY
     
     def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """OMDb API GET 요청"""
         params = {"apikey": self.api_key, **params}
-        response = self.session.get(
-            self.base_url,
-            params=params,
-            timeout=Config.REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
+        return self.client.get(self.base_url, params)
     
+    @instrumented("omdb")
     def get_movie_by_imdb_id(self, imdb_id: str) -> Dict[str, Any]:
         """
         IMDb ID로 영화 정보 조회
@@ -54,21 +53,23 @@ class OMDbService:
         
         return {}
     
-    def enrich_movie_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+    @instrumented("omdb")
+    def enrich_movie_profile(self, profile: MovieProfile) -> MovieProfile:
         """
         영화 프로필에 OMDb 정보 추가
         
+        캐시된 프로필은 공유 객체이므로 수정하지 않고 새 프로필을 반환합니다.
+        
         Args:
             profile: TMDb 영화 프로필
             
         Returns:
             OMDb 정보가 추가된 프로필
         """
-        imdb_id = (profile.get("external_ids") or {}).get("imdb_id")
-        omdb_data = self.get_movie_by_imdb_id(imdb_id)
+        omdb_data = self.get_movie_by_imdb_id(profile.imdb_id)
         
         if omdb_data:
-            profile["omdb"] = omdb_data
+            return profile.with_omdb(omdb_data)
         
         return profile
 
@@ -1,13 +1,48 @@
 """
 영화 추천 알고리즘 서비스 (TF-IDF 기반)
+
+numpy / scipy / scikit-learn은 import 비용이 크므로 처음 사용할 때 불러옵니다.
+gunicorn preload 모드에서는 마스터에서 미리 불러와 워커들이 공유합니다 (warm_imports).
+TFIDF_MODE=hashing이면 어휘 대신 특징 해싱을 사용합니다 (services/feature_hashing.py).
+후보 영화는 두 방식 모두 프로필과 함께 캐시된 해시 특징으로 변환합니다 (요청 중 토큰화 없음).
 """
 import math
-from typing import List, Dict, Any, Tuple
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from collections import Counter
 
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from config import Config
+from services.collaborative import collaborative_service
+from services.omdb_service import omdb_service
+from utils.lifecycle import on_preload
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy import sparse
+    from services.feature_hashing import HashedTfidfVectorizer
+    from utils.metrics import StageTimer
+
+# TF-IDF 토큰화 설정 (요청별 분석 / 취향 프로필 공통)
+TFIDF_PARAMS = {"ngram_range": (1, 2), "stop_words": None}
+TFIDF_MAX_FEATURES = 10000
+
+# 패턴 분석 대상 필드 → 응답 키
+PATTERN_FIELDS = {
+    "genres": "top_genres",
+    "directors": "top_directors",
+    "cast": "top_actors",
+}
+
+_analyzer = None
+
+
+def _get_analyzer():
+    """TfidfVectorizer와 같은 토큰화 함수 (처음 사용할 때 생성)"""
+    global _analyzer
+    if _analyzer is None:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        _analyzer = TfidfVectorizer(**TFIDF_PARAMS).build_analyzer()
+    return _analyzer
 
 
 class RecommendationService:
@@ -44,22 +79,48 @@ class RecommendationService:
         
         return document
     
+    @staticmethod
+    def term_vector(profile: Dict[str, Any]) -> Dict[str, float]:
+        """
+        영화 1편의 단어 벡터 (TF-IDF와 같은 토큰화, 단어 빈도를 L2 정규화)
+        
+        다른 영화와 무관하게 계산되므로 취향 프로필에 더하거나 빼서 갱신할 수 있습니다.
+        
+        Args:
+            profile: 영화 프로필 딕셔너리
+            
+        Returns:
+            {단어: 가중치}
+        """
+        counts = Counter(_get_analyzer()(RecommendationService.build_document(profile)))
+        norm = math.sqrt(sum(count * count for count in counts.values())) or 1.0
+        return {term: count / norm for term, count in counts.items()}
+    
     @staticmethod
     def create_tfidf_profile(
         favorite_profiles: List[Dict[str, Any]]
-    ) -> Tuple[TfidfVectorizer, np.ndarray, List[Tuple[str, float]]]:
+    ) -> Tuple["HashedTfidfVectorizer", "np.ndarray", List[Tuple[str, float]]]:
         """
         좋아하는 영화들로부터 TF-IDF 프로필 생성
         
+        좋아하는 영화 문서로 TfidfVectorizer를 학습하고, 사용자 선호 벡터는
+        좋아하는 영화들의 (행 단위 L2 정규화된) TF-IDF 벡터 평균입니다.
+        후보를 캐시된 해시 특징으로 변환할 수 있도록 어휘를 해시 인덱스 열로 옮깁니다.
+        
         Args:
             favorite_profiles: 좋아하는 영화 프로필 리스트
             
         Returns:
-            (vectorizer, user_vector, top_features) 튜플
-            - vectorizer: 학습된 TfidfVectorizer
-            - user_vector: 사용자 선호 벡터
-            - top_features: 상위 10개 특징 [(특징명, 점수), ...]
+            (vectorizer, user_vector, top_features) 튜플 (vectorize_taste 참고)
         """
+        if Config.TFIDF_MODE == "hashing":
+            from services import feature_hashing
+            return feature_hashing.create_tfidf_profile(favorite_profiles)
+        
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from services import feature_hashing
+        
         if not favorite_profiles:
             raise ValueError("최소 1개 이상의 영화 프로필이 필요합니다.")
         
@@ -70,47 +131,101 @@ class RecommendationService:
         ]
         
         # TF-IDF 벡터화
-        vectorizer = TfidfVectorizer(
-            ngram_range=(1, 2),
-            max_features=10000,
-            stop_words=None
-        )
-        tfidf_matrix = vectorizer.fit_transform(documents)
+        fitted = TfidfVectorizer(max_features=TFIDF_MAX_FEATURES, **TFIDF_PARAMS)
+        tfidf_matrix = fitted.fit_transform(documents)
         
         # 사용자 선호 벡터 = 좋아하는 영화들의 평균 벡터
         user_vector_1d = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
-        user_vector = user_vector_1d.reshape(1, -1)
+        terms = fitted.get_feature_names_out().tolist()
+        vectorizer, user_vector = feature_hashing.project_terms(terms, fitted.idf_, user_vector_1d)
         
         # 상위 특징 추출
-        feature_names = vectorizer.get_feature_names_out()
         top_indices = user_vector_1d.argsort()[::-1][:10]
         top_features = [
-            (feature_names[i], float(user_vector_1d[i]))
+            (terms[i], float(user_vector_1d[i]))
             for i in top_indices
         ]
         
         return vectorizer, user_vector, top_features
     
     @staticmethod
-    def score_candidates(
-        vectorizer: TfidfVectorizer,
-        user_vector: np.ndarray,
+    def vectorize_taste(
+        term_sums: Dict[str, float],
+        doc_freq: Dict[str, int],
+        n_favorites: int
+    ) -> Tuple["HashedTfidfVectorizer", "np.ndarray", List[Tuple[str, float]]]:
+        """
+        누적된 단어 벡터 합계로 사용자 선호 벡터와 후보 변환용 vectorizer 생성 (저장된 취향 프로필용)
+        
+        사용자 선호 벡터 = IDF × 좋아하는 영화 단어 벡터의 평균 (영화 추가/삭제 시 합계만 갱신하면 되도록).
+        IDF는 좋아하는 영화들 기준(smooth idf)이며 fit 없이 고정 어휘로 구성한 뒤
+        후보를 캐시된 해시 특징으로 변환할 수 있도록 어휘를 해시 인덱스 열로 옮깁니다.
+        
+        Args:
+            term_sums: {단어: 좋아하는 영화 단어 벡터 합계}
+            doc_freq: {단어: 해당 단어가 나온 좋아하는 영화 수}
+            n_favorites: 좋아하는 영화 수
+            
+        Returns:
+            (vectorizer, user_vector, top_features) 튜플
+            - vectorizer: 후보 영화 변환용 HashedTfidfVectorizer
+            - user_vector: 사용자 선호 벡터 (1 × 열 수)
+            - top_features: 상위 10개 특징 [(특징명, 점수), ...]
+        """
+        if Config.TFIDF_MODE == "hashing":
+            from services import feature_hashing
+            return feature_hashing.vectorize_taste(term_sums, doc_freq, n_favorites)
+        
+        import heapq
+        import numpy as np
+        from services import feature_hashing
+        
+        if not n_favorites or not term_sums:
+            raise ValueError("최소 1개 이상의 영화 프로필이 필요합니다.")
+        
+        terms = list(term_sums)
+        if len(terms) > TFIDF_MAX_FEATURES:
+            terms = heapq.nlargest(TFIDF_MAX_FEATURES, terms, key=term_sums.get)
+        terms.sort()
+        
+        doc_freqs = np.fromiter((doc_freq.get(t, 1) for t in terms), dtype=np.float64, count=len(terms))
+        idf = np.log((1.0 + n_favorites) / (1.0 + doc_freqs)) + 1.0
+        
+        sums = np.fromiter((term_sums[t] for t in terms), dtype=np.float64, count=len(terms))
+        user_vector_1d = idf * sums / n_favorites
+        vectorizer, user_vector = feature_hashing.project_terms(terms, idf, user_vector_1d)
+        
+        # 상위 특징 추출
+        top_indices = user_vector_1d.argsort()[::-1][:10]
+        top_features = [
+            (terms[i], float(user_vector_1d[i]))
+            for i in top_indices
+        ]
+        
+        return vectorizer, user_vector, top_features
+    
+    @staticmethod
+    def score_candidate_matrix(
+        vectorizer: "HashedTfidfVectorizer",
+        user_vector: "np.ndarray",
         candidates: List[Dict[str, Any]],
-        exclude_ids: set
-    ) -> List[Tuple[float, Dict[str, Any]]]:
+        exclude_ids: set,
+        cf_scores: Optional[Dict[int, float]] = None
+    ) -> Tuple["np.ndarray", List[Dict[str, Any]], "sparse.csr_matrix"]:
         """
-        후보 영화들에 점수를 매겨 정렬
+        후보 영화 점수 계산 (정렬 전, 다양성 재정렬용 후보 행렬 포함)
         
         Args:
-            vectorizer: 학습된 TfidfVectorizer
-            user_vector: 사용자 선호 벡터
-            candidates: 후보 영화 프로필 리스트
-            exclude_ids: 제외할 영화 ID 집합
+            score_candidates 참고
             
         Returns:
-            [(점수, 프로필), ...] 리스트 (점수 내림차순 정렬)
+            (점수 배열, 프로필 리스트, 후보 TF-IDF 행렬(행 단위 L2 정규화)) 튜플
         """
-        candidate_docs = []
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+        from services import feature_hashing
+        
+        candidate_features = []
         kept_profiles = []
         
         # 이미 입력한 영화는 제외
@@ -118,28 +233,56 @@ class RecommendationService:
             if profile.get("id") in exclude_ids:
                 continue
             
-            doc = RecommendationService.build_document(profile)
-            candidate_docs.append(doc)
+            candidate_features.append(feature_hashing.document_features(profile))
             kept_profiles.append(profile)
         
-        if not candidate_docs:
-            return []
+        if not candidate_features:
+            return np.zeros(0), [], None
         
-        # 후보 영화들을 벡터화
-        candidate_matrix = vectorizer.transform(candidate_docs)
+        # 후보 영화들을 벡터화 (캐시된 해시 특징 → 희소 행렬, 문자열 처리 없음)
+        candidate_matrix = vectorizer.transform_features(candidate_features)
         
         # 코사인 유사도 계산
         similarities = cosine_similarity(user_vector, candidate_matrix).ravel()
         
-        # 점수 계산 (유사도 + 인기도 보너스)
-        scored_movies = []
-        for profile, similarity in zip(kept_profiles, similarities):
-            vote_count = profile.get("vote_count") or 0
-            # 투표 수가 많을수록 보너스 (최대 0.3)
-            popularity_bonus = min(math.log1p(vote_count) / 10.0, 0.3)
-            final_score = float(similarity + popularity_bonus)
+        # 점수 계산 (유사도 + 협업 필터링 + 인기도 보너스)
+        cf_scores = cf_scores or {}
+        cf = np.fromiter(
+            (cf_scores.get(p.get("id"), 0.0) for p in kept_profiles), dtype=np.float64, count=len(kept_profiles)
+        )
+        bonuses = RecommendationService.popularity_bonuses(
+            [p.get("vote_count") or 0 for p in kept_profiles]
+        )
+        scores = similarities + Config.CF_WEIGHT * cf + bonuses
+        
+        return scores, kept_profiles, candidate_matrix
+    
+    @staticmethod
+    def score_candidates(
+        vectorizer: "HashedTfidfVectorizer",
+        user_vector: "np.ndarray",
+        candidates: List[Dict[str, Any]],
+        exclude_ids: set,
+        cf_scores: Optional[Dict[int, float]] = None
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        후보 영화들에 점수를 매겨 정렬
+        
+        Args:
+            vectorizer: create_tfidf_profile / vectorize_taste의 vectorizer
+            user_vector: 사용자 선호 벡터
+            candidates: 후보 영화 프로필 리스트
+            exclude_ids: 제외할 영화 ID 집합
+            cf_scores: 협업 필터링 점수 {영화 ID: 0~1} (있으면 CF_WEIGHT 비율로 더함)
             
-            scored_movies.append((final_score, profile))
+        Returns:
+            [(점수, 프로필), ...] 리스트 (점수 내림차순 정렬)
+        """
+        scores, profiles, _ = RecommendationService.score_candidate_matrix(
+            vectorizer, user_vector, candidates, exclude_ids, cf_scores
+        )
+        
+        scored_movies = [(float(score), profile) for score, profile in zip(scores, profiles)]
         
         # 점수 내림차순 정렬
         scored_movies.sort(key=lambda x: x[0], reverse=True)
@@ -147,15 +290,341 @@ class RecommendationService:
         return scored_movies
     
     @staticmethod
-    def analyze_patterns(
-        favorite_profiles: List[Dict[str, Any]]
-    ) -> Dict[str, List[Tuple[str, int]]]:
+    def rank(
+        vectorizer: "HashedTfidfVectorizer",
+        user_vector: "np.ndarray",
+        candidates: List[Dict[str, Any]],
+        exclude_ids: set,
+        timer: Optional["StageTimer"] = None
+    ) -> List[Tuple[float, Dict[str, Any]]]:
         """
-        좋아하는 영화들의 공통 패턴 분석
+        /api/analyze 추천 순위 (협업 필터링 + 콘텐츠 점수 → MMR 다양성 재정렬, TOP_N개)
+        
+        /api/analyze와 /api/analyze/batch가 같은 결과를 내도록 두 곳 모두 이 함수를 사용합니다.
         
         Args:
-            favorite_profiles: 좋아하는 영화 프로필 리스트
+            score_candidates 참고
+            timer: 단계별 타이머 (scoring / rerank, 없으면 기록하지 않음)
             
+        Returns:
+            [(점수, 프로필), ...] 리스트 (선택 순서)
+        """
+        stage = timer.stage if timer is not None else (lambda name: nullcontext())
+        with stage("scoring"):
+            cf_scores = collaborative_service.score(
+                exclude_ids,
+                [p.get("id") for p in candidates if p.get("id") is not None]
+            )
+            scores, scored_profiles, candidate_matrix = RecommendationService.score_candidate_matrix(
+                vectorizer,
+                user_vector,
+                candidates,
+                exclude_ids,
+                cf_scores
+            )
+        
+        # 상위 N개 선택 (같은 감독/장르 쏠림 방지)
+        with stage("rerank"):
+            selected = RecommendationService.mmr_rerank(
+                scores,
+                candidate_matrix,
+                scored_profiles,
+                Config.TOP_N,
+                Config.MMR_LAMBDA,
+                Config.MMR_MAX_PER_GENRE,
+                Config.MMR_MAX_PER_DIRECTOR
+            )
+        return [(scores[i], scored_profiles[i]) for i in selected]
+    
+    @staticmethod
+    def recommendation_entries(top_movies: List[Tuple[float, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        추천 결과 응답 항목 (상위 ENRICH_TOP개는 OMDb 정보 추가)
+        
+        Args:
+            top_movies: rank의 [(점수, 프로필), ...]
+            
+        Returns:
+            /api/analyze의 recommendations 항목 리스트
+        """
+        recommendations = []
+        for idx, (score, profile) in enumerate(top_movies, start=1):
+            if idx <= Config.ENRICH_TOP:
+                profile = omdb_service.enrich_movie_profile(profile)
+            
+            recommendations.append({
+                "score": float(score),
+                "id": profile.get("id"),
+                "title": profile.get("title"),
+                "overview": profile.get("overview"),
+                "poster": profile.get("poster"),
+                "genres": profile.get("genres"),
+                "vote_average": profile.get("vote_average"),
+                "vote_count": profile.get("vote_count"),
+                "release_date": profile.get("release_date"),
+                "runtime": profile.get("runtime"),
+                "omdb": profile.get("omdb"),
+            })
+        return recommendations
+    
+    @staticmethod
+    def mmr_rerank(
+        scores: "np.ndarray",
+        item_matrix: "sparse.csr_matrix",
+        profiles: List[Dict[str, Any]],
+        top_n: int,
+        diversity_lambda: float,
+        max_per_genre: int = 0,
+        max_per_director: int = 0
+    ) -> List[int]:
+        """
+        MMR(Maximal Marginal Relevance) 다양성 재정렬
+        
+        매 단계 λ × 관련도 − (1 − λ) × (이미 고른 영화와의 최대 유사도)가 가장 큰 영화를 선택합니다.
+        관련도는 점수를 0~1로 정규화한 값, 유사도는 후보 TF-IDF 벡터의 코사인 유사도입니다.
+        장르/감독 상한에 걸린 영화는 건너뛰고, 상한 때문에 top_n개를 채우지 못하면
+        남은 자리는 상한 없이 채웁니다. 단계마다 NumPy 벡터 연산만 사용합니다 (후보 수 n, O(n)).
+        
+        Args:
+            scores: 후보 점수 배열
+            item_matrix: 후보 TF-IDF 행렬 (행 단위 L2 정규화, scores와 같은 순서)
+            profiles: 후보 프로필 리스트 (genres, directors)
+            top_n: 선택 개수
+            diversity_lambda: λ (1이면 점수순, 작을수록 다양성 우선)
+            max_per_genre: 장르별 최대 개수 (0이면 제한 없음)
+            max_per_director: 감독별 최대 개수 (0이면 제한 없음)
+            
+        Returns:
+            선택한 후보 인덱스 리스트 (선택 순서)
+        """
+        import numpy as np
+        
+        n = len(scores)
+        top_n = min(top_n, n)
+        if top_n <= 0:
+            return []
+        
+        scores = np.asarray(scores, dtype=np.float64)
+        low = scores.min()
+        spread = scores.max() - low
+        # base: λ × 관련도, 고른 영화와 상한에 걸린 영화는 -inf (argmax에서 제외)
+        base = (scores - low) * (diversity_lambda / spread) if spread > 0 else np.full(n, diversity_lambda)
+        relevance = base.copy()
+        vectors = RecommendationService._compact_dense(item_matrix)
+        # (1 − λ)를 미리 곱한 벡터 → 단계마다 곱셈 없이 벌점(= (1 − λ) × 최대 유사도) 갱신
+        scaled = vectors * np.float32(1.0 - diversity_lambda)
+        
+        # 상한: [필드, 상한, 이름별 선택 수, 이름 → 후보 행 배열 (처음 상한에 도달할 때 한 번 생성)]
+        caps = [
+            [field, limit, {}, None]
+            for field, limit in (("genres", max_per_genre), ("directors", max_per_director))
+            if limit > 0
+        ]
+        
+        penalty = np.zeros(n, dtype=np.float32)
+        mmr = np.empty(n)
+        selected: List[int] = []
+        
+        while len(selected) < top_n:
+            np.subtract(base, penalty, out=mmr)
+            best = int(mmr.argmax())
+            if base[best] == -np.inf:
+                # 상한 때문에 더 고를 수 없으면 남은 자리는 상한 없이 채움
+                caps = []
+                base = relevance
+                continue
+            
+            selected.append(best)
+            base[best] = -np.inf
+            relevance[best] = -np.inf
+            # 고른 영화와의 유사도 1행만 계산 (n × n 전체 행렬은 만들지 않음)
+            np.maximum(penalty, scaled @ vectors[best], out=penalty)
+            for cap in caps:
+                field, limit, counts, rows_by_name = cap
+                for name in set(profiles[best].get(field) or ()):
+                    counts[name] = counts.get(name, 0) + 1
+                    if counts[name] == limit:
+                        if rows_by_name is None:
+                            rows_by_name = cap[3] = RecommendationService._rows_by_name(profiles, field)
+                        base[rows_by_name[name]] = -np.inf
+        
+        return selected
+    
+    @staticmethod
+    def _rows_by_name(profiles: List[Dict[str, Any]], field: str) -> Dict[str, "np.ndarray"]:
+        """이름(장르/감독) → 그 이름을 가진 후보 행 번호 배열"""
+        import numpy as np
+        
+        rows_by_name: Dict[str, List[int]] = {}
+        for row, profile in enumerate(profiles):
+            for name in profile.get(field) or ():
+                rows_by_name.setdefault(name, []).append(row)
+        return {name: np.array(rows, dtype=np.intp) for name, rows in rows_by_name.items()}
+    
+    @staticmethod
+    def _compact_dense(item_matrix: "sparse.csr_matrix") -> "np.ndarray":
+        """
+        CSR 행렬을 후보가 실제로 사용하는 열만 남긴 작은 밀집 행렬로 변환 (float32)
+        
+        후보 150개 규모에서는 희소 행렬 연산의 호출 비용보다 밀집 행렬-벡터 곱이 훨씬 빠릅니다.
+        열이 적어 그대로 밀집 변환해도 작으면(0이 아닌 값의 8배 이하) 열을 고르지 않고 변환합니다.
+        """
+        import numpy as np
+        
+        if item_matrix.shape[0] * item_matrix.shape[1] <= 8 * max(item_matrix.nnz, 1):
+            return item_matrix.toarray().astype(np.float32, copy=False)
+        
+        used = np.zeros(item_matrix.shape[1], dtype=bool)
+        used[item_matrix.indices] = True
+        columns = (np.cumsum(used) - 1)[item_matrix.indices]
+        
+        dense = np.zeros((item_matrix.shape[0], int(used.sum())), dtype=np.float32)
+        rows = np.repeat(np.arange(item_matrix.shape[0]), np.diff(item_matrix.indptr))
+        dense[rows, columns] = item_matrix.data
+        return dense
+    
+    @staticmethod
+    def popularity_bonus(vote_count: float) -> float:
+        """
+        투표 수 기반 인기도 보너스 (투표 수가 많을수록 보너스, 최대 0.3)
+        
+        Args:
+            vote_count: TMDb 투표 수
+            
+        Returns:
+            보너스 점수
+        """
+        return min(math.log1p(vote_count or 0) / 10.0, 0.3)
+    
+    @staticmethod
+    def popularity_bonuses(vote_counts: "np.ndarray") -> "np.ndarray":
+        """popularity_bonus의 벡터화 버전"""
+        import numpy as np
+        
+        vote_counts = np.nan_to_num(np.asarray(vote_counts, dtype=np.float64))
+        return np.minimum(np.log1p(np.maximum(vote_counts, 0.0)) / 10.0, 0.3)
+    
+    @staticmethod
+    def score_batch(
+        item_matrix: "sparse.csr_matrix",
+        favorite_rows: List[List[int]],
+        candidate_rows: List[List[int]],
+        bonuses: "np.ndarray",
+        top_n: int
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 사용자의 후보 점수를 한 번에 계산 (공유 카탈로그 행렬 기반)
+        
+        사용자 벡터 = 좋아하는 영화 행들의 평균.
+        후보 합집합에 대한 희소 행렬곱 1회로 유사도를 구한 뒤
+        (사용자, 후보) 쌍의 값만 골라 상위 N개를 선택합니다.
+        
+        Args:
+            item_matrix: 카탈로그 TF-IDF 행렬 (행 단위 L2 정규화된 CSR)
+            favorite_rows: 사용자별 좋아하는 영화의 행 번호 리스트
+            candidate_rows: 사용자별 후보 영화의 행 번호 리스트
+            bonuses: 행별 인기도 보너스 배열
+            top_n: 사용자별 반환 개수
+            
+        Returns:
+            사용자별 [(행 번호, 점수), ...] 리스트 (점수 내림차순)
+        """
+        import numpy as np
+        from scipy import sparse
+        
+        n_users = len(favorite_rows)
+        results: List[List[Tuple[int, float]]] = [[] for _ in range(n_users)]
+        if n_users == 0:
+            return results
+        
+        # 사용자 평균 벡터: (n_users × n_items) 가중치 행렬 × 카탈로그 행렬
+        fav_users = np.repeat(
+            np.arange(n_users), [len(rows) for rows in favorite_rows]
+        )
+        fav_items = np.fromiter(
+            (row for rows in favorite_rows for row in rows), dtype=np.int64
+        )
+        fav_weights = np.repeat(
+            [1.0 / len(rows) if rows else 0.0 for rows in favorite_rows],
+            [len(rows) for rows in favorite_rows]
+        )
+        weights = sparse.csr_matrix(
+            (fav_weights, (fav_users, fav_items)),
+            shape=(n_users, item_matrix.shape[0])
+        )
+        user_matrix = weights @ item_matrix
+        
+        # 코사인 유사도를 위해 사용자 벡터 정규화
+        norms = np.sqrt(np.asarray(user_matrix.multiply(user_matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        user_matrix = sparse.diags(1.0 / norms) @ user_matrix
+        
+        # (사용자, 후보) 쌍 구성
+        pair_users = np.repeat(
+            np.arange(n_users), [len(rows) for rows in candidate_rows]
+        )
+        pair_items = np.fromiter(
+            (row for rows in candidate_rows for row in rows), dtype=np.int64
+        )
+        if pair_items.size == 0:
+            return results
+        
+        # 후보 합집합에 대해 희소 행렬곱 1회
+        union_items, pair_cols = np.unique(pair_items, return_inverse=True)
+        similarity = (user_matrix @ item_matrix[union_items].T).tocsr()
+        scores = np.asarray(similarity[pair_users, pair_cols]).ravel()
+        scores = scores + bonuses[pair_items]
+        
+        # 사용자별 점수 내림차순 정렬 후 상위 N개 선택
+        order = np.lexsort((-scores, pair_users))
+        sorted_users = pair_users[order]
+        starts = np.searchsorted(sorted_users, sorted_users, side="left")
+        keep = order[(np.arange(order.size) - starts) < top_n]
+        
+        for user, item, score in zip(pair_users[keep], pair_items[keep], scores[keep]):
+            results[user].append((int(item), float(score)))
+        
+        return results
+    
+    @staticmethod
+    def rank_candidates(candidate_counts: Dict[int, int], limit: int) -> List[int]:
+        """
+        후보 영화 풀 (여러 좋아하는 영화에서 추천된 영화 우선, 같으면 영화 ID 순)
+        
+        좋아하는 영화를 넣고 뺀 순서와 무관하게 같은 결과가 나오도록 삽입 순서를 쓰지 않습니다
+        (저장된 취향 프로필과 요청별 분석의 후보 풀이 같아야 함).
+        
+        Args:
+            candidate_counts: {영화 ID: 해당 영화를 후보로 가진 좋아하는 영화 수}
+            limit: 최대 개수
+        """
+        ranked = sorted(candidate_counts, key=lambda movie_id: (-candidate_counts[movie_id], movie_id))
+        return ranked[:limit]
+    
+    @staticmethod
+    def count_patterns(
+        favorite_profiles: List[Dict[str, Any]]
+    ) -> Dict[str, Counter]:
+        """
+        좋아하는 영화들의 장르/감독/배우 빈도
+        
+        Returns:
+            {"genres": Counter, "directors": Counter, "cast": Counter}
+        """
+        counters = {field: Counter() for field in PATTERN_FIELDS}
+        
+        for profile in favorite_profiles:
+            for field, counter in counters.items():
+                for name in profile.get(field) or []:
+                    counter[name] += 1
+        
+        return counters
+    
+    @staticmethod
+    def top_patterns(pattern_counts: Dict[str, Dict[str, int]]) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        빈도 상위 5개씩 선택 (빈도가 같으면 먼저 나온 순서)
+        
         Returns:
             {
                 "top_genres": [(장르명, 빈도), ...],
@@ -163,29 +632,38 @@ class RecommendationService:
                 "top_actors": [(배우명, 빈도), ...]
             }
         """
-        genre_counter = Counter()
-        director_counter = Counter()
-        actor_counter = Counter()
-        
-        for profile in favorite_profiles:
-            # 장르 카운트
-            for genre in profile.get("genres") or []:
-                genre_counter[genre] += 1
-            
-            # 감독 카운트
-            for director in profile.get("directors") or []:
-                director_counter[director] += 1
-            
-            # 배우 카운트
-            for actor in profile.get("cast") or []:
-                actor_counter[actor] += 1
-        
         return {
-            "top_genres": genre_counter.most_common(5),
-            "top_directors": director_counter.most_common(5),
-            "top_actors": actor_counter.most_common(5),
+            key: Counter(pattern_counts.get(field) or {}).most_common(5)
+            for field, key in PATTERN_FIELDS.items()
         }
+    
+    @staticmethod
+    def analyze_patterns(
+        favorite_profiles: List[Dict[str, Any]]
+    ) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        좋아하는 영화들의 공통 패턴 분석
+        
+        Args:
+            favorite_profiles: 좋아하는 영화 프로필 리스트
+            
+        Returns:
+            top_patterns 참고
+        """
+        return RecommendationService.top_patterns(
+            RecommendationService.count_patterns(favorite_profiles)
+        )
 
 
 # 싱글톤 인스턴스
 recommendation_service = RecommendationService()
+
+
+@on_preload
+def warm_imports():
+    """gunicorn 마스터에서 무거운 모듈을 미리 로드 (워커는 fork로 공유)"""
+    import numpy  # noqa: F401
+    import scipy.sparse  # noqa: F401
+    import sklearn.feature_extraction.text  # noqa: F401
+    import sklearn.metrics.pairwise  # noqa: F401
+    _get_analyzer()
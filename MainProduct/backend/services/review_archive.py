@@ -0,0 +1,269 @@
+"""
+오래된 리뷰 보관 계층 (월별 Parquet 파일)
+
+reviews에서 REVIEW_ARCHIVE_AFTER_MONTHS달보다 오래된 달을 Parquet(zstd)으로 옮기고
+파티션을 삭제(일반 테이블은 DELETE)합니다 → 핫 테이블/인덱스 크기가 최근 리뷰 수에 비례.
+
+보관된 리뷰도 같은 API(/api/reviews/<id>, 통계, 영화 상세)로 조회됩니다.
+- 개수/평균 별점: review_archive_stats (영화별 PK 조회 1번)
+- 목록: 최근 리뷰 페이지를 넘어선 부분만 Parquet에서 읽음
+  파일은 (movie_id, created_at DESC) 순으로 정렬되어 있어
+  row group의 movie_id 최소/최대 통계로 해당 영화가 있는 row group만 읽습니다.
+
+보관된 리뷰는 읽기 전용입니다 (삭제/검색/협업 필터링 학습 대상 아님).
+"""
+import os
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from config import Config
+from models.review import Review
+from models.review_archive import ReviewArchive, ReviewArchiveStat
+from models.review_version import ReviewVersion
+from services.review_partitions import add_months, review_partition_service
+from utils.cache import LRUCache
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Parquet row group 크기 (= DB에서 한 번에 가져오는 행 수)
+ROW_GROUP_SIZE = 50000
+
+COLUMNS = ("id", "movie_id", "author_name", "content", "rating", "created_at")
+
+
+def _pyarrow():
+    """pyarrow 모듈 (pa, pc, pq) - 보관 파일을 읽고 쓸 때만 import (서버 시작 시에는 불러오지 않음)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:  # pragma: no cover - 선택 의존성
+        raise RuntimeError("리뷰 보관 파일을 읽고 쓰려면 pyarrow가 필요합니다.")
+    return pa, pc, pq
+
+
+def _schema() -> "pa.Schema":
+    pa, _, _ = _pyarrow()
+    return pa.schema([
+        ("id", pa.int64()),
+        ("movie_id", pa.int32()),
+        ("author_name", pa.string()),
+        ("content", pa.string()),
+        ("rating", pa.float64()),
+        ("created_at", pa.timestamp("us")),
+    ])
+
+
+class ReviewArchiveService:
+    """리뷰 보관/조회 서비스"""
+
+    def __init__(self):
+        # 파일 이름 → (Parquet 메타데이터, row group별 movie_id (최소, 최대))
+        self._files = LRUCache(maxsize=256)
+
+    def archive_month(self, conn: Connection, month: date) -> int:
+        """
+        한 달치 리뷰를 Parquet으로 옮기고 reviews에서 제거 (conn의 트랜잭션 안에서 실행)
+
+        이미 보관한 달은 다시 보관하지 않습니다 (보관 후 들어온 리뷰는 reviews에 남아 그대로 조회됨).
+        보관한 영화들의 리뷰 버전을 올려 ETag / 응답 캐시가 새 목록을 반환하도록 합니다.
+
+        Args:
+            conn: DB 연결 (호출한 쪽에서 커밋)
+            month: 보관할 달 (1일)
+
+        Returns:
+            보관한 리뷰 수
+        """
+        pa, _, pq = _pyarrow()
+        table = Review.__table__
+        start, end = month, add_months(month, 1)
+        in_month = (table.c.created_at >= start, table.c.created_at < end)
+
+        archived = conn.execute(
+            select(ReviewArchive.path).where(ReviewArchive.month == month)
+        ).scalar_one_or_none()
+        if archived is not None:
+            print(f"[경고] {month:%Y-%m}은 이미 보관되었습니다 ({archived}), 건너뜀")
+            return 0
+
+        filename = f"reviews_{month:%Y%m}.parquet"
+        path = os.path.join(Config.REVIEW_ARCHIVE_DIR, filename)
+        tmp_path = f"{path}.tmp"
+        os.makedirs(Config.REVIEW_ARCHIVE_DIR, exist_ok=True)
+
+        result = conn.execution_options(stream_results=True).execute(
+            select(*(table.c[name] for name in COLUMNS))
+            .where(*in_month)
+            .order_by(table.c.movie_id, table.c.created_at.desc(), table.c.id.desc())
+        )
+
+        schema = _schema()
+        stats: Dict[int, List[float]] = {}
+        row_count = 0
+        writer = None
+        try:
+            while True:
+                rows = result.fetchmany(ROW_GROUP_SIZE)
+                if not rows:
+                    break
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+                columns = list(zip(*rows))
+                writer.write_table(pa.table(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ), row_group_size=ROW_GROUP_SIZE)
+
+                for movie_id, rating in zip(columns[1], columns[4]):
+                    stat = stats.setdefault(movie_id, [0, 0.0])
+                    stat[0] += 1
+                    stat[1] += rating
+                row_count += len(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if row_count:
+            os.replace(tmp_path, path)
+            self._add_stats(conn, stats)
+            conn.execute(ReviewArchive.__table__.insert().values(
+                month=month, path=filename, row_count=row_count
+            ))
+            # 목록/통계 응답이 바뀌므로 버전 증가 (호출한 쪽의 커밋과 함께 반영)
+            ReviewVersion.bump_many(conn, list(stats))
+
+        if not review_partition_service.drop_partition(conn, month):
+            conn.execute(delete(table).where(*in_month))
+
+        metrics.inc("review_archive_rows_total", row_count)
+        return row_count
+
+    @staticmethod
+    def _add_stats(conn: Connection, stats: Dict[int, List[float]]):
+        """영화별 보관 개수/별점 합계 누적 (INSERT ... ON CONFLICT DO UPDATE)"""
+        if conn.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(ReviewArchiveStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReviewArchiveStat.movie_id],
+            set_={
+                "review_count": ReviewArchiveStat.review_count + stmt.excluded.review_count,
+                "rating_sum": ReviewArchiveStat.rating_sum + stmt.excluded.rating_sum,
+            }
+        )
+        conn.execute(stmt, [
+            {"movie_id": movie_id, "review_count": count, "rating_sum": rating_sum}
+            for movie_id, (count, rating_sum) in stats.items()
+        ])
+
+    def archived_stats(self, db: Session, movie_id: int) -> Tuple[int, float]:
+        """보관된 리뷰 (개수, 별점 합계) - PK 조회 1번"""
+        stat = db.get(ReviewArchiveStat, movie_id)
+        if stat is None:
+            return 0, 0.0
+        return stat.review_count, stat.rating_sum
+
+    def archived_page(self, db: Session, movie_id: int, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """
+        보관된 리뷰 페이지 (최신 달부터, 달 안에서는 최신순)
+
+        Args:
+            offset: 보관된 리뷰 기준 시작 위치
+            limit: 최대 개수
+        """
+        if limit <= 0:
+            return []
+        filenames = db.execute(
+            select(ReviewArchive.path).order_by(ReviewArchive.month.desc())
+        ).scalars().all()
+
+        page: List[Dict[str, Any]] = []
+        for filename in filenames:
+            rows = self._movie_rows(filename, movie_id)
+            if offset >= len(rows):
+                offset -= len(rows)
+                continue
+            page.extend(rows[offset:offset + limit - len(page)])
+            offset = 0
+            if len(page) >= limit:
+                break
+        return page
+
+    def with_archived(
+        self,
+        db: Session,
+        movie_id: int,
+        reviews: List[Dict[str, Any]],
+        hot_total: int,
+        hot_rating_sum: float,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int, float]:
+        """
+        reviews 테이블의 페이지/집계에 보관된 리뷰 합치기
+
+        Args:
+            reviews: reviews 테이블에서 조회한 페이지 (to_dict 결과)
+            hot_total / hot_rating_sum: reviews 테이블의 영화 리뷰 수 / 별점 합계
+            offset / limit: 요청한 페이지
+
+        Returns:
+            (리뷰 페이지, 전체 개수, 평균 별점)
+        """
+        archived_count, archived_sum = self.archived_stats(db, movie_id)
+        total = hot_total + archived_count
+        average = (hot_rating_sum + archived_sum) / total if total else 0.0
+
+        # 보관된 리뷰는 모두 최근 리뷰보다 오래되었으므로 최근 리뷰 뒤에 이어 붙임
+        if archived_count and len(reviews) < limit:
+            reviews = reviews + self.archived_page(
+                db, movie_id, max(0, offset - hot_total), limit - len(reviews)
+            )
+        return reviews, total, average
+
+    def _movie_rows(self, filename: str, movie_id: int) -> List[Dict[str, Any]]:
+        """보관 파일에서 영화의 리뷰만 읽기 (movie_id 범위가 맞는 row group만)"""
+        _, pc, pq = _pyarrow()
+        path = os.path.join(Config.REVIEW_ARCHIVE_DIR, filename)
+        cached = self._files.get(filename)
+        if cached is None:
+            metadata = pq.read_metadata(path)
+            column = metadata.schema.names.index("movie_id")
+            bounds = []
+            for index in range(metadata.num_row_groups):
+                statistics = metadata.row_group(index).column(column).statistics
+                bounds.append((statistics.min, statistics.max))
+            cached = (metadata, bounds)
+            self._files.put(filename, cached)
+
+        metadata, bounds = cached
+        groups = [i for i, (low, high) in enumerate(bounds) if low <= movie_id <= high]
+        if not groups:
+            return []
+
+        table = pq.ParquetFile(path, metadata=metadata).read_row_groups(groups)
+        table = table.filter(pc.equal(table["movie_id"], movie_id))
+        metrics.inc("review_archive_reads_total")
+
+        rows = table.to_pylist()
+        for row in rows:
+            row["created_at"] = row["created_at"].isoformat()
+            row["archived"] = True
+        return rows
+
+
+# 싱글톤 인스턴스
+review_archive_service = ReviewArchiveService()
+
+metrics.describe("review_archive_rows_total", "counter", "Parquet으로 보관한 리뷰 수")
+metrics.describe("review_archive_reads_total", "counter", "보관 파일에서 영화 리뷰를 읽은 횟수")
@@ -0,0 +1,259 @@
+"""
+영화별 리뷰 실시간 이벤트 (Server-Sent Events)
+
+리뷰 작성/삭제 시 같은 영화의 상세 모달을 보고 있는 모든 클라이언트에
+새 리뷰 / 삭제된 리뷰 ID / 갱신된 통계를 보냅니다 → 클라이언트는 목록을 다시 조회하지 않습니다.
+
+- 프로세스 안: 영화 ID별 구독자 큐로 전달 (pub/sub)
+- 워커 간 (PostgreSQL): 쓰기 트랜잭션 안에서 pg_notify → 각 워커의 LISTEN 스레드가 받아 자기 구독자에게 전달
+  NOTIFY는 커밋될 때만 전달되므로 롤백된 쓰기는 이벤트가 나가지 않습니다.
+- SQLite(로컬 개발, 워커 1개): 커밋 후 같은 프로세스의 구독자에게 바로 전달
+
+이벤트 ID는 영화의 리뷰 버전(review_versions)이므로 재연결 시 Last-Event-ID로 놓친 이벤트를 알 수 있고,
+놓쳤으면 resync 이벤트로 클라이언트가 한 번 다시 조회합니다.
+"""
+import queue
+import select
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from config import Config
+from database import SessionLocal, engine
+from utils.lifecycle import on_post_fork
+from utils.metrics import metrics
+from utils.serialization import dumps, loads
+
+# LISTEN/NOTIFY 채널 이름
+CHANNEL = "review_events"
+
+# PostgreSQL NOTIFY payload 최대 크기 (기본 8000바이트)
+NOTIFY_MAX_BYTES = 7900
+
+# 커밋 후 전달할 이벤트 (SQLite, Session.info 키)
+PENDING_KEY = "review_events"
+
+
+class SubscriberLimitError(Exception):
+    """워커의 동시 구독자 수 초과"""
+    pass
+
+
+class Subscription:
+    """SSE 연결 1개의 이벤트 큐"""
+
+    def __init__(self, movie_id: int):
+        self.movie_id = movie_id
+        self.queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=Config.REVIEW_EVENTS_QUEUE_SIZE)
+        # 큐가 넘쳐 이벤트를 버렸으면 True → 다음 전송에서 resync
+        self.overflowed = False
+
+    def put(self, message: Dict[str, Any]):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self.overflowed = True
+
+
+def format_event(event_type: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """SSE 메시지 1개 (id/event/data 필드)"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    return ("\n".join(lines) + "\n").encode("utf-8") + b"data: " + dumps(data) + b"\n\n"
+
+
+class ReviewEventBus:
+    """영화별 리뷰 이벤트 pub/sub"""
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    @property
+    def bridge(self) -> bool:
+        """워커 간 전달에 PostgreSQL LISTEN/NOTIFY를 사용하는지"""
+        return engine.dialect.name == "postgresql" and Config.REVIEW_EVENTS_PG_BRIDGE
+
+    def publish(self, db: Session, movie_id: int, event_type: str, data: Dict[str, Any]):
+        """
+        리뷰 이벤트 발행 (리뷰 변경과 같은 트랜잭션에서 db.commit() 전에 호출)
+
+        Args:
+            db: 쓰기 세션 (커밋되어야 전달)
+            movie_id: 영화 ID
+            event_type: review_created / review_deleted
+            data: 이벤트 내용 (version 포함)
+        """
+        message = {"type": event_type, "movie_id": movie_id, **data}
+        if not self.bridge:
+            db.info.setdefault(PENDING_KEY, []).append(message)
+            return
+
+        payload = dumps(message)
+        if len(payload) > NOTIFY_MAX_BYTES:
+            # 리뷰 본문을 빼고 보내면 클라이언트가 목록을 다시 조회
+            message = {"type": "resync", "movie_id": movie_id, "version": data.get("version")}
+            payload = dumps(message)
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {
+            "channel": CHANNEL, "payload": payload.decode("utf-8")
+        })
+
+    def dispatch(self, message: Dict[str, Any]):
+        """이 프로세스의 구독자에게 전달"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(message.get("movie_id"), ()))
+        for subscription in subscribers:
+            subscription.put(message)
+        metrics.inc("review_events_total", type=message.get("type", ""))
+        metrics.inc("review_events_delivered_total", len(subscribers))
+
+    def subscribe(self, movie_id: int) -> Subscription:
+        """
+        영화 이벤트 구독
+
+        Raises:
+            SubscriberLimitError: 워커의 동시 구독자 수가 REVIEW_EVENTS_MAX_SUBSCRIBERS 이상
+        """
+        if self.bridge:
+            self._ensure_listener()
+
+        subscription = Subscription(movie_id)
+        with self._lock:
+            count = sum(len(subscribers) for subscribers in self._subscribers.values())
+            if count >= Config.REVIEW_EVENTS_MAX_SUBSCRIBERS:
+                raise SubscriberLimitError("실시간 리뷰 연결 수가 너무 많습니다.")
+            self._subscribers.setdefault(movie_id, set()).add(subscription)
+            count += 1
+        metrics.set_gauge("review_event_subscribers", count)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.movie_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.movie_id]
+            count = sum(len(subscribers) for subscribers in self._subscribers.values())
+        metrics.set_gauge("review_event_subscribers", count)
+
+    def stream(self, subscription: Subscription, last_event_id: Optional[int], current_version: int) -> Iterator[bytes]:
+        """
+        SSE 응답 본문 (연결이 끊기거나 REVIEW_EVENTS_MAX_AGE초가 지나면 종료 → 브라우저가 재연결)
+
+        Args:
+            subscription: subscribe() 결과 (종료 시 구독 해제)
+            last_event_id: 재연결 시 브라우저가 보낸 Last-Event-ID (마지막으로 받은 버전)
+            current_version: 연결 시점의 영화 리뷰 버전
+        """
+        try:
+            yield f"retry: {Config.REVIEW_EVENTS_RETRY_MS}\n\n".encode("utf-8")
+            if last_event_id is not None and last_event_id < current_version:
+                yield format_event("resync", {"movie_id": subscription.movie_id, "version": current_version}, current_version)
+            else:
+                yield format_event("ready", {"movie_id": subscription.movie_id, "version": current_version}, current_version)
+
+            deadline = time.monotonic() + Config.REVIEW_EVENTS_MAX_AGE
+            while time.monotonic() < deadline:
+                try:
+                    message = subscription.queue.get(timeout=Config.REVIEW_EVENTS_HEARTBEAT)
+                except queue.Empty:
+                    # 프록시 유휴 타임아웃 방지 + 끊긴 연결 감지 (쓰기 실패 → 제너레이터 종료)
+                    yield b": ping\n\n"
+                    continue
+
+                if subscription.overflowed:
+                    # 버린 이벤트가 있으면 남은 이벤트 대신 resync 1번
+                    while not subscription.queue.empty():
+                        message = subscription.queue.get_nowait()
+                    subscription.overflowed = False
+                    message = {"type": "resync", "movie_id": subscription.movie_id, "version": message.get("version")}
+                # 메시지는 구독자들이 공유하므로 복사해서 type 제외
+                data = {key: value for key, value in message.items() if key != "type"}
+                yield format_event(message["type"], data, message.get("version"))
+        finally:
+            self.unsubscribe(subscription)
+
+    def _resync_all(self):
+        """이벤트를 놓쳤을 수 있을 때 (LISTEN 재연결) 모든 구독자에게 resync"""
+        with self._lock:
+            subscribers = [s for group in self._subscribers.values() for s in group]
+        for subscription in subscribers:
+            subscription.put({"type": "resync", "movie_id": subscription.movie_id, "version": None})
+
+    def _ensure_listener(self):
+        if self._listener is not None:
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="review-events-listen", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        """LISTEN 연결에서 알림을 받아 dispatch (연결이 끊기면 다시 연결)"""
+        backoff = 1.0
+        first = True
+        while True:
+            connection = None
+            try:
+                connection = engine.raw_connection()
+                pg = connection.driver_connection
+                pg.autocommit = True
+                with pg.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                if not first:
+                    self._resync_all()
+                first = False
+                backoff = 1.0
+
+                while True:
+                    if select.select([pg], [], [], Config.REVIEW_EVENTS_HEARTBEAT) == ([], [], []):
+                        continue
+                    pg.poll()
+                    while pg.notifies:
+                        notify = pg.notifies.pop(0)
+                        try:
+                            self.dispatch(loads(notify.payload))
+                        except ValueError as e:
+                            print(f"[경고] 잘못된 리뷰 이벤트: {e}")
+            except Exception as e:
+                print(f"[경고] 리뷰 이벤트 LISTEN 연결 끊김: {e} ({backoff:.0f}초 후 재연결)")
+                if connection is not None:
+                    # autocommit/LISTEN 상태로 풀에 돌려주지 않음
+                    connection.invalidate()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def reset(self):
+        """fork 후: 부모의 구독자/LISTEN 스레드 정보를 버림"""
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._listener = None
+
+
+def _dispatch_pending(session: Session):
+    for message in session.info.pop(PENDING_KEY, ()):
+        review_event_bus.dispatch(message)
+
+
+def _discard_pending(session: Session):
+    session.info.pop(PENDING_KEY, None)
+
+
+# 싱글톤 인스턴스
+review_event_bus = ReviewEventBus()
+
+event.listen(SessionLocal, "after_commit", _dispatch_pending)
+event.listen(SessionLocal, "after_rollback", _discard_pending)
+on_post_fork(review_event_bus.reset)
+
+metrics.describe("review_events_total", "counter", "발행된 리뷰 실시간 이벤트 수 (이 워커가 받은 것)")
+metrics.describe("review_events_delivered_total", "counter", "구독자 큐에 넣은 리뷰 이벤트 수")
+metrics.describe("review_event_subscribers", "gauge", "리뷰 실시간 이벤트(SSE) 연결 수")
@@ -0,0 +1,168 @@
+"""
+reviews 테이블 월별 파티션 관리 (PostgreSQL 선언적 파티셔닝)
+
+reviews를 created_at 기준 월별 RANGE 파티션으로 나누면
+- 영화별 최신순 조회는 각 파티션의 (movie_id, created_at DESC, id DESC) 인덱스를 병합하여 읽고
+- VACUUM/인덱스 관리가 최근 파티션에만 집중되며
+- 오래된 달은 파티션을 분리(DETACH) 후 삭제하여 보관 계층으로 옮길 수 있습니다 (services/review_archive.py)
+
+새 DB는 init_db가 파티션 테이블로 생성하고, 기존 일반 테이블은
+jobs/review_storage.py의 prepare → copy → cutover로 서비스 중에 이전합니다.
+SQLite(로컬 개발)에서는 일반 테이블 + 복합 인덱스만 사용합니다.
+"""
+from datetime import date, datetime
+from typing import List, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from config import Config
+
+# 기본 키에 파티션 키(created_at)가 포함되어야 하므로 (id, created_at)
+PARTITIONED_TABLE_DDL = """
+CREATE TABLE {table} (
+    id integer NOT NULL DEFAULT nextval('reviews_id_seq'),
+    movie_id integer NOT NULL,
+    author_name varchar(50) NOT NULL,
+    content text NOT NULL,
+    rating double precision NOT NULL,
+    created_at timestamp without time zone NOT NULL,
+    search_text text,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at)
+"""
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    """해당 달의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """month(1일)에서 count달 뒤의 1일"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ReviewPartitionService:
+    """reviews 월별 파티션 관리"""
+
+    @staticmethod
+    def partition_name(table: str, month: date) -> str:
+        return f"{table}_p{month:%Y%m}"
+
+    def is_partitioned(self, conn: Connection, table: str = "reviews") -> bool:
+        """테이블이 파티션 테이블인지 (PostgreSQL 외에는 항상 False)"""
+        if conn.dialect.name != "postgresql":
+            return False
+        return conn.execute(text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND c.relnamespace = current_schema()::regnamespace"
+        ), {"table": table}).first() is not None
+
+    def create_table(self, conn: Connection, table: str, first_month: Optional[date] = None):
+        """
+        파티션 테이블 생성 (인덱스, 검색 컬럼, 기본 파티션, first_month부터 앞으로의 월 파티션)
+
+        Args:
+            conn: PostgreSQL 연결
+            table: 테이블 이름 (새 DB는 reviews, 이전 중에는 reviews_partitioned)
+            first_month: 첫 월 파티션 (기본값: 이번 달)
+        """
+        from services.review_search import review_search_service
+
+        conn.execute(text("CREATE SEQUENCE IF NOT EXISTS reviews_id_seq"))
+        conn.execute(text(PARTITIONED_TABLE_DDL.format(table=table)))
+        conn.execute(text(
+            f"CREATE INDEX ix_{table}_movie_id_created_at ON {table} (movie_id, created_at DESC, id DESC)"
+        ))
+        review_search_service.ensure_postgres_columns(conn, table)
+        # 월 파티션 범위 밖의 행 (예: 시계가 틀린 서버)
+        conn.execute(text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+        if table == "reviews":
+            conn.execute(text("ALTER SEQUENCE reviews_id_seq OWNED BY reviews.id"))
+        self.ensure_partitions(conn, table, first_month)
+
+    def ensure_partitions(
+        self,
+        conn: Connection,
+        table: str = "reviews",
+        first_month: Optional[date] = None,
+        months_ahead: Optional[int] = None
+    ) -> List[str]:
+        """
+        first_month(기본값: 이번 달)부터 months_ahead달 뒤까지 월 파티션 생성 (이미 있으면 건너뜀)
+
+        Returns:
+            새로 만든 파티션 이름 리스트
+        """
+        if months_ahead is None:
+            months_ahead = Config.REVIEW_PARTITION_MONTHS_AHEAD
+        current = month_start(datetime.utcnow())
+        month = first_month or current
+        last = add_months(current, months_ahead)
+
+        existing = set(self.list_partitions(conn, table))
+        created = []
+        while month <= last:
+            name = self.partition_name(table, month)
+            if name not in existing:
+                conn.execute(text(
+                    f"CREATE TABLE {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                ))
+                created.append(name)
+            month = add_months(month, 1)
+        return created
+
+    def list_partitions(self, conn: Connection, table: str = "reviews") -> List[str]:
+        """파티션(자식 테이블) 이름 리스트"""
+        rows = conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND p.relnamespace = current_schema()::regnamespace "
+            "ORDER BY c.relname"
+        ), {"table": table}).all()
+        return [row.relname for row in rows]
+
+    def drop_partition(self, conn: Connection, month: date, table: str = "reviews") -> bool:
+        """
+        월 파티션 분리 후 삭제 (보관 완료 후 호출)
+
+        Returns:
+            파티션이 있어서 삭제했으면 True
+        """
+        name = self.partition_name(table, month)
+        if not self.is_partitioned(conn, table) or name not in self.list_partitions(conn, table):
+            return False
+        conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        return True
+
+    def before_create_all(self, conn: Connection):
+        """
+        init_db: 새 PostgreSQL DB면 create_all보다 먼저 reviews를 파티션 테이블로 생성
+
+        이미 있는 일반 테이블은 그대로 둡니다 (jobs/review_storage.py로 이전).
+        """
+        if conn.dialect.name != "postgresql" or not Config.REVIEW_PARTITIONING:
+            return
+        exists = conn.execute(text("SELECT to_regclass('reviews')")).scalar()
+        if exists is None:
+            self.create_table(conn, "reviews")
+            print("[파티션] reviews를 월별 파티션 테이블로 생성했습니다.")
+
+    def after_create_all(self, conn: Connection):
+        """init_db: 영화별 최신순 인덱스, 앞으로의 월 파티션 보장"""
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_reviews_movie_id_created_at "
+            "ON reviews (movie_id, created_at DESC, id DESC)"
+        ))
+        if self.is_partitioned(conn):
+            created = self.ensure_partitions(conn)
+            if created:
+                print(f"[파티션] 월 파티션 생성: {', '.join(created)}")
+
+
+# 싱글톤 인스턴스
+review_partition_service = ReviewPartitionService()
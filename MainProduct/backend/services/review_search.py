@@ -0,0 +1,217 @@
+"""
+리뷰 전문 검색 (/api/reviews/search)
+
+- PostgreSQL: reviews.search_vector = to_tsvector('simple', search_text) 생성 컬럼 + GIN 인덱스,
+  ts_rank_cd로 관련도 정렬
+- SQLite (로컬 개발): reviews_fts FTS5 외부 콘텐츠 테이블 + 트리거, bm25로 관련도 정렬
+
+search_text는 한글 2-gram 토큰 문자열입니다 (utils/text_search.py).
+페이지는 OFFSET 대신 (관련도, id) 커서로 이어서 조회합니다 → 뒤쪽 페이지도 앞 페이지를 다시 읽지 않음.
+"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models.review import Review
+from utils.metrics import metrics
+from utils.text_search import query_tokens, search_text
+
+# 기존 리뷰 search_text 채우기 단위
+BACKFILL_CHUNK = 1000
+
+SORTS = ("relevance", "recent")
+
+# {table}: reviews 또는 파티션 이전 중인 새 테이블 (jobs/review_storage.py)
+POSTGRES_SCHEMA = (
+    "ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_text text",
+    "ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(search_text, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING GIN (search_vector)",
+)
+
+SQLITE_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN
+        INSERT INTO reviews_fts(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF search_text ON reviews BEGIN
+        INSERT INTO reviews_fts(reviews_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+        INSERT INTO reviews_fts(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+)
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("잘못된 cursor입니다.")
+    if (not isinstance(values, list) or len(values) != size
+            or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)):
+        raise ValueError("잘못된 cursor입니다.")
+    return values
+
+
+class ReviewSearchService:
+    """리뷰 검색 서비스"""
+
+    def ensure_schema(self, conn: Connection):
+        """
+        검색 컬럼/인덱스 생성 및 기존 리뷰 search_text 채우기 (여러 번 실행해도 안전)
+
+        init_db에서 테이블 생성 후 호출합니다.
+        """
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            self.ensure_postgres_columns(conn, "reviews")
+            self._backfill(conn)
+            return
+
+        columns = {c["name"] for c in inspect(conn).get_columns("reviews")}
+        if "search_text" not in columns:
+            conn.execute(text("ALTER TABLE reviews ADD COLUMN search_text TEXT"))
+        self._backfill(conn)
+
+        if dialect == "sqlite":
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reviews_fts'"
+            )).first()
+            if not exists:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE reviews_fts USING fts5("
+                    "search_text, content='reviews', content_rowid='id', tokenize='unicode61')"
+                ))
+                conn.execute(text("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')"))
+            for statement in SQLITE_TRIGGERS:
+                conn.execute(text(statement))
+
+    @staticmethod
+    def ensure_postgres_columns(conn: Connection, table: str):
+        """PostgreSQL 검색 컬럼(search_text, search_vector) + GIN 인덱스 생성"""
+        for statement in POSTGRES_SCHEMA:
+            conn.execute(text(statement.format(table=table)))
+
+    @staticmethod
+    def _backfill(conn: Connection):
+        """search_text가 비어 있는 기존 리뷰를 id 순으로 나누어 채우기"""
+        table = Review.__table__
+        last_id, filled = 0, 0
+        while True:
+            rows = conn.execute(
+                select(table.c.id, table.c.content)
+                .where(table.c.search_text.is_(None), table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(BACKFILL_CHUNK)
+            ).all()
+            if not rows:
+                break
+            conn.execute(
+                table.update().where(table.c.id == bindparam("review_id")).values(search_text=bindparam("tokens")),
+                [{"review_id": row.id, "tokens": search_text(row.content)} for row in rows]
+            )
+            last_id = rows[-1].id
+            filled += len(rows)
+        if filled:
+            print(f"[검색] 기존 리뷰 {filled}개의 검색 토큰을 생성했습니다.")
+
+    def search(
+        self,
+        db: Session,
+        query: str,
+        movie_id: Optional[int] = None,
+        sort: str = "relevance",
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        검색어의 모든 토큰을 포함하는 리뷰 검색
+
+        Args:
+            db: DB 세션
+            query: 검색어 (한글은 2글자 이상)
+            movie_id: 특정 영화 리뷰만 검색
+            sort: relevance (관련도순) / recent (최신순)
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            (리뷰 딕셔너리 리스트 (rank 포함), 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 검색어/정렬/커서가 잘못되었을 때
+        """
+        tokens = query_tokens(query)
+        if not tokens:
+            raise ValueError("검색어를 입력하세요.")
+        if sort not in SORTS:
+            raise ValueError(f"sort는 {', '.join(SORTS)} 중 하나여야 합니다.")
+
+        params: Dict[str, Any] = {"limit": limit + 1}
+        if db.get_bind().dialect.name == "postgresql":
+            params["query"] = " ".join(tokens)
+            matches = (
+                "SELECT r.id AS id, ts_rank_cd(r.search_vector, q) AS rank "
+                "FROM reviews r, plainto_tsquery('simple', :query) q "
+                "WHERE r.search_vector @@ q"
+            )
+        else:
+            params["query"] = " ".join('"' + token.replace('"', '""') + '"' for token in tokens)
+            matches = (
+                "SELECT r.id AS id, -bm25(reviews_fts) AS rank "
+                "FROM reviews_fts JOIN reviews r ON r.id = reviews_fts.rowid "
+                "WHERE reviews_fts MATCH :query"
+            )
+        if movie_id is not None:
+            matches += " AND r.movie_id = :movie_id"
+            params["movie_id"] = movie_id
+
+        if sort == "relevance":
+            order = "rank DESC, id DESC"
+            keyset = "(rank < :after_rank OR (rank = :after_rank AND id < :after_id))"
+            if cursor:
+                params["after_rank"], params["after_id"] = _decode_cursor(cursor, 2)
+        else:
+            order = "id DESC"
+            keyset = "id < :after_id"
+            if cursor:
+                (params["after_id"],) = _decode_cursor(cursor, 1)
+
+        where = f" WHERE {keyset}" if cursor else ""
+        rows = db.execute(text(
+            f"SELECT id, rank FROM ({matches}) AS matches{where} ORDER BY {order} LIMIT :limit"
+        ), params).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # 페이지의 리뷰만 PK로 조회 (search_text는 지연 로딩이라 읽지 않음)
+        reviews = {r.id: r for r in db.query(Review).filter(Review.id.in_([row.id for row in rows]))}
+        results = []
+        for row in rows:
+            review = reviews.get(row.id)
+            if review is not None:
+                results.append({**review.to_dict(), "rank": round(float(row.rank), 6)})
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = _encode_cursor([float(last.rank), last.id] if sort == "relevance" else [last.id])
+
+        metrics.inc("review_search_total", sort=sort)
+        return results, next_cursor
+
+
+# 싱글톤 인스턴스
+review_search_service = ReviewSearchService()
+
+metrics.describe("review_search_total", "counter", "리뷰 검색 요청 수")
@@ -0,0 +1,405 @@
+"""
+백그라운드 작업 스케줄러
+
+인기 목록 / 오래된 프로필 갱신, 파티션 관리, 모델 증분 학습 같은 주기 작업을 요청 처리와 분리하여 실행합니다.
+작업은 jobs/periodic.py에서 @scheduler.job(...)으로 등록합니다.
+
+- 웹 워커 안 (SCHEDULER_ENABLED=True): 프로세스마다 스케줄러 스레드 1개 (preload 모드는 fork 직후 시작)
+- 사이드카: python -m jobs.scheduler run (이때 웹 워커는 SCHEDULER_ENABLED=False)
+- 1회 실행: python -m jobs.scheduler run-once <작업>
+
+작업 범위:
+- cluster: DB/파일을 바꾸는 작업 → 리더 선출로 전체 워커/복제본 중 1곳만 실행
+    PostgreSQL: pg_try_advisory_lock(작업 이름 해시, 슬롯) / 그 외: 잠금 파일 flock (같은 호스트만)
+    잠금을 얻은 뒤 실행 기록(job_runs)의 마지막 시작 시각을 확인하여
+    다른 워커가 이번 주기에 이미 실행했으면 건너뜀
+- local: 프로세스 메모리 캐시를 갱신하는 작업 → 워커마다 실행 (잠금 없음)
+
+max_concurrency는 작업별 동시 실행 수입니다 (잠금 슬롯 수, 프로세스 안에서는 세마포어).
+다음 실행 시각 = 마지막 시작 + 주기 × (1 + 0~SCHEDULER_JITTER 무작위) → 워커들이 같은 시각에 몰리지 않음
+"""
+import os
+import random
+import socket
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import func, select, text
+
+from config import Config
+from database import SessionLocal, engine
+from models.job_run import JobRun
+from utils.lifecycle import on_post_fork
+from utils.metrics import metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (잠금 없이 실행)
+    fcntl = None
+
+# 작업 범위
+CLUSTER = "cluster"
+LOCAL = "local"
+
+# 실행 결과 (skipped: 다른 워커가 이번 주기에 이미 실행, locked: 다른 곳에서 실행 중 / 동시 실행 수 초과)
+SUCCESS = "success"
+FAILED = "failed"
+SKIPPED = "skipped"
+LOCKED = "locked"
+
+# 실행 기록 메시지 최대 길이
+MAX_MESSAGE_LENGTH = 2000
+
+# 기록이 없거나 주기가 지난 작업의 첫 실행 지연 상한(초, 배포 직후 워커들이 동시에 잠금을 시도하지 않도록)
+MAX_START_DELAY = 60.0
+
+
+@dataclass
+class Job:
+    """예약 작업"""
+    name: str
+    func: Callable[[], Optional[str]]
+    interval: float
+    scope: str = CLUSTER
+    max_concurrency: int = 1
+    description: str = ""
+    slots: threading.BoundedSemaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.slots = threading.BoundedSemaphore(max(self.max_concurrency, 1))
+
+    @property
+    def effective_interval(self) -> float:
+        """Config.SCHEDULER_INTERVALS로 재정의한 주기(초, 0이면 자동 실행 안 함)"""
+        return Config.SCHEDULER_INTERVALS.get(self.name, self.interval)
+
+
+def _lock_key(name: str) -> int:
+    """작업 이름 → advisory lock 키 (부호 있는 32비트)"""
+    key = zlib.crc32(name.encode("utf-8"))
+    return key - (1 << 32) if key >= 1 << 31 else key
+
+
+def _timestamp(value: datetime) -> float:
+    """UTC naive datetime → epoch 초"""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class Scheduler:
+    """주기 작업 스케줄러 (리더 선출, 동시 실행 제한, 실행 기록)"""
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread_pid: Optional[int] = None
+
+    @property
+    def host(self) -> str:
+        """실행 기록에 남길 프로세스 (호스트:pid, fork 이후 포함)"""
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def job(self, name: str, interval: float, scope: str = CLUSTER, max_concurrency: int = 1):
+        """
+        작업 등록 데코레이터
+
+        Args:
+            name: 작업 이름 (CLI, Config.SCHEDULER_INTERVALS, 메트릭 레이블)
+            interval: 기본 실행 주기(초, 0이면 run-once로만 실행)
+            scope: cluster (전체에서 1곳만) / local (프로세스마다)
+            max_concurrency: 동시 실행 수
+
+        함수는 인자 없이 호출되며, 반환한 문자열은 실행 기록에 저장됩니다.
+        """
+        def decorator(func: Callable[[], Optional[str]]) -> Callable[[], Optional[str]]:
+            description = (func.__doc__ or "").strip().split("\n")[0]
+            self.jobs[name] = Job(name, func, interval, scope, max_concurrency, description)
+            return func
+
+        return decorator
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def run(self, name: str, force: bool = False) -> str:
+        """
+        작업 1회 실행 (동시 실행 수 → 리더 잠금 → 이번 주기 실행 여부 확인 후)
+
+        Args:
+            name: 작업 이름
+            force: 이번 주기에 이미 실행했어도 실행 (잠금은 확인)
+
+        Returns:
+            success / failed / skipped / locked
+
+        Raises:
+            KeyError: 등록되지 않은 작업
+        """
+        job = self.jobs[name]
+        if not job.slots.acquire(blocking=False):
+            return self._count(job, LOCKED)
+        try:
+            with self._leader(job) as leader:
+                if not leader:
+                    return self._count(job, LOCKED)
+                if not force and job.scope == CLUSTER and self._ran_recently(job):
+                    return self._count(job, SKIPPED)
+                return self._execute(job)
+        finally:
+            job.slots.release()
+
+    def _execute(self, job: Job) -> str:
+        run_id = self._record_start(job)
+        started = time.perf_counter()
+        interrupted = None
+        try:
+            message = job.func()
+            status = SUCCESS
+        except BaseException as e:
+            # sys.exit()도 실패로 기록 (running으로 남지 않도록), KeyboardInterrupt 등은 기록 후 다시 발생
+            message = f"{type(e).__name__}: {e}"
+            status = FAILED
+            print(f"[ERROR] 예약 작업 실패 ({job.name}): {message}")
+            if not isinstance(e, (Exception, SystemExit)):
+                interrupted = e
+        duration = time.perf_counter() - started
+
+        self._record_finish(run_id, status, message, duration)
+        metrics.observe("scheduler_job_duration_seconds", duration, job=job.name)
+        if status == SUCCESS:
+            metrics.set_gauge("scheduler_job_last_success_timestamp", time.time(), job=job.name)
+        status = self._count(job, status)
+        if interrupted is not None:
+            raise interrupted
+        return status
+
+    @staticmethod
+    def _count(job: Job, status: str) -> str:
+        metrics.inc("scheduler_job_runs_total", job=job.name, status=status)
+        return status
+
+    # ------------------------------------------------------------------
+    # 리더 선출 (작업별 잠금 슬롯)
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _leader(self, job: Job) -> Iterator[bool]:
+        """클러스터 작업의 잠금 슬롯 하나를 잡고 있는 동안 True (local 작업은 항상 True)"""
+        if job.scope == LOCAL:
+            yield True
+        elif engine.dialect.name == "postgresql":
+            with self._advisory_lock(job) as acquired:
+                yield acquired
+        else:
+            with self._file_lock(job) as acquired:
+                yield acquired
+
+    @contextmanager
+    def _advisory_lock(self, job: Job) -> Iterator[bool]:
+        key = _lock_key(job.name)
+        conn = engine.connect()
+        slot = None
+        try:
+            for candidate in range(max(job.max_concurrency, 1)):
+                if conn.execute(text("SELECT pg_try_advisory_lock(:key, :slot)"),
+                                {"key": key, "slot": candidate}).scalar():
+                    slot = candidate
+                    break
+            # 잠금은 세션 단위로 유지되므로 작업 중에 트랜잭션을 열어 두지 않음
+            conn.commit()
+            yield slot is not None
+        finally:
+            try:
+                if slot is not None:
+                    conn.execute(text("SELECT pg_advisory_unlock(:key, :slot)"), {"key": key, "slot": slot})
+                    conn.commit()
+            except Exception:
+                # 해제하지 못한 잠금을 가진 커넥션이 풀로 돌아가지 않도록 버림 (세션이 끝나면 해제됨)
+                conn.invalidate()
+            finally:
+                conn.close()
+
+    @contextmanager
+    def _file_lock(self, job: Job) -> Iterator[bool]:
+        if fcntl is None:
+            yield True
+            return
+        os.makedirs(Config.SCHEDULER_LOCK_DIR, exist_ok=True)
+        handle = None
+        for slot in range(max(job.max_concurrency, 1)):
+            f = open(os.path.join(Config.SCHEDULER_LOCK_DIR, f"{job.name}.{slot}.lock"), "a")
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                handle = f
+                break
+            except OSError:
+                f.close()
+        try:
+            yield handle is not None
+        finally:
+            if handle is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+                handle.close()
+
+    # ------------------------------------------------------------------
+    # 실행 기록
+    # ------------------------------------------------------------------
+
+    def last_started(self, name: str) -> Optional[datetime]:
+        """작업의 마지막 실행 시작 시각 (UTC, 모든 프로세스 기준)"""
+        db = SessionLocal()
+        try:
+            return db.execute(select(func.max(JobRun.started_at)).where(JobRun.job == name)).scalar()
+        finally:
+            db.close()
+
+    def _ran_recently(self, job: Job) -> bool:
+        """다른 워커가 이번 주기에 이미 실행했는지 (지연 비율만큼 일찍 실행한 경우도 포함)"""
+        interval = job.effective_interval
+        last = self.last_started(job.name)
+        if last is None or interval <= 0:
+            return False
+        return (datetime.utcnow() - last).total_seconds() < interval * (1 - Config.SCHEDULER_JITTER)
+
+    def _record_start(self, job: Job) -> Optional[int]:
+        db = SessionLocal()
+        try:
+            run = JobRun(job=job.name, status="running", host=self.host, started_at=datetime.utcnow())
+            db.add(run)
+            db.commit()
+            return run.id
+        except Exception as e:
+            db.rollback()
+            metrics.inc("scheduler_errors_total", op="record")
+            print(f"[경고] 작업 실행 기록 실패 ({job.name}): {e}")
+            return None
+        finally:
+            db.close()
+
+    def _record_finish(self, run_id: Optional[int], status: str, message: Optional[str], duration: float):
+        if run_id is None:
+            return
+        db = SessionLocal()
+        try:
+            run = db.get(JobRun, run_id)
+            run.status = status
+            run.finished_at = datetime.utcnow()
+            run.duration = round(duration, 3)
+            run.message = str(message)[:MAX_MESSAGE_LENGTH] if message is not None else None
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            metrics.inc("scheduler_errors_total", op="record")
+            print(f"[경고] 작업 실행 기록 실패 ({run_id}): {e}")
+        finally:
+            db.close()
+
+    def history(self, name: Optional[str] = None, limit: int = 20) -> List[JobRun]:
+        """최근 실행 기록 (최신순)"""
+        db = SessionLocal()
+        try:
+            query = select(JobRun).order_by(JobRun.started_at.desc()).limit(limit)
+            if name:
+                query = query.where(JobRun.job == name)
+            return list(db.execute(query).scalars())
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 주기 실행
+    # ------------------------------------------------------------------
+
+    def _next_due(self, job: Job, last: Optional[float]) -> float:
+        """다음 실행 시각 (epoch 초)"""
+        interval = job.effective_interval
+        now = time.time()
+        due = last + interval * (1 + random.uniform(0, Config.SCHEDULER_JITTER)) if last else now
+        return max(due, now + random.uniform(0, min(interval * Config.SCHEDULER_JITTER, MAX_START_DELAY)))
+
+    def _cluster_last(self, job: Job, fallback: Optional[float]) -> Optional[float]:
+        """클러스터 작업은 다른 워커의 실행도 반영하여 DB의 마지막 시작 시각 사용"""
+        try:
+            last = self.last_started(job.name)
+            return _timestamp(last) if last else fallback
+        except Exception as e:
+            metrics.inc("scheduler_errors_total", op="history")
+            print(f"[경고] 작업 실행 기록 조회 실패 ({job.name}): {e}")
+            return fallback or time.time()
+
+    def _run_scheduled(self, job: Job):
+        try:
+            self.run(job.name)
+        except Exception as e:
+            metrics.inc("scheduler_errors_total", op="run")
+            print(f"[경고] 예약 작업 실행 실패 ({job.name}): {e}")
+
+    def start(self, scopes: Iterable[str] = (CLUSTER, LOCAL)) -> bool:
+        """프로세스마다 (fork 이후 포함) 스케줄러 스레드 1개 시작 (이미 실행 중이면 False)"""
+        with self._lock:
+            if self._thread_pid == os.getpid():
+                return False
+            self._thread_pid = os.getpid()
+        threading.Thread(target=self.run_forever, args=(tuple(scopes),), name="job-scheduler", daemon=True).start()
+        return True
+
+    def run_forever(self, scopes: Iterable[str] = (CLUSTER, LOCAL)):
+        """주기가 된 작업을 스레드 풀(SCHEDULER_WORKERS)에서 실행 (같은 작업은 이전 실행이 끝난 뒤)"""
+        jobs = {name: job for name, job in self.jobs.items() if job.scope in scopes and job.effective_interval > 0}
+        if not jobs:
+            return
+        print(f"[스케줄러] 시작 ({self.host}): {', '.join(jobs)}")
+
+        executor = ThreadPoolExecutor(max_workers=max(Config.SCHEDULER_WORKERS, 1), thread_name_prefix="job")
+        started = time.time()
+        last_run = {name: started for name in jobs}
+        due = {
+            name: self._next_due(job, self._cluster_last(job, None) if job.scope == CLUSTER else started)
+            for name, job in jobs.items()
+        }
+        running = {}
+        while True:
+            self._wake.clear()
+            for name, future in list(running.items()):
+                if future.done():
+                    del running[name]
+                    job = jobs[name]
+                    last = self._cluster_last(job, last_run[name]) if job.scope == CLUSTER else last_run[name]
+                    due[name] = self._next_due(job, last)
+
+            now = time.time()
+            for name, job in jobs.items():
+                if name not in running and due[name] <= now:
+                    last_run[name] = now
+                    running[name] = executor.submit(self._run_scheduled, job)
+                    running[name].add_done_callback(lambda _: self._wake.set())
+
+            waiting = [due[name] for name in jobs if name not in running]
+            self._wake.wait(max(min(waiting, default=now + MAX_START_DELAY) - time.time(), 0.1))
+
+
+# 싱글톤 인스턴스
+scheduler = Scheduler()
+
+
+@on_post_fork
+def start_scheduler():
+    """preload 모드: 워커 fork 직후 스케줄러 시작 (마스터에서는 실행하지 않음)"""
+    if Config.SCHEDULER_ENABLED:
+        scheduler.start()
+
+
+metrics.describe("scheduler_job_runs_total", "counter",
+                 "예약 작업 실행 결과 수 (success / failed / skipped: 이번 주기에 다른 워커가 실행 / "
+                 "locked: 다른 곳에서 실행 중)")
+metrics.describe("scheduler_job_duration_seconds", "histogram", "예약 작업 실행 시간",
+                 buckets=(0.1, 1.0, 10.0, 60.0, 300.0, 900.0, 3600.0))
+metrics.describe("scheduler_job_last_success_timestamp", "gauge", "작업별 마지막 성공 시각 (epoch 초)",
+                 aggregate="max")
+metrics.describe("scheduler_errors_total", "counter", "스케줄러 DB 오류 수 (잠금/실행 기록)")
@@ -0,0 +1,226 @@
+"""
+저장된 취향 프로필 서비스
+
+/api/analyze는 매번 제목 검색 → 상세 조회 → TF-IDF 계산을 반복합니다.
+프로필을 저장해 두면 다시 방문할 때 이 과정을 건너뛰고 (profile_id로 분석),
+영화 추가/삭제는 그 영화의 기여분(단어 벡터, 후보 영화, 장르/감독/배우)만
+더하거나 빼서 갱신합니다 → 영화 1편의 특징 수에 비례, 외부 API 재조회/재학습 없음.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.exc import StaleDataError
+
+from config import Config
+from models.taste_profile import TasteProfile, new_profile_id
+from services.recommendation import PATTERN_FIELDS, recommendation_service
+from utils.metrics import metrics
+
+# 동시 수정 충돌 시 재시도 횟수
+MAX_RETRIES = 3
+
+AGGREGATE_COLUMNS = ("favorites", "term_sums", "doc_freq", "candidate_counts", "pattern_counts")
+
+
+class ProfileConflictError(Exception):
+    """재시도 후에도 동시 수정이 계속 충돌할 때"""
+
+
+class ProfileLimitError(Exception):
+    """좋아하는 영화 수가 TASTE_PROFILE_MAX_FAVORITES를 넘을 때"""
+
+
+def movie_contribution(movie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    영화 1편이 프로필에 더하는 값 (삭제할 때 그대로 빼기 위해 프로필에 함께 저장)
+
+    Args:
+        movie: 영화 프로필
+    """
+    return {
+        "id": movie.get("id"),
+        "title": movie.get("title"),
+        "poster": movie.get("poster"),
+        "terms": recommendation_service.term_vector(movie),
+        "candidate_ids": list(movie.get("candidate_ids") or []),
+        **{field: list(movie.get(field) or []) for field in PATTERN_FIELDS},
+    }
+
+
+def _update_counts(counts: Dict[str, int], keys: Iterable[str], sign: int):
+    for key in keys:
+        count = counts.get(key, 0) + sign
+        if count > 0:
+            counts[key] = count
+        else:
+            counts.pop(key, None)
+
+
+def apply_contribution(profile: TasteProfile, contribution: Dict[str, Any], sign: int):
+    """
+    프로필에 영화 기여분을 더하거나(sign=1) 빼기(sign=-1)
+
+    단어가 더 이상 어떤 영화에도 없으면 제거하여 부동소수점 오차가 남지 않게 합니다.
+    """
+    term_sums, doc_freq = profile.term_sums, profile.doc_freq
+    for term, weight in contribution["terms"].items():
+        count = doc_freq.get(term, 0) + sign
+        if count > 0:
+            doc_freq[term] = count
+            term_sums[term] = term_sums.get(term, 0.0) + sign * weight
+        else:
+            doc_freq.pop(term, None)
+            term_sums.pop(term, None)
+
+    _update_counts(profile.candidate_counts, (str(c) for c in contribution["candidate_ids"]), sign)
+    for field in PATTERN_FIELDS:
+        _update_counts(profile.pattern_counts.setdefault(field, {}), contribution.get(field) or [], sign)
+
+    # JSON 컬럼을 제자리에서 수정했으므로 변경 표시
+    for column in AGGREGATE_COLUMNS:
+        flag_modified(profile, column)
+
+
+class TasteProfileService:
+    """취향 프로필 저장/갱신 서비스"""
+
+    def create(self, db: Session, movies: List[Dict[str, Any]], lang: str) -> TasteProfile:
+        """
+        좋아하는 영화 프로필들로 새 취향 프로필 생성
+
+        Raises:
+            ProfileLimitError: 영화 수가 너무 많을 때
+        """
+        if len(movies) > Config.TASTE_PROFILE_MAX_FAVORITES:
+            raise ProfileLimitError(f"좋아하는 영화는 최대 {Config.TASTE_PROFILE_MAX_FAVORITES}편입니다.")
+
+        profile = TasteProfile(
+            id=new_profile_id(),
+            language=lang,
+            favorites=[],
+            term_sums={},
+            doc_freq={},
+            candidate_counts={},
+            pattern_counts={},
+        )
+        for movie in movies:
+            self._add(profile, movie)
+
+        db.add(profile)
+        db.commit()
+        metrics.inc("taste_profile_updates_total", op="create")
+        return profile
+
+    def get(self, db: Session, profile_id: str) -> Optional[TasteProfile]:
+        """프로필 조회 (PK 조회 1번)"""
+        return db.get(TasteProfile, profile_id)
+
+    def delete(self, db: Session, profile_id: str) -> bool:
+        """프로필 삭제"""
+        profile = self.get(db, profile_id)
+        if profile is None:
+            return False
+        db.delete(profile)
+        db.commit()
+        return True
+
+    def add_favorite(self, db: Session, profile_id: str, movie: Dict[str, Any]) -> Optional[TasteProfile]:
+        """
+        좋아하는 영화 추가 (이미 있으면 변경 없음)
+
+        Returns:
+            갱신된 프로필 (프로필이 없으면 None)
+
+        Raises:
+            ProfileLimitError / ProfileConflictError
+        """
+        contribution = movie_contribution(movie)
+
+        def change(profile: TasteProfile) -> bool:
+            if contribution["id"] in profile.favorite_ids:
+                return False
+            if len(profile.favorites) >= Config.TASTE_PROFILE_MAX_FAVORITES:
+                raise ProfileLimitError(f"좋아하는 영화는 최대 {Config.TASTE_PROFILE_MAX_FAVORITES}편입니다.")
+            profile.favorites.append(contribution)
+            apply_contribution(profile, contribution, 1)
+            return True
+
+        return self._update(db, profile_id, change, "add")
+
+    def remove_favorite(self, db: Session, profile_id: str, movie_id: int) -> Optional[TasteProfile]:
+        """
+        좋아하는 영화 삭제 (저장된 기여분을 그대로 빼므로 외부 API 조회 없음)
+
+        Returns:
+            갱신된 프로필 (프로필이 없으면 None)
+        """
+        def change(profile: TasteProfile) -> bool:
+            for index, favorite in enumerate(profile.favorites):
+                if favorite["id"] == movie_id:
+                    profile.favorites.pop(index)
+                    apply_contribution(profile, favorite, -1)
+                    return True
+            return False
+
+        return self._update(db, profile_id, change, "remove")
+
+    def scoring_inputs(self, profile: TasteProfile) -> Tuple[Any, Any, List[Tuple[str, float]], List[int]]:
+        """
+        저장된 프로필로 추천 계산 입력 생성 (제목 검색 / 상세 조회 / fit 없음)
+
+        Returns:
+            (vectorizer, user_vector, top_features, candidate_ids)
+
+        Raises:
+            ValueError: 좋아하는 영화가 없을 때
+        """
+        vectorizer, user_vector, top_features = recommendation_service.vectorize_taste(
+            profile.term_sums, profile.doc_freq, len(profile.favorites)
+        )
+        candidate_ids = recommendation_service.rank_candidates(
+            {int(movie_id): count for movie_id, count in profile.candidate_counts.items()},
+            Config.CANDIDATE_LIMIT
+        )
+        return vectorizer, user_vector, top_features, candidate_ids
+
+    @staticmethod
+    def _add(profile: TasteProfile, movie: Dict[str, Any]):
+        contribution = movie_contribution(movie)
+        if contribution["id"] is None or contribution["id"] in profile.favorite_ids:
+            return
+        profile.favorites.append(contribution)
+        apply_contribution(profile, contribution, 1)
+
+    def _update(
+        self,
+        db: Session,
+        profile_id: str,
+        change: Callable[[TasteProfile], bool],
+        op: str
+    ) -> Optional[TasteProfile]:
+        """
+        프로필 읽기 → 변경 → 저장 (다른 요청이 먼저 저장했으면 다시 읽어서 재시도)
+        """
+        for _ in range(MAX_RETRIES):
+            profile = self.get(db, profile_id)
+            if profile is None:
+                return None
+            if not change(profile):
+                return profile
+            try:
+                db.commit()
+                metrics.inc("taste_profile_updates_total", op=op)
+                return profile
+            except StaleDataError:
+                db.rollback()
+                metrics.inc("taste_profile_conflicts_total")
+
+        raise ProfileConflictError("프로필이 동시에 수정되고 있습니다. 잠시 후 다시 시도하세요.")
+
+
+# 싱글톤 인스턴스
+taste_profile_service = TasteProfileService()
+
+metrics.describe("taste_profile_updates_total", "counter", "취향 프로필 생성/영화 추가/삭제 수")
+metrics.describe("taste_profile_conflicts_total", "counter", "동시 수정으로 재시도한 취향 프로필 갱신 수")
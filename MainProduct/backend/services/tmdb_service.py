@@ -1,13 +1,27 @@
 """
 TMDb API 호출 서비스
 """
-from typing import Dict, Any, List
-from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timedelta
 
+import re
+
 import requests
+
 from config import Config
+from services import feature_hashing
+from services.movie_profile import MovieCore, MovieOverlay, MovieProfile
+from services.negative_cache import negative_cache, title_key
+from services.upstream_client import UpstreamClient
+from utils.cache import SWRCache, swr_cache
+from utils.hotkeys import record_hot_key
+from utils.metrics import instrumented, metrics
+
+
+class MovieNotFound(Exception):
+    """TMDb에 없는 영화 ID (404, 네거티브 캐시에 기록됨)"""
 
 
 # TMDb 장르 ID 매핑
@@ -81,24 +95,37 @@ class TMDbService:
     """TMDb API 서비스 클래스"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json"})
+        # 속도 제한은 워커 프로세스마다 적용되므로 전체 한도를 워커 수로 나눔
+        self.client = UpstreamClient(
+            "tmdb",
+            Config.TMDB_RATE_LIMIT / max(Config.WEB_CONCURRENCY, 1)
+        )
         self.base_url = Config.TMDB_BASE_URL
         self.image_base_url = Config.TMDB_IMAGE_BASE_URL
         self.api_key = Config.TMDB_API_KEY
+        
+        # 영화 프로필 캐시: 언어 무관 core(영화당 1개) + 언어별 overlay
+        self.core_cache = SWRCache(
+            "tmdb.movie_core", 8192,
+            Config.CACHE_DETAILS_SOFT_TTL, Config.CACHE_DETAILS_HARD_TTL
+        )
+        self.overlay_cache = SWRCache(
+            "tmdb.movie_overlay", 16384,
+            Config.CACHE_DETAILS_SOFT_TTL, Config.CACHE_DETAILS_HARD_TTL
+        )
     
     def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """TMDb API GET 요청"""
         params = {"api_key": self.api_key, **params}
-        response = self.session.get(
-            f"{self.base_url}{path}", 
-            params=params, 
-            timeout=Config.REQUEST_TIMEOUT
+        return self.client.get(
+            f"{self.base_url}{path}",
+            params,
+            endpoint=re.sub(r"/\d+", "/{id}", path)
         )
-        response.raise_for_status()
-        return response.json()
     
-    @lru_cache(maxsize=4096)
+    @instrumented("tmdb")
+    @record_hot_key("search")
+    @swr_cache("tmdb.search_movie", 4096, Config.CACHE_SEARCH_SOFT_TTL, Config.CACHE_SEARCH_HARD_TTL)
     def search_movie(self, title: str, lang: str = "ko-KR") -> Dict[str, Any]:
         """
         영화 제목으로 검색하여 가장 적합한 영화 반환
@@ -113,6 +140,11 @@ class TMDbService:
         if not title.strip():
             return {}
         
+        # 최근에 찾지 못한 제목은 검색하지 않음 (워커 간 공유, 재시작 후에도 유지)
+        negative_key = title_key(title, lang)
+        if negative_cache.contains("title", negative_key):
+            return {}
+        
         # 한국어로 검색
         data = self._get("/search/movie", {
             "query": title,
@@ -131,6 +163,7 @@ class TMDbService:
             results = data.get("results", [])
             
             if not results:
+                negative_cache.add("title", negative_key)
                 return {}
         
         # 인기도와 제목 유사도로 정렬
@@ -144,6 +177,7 @@ class TMDbService:
         best_match = sorted(results, key=lambda x: x["_popularity"], reverse=True)[0]
         return best_match
     
+    @instrumented("tmdb")
     def search_movies(self, title: str, lang: str = "ko-KR", limit: int = 10) -> List[Dict[str, Any]]:
         """
         영화 제목으로 검색하여 여러 결과 반환 (자동완성용)
@@ -187,63 +221,75 @@ class TMDbService:
         sorted_results = sorted(results, key=lambda x: x["_popularity"], reverse=True)
         return sorted_results[:limit]
     
-    @lru_cache(maxsize=8192)
-    def get_movie_details(self, movie_id: int, lang: str = "ko-KR") -> Dict[str, Any]:
+    @instrumented("tmdb")
+    @record_hot_key("details")
+    def get_movie_details(self, movie_id: int, lang: str = "ko-KR") -> MovieProfile:
         """
         영화 상세 정보 조회 (키워드, 크레딧, 추천 영화 등 포함)
         
+        언어와 무관한 core는 영화당 한 번만 전체 조회(append_to_response)하고,
+        다른 언어는 제목/줄거리/장르/포스터만 가벼운 요청으로 조회합니다.
+        TF-IDF 문서의 해시 특징은 overlay를 캐시할 때 한 번 계산하여 함께 저장합니다.
+        
         Args:
             movie_id: TMDb 영화 ID
             lang: 언어 코드
             
         Returns:
-            영화 프로필 딕셔너리
+            영화 프로필 (불변 MovieProfile, 캐시 객체를 공유하므로 수정 불가)
+            
+        Raises:
+            MovieNotFound: TMDb에 없는 영화 (404, 네거티브 캐시에 기록된 동안은 조회하지 않음)
         """
+        if negative_cache.contains("movie", movie_id):
+            raise MovieNotFound(movie_id)
+        try:
+            core = self.core_cache.get_or_load(movie_id, lambda: self._fetch_movie_core(movie_id, lang))
+            overlay = self.get_movie_overlay(movie_id, lang, core)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                negative_cache.add("movie", movie_id)
+                raise MovieNotFound(movie_id) from e
+            raise
+        return MovieProfile(core, overlay)
+    
+    def _fetch_movie_core(self, movie_id: int, lang: str) -> MovieCore:
+        """전체 조회(append_to_response)로 core 생성, 응답에 포함된 해당 언어 overlay도 함께 캐시"""
         detail = self._get(f"/movie/{movie_id}", {
             "language": lang,
             "append_to_response": "keywords,credits,recommendations,external_ids,similar"
         })
+        core = MovieCore.from_tmdb(detail)
+        overlay = MovieOverlay.from_tmdb(detail, lang, self.image_base_url)
+        self.overlay_cache.put((movie_id, lang), self._with_features(core, overlay))
+        return core
+    
+    def get_movie_overlay(self, movie_id: int, lang: str, core: Optional[MovieCore] = None) -> MovieOverlay:
+        """
+        영화의 언어별 정보(제목, 줄거리, 장르, 포스터)만 조회
         
-        # 데이터 정규화
-        genres = [g.get("name") for g in (detail.get("genres") or [])]
-        keywords = [k.get("name") for k in ((detail.get("keywords") or {}).get("keywords") or [])]
-        cast = [c.get("name") for c in ((detail.get("credits") or {}).get("cast") or [])[:10]]
-        
-        crew = (detail.get("credits") or {}).get("crew") or []
-        directors = [c.get("name") for c in crew if c.get("job") == "Director"]
-        writers = [c.get("name") for c in crew if c.get("job") in ("Writer", "Screenplay")]
-        
-        recommendations = ((detail.get("recommendations") or {}).get("results") or [])
-        similars = ((detail.get("similar") or {}).get("results") or [])
-        
-        profile = {
-            "id": detail.get("id"),
-            "title": detail.get("title") or detail.get("original_title"),
-            "overview": detail.get("overview") or "",
-            "genres": genres,
-            "keywords": keywords,
-            "cast": cast,
-            "directors": directors,
-            "writers": writers,
-            "poster": (
-                self.image_base_url + detail.get("poster_path")
-                if detail.get("poster_path") else None
-            ),
-            "vote_average": detail.get("vote_average"),
-            "vote_count": detail.get("vote_count"),
-            "release_date": detail.get("release_date"),
-            "runtime": detail.get("runtime"),
-            "lang": lang,
-            "external_ids": detail.get("external_ids") or {},
-            "candidate_ids": [
-                m.get("id") 
-                for m in recommendations[:30] + similars[:30] 
-                if m.get("id")
-            ],
-        }
-        return profile
+        Args:
+            movie_id: TMDb 영화 ID
+            lang: 언어 코드
+            core: 같은 영화의 core (있으면 해시 특징을 계산하여 overlay와 함께 캐시)
+            
+        Returns:
+            MovieOverlay
+        """
+        def fetch_overlay() -> MovieOverlay:
+            detail = self._get(f"/movie/{movie_id}", {"language": lang})
+            overlay = MovieOverlay.from_tmdb(detail, lang, self.image_base_url)
+            return self._with_features(core, overlay) if core is not None else overlay
+        
+        return self.overlay_cache.get_or_load((movie_id, lang), fetch_overlay)
     
-    def get_bulk_movie_details(self, movie_ids: List[int], lang: str = "ko-KR") -> List[Dict[str, Any]]:
+    @staticmethod
+    def _with_features(core: MovieCore, overlay: MovieOverlay) -> MovieOverlay:
+        """overlay에 TF-IDF 문서 해시 특징 추가 (요청마다 문서를 만들고 토큰화하지 않도록)"""
+        return replace(overlay, features=feature_hashing.build_features(core, overlay))
+    
+    @instrumented("tmdb")
+    def get_bulk_movie_details(self, movie_ids: List[int], lang: str = "ko-KR") -> List[MovieProfile]:
         """
         여러 영화의 상세 정보를 병렬로 조회
         
@@ -262,12 +308,20 @@ class TMDbService:
                 seen.add(movie_id)
                 unique_ids.append(movie_id)
         
+        # TMDb에 없는 것으로 기록된 영화는 조회하지 않음 (Bloom 필터 + DB 1번)
+        missing = negative_cache.known_missing("movie", unique_ids)
+        if missing:
+            unique_ids = [movie_id for movie_id in unique_ids if str(movie_id) not in missing]
+        
         results = []
         
         def fetch_movie(movie_id: int):
             try:
                 return self.get_movie_details(movie_id, lang)
+            except MovieNotFound:
+                return None
             except Exception:
+                metrics.inc("bulk_fetch_dropped_total", service="tmdb", method="get_movie_details")
                 return None
         
         with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
@@ -275,8 +329,37 @@ class TMDbService:
                 if profile:
                     results.append(profile)
         
+        dropped = len(unique_ids) - len(results)
+        if dropped:
+            print(f"[경고] 영화 상세 정보 {dropped}/{len(unique_ids)}건 조회 실패")
+        
         return results
     
+    @instrumented("tmdb")
+    def get_popular_movie_ids(self, pages: int = 1, lang: str = "ko-KR") -> List[int]:
+        """
+        인기 영화 ID 조회 (캐시 워밍업용)
+    
+        Args:
+            pages: 조회할 페이지 수 (페이지당 20개)
+            lang: 언어 코드
+    
+        Returns:
+            인기순 영화 ID 리스트
+        """
+        movie_ids = []
+        for page in range(1, pages + 1):
+            try:
+                data = self._get("/movie/popular", {"language": lang, "page": page})
+            except Exception as e:
+                print(f"[ERROR] 인기 영화 조회 실패: {e}")
+                break
+            movie_ids.extend(movie["id"] for movie in data.get("results", []))
+        return movie_ids
+    
+    @instrumented("tmdb")
+    @record_hot_key("discover")
+    @swr_cache("tmdb.discover_movies", 512, Config.CACHE_DISCOVER_SOFT_TTL, Config.CACHE_DISCOVER_HARD_TTL)
     def discover_movies(
         self,
         genres: List[str] = None,
@@ -358,7 +441,14 @@ class TMDbService:
         
         return movies
     
-    @lru_cache(maxsize=2048)
+    @instrumented("tmdb")
+    @record_hot_key("streaming")
+    @swr_cache(
+        "tmdb.get_streaming_providers", 2048,
+        Config.CACHE_STREAMING_SOFT_TTL, Config.CACHE_STREAMING_HARD_TTL,
+        # 조회 실패 시 반환하는 빈 결과(error 포함)는 캐시하지 않고 기존 값 유지
+        should_cache=lambda info: "error" not in info
+    )
     def get_streaming_providers(self, movie_id: int, region: str = "KR") -> Dict[str, Any]:
         """
         영화의 스트리밍 제공 정보 조회 (OTT 플랫폼)
@@ -427,6 +517,7 @@ class TMDbService:
                 "error": str(e)
             }
     
+    @instrumented("tmdb")
     def get_bulk_streaming_providers(
         self, 
         movie_ids: List[int], 
@@ -456,3 +547,10 @@ class TMDbService:
 
 # 싱글톤 인스턴스
 tmdb_service = TMDbService()
+
+metrics.describe("bulk_fetch_dropped_total", "counter", "대량 조회 중 실패로 제외된 항목 수")
+metrics.register_cache("tmdb.search_movie", TMDbService.search_movie)
+metrics.register_cache("tmdb.movie_core", tmdb_service.core_cache)
+metrics.register_cache("tmdb.movie_overlay", tmdb_service.overlay_cache)
+metrics.register_cache("tmdb.discover_movies", TMDbService.discover_movies)
+metrics.register_cache("tmdb.get_streaming_providers", TMDbService.get_streaming_providers)
@@ -0,0 +1,205 @@
+"""
+외부 API 공용 HTTP 클라이언트 (속도 제한, 재시도, 서킷 브레이커, 메트릭)
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from config import Config
+from utils.lifecycle import on_post_fork
+from utils.metrics import metrics
+from utils.resilience import (
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    UpstreamUnavailable,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+# 재시도 대상 상태 코드 (요청 속도 제한 / 일시적 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class UpstreamClient:
+    """
+    외부 API GET 전용 클라이언트
+
+    - 토큰 버킷으로 프로세스 전체 요청 속도 제한 (429 시 자동 감속, Retry-After 준수)
+    - 멱등 GET 요청은 지터 백오프로 재시도
+    - 연속 실패 시 서킷을 열고, 최근 성공 응답이 있으면 그 값으로 대체
+    """
+
+    def __init__(self, service: str, rate_limit: float):
+        self.service = service
+        self.session = self._new_session()
+        self.limiter = AdaptiveTokenBucket(rate_limit)
+        self.breaker = CircuitBreaker(
+            Config.UPSTREAM_FAILURE_THRESHOLD,
+            Config.UPSTREAM_RESET_TIMEOUT
+        )
+        self.max_retries = Config.UPSTREAM_MAX_RETRIES
+        self._fallback: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._fallback_size = Config.UPSTREAM_FALLBACK_SIZE
+        self._fallback_lock = threading.Lock()
+
+        metrics.register_collector(self._collect)
+        on_post_fork(self._reset_session)
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"Accept": "application/json"})
+        return session
+
+    def _reset_session(self):
+        """fork 이후 마스터의 keep-alive 소켓을 공유하지 않도록 세션 재생성"""
+        self.session = self._new_session()
+
+    def _collect(self):
+        state = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+        return [
+            ("gauge", "upstream_circuit_state", {"service": self.service}, state[self.breaker.state]),
+            ("gauge", "upstream_rate_limit", {"service": self.service}, self.limiter.rate),
+        ]
+
+    @staticmethod
+    def _fallback_key(url: str, params: Dict[str, Any]):
+        return url, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def _remember(self, key, data: Dict[str, Any]):
+        if self._fallback_size <= 0:
+            return
+        with self._fallback_lock:
+            self._fallback[key] = data
+            self._fallback.move_to_end(key)
+            while len(self._fallback) > self._fallback_size:
+                self._fallback.popitem(last=False)
+
+    def _recall(self, key, endpoint: str, reason: Exception) -> Dict[str, Any]:
+        """최근 성공 응답으로 대체 (없으면 원래 예외 전달)"""
+        with self._fallback_lock:
+            data = self._fallback.get(key)
+        if data is None:
+            raise reason
+        metrics.inc("upstream_fallback_total", service=self.service, endpoint=endpoint)
+        return data
+
+    def get(self, url: str, params: Dict[str, Any], endpoint: str = "/") -> Dict[str, Any]:
+        """
+        GET 요청 후 JSON 반환
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터 (API 키 포함)
+            endpoint: 메트릭 레이블용 경로 (ID 부분은 {id}로 치환)
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            requests.HTTPError: 재시도 대상이 아닌 오류 (404 등)
+            UpstreamUnavailable: 서킷이 열려 있고 대체할 응답이 없는 경우
+        """
+        key = self._fallback_key(url, params)
+        # 속도 제한 대기 + 재시도 대기의 합계 상한 (Retry-After가 길어도 요청 스레드를 오래 잡지 않음)
+        deadline = time.monotonic() + Config.UPSTREAM_MAX_WAIT
+
+        # 속도 제한을 먼저 확인하여 거절된 요청이 half_open 시험 요청을 차지하지 않도록 함
+        try:
+            waited = self.limiter.acquire(Config.UPSTREAM_MAX_WAIT)
+        except UpstreamUnavailable as e:
+            metrics.inc("upstream_rejected_total", service=self.service, endpoint=endpoint)
+            return self._recall(key, endpoint, e)
+
+        if not self.breaker.allow():
+            metrics.inc("upstream_rejected_total", service=self.service, endpoint=endpoint)
+            return self._recall(key, endpoint, UpstreamUnavailable(f"{self.service} 서킷 열림"))
+
+        recorded = False
+        try:
+            last_error: Optional[Exception] = None
+            # 마지막 실패가 서버 장애(5xx / 연결 오류)인지 (429, 대기 시간 초과는 서킷에 반영하지 않음)
+            upstream_fault = False
+            for attempt in range(self.max_retries + 1):
+                if attempt > 0:
+                    try:
+                        waited = self.limiter.acquire(max(deadline - time.monotonic(), 0.0))
+                    except UpstreamUnavailable as e:
+                        metrics.inc("upstream_rejected_total", service=self.service, endpoint=endpoint)
+                        last_error = e
+                        upstream_fault = False
+                        break
+                if waited:
+                    metrics.observe("upstream_throttle_wait_seconds", waited, service=self.service)
+
+                started = time.perf_counter()
+                retry_after = None
+                try:
+                    response = self.session.get(url, params=params, timeout=Config.REQUEST_TIMEOUT)
+                    if response.status_code in RETRYABLE_STATUS:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        if response.status_code == 429:
+                            self.limiter.on_throttled(retry_after)
+                            metrics.inc("upstream_throttled_total", service=self.service)
+                    response.raise_for_status()
+                    data = response.json()
+                except requests.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    metrics.inc("upstream_errors_total", service=self.service, endpoint=endpoint,
+                                status=status)
+                    if status not in RETRYABLE_STATUS:
+                        # 404 등 요청 자체의 오류는 서버 장애가 아니므로 서킷에 반영하지 않음
+                        self.breaker.record_success()
+                        recorded = True
+                        raise
+                    last_error = e
+                    upstream_fault = status != 429
+                except (requests.RequestException, ValueError) as e:
+                    # 연결 오류 / 타임아웃 / 잘못된 JSON 응답 등
+                    metrics.inc("upstream_errors_total", service=self.service, endpoint=endpoint,
+                                status=type(e).__name__)
+                    last_error = e
+                    upstream_fault = True
+                else:
+                    self.limiter.on_success()
+                    self.breaker.record_success()
+                    recorded = True
+                    self._remember(key, data)
+                    return data
+                finally:
+                    metrics.inc("upstream_requests_total", service=self.service, endpoint=endpoint)
+                    metrics.observe("upstream_request_seconds", time.perf_counter() - started,
+                                    service=self.service, endpoint=endpoint)
+
+                if attempt < self.max_retries:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or (retry_after or 0.0) > remaining:
+                        # 남은 대기 시간 안에 재시도할 수 없음 → 바로 최근 성공 응답으로 대체
+                        metrics.inc("upstream_wait_exhausted_total", service=self.service, endpoint=endpoint)
+                        break
+                    metrics.inc("upstream_retries_total", service=self.service, endpoint=endpoint)
+                    delay = backoff_delay(attempt, Config.UPSTREAM_BACKOFF_BASE, Config.UPSTREAM_BACKOFF_CAP)
+                    time.sleep(min(max(delay, retry_after or 0.0), remaining))
+
+            if upstream_fault:
+                self.breaker.record_failure()
+                recorded = True
+            return self._recall(key, endpoint, last_error)
+        finally:
+            if not recorded:
+                # 서킷에 반영하지 않는 결과(429 등)나 예상하지 못한 예외로 끝난 경우에도
+                # half_open 시험 요청 표시가 남지 않도록 함
+                self.breaker.release()
+
+
+metrics.describe("upstream_retries_total", "counter", "외부 API 재시도 수")
+metrics.describe("upstream_throttled_total", "counter", "외부 API 429 응답 수")
+metrics.describe("upstream_rejected_total", "counter", "서킷/속도 제한으로 보내지 않은 요청 수")
+metrics.describe("upstream_wait_exhausted_total", "counter", "대기 시간(UPSTREAM_MAX_WAIT)을 넘어 재시도하지 않은 요청 수")
+metrics.describe("upstream_fallback_total", "counter", "최근 성공 응답으로 대체한 요청 수")
+metrics.describe("upstream_throttle_wait_seconds", "histogram", "속도 제한 대기 시간")
+metrics.describe("upstream_circuit_state", "gauge", "서킷 상태 (0=closed, 1=half_open, 2=open)", aggregate="max")
+metrics.describe("upstream_rate_limit", "gauge", "현재 허용 요청 속도 (초당, 워커 합계)")
@@ -0,0 +1,147 @@
+"""
+캐시 워밍업 서비스
+
+배포 직후 비어 있는 캐시(search_movie / get_movie_details / get_streaming_providers)를
+핫 키 로그(utils/hotkeys.py)의 상위 N개와 TMDb 인기 영화 목록으로 미리 채웁니다.
+- gunicorn preload 모드: 워커 fork 전 마스터에서 1번 실행 → 워커들이 채워진 캐시를 공유
+- 그 외 (python app.py 등): 시작 시 백그라운드 스레드로 실행
+- 수동 실행: POST /api/warmup
+카탈로그 스냅샷(services/catalog_snapshot.py)이 있으면 먼저 로드되므로, 스냅샷에 있는 항목은 TMDb를 다시 조회하지 않습니다.
+시작 시 워밍업이 끝나기 전까지 /ready는 503을 반환합니다 (수동 실행은 준비 상태에 영향 없음).
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from config import Config
+from services.catalog_snapshot import catalog_snapshot_service  # preload 훅이 워밍업보다 먼저 등록되도록
+from services.tmdb_service import tmdb_service
+from utils.hotkeys import hot_keys
+from utils.lifecycle import on_preload
+from utils.metrics import metrics
+
+
+class WarmupService:
+    """핫 키 재생으로 캐시를 채우는 서비스"""
+
+    IDLE = "idle"
+    RUNNING = "running"
+    DONE = "done"
+
+    def __init__(self):
+        self.status = self.IDLE if Config.WARMUP_ON_START else self.DONE
+        # 첫 워밍업 완료 여부 (/ready 기준, 이후 수동 실행 중에도 유지)
+        self.initial_done = not Config.WARMUP_ON_START
+        self.started_at = None
+        self.finished_at = None
+        self.loaded: Dict[str, int] = {}
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.initial_done
+
+    def state(self) -> Dict[str, Any]:
+        """현재 워밍업 상태"""
+        return {
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "loaded": dict(self.loaded),
+            "failed": self.failed,
+            "snapshot": catalog_snapshot_service.state(),
+        }
+
+    def _tasks(self, top_n: int) -> List[Tuple[str, Callable, Tuple[Any, ...]]]:
+        """종류별 상위 키를 (종류, 함수, 인자) 작업 목록으로 변환"""
+        loaders = {
+            "search": tmdb_service.search_movie,
+            "details": tmdb_service.get_movie_details,
+            "streaming": tmdb_service.get_streaming_providers,
+        }
+        tasks = []
+        for kind, loader in loaders.items():
+            for key in hot_keys.top(kind, top_n):
+                tasks.append((kind, loader, key))
+
+        # 로그가 부족한 경우(첫 배포 등) 인기 영화 목록으로 상세 정보 보충
+        logged = {key for kind, _, key in tasks if kind == "details"}
+        for movie_id in tmdb_service.get_popular_movie_ids(Config.WARMUP_POPULAR_PAGES):
+            key = (movie_id, "ko-KR")
+            if key not in logged:
+                tasks.append(("popular", tmdb_service.get_movie_details, key))
+        return tasks
+
+    def run(self, top_n: int = None):
+        """
+        워밍업 실행 (동시 요청 수 제한, 전체 시간 제한)
+
+        Args:
+            top_n: 종류별 재생할 키 수 (기본값: Config.WARMUP_TOP_N)
+        """
+        if self._begin():
+            self._run(top_n)
+
+    def start(self, top_n: int = None) -> bool:
+        """백그라운드 스레드로 워밍업 시작 (이미 실행 중이면 False)"""
+        if not self._begin():
+            return False
+        threading.Thread(target=self._run, args=(top_n,), name="cache-warmup", daemon=True).start()
+        return True
+
+    def _begin(self) -> bool:
+        with self._lock:
+            if self.status == self.RUNNING:
+                return False
+            self.status = self.RUNNING
+            return True
+
+    def _run(self, top_n: int = None):
+        self.started_at = time.time()
+        self.loaded = {}
+        self.failed = 0
+
+        deadline = time.monotonic() + Config.WARMUP_TIMEOUT
+
+        def load(task):
+            kind, loader, key = task
+            if time.monotonic() > deadline:
+                return kind, False
+            with hot_keys.suppressed():
+                try:
+                    loader(*key)
+                    return kind, True
+                except Exception:
+                    return kind, False
+
+        try:
+            tasks = self._tasks(top_n or Config.WARMUP_TOP_N)
+            with ThreadPoolExecutor(max_workers=Config.WARMUP_CONCURRENCY) as executor:
+                for kind, ok in executor.map(load, tasks):
+                    if ok:
+                        self.loaded[kind] = self.loaded.get(kind, 0) + 1
+                    else:
+                        self.failed += 1
+        finally:
+            self.finished_at = time.time()
+            self.status = self.DONE
+            self.initial_done = True
+            metrics.observe("warmup_seconds", self.finished_at - self.started_at)
+            print(f"[워밍업] 완료: {self.loaded}, 실패 {self.failed}건, "
+                  f"{self.finished_at - self.started_at:.1f}초")
+
+
+# 싱글톤 인스턴스
+warmup_service = WarmupService()
+
+metrics.describe("warmup_seconds", "histogram", "캐시 워밍업 소요 시간",
+                 buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+
+
+@on_preload
+def warm_caches():
+    """gunicorn 마스터에서 fork 전에 캐시 워밍업 (워커는 채워진 캐시를 공유)"""
+    if Config.WARMUP_ON_START:
+        warmup_service.run()
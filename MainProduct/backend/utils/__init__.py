@@ -0,0 +1,3 @@
+"""
+공통 유틸리티 패키지
+"""
@@ -0,0 +1,54 @@
+"""
+Bloom 필터 (집합 포함 여부를 작은 메모리로 빠르게 확인)
+
+- 없다고 답하면 확실히 없음 → 뒤의 저장소(DB 등)를 조회하지 않음
+- 있다고 답하면 error_rate 확률로 틀릴 수 있음 → 저장소에서 확인
+- 삭제는 지원하지 않으므로 TTL이 있는 집합은 주기적으로 새로 만들어 교체합니다.
+
+용량 n, 오탐률 p일 때 비트 수 m = -n·ln(p) / (ln 2)², 해시 수 k = (m / n)·ln 2
+(n = 20만, p = 1%면 약 234KB, k = 7)
+"""
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """문자열 키 Bloom 필터 (blake2b 1번 + double hashing으로 k개 위치)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(int(capacity), 1)
+        error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str):
+        positions = self._positions(key)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def saturated(self) -> bool:
+        """추가한 키가 용량을 넘어 오탐률이 error_rate보다 높아졌는지"""
+        return self.count > self.capacity
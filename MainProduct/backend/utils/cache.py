@@ -0,0 +1,297 @@
+"""
+스레드 안전 캐시
+
+- LRUCache: 명시적 get/put LRU 캐시
+- SWRCache / swr_cache: soft/hard TTL을 갖는 stale-while-revalidate 캐시
+"""
+import functools
+import inspect
+import itertools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from config import Config
+from utils.lifecycle import on_post_fork
+from utils.metrics import metrics
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# 캐시 항목: 값, 조회 시각(epoch 초), 캐시 내 버전 번호 (값이 바뀔 때마다 증가)
+CacheEntry = namedtuple("CacheEntry", ["value", "fetched_at", "version"])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    명시적으로 값을 넣고 꺼낼 수 있는 LRU 캐시
+
+    functools.lru_cache와 같은 cache_info() / cache_clear()를 제공하여
+    메트릭(metrics.register_cache)에 그대로 등록할 수 있습니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """히트/미스 집계와 LRU 순서 변경 없이 조회"""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """(키, 값) 목록 (오래 사용하지 않은 것부터, 집계/순서 변경 없음)"""
+        with self._lock:
+            return list(self._data.items())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SWRCache:
+    """
+    stale-while-revalidate 캐시
+
+    - soft TTL 이내: 캐시 값 반환
+    - soft TTL ~ hard TTL: 캐시 값(stale)을 즉시 반환하고 백그라운드에서 키당 1번만 갱신
+    - hard TTL 이후 / 미스: 호출자가 직접 조회 (같은 키의 동시 미스는 1번만 조회)
+    - 갱신 실패 시 (예외 또는 should_cache가 False인 결과) 기존 값을 계속 반환
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        soft_ttl: float,
+        hard_ttl: float,
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ):
+        self.name = name
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.should_cache = should_cache or (lambda value: True)
+        self._entries = LRUCache(maxsize)
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._versions = itertools.count(1)
+        self.hits = 0
+        self.misses = 0
+
+        on_post_fork(self._reset_after_fork)
+
+    def _reset_after_fork(self):
+        # fork 시점에 진행 중이던 갱신은 자식 프로세스에서 끝나지 않음
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """캐시 항목(값, 조회 시각, 버전) 조회 (집계/갱신 없음)"""
+        return self._entries.peek(key)
+
+    def put(self, key: Hashable, value: Any, fetched_at: Optional[float] = None) -> CacheEntry:
+        """
+        값 저장
+
+        Args:
+            fetched_at: 조회 시각 (기본값: 현재, 스냅샷에서 복원할 때 원래 시각을 넣으면 TTL이 그대로 적용됨)
+        """
+        entry = CacheEntry(value, time.time() if fetched_at is None else fetched_at, next(self._versions))
+        self._entries.put(key, entry)
+        return entry
+
+    def entries(self) -> List[Tuple[Hashable, CacheEntry]]:
+        """(키, 캐시 항목) 목록 (오래 사용하지 않은 것부터)"""
+        return self._entries.items()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        캐시 값 반환, 없거나 만료되었으면 loader로 조회
+
+        Args:
+            key: 캐시 키
+            loader: 값을 조회하는 함수 (인자 없음)
+
+        Returns:
+            캐시 또는 새로 조회한 값
+        """
+        entry = self._entries.peek(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age < self.hard_ttl:
+                self.hits += 1
+                if age >= self.soft_ttl:
+                    metrics.inc("cache_stale_served_total", cache=self.name)
+                    metrics.observe("cache_staleness_seconds", age - self.soft_ttl, cache=self.name)
+                    self._refresh_async(key, loader, entry)
+                return entry.value
+
+        self.misses += 1
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result()
+        return self._load(key, loader, entry, future)
+
+    def _claim(self, key: Hashable):
+        """키의 진행 중 조회를 가져오거나 새로 등록 (등록한 쪽이 leader)"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _refresh_async(self, key: Hashable, loader: Callable[[], Any], stale: CacheEntry):
+        future, leader = self._claim(key)
+        if leader:
+            _refresh_executor().submit(self._load, key, loader, stale, future)
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], stale: Optional[CacheEntry], future: Future) -> Any:
+        try:
+            try:
+                value = loader()
+            except Exception:
+                metrics.inc("cache_refresh_total", cache=self.name, result="error")
+                if stale is None:
+                    raise
+                value = stale.value
+            else:
+                if self.should_cache(value):
+                    metrics.inc("cache_refresh_total", cache=self.name, result="ok")
+                    self.put(key, value)
+                else:
+                    metrics.inc("cache_refresh_total", cache=self.name, result="rejected")
+                    if stale is not None:
+                        value = stale.value
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._entries.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        self._entries.cache_clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _refresh_executor() -> ThreadPoolExecutor:
+    """백그라운드 갱신용 공용 스레드 풀 (처음 필요할 때 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.CACHE_REFRESH_WORKERS,
+                    thread_name_prefix="cache-refresh"
+                )
+    return _executor
+
+
+@on_post_fork
+def _reset_refresh_executor():
+    """마스터의 스레드 풀은 fork된 워커에 스레드가 없으므로 새로 생성"""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Hashable:
+    """리스트/딕셔너리 인자를 캐시 키로 쓸 수 있도록 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def swr_cache(
+    name: str,
+    maxsize: int,
+    soft_ttl: float,
+    hard_ttl: float,
+    should_cache: Optional[Callable[[Any], bool]] = None
+):
+    """
+    함수 결과를 SWRCache로 캐시하는 데코레이터 (functools.lru_cache 대체)
+
+    키는 기본값을 채운 전체 인자이므로 f(x)와 f(x, "ko-KR")는 같은 항목을 사용합니다.
+    cache_info / cache_clear와 함께 cache_entry(*args)로 항목의 조회 시각/버전을 제공합니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache = SWRCache(name, maxsize, soft_ttl, hard_ttl, should_cache)
+
+        def make_key(args, kwargs) -> Hashable:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return _freeze(tuple(bound.arguments.values()))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_load(make_key(args, kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.cache_info
+        wrapper.cache_clear = cache.cache_clear
+        wrapper.cache_entry = lambda *args, **kwargs: cache.peek(make_key(args, kwargs))
+        return wrapper
+
+    return decorator
+
+
+metrics.describe("cache_stale_served_total", "counter", "soft TTL이 지난 값을 반환한 횟수")
+metrics.describe("cache_staleness_seconds", "histogram", "반환한 stale 값이 soft TTL을 넘긴 시간",
+                 buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 3600.0, 21600.0, 86400.0))
+metrics.describe("cache_refresh_total", "counter", "캐시 조회/갱신 결과 수 (ok/error/rejected)")
@@ -0,0 +1,172 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+리뷰 조회(GET)는 복제본으로, 작성/삭제와 작성 직후의 조회는 primary로 보냅니다.
+- 가중치: DATABASE_REPLICA_WEIGHTS 비율로 복제본 선택
+- 상태 확인: 백그라운드 스레드가 DB_REPLICA_CHECK_INTERVAL초마다 연결/복제 지연 확인
+  (연결 실패 또는 지연이 DB_REPLICA_MAX_LAG초를 넘으면 제외, 모두 제외되면 primary,
+  첫 확인이 끝나기 전에는 사용 가능으로 간주)
+- 쓴 내용 읽기(read-your-writes): 쓰기 응답의 read_after(커밋 시각)를 다음 조회에 넘기면
+  그 시각 이후까지 반영된 것이 확인된 복제본만 사용하고, 없으면 primary로 조회
+
+복제 지연은 PostgreSQL만 측정합니다 (pg_last_xact_replay_timestamp).
+SQLite 등 지연을 알 수 없는 복제본은 read_after 이후 DB_READ_YOUR_WRITES_WINDOW초 동안 제외합니다.
+"""
+import random
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+
+from utils.metrics import metrics
+
+# 지연 0으로 측정되어도 전송 중인 WAL이 있을 수 있으므로 read_after 비교 시 더하는 여유(초)
+REPLICATION_SLACK = 1.0
+
+# 복제 지연(초): 재생할 WAL이 남아 있을 때만 마지막 재생 트랜잭션 시각과의 차이
+POSTGRES_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+class Replica:
+    """복제본 1개의 엔진과 최근 상태"""
+
+    def __init__(self, name: str, engine: Engine, weight: float):
+        self.name = name
+        self.engine = engine
+        self.weight = weight
+        # 첫 상태 확인 전에는 사용 가능으로 간주 (연결이 끊기면 handle_error에서 바로 제외)
+        self.healthy = True
+        # 복제 지연(초), 측정할 수 없으면 None
+        self.lag: Optional[float] = None
+        # 마지막으로 상태를 확인한 시각 (epoch 초)
+        self.checked_at = 0.0
+
+    def caught_up(self, read_after: Optional[float], window: float, now: float) -> bool:
+        """read_after 시각에 커밋된 쓰기가 이 복제본에 반영되었는지"""
+        if read_after is None:
+            return True
+        if self.lag is None:
+            return now - read_after >= window
+        # 확인 시점의 복제본은 (확인 시각 - 지연) 시점의 primary 상태를 반영
+        return self.checked_at - self.lag - REPLICATION_SLACK >= read_after
+
+
+class ReplicaRouter:
+    """primary / 복제본 엔진 선택기"""
+
+    def __init__(
+        self,
+        primary: Engine,
+        urls: Sequence[str],
+        weights: Sequence[float],
+        max_lag: float,
+        check_interval: float,
+        read_your_writes_window: float
+    ):
+        self.primary = primary
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.read_your_writes_window = read_your_writes_window
+        self.replicas: List[Replica] = []
+        for index, url in enumerate(urls):
+            weight = weights[index] if index < len(weights) else 1.0
+            engine = create_engine(url, echo=primary.echo, pool_pre_ping=True)
+            replica = Replica(f"replica{index + 1}", engine, weight)
+            event.listen(engine, "handle_error", self._on_error(replica))
+            self.replicas.append(replica)
+
+        self._checker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self, read_after: Optional[float] = None) -> Engine:
+        """
+        조회에 사용할 엔진 선택
+
+        Args:
+            read_after: 이 시각(epoch 초) 이후의 쓰기까지 반영되어야 하는 조회 (쓰기 응답의 read_after)
+
+        Returns:
+            복제본 엔진 (사용할 수 있는 복제본이 없으면 primary)
+        """
+        if not self.replicas:
+            return self.primary
+        self._ensure_checker()
+
+        now = time.time()
+        healthy = [r for r in self.replicas if r.healthy and (r.lag is None or r.lag <= self.max_lag)]
+        candidates = [r for r in healthy if r.caught_up(read_after, self.read_your_writes_window, now)]
+        if not candidates:
+            reason = "read_your_writes" if healthy else "unavailable"
+            metrics.inc("db_reads_total", target="primary", reason=reason)
+            return self.primary
+
+        replica = random.choices(candidates, weights=[r.weight for r in candidates])[0]
+        metrics.inc("db_reads_total", target=replica.name, reason="replica")
+        return replica.engine
+
+    def check(self):
+        """모든 복제본의 연결/복제 지연 확인"""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    if conn.dialect.name == "postgresql":
+                        replica.lag = float(conn.execute(text(POSTGRES_LAG_QUERY)).scalar())
+                    else:
+                        conn.execute(text("SELECT 1"))
+                        replica.lag = None
+                replica.healthy = True
+            except Exception as e:
+                if replica.healthy:
+                    print(f"[경고] DB 복제본 {replica.name} 사용 불가: {e}")
+                replica.healthy = False
+            replica.checked_at = time.time()
+
+            metrics.set_gauge("db_replica_up", 1 if replica.healthy else 0, replica=replica.name)
+            if replica.lag is not None:
+                metrics.set_gauge("db_replica_lag_seconds", replica.lag, replica=replica.name)
+
+    def _on_error(self, replica: Replica):
+        """조회 중 연결이 끊기면 다음 상태 확인까지 바로 제외"""
+        def handle_error(context):
+            if context.is_disconnect:
+                replica.healthy = False
+        return handle_error
+
+    def _ensure_checker(self):
+        if self._checker is not None:
+            return
+        with self._lock:
+            if self._checker is not None:
+                return
+            # 첫 확인도 백그라운드에서 실행 (요청 스레드가 복제본 연결을 기다리지 않도록)
+            self._checker = threading.Thread(target=self._run_checker, name="db-replica-check", daemon=True)
+            self._checker.start()
+
+    def _run_checker(self):
+        while True:
+            self.check()
+            time.sleep(self.check_interval)
+
+    def reset(self):
+        """fork 후: 부모의 커넥션 풀과 상태 확인 스레드를 버리고 다시 시작"""
+        for replica in self.replicas:
+            replica.engine.dispose(close=False)
+        self._checker = None
+        self._lock = threading.Lock()
+
+
+metrics.describe("db_reads_total", "counter", "조회 세션을 보낸 DB (target=primary/replicaN)")
+metrics.describe("db_replica_up", "gauge", "복제본 상태 확인 결과 (1=사용 가능)")
+metrics.describe("db_replica_lag_seconds", "gauge", "복제본 복제 지연 (PostgreSQL)")
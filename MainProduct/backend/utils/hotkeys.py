@@ -0,0 +1,147 @@
+"""
+자주 요청되는 캐시 키 기록 (배포 후 캐시 워밍업용)
+
+- 요청 경로에서는 메모리 Counter만 증가
+- 주기적으로 디스크의 공유 로그 파일(JSON, 종류별 상위 N개)에 병합
+  (파일 잠금으로 gunicorn 워커 간 안전하게 병합, 재시작 후에도 유지)
+"""
+import fcntl
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Tuple
+
+from config import Config
+
+LOG_FILE = "hotkeys.json"
+
+
+class HotKeyRecorder:
+    """캐시 키 접근 빈도 기록기"""
+
+    def __init__(self, log_dir: str, max_keys: int, flush_interval: float, decay: float):
+        self.log_dir = log_dir
+        self.max_keys = max_keys
+        self.flush_interval = flush_interval
+        self.decay = decay
+        self._pending: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._flusher_pid = None
+
+    @property
+    def log_path(self) -> str:
+        return os.path.join(self.log_dir, LOG_FILE)
+
+    def record(self, kind: str, key: Tuple[Any, ...]):
+        """키 접근 1회 기록"""
+        if not self.log_dir or getattr(self._local, "suppressed", False):
+            return
+        self._ensure_flusher()
+        with self._lock:
+            self._pending.setdefault(kind, Counter())[json.dumps(key, ensure_ascii=False)] += 1
+
+    @contextmanager
+    def suppressed(self):
+        """현재 스레드의 기록 중지 (워밍업 재생 요청이 다시 기록되지 않도록)"""
+        self._local.suppressed = True
+        try:
+            yield
+        finally:
+            self._local.suppressed = False
+
+    def _ensure_flusher(self):
+        """프로세스마다 (fork 이후 포함) 백그라운드 병합 스레드 1개 실행"""
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            # fork 이전 마스터에서 쌓인 값은 마스터가 기록하므로 버림
+            self._pending = {}
+
+        def loop():
+            while True:
+                time.sleep(self.flush_interval)
+                self.flush()
+
+        threading.Thread(target=loop, name="hotkey-flusher", daemon=True).start()
+
+    def flush(self):
+        """메모리에 쌓인 접근 횟수를 디스크 로그에 병합"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            with open(self.log_path + ".lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                data = self._read()
+                for kind, counter in pending.items():
+                    merged = Counter({k: v * self.decay for k, v in data.get(kind, {}).items()})
+                    merged.update(counter)
+                    data[kind] = dict(merged.most_common(self.max_keys))
+
+                tmp_path = f"{self.log_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.log_path)
+        except OSError as e:
+            print(f"[ERROR] 핫 키 로그 저장 실패: {e}")
+
+    def _read(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def top(self, kind: str, limit: int) -> List[Tuple[Any, ...]]:
+        """로그에서 접근 빈도 상위 키 반환"""
+        counts = self._read().get(kind, {})
+        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [tuple(json.loads(key)) for key, _ in ranked]
+
+
+def record_hot_key(kind: str):
+    """
+    메서드 호출 인자(self 제외, 기본값 포함)를 핫 키로 기록하는 데코레이터
+
+    lru_cache / swr_cache 바깥에 적용해야 캐시 히트도 집계됩니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                hot_keys.record(kind, tuple(bound.arguments.values())[1:])
+            except TypeError:
+                pass
+            return func(*args, **kwargs)
+
+        for attr in ("cache_info", "cache_clear", "cache_entry"):
+            if hasattr(func, attr):
+                setattr(wrapper, attr, getattr(func, attr))
+        return wrapper
+
+    return decorator
+
+
+# 싱글톤 인스턴스
+hot_keys = HotKeyRecorder(
+    Config.WARMUP_LOG_DIR,
+    Config.WARMUP_LOG_MAX_KEYS,
+    Config.WARMUP_FLUSH_INTERVAL,
+    Config.WARMUP_DECAY
+)
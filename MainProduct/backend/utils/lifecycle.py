@@ -0,0 +1,55 @@
+"""
+프로세스 수명 주기 훅 (gunicorn preload / fork)
+
+gunicorn을 preload_app 모드로 실행하면 앱은 마스터에서 한 번만 로드되고 워커는 fork됩니다.
+- on_preload: 워커 fork 직전 마스터에서 실행 → 여기서 로드한 읽기 전용 데이터는
+  워커들이 copy-on-write로 공유
+- on_post_fork: 각 워커에서 fork 직후 실행 → 소켓/커넥션 풀 등 프로세스별 자원 재생성
+
+gunicorn 없이 실행하면 (python app.py, 배치 작업 등) 훅은 호출되지 않습니다.
+"""
+import gc
+import time
+from typing import Callable, List
+
+_preload_hooks: List[Callable[[], None]] = []
+_post_fork_hooks: List[Callable[[], None]] = []
+
+
+def on_preload(func: Callable[[], None]) -> Callable[[], None]:
+    """마스터 preload 훅 등록 (데코레이터로 사용 가능)"""
+    _preload_hooks.append(func)
+    return func
+
+
+def on_post_fork(func: Callable[[], None]) -> Callable[[], None]:
+    """워커 fork 직후 훅 등록 (데코레이터로 사용 가능)"""
+    _post_fork_hooks.append(func)
+    return func
+
+
+def run_preload():
+    """
+    등록된 preload 훅 실행 후 gc.freeze()
+
+    freeze 이후에는 지금까지 만든 객체를 GC가 검사하지 않으므로,
+    워커에서 GC가 돌아도 공유 페이지가 복사되지 않습니다.
+    """
+    for hook in _preload_hooks:
+        started = time.perf_counter()
+        try:
+            hook()
+            print(f"[preload] {hook.__module__}.{hook.__name__}: {time.perf_counter() - started:.2f}초")
+        except Exception as e:
+            print(f"[경고] preload 실패 ({hook.__name__}): {e}")
+    gc.collect()
+    gc.freeze()
+
+
+def run_post_fork():
+    """등록된 post-fork 훅 실행"""
+    for hook in _post_fork_hooks:
+        try:
+            hook()
+        except Exception as e:
+            print(f"[경고] post-fork 처리 실패 ({hook.__name__}): {e}")
@@ -0,0 +1,388 @@
+"""
+경량 메트릭 수집 및 Prometheus 텍스트 포맷 출력
+
+- 카운터 / 게이지 / 히스토그램을 프로세스 메모리에 기록
+- Config.METRICS_DIR가 설정되면 프로세스별 스냅샷 파일을 주기적으로 저장하고,
+  /metrics 응답 시 모든 파일을 합산 → gunicorn 워커 전체 기준 집계
+  (종료된 워커의 파일은 gunicorn child_exit 또는 합산 시 PID 확인으로 삭제)
+- 캐시 통계처럼 조회 시점에 계산되는 값은 collector 함수로 등록
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import Config
+
+
+# 기본 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _pid_alive(pid: int) -> bool:
+    """같은 호스트의 프로세스가 살아 있는지 (시그널 0으로 확인)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """프로세스 단위 메트릭 레지스트리"""
+
+    def __init__(self, metrics_dir: str = "", flush_interval: float = 5.0):
+        self.metrics_dir = metrics_dir
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], List[Any]] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, Dict[str, Any], float]]]] = []
+        self._flusher_pid: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # 등록 및 기록
+    # ------------------------------------------------------------------
+
+    def describe(self, name: str, kind: str, help_text: str = "",
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS, aggregate: str = "sum"):
+        """
+        메트릭 메타데이터 등록
+
+        Args:
+            name: 메트릭 이름
+            kind: counter / gauge / histogram
+            help_text: 설명
+            buckets: 히스토그램 버킷 경계
+            aggregate: 워커 간 게이지 합산 방식 (sum / max)
+        """
+        self._meta.setdefault(name, {
+            "type": kind,
+            "help": help_text,
+            "buckets": list(buckets),
+            "aggregate": aggregate,
+        })
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """카운터 증가"""
+        self.describe(name, "counter")
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+        self._ensure_flusher()
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """게이지 값 설정"""
+        self.describe(name, "gauge")
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = float(value)
+        self._ensure_flusher()
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 관측값 기록"""
+        self.describe(name, "histogram")
+        buckets = self._meta[name]["buckets"]
+        key = (name, _label_key(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = [[0] * len(buckets), 0.0, 0]
+                self._histograms[key] = hist
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    hist[0][i] += 1
+                    break
+            hist[1] += value
+            hist[2] += 1
+        self._ensure_flusher()
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """with 블록의 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, Dict[str, Any], float]]]):
+        """
+        조회 시점에 값을 계산하는 collector 등록
+
+        collector는 (종류, 이름, 레이블, 값) 튜플들을 반환해야 합니다.
+        """
+        self._collectors.append(collector)
+
+    def register_cache(self, cache_name: str, cached_func: Callable):
+        """cache_info()를 제공하는 캐시(lru_cache, LRUCache, swr_cache 등)를 메트릭으로 노출"""
+        self.describe("cache_hits_total", "counter", "캐시 히트 수")
+        self.describe("cache_misses_total", "counter", "캐시 미스 수")
+        self.describe("cache_entries", "gauge", "캐시 항목 수")
+
+        def collect():
+            info = cached_func.cache_info()
+            return [
+                ("counter", "cache_hits_total", {"cache": cache_name}, info.hits),
+                ("counter", "cache_misses_total", {"cache": cache_name}, info.misses),
+                ("gauge", "cache_entries", {"cache": cache_name}, info.currsize),
+            ]
+
+        self.register_collector(collect)
+
+    # ------------------------------------------------------------------
+    # 스냅샷 / 워커 간 집계
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 프로세스의 메트릭을 직렬화 가능한 형태로 반환"""
+        with self._lock:
+            counters = [[n, list(map(list, l)), v] for (n, l), v in self._counters.items()]
+            gauges = [[n, list(map(list, l)), v] for (n, l), v in self._gauges.items()]
+            histograms = [
+                [n, list(map(list, l)), list(h[0]), h[1], h[2]]
+                for (n, l), h in self._histograms.items()
+            ]
+
+        for collector in self._collectors:
+            try:
+                for kind, name, labels, value in collector():
+                    self.describe(name, kind)
+                    row = [name, list(map(list, _label_key(labels))), float(value)]
+                    (counters if kind == "counter" else gauges).append(row)
+            except Exception as e:
+                print(f"[ERROR] 메트릭 collector 실패: {e}")
+
+        return {
+            "pid": os.getpid(),
+            "meta": dict(self._meta),
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": histograms,
+        }
+
+    def flush(self):
+        """현재 프로세스 스냅샷을 METRICS_DIR에 저장"""
+        if not self.metrics_dir:
+            return
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            path = os.path.join(self.metrics_dir, f"metrics-{os.getpid()}.json")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[ERROR] 메트릭 스냅샷 저장 실패: {e}")
+
+    def _ensure_flusher(self):
+        """프로세스마다 (fork 이후 포함) 백그라운드 스냅샷 스레드 1개 실행"""
+        if not self.metrics_dir or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+
+        def loop():
+            while True:
+                time.sleep(self.flush_interval)
+                self.flush()
+
+        threading.Thread(target=loop, name="metrics-flusher", daemon=True).start()
+
+    def _load_snapshots(self) -> List[Dict[str, Any]]:
+        """모든 워커의 스냅샷 로드 (현재 프로세스는 최신 값 사용)"""
+        if not self.metrics_dir:
+            return [self.snapshot()]
+
+        self.flush()
+        snapshots = []
+        try:
+            names = os.listdir(self.metrics_dir)
+        except FileNotFoundError:
+            return [self.snapshot()]
+
+        for filename in names:
+            if not (filename.startswith("metrics-") and filename.endswith(".json")):
+                continue
+            path = os.path.join(self.metrics_dir, filename)
+            pid = filename[len("metrics-"):-len(".json")]
+            if pid.isdigit() and not _pid_alive(int(pid)):
+                # 종료된 워커의 스냅샷 (gunicorn child_exit에서 지우지 못한 경우) → 집계에서 제외하고 삭제
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def remove_snapshot(self, pid: int):
+        """종료된 프로세스의 스냅샷 파일 삭제 (gunicorn.conf.py child_exit)"""
+        if not self.metrics_dir:
+            return
+        try:
+            os.remove(os.path.join(self.metrics_dir, f"metrics-{pid}.json"))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[ERROR] 메트릭 스냅샷 삭제 실패: {e}")
+
+    def render(self) -> str:
+        """전체 워커 합산 결과를 Prometheus 텍스트 포맷으로 반환"""
+        meta: Dict[str, Dict[str, Any]] = {}
+        values: Dict[Tuple[str, LabelKey], float] = {}
+        histograms: Dict[Tuple[str, LabelKey], List[Any]] = {}
+
+        for snap in self._load_snapshots():
+            for name, info in snap.get("meta", {}).items():
+                meta.setdefault(name, info)
+
+            for name, labels, value in snap.get("counters", []):
+                key = (name, tuple(map(tuple, labels)))
+                values[key] = values.get(key, 0.0) + value
+
+            for name, labels, value in snap.get("gauges", []):
+                key = (name, tuple(map(tuple, labels)))
+                if meta.get(name, {}).get("aggregate") == "max":
+                    values[key] = max(values.get(key, value), value)
+                else:
+                    values[key] = values.get(key, 0.0) + value
+
+            for name, labels, counts, total, count in snap.get("histograms", []):
+                key = (name, tuple(map(tuple, labels)))
+                hist = histograms.setdefault(key, [[0] * len(counts), 0.0, 0])
+                for i, c in enumerate(counts):
+                    hist[0][i] += c
+                hist[1] += total
+                hist[2] += count
+
+        lines: List[str] = []
+        for name in sorted(meta):
+            info = meta[name]
+            lines.append(f"# HELP {name} {info.get('help') or name}")
+            lines.append(f"# TYPE {name} {info['type']}")
+
+            if info["type"] == "histogram":
+                buckets = info.get("buckets") or list(DEFAULT_BUCKETS)
+                for (n, labels), (counts, total, count) in sorted(histograms.items()):
+                    if n != name:
+                        continue
+                    cumulative = 0
+                    for bound, c in zip(buckets, counts):
+                        cumulative += c
+                        le = _format_labels(labels + (("le", _format_value(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    le = _format_labels(labels + (("le", "+Inf"),))
+                    lines.append(f"{name}_bucket{le} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+            else:
+                for (n, labels), value in sorted(values.items()):
+                    if n == name:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+class StageTimer:
+    """요청 내 단계별 실행 시간 측정 (히스토그램 + Server-Timing 헤더)"""
+
+    def __init__(self, route: str, registry: Optional[MetricsRegistry] = None):
+        self.route = route
+        self.registry = registry or metrics
+        self.stages: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록을 하나의 단계로 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stages.append((name, elapsed))
+            self.registry.observe("request_stage_seconds", elapsed, route=self.route, stage=name)
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: search;dur=12.3, tfidf;dur=4.1)"""
+        return ", ".join(f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in self.stages)
+
+
+def instrumented(service: str, method: Optional[str] = None):
+    """
+    서비스 메서드 호출 수 / 오류 수 / 소요 시간을 기록하는 데코레이터
+
+    lru_cache / swr_cache 바깥에 적용하면 캐시 히트를 포함한 전체 호출이 집계되며,
+    감싼 함수의 cache_info / cache_clear / cache_entry는 그대로 노출됩니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        name = method or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                metrics.inc("service_errors_total", service=service, method=name)
+                raise
+            finally:
+                metrics.inc("service_calls_total", service=service, method=name)
+                metrics.observe("service_call_seconds", time.perf_counter() - started,
+                                service=service, method=name)
+
+        for attr in ("cache_info", "cache_clear", "cache_entry"):
+            if hasattr(func, attr):
+                setattr(wrapper, attr, getattr(func, attr))
+        return wrapper
+
+    return decorator
+
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry(Config.METRICS_DIR, Config.METRICS_FLUSH_INTERVAL)
+
+metrics.describe("http_requests_total", "counter", "HTTP 요청 수")
+metrics.describe("http_request_seconds", "histogram", "HTTP 요청 처리 시간")
+metrics.describe("request_stage_seconds", "histogram", "요청 내 단계별 처리 시간")
+metrics.describe("service_calls_total", "counter", "서비스 메서드 호출 수 (캐시 히트 포함)")
+metrics.describe("service_errors_total", "counter", "서비스 메서드 오류 수")
+metrics.describe("service_call_seconds", "histogram", "서비스 메서드 호출 시간")
+metrics.describe("upstream_requests_total", "counter", "외부 API 요청 수")
+metrics.describe("upstream_errors_total", "counter", "외부 API 오류 수")
+metrics.describe("upstream_request_seconds", "histogram", "외부 API 응답 시간")
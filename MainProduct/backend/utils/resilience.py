@@ -0,0 +1,155 @@
+"""
+외부 API 호출 안정화 도구 (토큰 버킷, 재시도 백오프, 서킷 브레이커)
+"""
+import random
+import threading
+import time
+from typing import Optional
+
+
+class UpstreamUnavailable(Exception):
+    """서킷이 열려 있거나 대기 시간 한도를 넘어 요청을 보낼 수 없음"""
+
+
+class AdaptiveTokenBucket:
+    """
+    프로세스 내 모든 스레드가 공유하는 적응형 토큰 버킷
+
+    - 429 응답 시 속도를 절반으로 줄이고 Retry-After 동안 발급 중단 (AIMD)
+    - 성공할 때마다 설정 속도까지 조금씩 회복
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, min_rate: float = 0.5):
+        self.max_rate = max(rate, min_rate)
+        self.min_rate = min_rate
+        self.rate = self.max_rate
+        self.capacity = burst or max(self.max_rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, max_wait: float) -> float:
+        """
+        토큰 1개 획득 (필요하면 대기)
+
+        Args:
+            max_wait: 최대 대기 시간 (초)
+
+        Returns:
+            실제 대기한 시간 (초)
+
+        Raises:
+            UpstreamUnavailable: max_wait 안에 토큰을 얻을 수 없는 경우
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return waited
+                else:
+                    wait = (1.0 - self.tokens) / self.rate
+
+            if waited + wait > max_wait:
+                raise UpstreamUnavailable(f"요청 속도 제한 대기 시간 초과 ({waited + wait:.1f}초)")
+            time.sleep(wait)
+            waited += wait
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """429 응답: 속도 절반 감소 + Retry-After 동안 발급 중단"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2.0)
+            self.tokens = 0.0
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def on_success(self):
+        """성공 응답: 설정 속도까지 선형 회복"""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 요청을 차단하는 서킷 브레이커
+
+    closed → (연속 실패 threshold회) → open → (reset_timeout 경과) → half_open
+    half_open 상태에서는 시험 요청 1개만 허용하고, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """성공/실패를 기록하지 않고 끝난 요청의 시험 요청 표시 해제 (다음 요청이 시험 요청이 됨)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """지수 백오프 + full jitter 대기 시간 (attempt는 0부터)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 float로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        # HTTP-date 형식
+        from email.utils import parsedate_to_datetime
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
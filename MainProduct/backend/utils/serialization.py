@@ -0,0 +1,103 @@
+"""
+JSON 직렬화 계층
+
+- orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작 (Config.JSON_BACKEND로 강제 가능)
+- FastJSONProvider: Flask jsonify / request.get_json이 같은 직렬화기를 사용하도록 app.json에 설정
+- response_cache: 캐시에서 나온 응답의 직렬화(및 압축) 결과를 캐시 항목 버전 기준으로 보관
+"""
+import dataclasses
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+from config import Config
+from utils.cache import CacheEntry, LRUCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """기본 직렬화기가 처리하지 못하는 타입 변환"""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # numpy 스칼라 / 배열
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _select_backend() -> str:
+    if Config.JSON_BACKEND == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+BACKEND = _select_backend()
+
+if BACKEND == "orjson":
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화"""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+    def loads(data) -> Any:
+        """JSON 문자열/바이트 역직렬화"""
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화"""
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data) -> Any:
+        """JSON 문자열/바이트 역직렬화"""
+        return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider (jsonify, request.get_json)
+
+    응답 본문은 문자열을 거치지 않고 바로 바이트로 직렬화합니다.
+    DEBUG 모드의 들여쓰기 출력은 사용하지 않습니다.
+    """
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs) -> Any:
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+# 직렬화/압축 결과 캐시: 키 = (라우트, 인자..., 캐시 항목 버전) [+ 인코딩]
+response_cache = LRUCache(maxsize=Config.RESPONSE_CACHE_SIZE)
+
+
+def entry_version(entry: Optional[CacheEntry], value: Any) -> Optional[int]:
+    """
+    캐시 항목의 버전 반환 (value가 그 항목의 값 그대로일 때만)
+
+    조회 직후 백그라운드 갱신으로 항목이 바뀌었거나 캐시되지 않은 결과(오류 응답 등)이면
+    None을 반환하여 직렬화 결과를 캐시하지 않도록 합니다.
+    """
+    if entry is None or entry.value is not value:
+        return None
+    return entry.version
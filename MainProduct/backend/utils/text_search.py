@@ -0,0 +1,65 @@
+"""
+리뷰 검색용 토큰화 (한국어 2-gram)
+
+PostgreSQL / SQLite 기본 파서는 공백 기준으로 단어를 나누므로
+"재미있었다"와 "재미있는"이 서로 다른 단어가 되어 "재미"로 찾을 수 없습니다.
+한글/한자/가나 구간은 글자 2-gram으로 나누어 (재미 미있 있었 었다)
+형태소 분석기 없이 부분 문자열 검색이 되도록 하고, 영문/숫자는 단어 그대로 둡니다.
+
+저장 시 tokenize 결과를 공백으로 이어 reviews.search_text에 넣고,
+검색어도 같은 방식으로 나누어 모든 토큰을 포함하는 리뷰를 찾습니다.
+"""
+import re
+import unicodedata
+from typing import List
+
+# 한글 음절/자모, 한자, 히라가나/가타카나
+CJK_PATTERN = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3]+")
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# 검색어에서 사용할 최대 토큰 수 (긴 문장을 붙여 넣었을 때 쿼리가 커지지 않도록)
+MAX_QUERY_TOKENS = 16
+
+
+def _word_tokens(word: str) -> List[str]:
+    tokens = []
+    position = 0
+    for match in CJK_PATTERN.finditer(word):
+        if match.start() > position:
+            tokens.append(word[position:match.start()])
+        run = match.group()
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        position = match.end()
+    if position < len(word):
+        tokens.append(word[position:])
+    return tokens
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색 토큰으로 분리 (NFKC 정규화 + 소문자)
+
+    Args:
+        text: 리뷰 내용 또는 검색어
+
+    Returns:
+        토큰 리스트 (순서 유지, 중복 포함)
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    tokens = []
+    for word in WORD_PATTERN.findall(text):
+        tokens.extend(_word_tokens(word))
+    return tokens
+
+
+def search_text(content: str) -> str:
+    """reviews.search_text에 저장할 값 (토큰을 공백으로 연결)"""
+    return " ".join(tokenize(content))
+
+
+def query_tokens(query: str) -> List[str]:
+    """검색어 토큰 (중복 제거, 최대 MAX_QUERY_TOKENS개)"""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
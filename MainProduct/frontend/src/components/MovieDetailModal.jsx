@@ -1,12 +1,16 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
+import { fetchLogoBundle, imageUrl, posterSrcSet } from '../imageProxy';
 import './MovieDetailModal.css';
 
 function MovieDetailModal({ movie, isOpen, onClose }) {
   const [streaming, setStreaming] = useState(null);
+  const [logos, setLogos] = useState({});
   const [loadingStreaming, setLoadingStreaming] = useState(false);
   const [reviews, setReviews] = useState([]);
   const [loadingReviews, setLoadingReviews] = useState(false);
   const [reviewStats, setReviewStats] = useState(null);
+  // 리뷰 실시간 이벤트(SSE) 연결
+  const eventsRef = useRef(null);
   const [newReview, setNewReview] = useState({
     author: '',
     rating: 5,
@@ -17,9 +21,7 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
 
   useEffect(() => {
     if (isOpen && movie?.id) {
-      fetchStreaming();
-      fetchReviews();
-      fetchReviewStats();
+      fetchDetail();
       // 모달 열릴 때 body 스크롤 잠금
       document.body.style.overflow = 'hidden';
     } else {
@@ -33,44 +35,66 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
     };
   }, [isOpen, movie]);
 
-  const fetchStreaming = async () => {
-    setLoadingStreaming(true);
-    try {
-      const response = await fetch(
-        `${API_URL}/api/streaming/${movie.id}?region=KR`
+  // 다른 사용자가 작성/삭제한 리뷰와 통계를 실시간으로 반영 (목록 재조회 없음)
+  useEffect(() => {
+    if (!isOpen || !movie?.id || typeof EventSource === 'undefined') return;
+
+    const source = new EventSource(`${API_URL}/api/reviews/${movie.id}/events`);
+    eventsRef.current = source;
+
+    source.addEventListener('review_created', (e) => {
+      const { review, stats } = JSON.parse(e.data);
+      setReviews((prev) =>
+        prev.some((r) => r.id === review.id) ? prev : [review, ...prev]
       );
-      const data = await response.json();
-      setStreaming(data);
-    } catch (error) {
-      console.error('스트리밍 정보 로드 실패:', error);
-    } finally {
-      setLoadingStreaming(false);
-    }
-  };
+      setReviewStats(stats);
+    });
+    source.addEventListener('review_deleted', (e) => {
+      const { review_id, stats } = JSON.parse(e.data);
+      setReviews((prev) => prev.filter((r) => r.id !== review_id));
+      setReviewStats(stats);
+    });
+    // 연결이 끊긴 사이 놓친 이벤트가 있으면 한 번 다시 조회
+    source.addEventListener('resync', () => fetchDetail('reviews,stats'));
+
+    return () => {
+      source.close();
+      eventsRef.current = null;
+    };
+  }, [isOpen, movie?.id]);
 
-  const fetchReviews = async () => {
+  // 스트리밍 정보 + 리뷰 + 리뷰 통계를 한 번에 조회
+  // fields를 지정하면 해당 항목만 조회 (예: 리뷰 작성 후 'reviews,stats')
+  // readAfter: 리뷰 작성 응답의 read_after (작성한 리뷰가 반영된 DB에서 조회)
+  const fetchDetail = async (fields, readAfter) => {
+    const withStreaming = !fields || fields.includes('streaming');
+    if (withStreaming) setLoadingStreaming(true);
     setLoadingReviews(true);
     try {
-      const response = await fetch(`${API_URL}/api/reviews/${movie.id}`);
+      const params = new URLSearchParams({ region: 'KR' });
+      if (fields) params.set('fields', fields);
+      if (readAfter) params.set('read_after', readAfter);
+      const response = await fetch(
+        `${API_URL}/api/movies/${movie.id}/detail?${params}`
+      );
       const data = await response.json();
-      setReviews(data.reviews || []);
+      if (data.streaming) {
+        setStreaming(data.streaming);
+        const providers = ['flatrate', 'rent', 'buy'].flatMap(
+          (type) => data.streaming[type] || []
+        );
+        fetchLogoBundle(providers.map((p) => p.logo_path)).then(setLogos);
+      }
+      if (data.reviews) setReviews(data.reviews.reviews || []);
+      if (data.stats) setReviewStats(data.stats);
     } catch (error) {
-      console.error('리뷰 로드 실패:', error);
+      console.error('영화 상세 정보 로드 실패:', error);
     } finally {
+      if (withStreaming) setLoadingStreaming(false);
       setLoadingReviews(false);
     }
   };
 
-  const fetchReviewStats = async () => {
-    try {
-      const response = await fetch(`${API_URL}/api/reviews/stats/${movie.id}`);
-      const data = await response.json();
-      setReviewStats(data);
-    } catch (error) {
-      console.error('리뷰 통계 로드 실패:', error);
-    }
-  };
-
   const handleSubmitReview = async (e) => {
     e.preventDefault();
     if (!newReview.text.trim()) {
@@ -93,10 +117,17 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
       });
 
       if (response.ok) {
+        const data = await response.json();
         alert('리뷰가 등록되었습니다!');
         setNewReview({ author: '', rating: 5, text: '' });
-        fetchReviews();
-        fetchReviewStats();
+        // 실시간 연결이 있으면 review_created 이벤트로 반영됨
+        if (eventsRef.current?.readyState === EventSource.OPEN) {
+          setReviews((prev) =>
+            prev.some((r) => r.id === data.review.id) ? prev : [data.review, ...prev]
+          );
+        } else {
+          fetchDetail('reviews,stats', data.read_after);
+        }
       } else {
         const error = await response.json();
         alert(`리뷰 등록 실패: ${error.error}`);
@@ -122,7 +153,9 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
             <div className="poster-section">
               {movie.poster ? (
                 <img
-                  src={movie.poster}
+                  src={imageUrl(movie.poster, 342)}
+                  srcSet={posterSrcSet(movie.poster, [342, 500])}
+                  sizes="342px"
                   alt={movie.title}
                   className="modal-poster"
                 />
@@ -190,7 +223,7 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
                             >
                               {provider.logo_path && (
                                 <img
-                                  src={provider.logo_path}
+                                  src={logos[provider.logo_path] || provider.logo_path}
                                   alt={provider.provider_name}
                                   className="provider-logo"
                                 />
@@ -213,7 +246,7 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
                             >
                               {provider.logo_path && (
                                 <img
-                                  src={provider.logo_path}
+                                  src={logos[provider.logo_path] || provider.logo_path}
                                   alt={provider.provider_name}
                                   className="provider-logo"
                                 />
@@ -236,7 +269,7 @@ function MovieDetailModal({ movie, isOpen, onClose }) {
                             >
                               {provider.logo_path && (
                                 <img
-                                  src={provider.logo_path}
+                                  src={logos[provider.logo_path] || provider.logo_path}
                                   alt={provider.provider_name}
                                   className="provider-logo"
                                 />
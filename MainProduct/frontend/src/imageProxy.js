@@ -0,0 +1,39 @@
+// TMDb 이미지 URL → 백엔드 이미지 프록시 URL (크기 변환 + AVIF/WebP + 장기 캐시)
+const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+const TMDB_IMAGE = /^https:\/\/image\.tmdb\.org\/t\/p\/[^/]+\/([^/?#]+)$/;
+
+// 백엔드 IMAGE_WIDTHS와 같은 값만 사용
+const POSTER_WIDTHS = [92, 185, 342, 500];
+
+export const tmdbFilename = (url) => {
+  const match = TMDB_IMAGE.exec(url || '');
+  return match ? match[1] : null;
+};
+
+// 프록시할 수 없는 URL(TMDb 외부 이미지 등)은 그대로 반환
+export const imageUrl = (url, width, kind = 'poster') => {
+  const filename = tmdbFilename(url);
+  return filename ? `${API_URL}/api/images/${kind}/${width}/${filename}` : url;
+};
+
+// <img srcSet>용 폭 후보 목록 (sizes와 함께 사용)
+export const posterSrcSet = (url, widths = POSTER_WIDTHS) =>
+  tmdbFilename(url)
+    ? widths.map((w) => `${imageUrl(url, w)} ${w}w`).join(', ')
+    : undefined;
+
+// 제공처 로고 여러 개를 요청 1번으로 (data URI), 실패하면 빈 객체 → 원본 URL 사용
+export const fetchLogoBundle = async (urls, width = 64) => {
+  const paths = [...new Set(urls.filter((url) => tmdbFilename(url)))];
+  if (paths.length === 0) return {};
+  try {
+    const params = new URLSearchParams({ paths: paths.join(','), width });
+    const response = await fetch(`${API_URL}/api/images/logos?${params}`);
+    if (!response.ok) return {};
+    const data = await response.json();
+    return data.logos || {};
+  } catch (error) {
+    console.error('제공처 로고 로드 실패:', error);
+    return {};
+  }
+};
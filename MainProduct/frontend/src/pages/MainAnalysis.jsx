@@ -2,6 +2,7 @@ import { useState } from 'react';
 import axios from 'axios';
 import MovieDetailModal from '../components/MovieDetailModal';
 import MovieSearchBar from '../components/MovieSearchBar';
+import { imageUrl, posterSrcSet } from '../imageProxy';
 import './MainAnalysis.css';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
@@ -78,7 +79,9 @@ function MainAnalysis() {
       <img
         className="poster"
         loading="lazy"
-        src={item.poster}
+        src={imageUrl(item.poster, 185)}
+        srcSet={posterSrcSet(item.poster)}
+        sizes="(max-width: 600px) 50vw, (max-width: 900px) 33vw, 20vw"
         alt={item.title}
         onClick={() => handleMovieClick(item)}
         style={{ cursor: 'pointer' }}
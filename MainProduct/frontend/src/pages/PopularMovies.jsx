@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
 import MovieDetailModal from '../components/MovieDetailModal';
+import { imageUrl, posterSrcSet } from '../imageProxy';
 import './PopularMovies.css';
 import movieFinderLogo from '../assets/logo.png';
 
@@ -462,7 +463,14 @@ function PopularMovies() {
               onClick={() => handleMovieClick(m)}
               style={{ cursor: 'pointer' }}
             >
-              <img className="thumb" src={m.poster || ''} alt={m.title} />
+              <img
+                className="thumb"
+                loading="lazy"
+                src={imageUrl(m.poster, 342) || ''}
+                srcSet={posterSrcSet(m.poster)}
+                sizes="(max-width: 600px) 100vw, (max-width: 900px) 50vw, 25vw"
+                alt={m.title}
+              />
               <div className="meta">
                 <div className="title">
                   {m.title || '(제목 없음)'}